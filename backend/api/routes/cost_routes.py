@@ -14,6 +14,7 @@ from ...domain.entities.cargo import (
     CostSettingsCreate,
     CostSettingsPartialUpdate
 )
+from ...domain.services.cost_scenarios import CostScenario
 from ...domain.services.cost_service import CostService
 from ...infrastructure.database import db_session
 from ...infrastructure.container import get_container
@@ -26,6 +27,9 @@ logger = structlog.get_logger()
 cost_bp = Blueprint("cost", __name__, url_prefix="/api/cost")
 api = Api(cost_bp)
 
+# Maximum number of routes accepted by one batch cost calculation
+MAX_BATCH_ROUTES = 1000
+
 
 def get_db():
     """Get the database session."""
@@ -34,6 +38,22 @@ def get_db():
     return db_session
 
 
+def _breakdown_to_dict(breakdown: CostBreakdown) -> Dict[str, Any]:
+    """Convert a cost breakdown to its response format."""
+    return {
+        "id": str(breakdown.id),
+        "route_id": str(breakdown.route_id),
+        "fuel_costs": {k: str(v) for k, v in breakdown.fuel_costs.items()},
+        "toll_costs": {k: str(v) for k, v in breakdown.toll_costs.items()},
+        "driver_costs": {k: str(v) for k, v in breakdown.driver_costs.items()},
+        "overhead_costs": str(breakdown.overhead_costs),
+        "timeline_event_costs": {k: str(v) for k, v in breakdown.timeline_event_costs.items()},
+        "total_cost": str(breakdown.total_cost),
+        "toll_rate_version": breakdown.toll_rate_version,
+        "input_hash": breakdown.input_hash
+    }
+
+
 @cost_bp.route("/settings/<route_id>", methods=["POST"])
 def create_cost_settings(route_id: str):
     """Create cost settings for a route."""
@@ -225,8 +245,8 @@ def calculate_costs(route_id: str):
         if not route:
             return jsonify({"error": "Route not found"}), 404
         
-        # Calculate and save costs
-        breakdown = cost_service.calculate_and_save_costs(
+        # Calculate and save costs, reusing a breakdown priced from identical inputs
+        breakdown, reused = cost_service.calculate_or_reuse_costs(
             route_id=UUID(route_id),
             transport_id=route.transport_id,
             business_entity_id=route.business_entity_id
@@ -234,16 +254,8 @@ def calculate_costs(route_id: str):
         
         # Convert to response format
         response = {
-            "breakdown": {
-                "id": str(breakdown.id),
-                "route_id": str(breakdown.route_id),
-                "fuel_costs": {k: str(v) for k, v in breakdown.fuel_costs.items()},
-                "toll_costs": {k: str(v) for k, v in breakdown.toll_costs.items()},
-                "driver_costs": {k: str(v) for k, v in breakdown.driver_costs.items()},
-                "overhead_costs": str(breakdown.overhead_costs),
-                "timeline_event_costs": {k: str(v) for k, v in breakdown.timeline_event_costs.items()},
-                "total_cost": str(breakdown.total_cost)
-            }
+            "breakdown": _breakdown_to_dict(breakdown),
+            "memo_hit": reused
         }
         
         return jsonify(response), 200
@@ -256,6 +268,116 @@ def calculate_costs(route_id: str):
         return jsonify({"error": str(e)}), 500
 
 
+@cost_bp.route("/calculate-batch", methods=["POST"])
+def calculate_costs_batch():
+    """Calculate and save costs for many routes in one request.
+
+    Expects ``{"route_ids": [...]}``. Entities are loaded in bulk and all
+    breakdowns are saved in one transaction; routes that cannot be priced
+    are listed under ``errors`` without failing the rest.
+    """
+    db = get_db()
+
+    try:
+        data = request.get_json() or {}
+        raw_ids = data.get("route_ids")
+        if not isinstance(raw_ids, list) or not raw_ids:
+            return jsonify({"error": "route_ids must be a non-empty list"}), 400
+        if len(raw_ids) > MAX_BATCH_ROUTES:
+            return jsonify({"error": f"At most {MAX_BATCH_ROUTES} routes per batch"}), 400
+        try:
+            route_ids = [UUID(str(route_id)) for route_id in raw_ids]
+        except ValueError as e:
+            return jsonify({"error": f"Invalid route ID: {str(e)}"}), 400
+
+        container = get_container()
+        cost_service = container.cost_service()
+        breakdowns, errors = cost_service.calculate_and_save_costs_batch(route_ids)
+
+        return jsonify({
+            "breakdowns": [_breakdown_to_dict(breakdown) for breakdown in breakdowns],
+            "errors": {str(route_id): message for route_id, message in errors.items()},
+            "calculated_count": len(breakdowns),
+            "failed_count": len(errors)
+        }), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        if hasattr(db, 'rollback'):
+            db.rollback()
+        return jsonify({"error": str(e)}), 500
+
+
+def _scenario_axis(data: Dict[str, Any], key: str, default: list) -> list:
+    """Read a scenario axis from the request, wrapping single values in a list."""
+    value = data.get(key, default)
+    return value if isinstance(value, list) else [value]
+
+
+@cost_bp.route("/scenarios/<route_id>", methods=["POST"])
+def evaluate_cost_scenarios(route_id: str):
+    """Evaluate a grid of what-if scenarios for a route.
+
+    Accepts optional ``fuel_price_factors``, ``toll_classes``,
+    ``driver_rate_factors`` and ``margins`` lists. Every combination is
+    priced with the vectorized scenario model; figures are indicative and
+    the chosen scenario can be priced exactly with ``/scenarios/<route_id>/exact``.
+    """
+    try:
+        data = request.get_json() or {}
+        toll_classes = data.get("toll_classes")
+        if toll_classes is not None:
+            toll_classes = [str(toll_class) for toll_class in _scenario_axis(data, "toll_classes", [])]
+
+        container = get_container()
+        cost_service = container.cost_service()
+        model = cost_service.build_scenario_model(UUID(route_id), toll_classes)
+        grid = model.evaluate(
+            fuel_price_factors=_scenario_axis(data, "fuel_price_factors", [1.0]),
+            driver_rate_factors=_scenario_axis(data, "driver_rate_factors", [1.0]),
+            margins=_scenario_axis(data, "margins", [0.0])
+        )
+        return jsonify(grid.to_dict()), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@cost_bp.route("/scenarios/<route_id>/exact", methods=["POST"])
+def calculate_cost_scenario(route_id: str):
+    """Price a single what-if scenario exactly without saving it."""
+    try:
+        data = request.get_json() or {}
+        try:
+            scenario = CostScenario(
+                fuel_price_factor=float(data.get("fuel_price_factor", 1.0)),
+                toll_class=str(data["toll_class"]) if data.get("toll_class") is not None else None,
+                driver_rate_factor=float(data.get("driver_rate_factor", 1.0)),
+                margin_percent=float(data.get("margin_percent", 0.0))
+            )
+        except (TypeError, ValueError) as e:
+            return jsonify({"error": f"Invalid scenario: {str(e)}"}), 400
+        if scenario.fuel_price_factor < 0 or scenario.driver_rate_factor < 0:
+            return jsonify({"error": "Scenario factors must not be negative"}), 400
+
+        container = get_container()
+        cost_service = container.cost_service()
+        breakdown, final_price = cost_service.calculate_scenario_costs(UUID(route_id), scenario)
+        return jsonify({
+            "scenario": scenario._asdict(),
+            "breakdown": _breakdown_to_dict(breakdown),
+            "final_price": str(final_price)
+        }), 200
+
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
 @cost_bp.route("/breakdown/<route_id>", methods=["GET"])
 def get_cost_breakdown(route_id: str):
     """Get cost breakdown for a route."""
@@ -279,16 +401,7 @@ def get_cost_breakdown(route_id: str):
         
         # Convert to response format
         response = {
-            "breakdown": {
-                "id": str(breakdown.id),
-                "route_id": str(breakdown.route_id),
-                "fuel_costs": {k: str(v) for k, v in breakdown.fuel_costs.items()},
-                "toll_costs": {k: str(v) for k, v in breakdown.toll_costs.items()},
-                "driver_costs": {k: str(v) for k, v in breakdown.driver_costs.items()},
-                "overhead_costs": str(breakdown.overhead_costs),
-                "timeline_event_costs": {k: str(v) for k, v in breakdown.timeline_event_costs.items()},
-                "total_cost": str(breakdown.total_cost)
-            }
+            "breakdown": _breakdown_to_dict(breakdown)
         }
         
         return jsonify(response), 200
@@ -515,7 +628,6 @@ def get_toll_rates(route_id: str):
         
         # Import toll rates configuration
         from ...infrastructure.data.toll_rates import (
-            DEFAULT_TOLL_RATES,
             get_toll_class_description,
             get_euro_class_description,
             get_toll_rate
@@ -43,7 +43,7 @@ def generate_offer(route_id: str):
     
     try:
         # Get cost breakdown first
-        cost_breakdown = container.cost_breakdown_repository().find_by_route_id(UUID(route_id))
+        cost_breakdown = container.cost_breakdown_repository().find_latest_by_route_id(UUID(route_id))
         if not cost_breakdown:
             return jsonify({"error": "Cost breakdown not found for route"}), 404
 
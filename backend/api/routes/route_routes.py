@@ -1,11 +1,13 @@
 """Route-related API routes."""
 import logging
 from datetime import datetime, timezone
+from typing import List
 from uuid import UUID, uuid4
 from flask import Blueprint, jsonify, request, g
 
+from ...domain.entities.geometry import RouteGeometry
 from ...domain.entities.location import Location
-from ...domain.entities.route import Route, EmptyDriving, TimelineEvent, SegmentType
+from ...domain.entities.route import Route, EmptyDriving, TimelineEvent, SegmentType, RouteStop
 from ...infrastructure.models.transport_models import TransportModel
 from ...infrastructure.models.cargo_models import CargoModel
 from ...infrastructure.models.route_models import (
@@ -14,16 +16,24 @@ from ...infrastructure.models.route_models import (
 )
 from ...infrastructure.repositories.route_repository import SQLRouteRepository
 from ...infrastructure.repositories.location_repository import SQLLocationRepository
-from ...domain.services.route_service import RouteService
+from ...domain.services.route_service import (
+    RouteService, DEFAULT_MAX_TRUCK_CANDIDATES, MAX_ROUTE_WAYPOINTS, ROUTE_MODE_EXACT, ROUTE_MODES
+)
 from ...infrastructure.adapters.google_maps_adapter import GoogleMapsAdapter
 from ...infrastructure.external_services.google_maps_service import GoogleMapsService
 from ...infrastructure.container import get_container
+from ...infrastructure.geo.simplify import LOD_FULL, LOD_TOLERANCES_M, LODS, simplify_points
 
 logger = logging.getLogger(__name__)
 
 # Create blueprint
 route_bp = Blueprint("route", __name__, url_prefix="/api/route")
 
+# Route point encodings accepted by the ``encoding`` query parameter
+POINTS_LIST = "list"
+POINTS_POLYLINE = "polyline"
+POINTS_ENCODINGS = (POINTS_LIST, POINTS_POLYLINE)
+
 def _log_route_request(data: dict, endpoint: str) -> None:
     """Log route request details."""
     logger.debug(f"Route {endpoint} request", extra={
@@ -64,14 +74,118 @@ def _format_duration(duration_hours: float) -> str:
         return f"{minutes}min"
     return f"{hours}h {minutes}min"
 
+def _parse_lod() -> tuple:
+    """Read the ``lod`` and ``tolerance`` query parameters.
+
+    Returns:
+        Tuple of (lod, tolerance_m); tolerance_m is None unless given
+
+    Raises:
+        ValueError: If the level of detail or tolerance is invalid
+    """
+    lod = request.args.get("lod", LOD_FULL)
+    if lod not in LODS:
+        raise ValueError(f"Invalid lod '{lod}', expected one of: {', '.join(LODS)}")
+    tolerance = request.args.get("tolerance")
+    if tolerance is None:
+        return lod, None
+    try:
+        tolerance_m = float(tolerance)
+    except ValueError:
+        raise ValueError("tolerance must be a number of meters")
+    if tolerance_m < 0:
+        raise ValueError("tolerance must not be negative")
+    return lod, tolerance_m
+
+
+def _parse_encoding() -> str:
+    """Read the ``encoding`` query parameter for route points.
+
+    Raises:
+        ValueError: If the encoding is unknown
+    """
+    encoding = request.args.get("encoding", POINTS_LIST)
+    if encoding not in POINTS_ENCODINGS:
+        raise ValueError(f"Invalid encoding '{encoding}', expected one of: {', '.join(POINTS_ENCODINGS)}")
+    return encoding
+
+
+def _parse_waypoints(data: dict) -> List[RouteStop]:
+    """Read intermediate stops from the ``waypoints`` body field.
+
+    Each waypoint is a location ID or an object with ``location_id`` and an
+    optional ``type`` ("pickup" or "delivery", default "delivery").
+
+    Raises:
+        ValueError: If a waypoint is malformed or there are too many
+    """
+    waypoints = data.get("waypoints") or []
+    if not isinstance(waypoints, list):
+        raise ValueError("waypoints must be a list")
+    if len(waypoints) > MAX_ROUTE_WAYPOINTS:
+        raise ValueError(f"At most {MAX_ROUTE_WAYPOINTS} waypoints are supported")
+    try:
+        return [
+            RouteStop(location_id=UUID(waypoint)) if isinstance(waypoint, str)
+            else RouteStop(**waypoint)
+            for waypoint in waypoints
+        ]
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid waypoint: {str(e)}")
+
+
+def _lod_points(route_points, simplified_points, lod: str, tolerance_m=None) -> RouteGeometry:
+    """Get route points at a level of detail or explicit tolerance in meters.
+
+    Stored simplified points are used when available; otherwise the points
+    are simplified on the fly.
+    """
+    route_points = RouteGeometry.validate(route_points)
+    if not route_points:
+        return route_points
+    if tolerance_m is not None:
+        return simplify_points(route_points, tolerance_m)
+    if lod == LOD_FULL:
+        return route_points
+    return (simplified_points or {}).get(lod) or simplify_points(route_points, LOD_TOLERANCES_M[lod])
+
+
+def _encode_points(route_points, encoding: str):
+    """Serialize route points as [lat, lng] pairs or a Google encoded polyline."""
+    route_points = RouteGeometry.validate(route_points)
+    if encoding == POINTS_POLYLINE:
+        return route_points.to_polyline() or ""
+    return route_points.to_list()
+
+
 @route_bp.route("/calculate", methods=["POST"])
 def calculate_route():
-    """Calculate a new route."""
+    """Calculate a new route.
+
+    Pass ``?lod=overview|detail`` or ``?tolerance=<meters>`` to receive
+    simplified route points instead of the full geometry, and
+    ``?encoding=polyline`` to receive them as Google encoded polylines.
+    ``mode=estimate`` (body field or query parameter) builds an indicative
+    route offline from great-circle distance instead of calling Google.
+    ``waypoints`` lists intermediate pickups and drops, visited in order
+    and calculated together with the main route in one call.
+    """
     data = request.get_json()
     _log_route_request(data, "calculate")
     db = g.db
     
     try:
+        try:
+            lod, tolerance_m = _parse_lod()
+            encoding = _parse_encoding()
+            waypoints = _parse_waypoints(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        mode = data.get("mode") or request.args.get("mode", ROUTE_MODE_EXACT)
+        if mode not in ROUTE_MODES:
+            return jsonify({"error": f"Invalid mode '{mode}', expected one of: {', '.join(ROUTE_MODES)}"}), 400
+
         # Get container
         container = get_container()
         
@@ -111,7 +225,8 @@ def calculate_route():
                 'cargo_id': data["cargo_id"],
                 'origin_id': data["origin_id"],
                 'destination_id': data["destination_id"],
-                'truck_location_id': data["truck_location_id"]
+                'truck_location_id': data["truck_location_id"],
+                'waypoint_count': len(waypoints)
             })
             route = route_service.create_route(
                 transport_id=UUID(data["transport_id"]),
@@ -121,7 +236,9 @@ def calculate_route():
                 destination_id=UUID(data["destination_id"]),
                 pickup_time=pickup_time,
                 delivery_time=delivery_time,
-                truck_location_id=UUID(data["truck_location_id"])
+                truck_location_id=UUID(data["truck_location_id"]),
+                mode=mode,
+                waypoints=waypoints
             )
             
             # Check route feasibility
@@ -149,7 +266,11 @@ def calculate_route():
                         "id": str(route.empty_driving_id),
                         "distance_km": route.empty_driving.distance_km,
                         "duration_hours": route.empty_driving.duration_hours,
-                        "route_points": route.empty_driving.route_points if hasattr(route.empty_driving, 'route_points') else None,
+                        "route_points": _encode_points(_lod_points(
+                            route.empty_driving.route_points,
+                            route.empty_driving.simplified_points,
+                            lod, tolerance_m
+                        ), encoding),
                         "start_location": {
                             "id": str(container.location_repository().find_by_id(route.truck_location_id).id),
                             "latitude": container.location_repository().find_by_id(route.truck_location_id).latitude,
@@ -184,7 +305,9 @@ def calculate_route():
                             "country_code": segment.country_code,
                             "distance_km": segment.distance_km,
                             "duration_hours": segment.duration_hours,
-                            "route_points": segment.route_points if hasattr(segment, 'route_points') else None,
+                            "route_points": _encode_points(_lod_points(
+                                segment.route_points, segment.simplified_points, lod, tolerance_m
+                            ), encoding),
                             "start_location": {
                                 "id": str(segment.start_location_id),
                                 "latitude": container.location_repository().find_by_id(segment.start_location_id).latitude,
@@ -201,7 +324,8 @@ def calculate_route():
                         for segment in route.country_segments
                         if segment.segment_type != SegmentType.EMPTY_DRIVING  # Filter out empty driving segments
                     ],
-                    "route_polyline": route.route_polyline,
+                    "route_polyline": _encode_points(route.route_polyline, encoding),
+                    "mode": mode,
                     "total_distance_km": route.total_distance_km,
                     "total_duration_hours": route.total_duration_hours,
                     "is_feasible": route.is_feasible,
@@ -258,6 +382,78 @@ def check_route_feasibility():
         db.close()
 
 
+@route_bp.route("/rank-trucks", methods=["POST"])
+def rank_trucks():
+    """Rank candidate trucks by empty driving to a cargo origin."""
+    data = request.get_json() or {}
+    _log_route_request(data, "rank-trucks")
+    db = g.db
+
+    try:
+        if "origin_id" not in data or not data.get("candidates"):
+            return jsonify({"error": "origin_id and candidates are required"}), 400
+
+        container = get_container()
+        route_service = container.route_service()
+        transport_repo = container.transport_repository()
+
+        transports = transport_repo.find_by_ids(
+            UUID(candidate["transport_id"]) for candidate in data["candidates"]
+        )
+        candidates = []
+        for candidate in data["candidates"]:
+            transport = transports.get(UUID(candidate["transport_id"]))
+            if not transport:
+                return jsonify({"error": f"Transport not found: {candidate['transport_id']}"}), 404
+            candidates.append((transport, UUID(candidate["truck_location_id"])))
+
+        ranked = route_service.rank_trucks(
+            origin_id=UUID(data["origin_id"]),
+            candidates=candidates,
+            max_candidates=int(data.get("max_candidates", DEFAULT_MAX_TRUCK_CANDIDATES)),
+            max_radius_km=float(data["max_radius_km"]) if data.get("max_radius_km") is not None else None,
+            rank_by=data.get("rank_by", "distance")
+        )
+
+        return jsonify({
+            "origin_id": data["origin_id"],
+            "trucks": [
+                {
+                    "rank": index + 1,
+                    "transport_id": str(candidate.transport_id),
+                    "truck_location_id": str(candidate.truck_location_id),
+                    "straight_line_km": round(candidate.straight_line_km, 1),
+                    "empty_distance_km": candidate.empty_distance_km,
+                    "empty_duration_hours": candidate.empty_duration_hours,
+                    "empty_driving_cost": str(candidate.empty_driving_cost),
+                    "distance_formatted": _format_distance(candidate.empty_distance_km),
+                    "duration_formatted": _format_duration(candidate.empty_duration_hours)
+                }
+                for index, candidate in enumerate(ranked)
+            ]
+        }), 200
+
+    except (ValueError, KeyError) as e:
+        logger.error(f"Validation error in rank_trucks: {str(e)}")
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Error in rank_trucks: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+    finally:
+        db.close()
+
+
+@route_bp.route("/maps-client/metrics", methods=["GET"])
+def get_maps_client_metrics():
+    """Get request, quota and circuit metrics of the shared Google Maps client."""
+    try:
+        container = get_container()
+        return jsonify(container.maps_client_factory().metrics()), 200
+    except Exception as e:
+        logger.error(f"Error in get_maps_client_metrics: {str(e)}")
+        return jsonify({"error": str(e)}), 500
+
+
 @route_bp.route("/<route_id>/timeline", methods=["GET"])
 def get_route_timeline(route_id):
     """Get route timeline events."""
@@ -307,15 +503,33 @@ def get_route_timeline(route_id):
 
 @route_bp.route("/<route_id>/segments", methods=["GET"])
 def get_route_segments(route_id):
-    """Get route segments for visualization."""
+    """Get route segments for visualization.
+
+    Route points are served from the stored segment polylines. Pass
+    ``?refresh=true`` to re-fetch them from Google Maps; segments without
+    stored points (e.g. routes created before polylines were persisted) are
+    fetched once and stored.
+
+    Pass ``?lod=overview|detail`` to get the simplified points stored at
+    route creation, or ``?tolerance=<meters>`` for a custom simplification.
+    The default ``lod=full`` returns every point. ``?encoding=polyline``
+    returns each segment's points as a Google encoded polyline.
+    """
     db = g.db
     
     try:
+        try:
+            lod, tolerance_m = _parse_lod()
+            encoding = _parse_encoding()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         # Get services from container
         container = get_container()
         route_service = container.route_service()
+        route_repo = container.route_repository()
         location_repo = container.location_repository()
-        maps_service = container.google_maps_service()
+        refresh = request.args.get("refresh", "false").lower() == "true"
         
         # Get route segments
         route = route_service.get_route(UUID(route_id))
@@ -335,7 +549,14 @@ def get_route_segments(route_id):
                     logger.error(f"Location not found for empty driving - start: {route.truck_location_id}, end: {route.origin_id}")
                 else:
                     # Get route points for empty driving
-                    route_points = maps_service.get_segment_route_points(start_location, end_location)
+                    route_points = route.empty_driving.route_points
+                    simplified_points = route.empty_driving.simplified_points
+                    if refresh or not route_points:
+                        maps_service = container.google_maps_service()
+                        route_points = maps_service.get_segment_route_points(start_location, end_location)
+                        route_repo.update_empty_driving_route_points(route.empty_driving.id, route_points)
+                        simplified_points = {}
+                    route_points = _lod_points(route_points, simplified_points, lod, tolerance_m)
                     
                     empty_dict = {
                         "type": "empty_driving",
@@ -355,7 +576,7 @@ def get_route_segments(route_id):
                             "longitude": end_location.longitude,
                             "address": end_location.address
                         },
-                        "route_points": route_points
+                        "route_points": _encode_points(route_points, encoding)
                     }
                     segments.append(empty_dict)
                     
@@ -380,7 +601,14 @@ def get_route_segments(route_id):
                     continue
                 
                 # Get route points for country segment
-                route_points = maps_service.get_segment_route_points(start_location, end_location)
+                route_points = segment.route_points
+                simplified_points = segment.simplified_points
+                if refresh or not route_points:
+                    maps_service = container.google_maps_service()
+                    route_points = maps_service.get_segment_route_points(start_location, end_location)
+                    route_repo.update_segment_route_points(segment.id, route_points)
+                    simplified_points = {}
+                route_points = _lod_points(route_points, simplified_points, lod, tolerance_m)
                 
                 segment_dict = {
                     "type": "country",
@@ -401,7 +629,7 @@ def get_route_segments(route_id):
                         "longitude": end_location.longitude,
                         "address": end_location.address
                     },
-                    "route_points": route_points
+                    "route_points": _encode_points(route_points, encoding)
                 }
                 segments.append(segment_dict)
                 
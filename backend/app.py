@@ -55,6 +55,8 @@ def create_app(config: Config = None) -> Flask:
     
     # Create container at app level
     app.container = Container(config.to_dict(), db_session())
+    # Calibrate route estimates off the request path
+    app.container.warm_detour_factors()
     
     # Set up database session handling
     @app.before_request
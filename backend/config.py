@@ -1,7 +1,7 @@
 """Configuration management for the application."""
 import os
 from typing import Dict, Any, Literal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # Type definitions
 EnvironmentType = Literal['development', 'testing', 'staging', 'production']
@@ -42,6 +42,25 @@ class GoogleMapsConfig:
     RETRY_DELAY: float
     TIMEOUT: float
     CACHE_TTL: int
+    BORDER_MARGIN_KM: float = 25.0
+    CACHE_PATH: str = 'gmaps_cache.db'
+    CACHE_MAX_ENTRIES: int = 10000
+    CACHE_COORD_PRECISION: int = 5
+    TILE_PRECISION: int = 7
+    TILE_CACHE_SIZE: int = 4096
+    QUERIES_PER_SECOND: int = 50
+    MAX_WORKERS: int = 8
+    TRANSPORT_MODE: str = 'live'
+    CASSETTE_DIR: str = 'tests/fixtures/cassettes'
+    REPLAY_LATENCY_MS: float = 0.0
+    DAILY_QUOTA: int = 0
+    POOL_SIZE: int = 20
+    CIRCUIT_FAILURE_THRESHOLD: int = 5
+    CIRCUIT_RESET_SECONDS: float = 30.0
+    LANE_PRECISION: int = 7  # Geohash precision of lane endpoints
+    LANE_MAX_AGE_HOURS: float = 168.0  # Stored lanes older than this are recalculated; 0 disables
+    ESTIMATE_SPEED_KMH: float = 65.0  # Truck speed for countries without a configured average
+    ESTIMATE_CALIBRATION_SECONDS: float = 3600.0  # Interval between detour factor recalibrations
 
 
 @dataclass
@@ -51,6 +70,15 @@ class TollRateConfig:
     MAX_RETRIES: int
     RETRY_DELAY: float
     TIMEOUT: float
+    RATES_FILE: str = ''  # Empty uses the bundled toll_rates.json
+    RATES_RELOAD_SECONDS: float = 5.0  # Negative disables hot reload
+    RESULT_CACHE_SIZE: int = 4096  # Memoized segment tolls; 0 disables
+
+
+@dataclass
+class CostConfig:
+    """Cost calculation settings."""
+    BREAKDOWN_MEMO_SIZE: int = 2048  # Memoized cost breakdowns; 0 disables
 
 
 @dataclass
@@ -79,6 +107,7 @@ class Config:
     TOLL_RATE: TollRateConfig
     LOGGING: LoggingConfig
     FRONTEND: FrontendConfig
+    COST: CostConfig = field(default_factory=CostConfig)
 
     @classmethod
     def from_env(cls) -> 'Config':
@@ -111,14 +140,36 @@ class Config:
                 MAX_RETRIES=int(os.getenv('GMAPS_MAX_RETRIES', '3')),
                 RETRY_DELAY=float(os.getenv('GMAPS_RETRY_DELAY', '1.0')),
                 TIMEOUT=float(os.getenv('GMAPS_TIMEOUT', '30.0')),
-                CACHE_TTL=int(os.getenv('GMAPS_CACHE_TTL', '3600'))
+                CACHE_TTL=int(os.getenv('GMAPS_CACHE_TTL', '3600')),
+                BORDER_MARGIN_KM=float(os.getenv('GMAPS_BORDER_MARGIN_KM', '25.0')),
+                CACHE_PATH=os.getenv('GMAPS_CACHE_PATH', 'gmaps_cache.db'),
+                CACHE_MAX_ENTRIES=int(os.getenv('GMAPS_CACHE_MAX_ENTRIES', '10000')),
+                CACHE_COORD_PRECISION=int(os.getenv('GMAPS_CACHE_COORD_PRECISION', '5')),
+                TILE_PRECISION=int(os.getenv('GMAPS_TILE_PRECISION', '7')),
+                TILE_CACHE_SIZE=int(os.getenv('GMAPS_TILE_CACHE_SIZE', '4096')),
+                QUERIES_PER_SECOND=int(os.getenv('GMAPS_QUERIES_PER_SECOND', '50')),
+                MAX_WORKERS=int(os.getenv('GMAPS_MAX_WORKERS', '8')),
+                TRANSPORT_MODE=os.getenv('GMAPS_TRANSPORT_MODE', 'live'),
+                CASSETTE_DIR=os.getenv('GMAPS_CASSETTE_DIR', 'tests/fixtures/cassettes'),
+                REPLAY_LATENCY_MS=float(os.getenv('GMAPS_REPLAY_LATENCY_MS', '0.0')),
+                DAILY_QUOTA=int(os.getenv('GMAPS_DAILY_QUOTA', '0')),
+                POOL_SIZE=int(os.getenv('GMAPS_POOL_SIZE', '20')),
+                CIRCUIT_FAILURE_THRESHOLD=int(os.getenv('GMAPS_CIRCUIT_FAILURE_THRESHOLD', '5')),
+                CIRCUIT_RESET_SECONDS=float(os.getenv('GMAPS_CIRCUIT_RESET_SECONDS', '30.0')),
+                LANE_PRECISION=int(os.getenv('GMAPS_LANE_PRECISION', '7')),
+                LANE_MAX_AGE_HOURS=float(os.getenv('GMAPS_LANE_MAX_AGE_HOURS', '168.0')),
+                ESTIMATE_SPEED_KMH=float(os.getenv('GMAPS_ESTIMATE_SPEED_KMH', '65.0')),
+                ESTIMATE_CALIBRATION_SECONDS=float(os.getenv('GMAPS_ESTIMATE_CALIBRATION_SECONDS', '3600.0'))
             ),
             
             TOLL_RATE=TollRateConfig(
                 API_KEY=os.getenv('TOLL_RATE_API_KEY', ''),
                 MAX_RETRIES=int(os.getenv('TOLL_RATE_MAX_RETRIES', '3')),
                 RETRY_DELAY=float(os.getenv('TOLL_RATE_RETRY_DELAY', '1.0')),
-                TIMEOUT=float(os.getenv('TOLL_RATE_TIMEOUT', '30.0'))
+                TIMEOUT=float(os.getenv('TOLL_RATE_TIMEOUT', '30.0')),
+                RATES_FILE=os.getenv('TOLL_RATE_RATES_FILE', ''),
+                RATES_RELOAD_SECONDS=float(os.getenv('TOLL_RATE_RATES_RELOAD_SECONDS', '5.0')),
+                RESULT_CACHE_SIZE=int(os.getenv('TOLL_RATE_RESULT_CACHE_SIZE', '4096'))
             ),
             
             LOGGING=LoggingConfig(
@@ -127,6 +178,10 @@ class Config:
             
             FRONTEND=FrontendConfig(
                 PORT=int(os.getenv('FRONTEND_PORT', '8501'))
+            ),
+
+            COST=CostConfig(
+                BREAKDOWN_MEMO_SIZE=int(os.getenv('COST_BREAKDOWN_MEMO_SIZE', '2048'))
             )
         )
 
@@ -156,18 +211,43 @@ class Config:
                 'MAX_RETRIES': self.GOOGLE_MAPS.MAX_RETRIES,
                 'RETRY_DELAY': self.GOOGLE_MAPS.RETRY_DELAY,
                 'TIMEOUT': self.GOOGLE_MAPS.TIMEOUT,
-                'CACHE_TTL': self.GOOGLE_MAPS.CACHE_TTL
+                'CACHE_TTL': self.GOOGLE_MAPS.CACHE_TTL,
+                'BORDER_MARGIN_KM': self.GOOGLE_MAPS.BORDER_MARGIN_KM,
+                'CACHE_PATH': self.GOOGLE_MAPS.CACHE_PATH,
+                'CACHE_MAX_ENTRIES': self.GOOGLE_MAPS.CACHE_MAX_ENTRIES,
+                'CACHE_COORD_PRECISION': self.GOOGLE_MAPS.CACHE_COORD_PRECISION,
+                'TILE_PRECISION': self.GOOGLE_MAPS.TILE_PRECISION,
+                'TILE_CACHE_SIZE': self.GOOGLE_MAPS.TILE_CACHE_SIZE,
+                'QUERIES_PER_SECOND': self.GOOGLE_MAPS.QUERIES_PER_SECOND,
+                'MAX_WORKERS': self.GOOGLE_MAPS.MAX_WORKERS,
+                'TRANSPORT_MODE': self.GOOGLE_MAPS.TRANSPORT_MODE,
+                'CASSETTE_DIR': self.GOOGLE_MAPS.CASSETTE_DIR,
+                'REPLAY_LATENCY_MS': self.GOOGLE_MAPS.REPLAY_LATENCY_MS,
+                'DAILY_QUOTA': self.GOOGLE_MAPS.DAILY_QUOTA,
+                'POOL_SIZE': self.GOOGLE_MAPS.POOL_SIZE,
+                'CIRCUIT_FAILURE_THRESHOLD': self.GOOGLE_MAPS.CIRCUIT_FAILURE_THRESHOLD,
+                'CIRCUIT_RESET_SECONDS': self.GOOGLE_MAPS.CIRCUIT_RESET_SECONDS,
+                'LANE_PRECISION': self.GOOGLE_MAPS.LANE_PRECISION,
+                'LANE_MAX_AGE_HOURS': self.GOOGLE_MAPS.LANE_MAX_AGE_HOURS,
+                'ESTIMATE_SPEED_KMH': self.GOOGLE_MAPS.ESTIMATE_SPEED_KMH,
+                'ESTIMATE_CALIBRATION_SECONDS': self.GOOGLE_MAPS.ESTIMATE_CALIBRATION_SECONDS
             },
             'TOLL_RATE': {
                 'API_KEY': self.TOLL_RATE.API_KEY,
                 'MAX_RETRIES': self.TOLL_RATE.MAX_RETRIES,
                 'RETRY_DELAY': self.TOLL_RATE.RETRY_DELAY,
-                'TIMEOUT': self.TOLL_RATE.TIMEOUT
+                'TIMEOUT': self.TOLL_RATE.TIMEOUT,
+                'RATES_FILE': self.TOLL_RATE.RATES_FILE,
+                'RATES_RELOAD_SECONDS': self.TOLL_RATE.RATES_RELOAD_SECONDS,
+                'RESULT_CACHE_SIZE': self.TOLL_RATE.RESULT_CACHE_SIZE
             },
             'LOGGING': {
                 'LEVEL': self.LOGGING.LEVEL
             },
             'FRONTEND': {
                 'PORT': self.FRONTEND.PORT
+            },
+            'COST': {
+                'BREAKDOWN_MEMO_SIZE': self.COST.BREAKDOWN_MEMO_SIZE
             }
         } 
\ No newline at end of file
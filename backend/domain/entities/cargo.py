@@ -80,6 +80,12 @@ class CostBreakdown(BaseModel):
     overhead_costs: Decimal = Field(default=Decimal('0'), ge=0, description="Overhead costs")
     timeline_event_costs: Dict[str, Decimal] = Field(default_factory=dict, description="Costs by timeline event")
     total_cost: Decimal = Field(default=Decimal('0'), ge=0, description="Total transport cost")
+    toll_rate_version: Optional[str] = Field(None, description="Version of the toll rate table used")
+    input_fingerprints: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Hash of the inputs of each cost component"
+    )
+    input_hash: Optional[str] = Field(None, description="Content hash of all calculation inputs")
 
 
 class Offer(BaseModel):
@@ -0,0 +1,135 @@
+"""Compact route geometry value type."""
+from array import array
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Union
+
+import polyline
+from pydantic_core import core_schema
+
+
+class RouteGeometry(Sequence):
+    """Immutable [lat, lng] polyline backed by a flat ``array('d')`` buffer.
+
+    A list of two-float lists costs well over 100 bytes per point; this keeps
+    16. Slices with a step of one are views onto the same buffer, so country
+    segments can share the geometry of their leg without copying it. Indexing
+    and iteration still yield ``[lat, lng]`` lists, and a geometry compares
+    equal to the equivalent list of points.
+
+    As a pydantic field the geometry accepts another geometry (kept as-is),
+    a sequence of [lat, lng] pairs or a Google encoded polyline string. It
+    dumps as itself in python mode and as a list of points in JSON mode.
+    """
+
+    __slots__ = ("_buffer", "_start", "_stop")
+
+    def __init__(self, points: Optional[Iterable[Sequence[float]]] = None):
+        """Initialize geometry from [lat, lng] pairs."""
+        self._buffer = array("d", chain.from_iterable((point[0], point[1]) for point in points or ()))
+        self._start = 0
+        self._stop = len(self._buffer) // 2
+
+    @classmethod
+    def _view(cls, buffer: array, start: int, stop: int) -> "RouteGeometry":
+        geometry = cls.__new__(cls)
+        geometry._buffer = buffer
+        geometry._start = start
+        geometry._stop = stop
+        return geometry
+
+    @classmethod
+    def from_polyline(cls, encoded: Optional[str]) -> "RouteGeometry":
+        """Decode a Google encoded polyline."""
+        if not encoded:
+            return cls()
+        return cls(polyline.decode(encoded))
+
+    @classmethod
+    def from_buffer(cls, buffer: array) -> "RouteGeometry":
+        """Wrap a flat lat, lng, lat, lng ... buffer without copying it."""
+        if buffer.typecode != "d" or len(buffer) % 2:
+            raise ValueError("Geometry buffer must be an array('d') of lat, lng pairs")
+        return cls._view(buffer, 0, len(buffer) // 2)
+
+    def to_polyline(self) -> Optional[str]:
+        """Encode as a Google encoded polyline, or None when empty."""
+        if not len(self):
+            return None
+        return polyline.encode(list(self.pairs()))
+
+    def to_list(self) -> List[List[float]]:
+        """Copy out as a list of [lat, lng] lists."""
+        return [list(pair) for pair in self.pairs()]
+
+    def pairs(self) -> Iterator[tuple]:
+        """Iterate (lat, lng) tuples."""
+        values = self.buffer
+        return zip(values[0::2], values[1::2])
+
+    @property
+    def buffer(self) -> memoryview:
+        """Zero-copy view of the flat lat, lng values covered by this geometry."""
+        return memoryview(self._buffer)[self._start * 2:self._stop * 2]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of coordinate data covered by this geometry."""
+        return len(self) * 2 * self._buffer.itemsize
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[List[float], "RouteGeometry"]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self._view(self._buffer, self._start + start, self._start + max(start, stop))
+            return RouteGeometry(self[i] for i in range(start, stop, step))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("RouteGeometry index out of range")
+        offset = (self._start + index) * 2
+        return [self._buffer[offset], self._buffer[offset + 1]]
+
+    def __iter__(self) -> Iterator[List[float]]:
+        return (list(pair) for pair in self.pairs())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RouteGeometry):
+            return self.buffer == other.buffer
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(
+                len(theirs) == 2 and mine[0] == theirs[0] and mine[1] == theirs[1]
+                for mine, theirs in zip(self.pairs(), other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"RouteGeometry(points={len(self)})"
+
+    @classmethod
+    def validate(cls, value: Any) -> "RouteGeometry":
+        """Coerce a geometry, sequence of points or encoded polyline."""
+        if isinstance(value, RouteGeometry):
+            return value
+        if value is None:
+            return cls()
+        if isinstance(value, str):
+            return cls.from_polyline(value)
+        try:
+            return cls(value)
+        except (TypeError, IndexError) as e:
+            raise ValueError(f"Route points must be [lat, lng] pairs: {e}") from e
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda geometry: geometry.to_list(),
+                when_used="json"
+            )
+        )
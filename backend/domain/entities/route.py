@@ -1,11 +1,13 @@
 """Route domain entities."""
 from datetime import datetime
+from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from .geometry import RouteGeometry
 from .location import Location
 
 
@@ -49,6 +51,14 @@ class EmptyDriving(BaseModel):
         gt=0,
         description="Empty driving duration in hours"
     )
+    route_points: RouteGeometry = Field(
+        default_factory=RouteGeometry,
+        description="List of [lat, lng] coordinates representing the empty driving path"
+    )
+    simplified_points: Dict[str, RouteGeometry] = Field(
+        default_factory=dict,
+        description="Simplified route points per level of detail"
+    )
 
 
 class RouteSegment(BaseModel):
@@ -74,6 +84,30 @@ class RouteSegment(BaseModel):
     )
 
 
+class RouteStep(BaseModel):
+    """Compact record of one Directions step, kept for offline toll classification."""
+
+    distance_km: float = Field(
+        ...,
+        ge=0,
+        description="Step distance in kilometers"
+    )
+    road_ref: Optional[str] = Field(
+        default=None,
+        description="Road reference such as A2 or E30"
+    )
+    is_toll: bool = Field(
+        default=False,
+        description="Whether the step runs on a toll road"
+    )
+    country_code: str = Field(
+        ...,
+        min_length=2,
+        max_length=2,
+        description="ISO 3166-1 alpha-2 country code"
+    )
+
+
 class CountrySegment(BaseModel):
     """Route segment within a single country."""
     
@@ -118,10 +152,18 @@ class CountrySegment(BaseModel):
         ge=0,
         description="Order of segment in route"
     )
-    route_points: List[List[float]] = Field(
-        default_factory=list,
+    route_points: RouteGeometry = Field(
+        default_factory=RouteGeometry,
         description="List of [lat, lng] coordinates representing the segment path"
     )
+    simplified_points: Dict[str, RouteGeometry] = Field(
+        default_factory=dict,
+        description="Simplified route points per level of detail"
+    )
+    steps: List[RouteStep] = Field(
+        default_factory=list,
+        description="Compact Directions step records within the segment"
+    )
 
 
 class TimelineEvent(BaseModel):
@@ -182,6 +224,26 @@ class TimelineEvent(BaseModel):
         }
 
 
+class RouteStop(BaseModel):
+    """Intermediate pickup or drop between route origin and destination."""
+
+    location_id: UUID = Field(
+        ...,
+        description="Stop location ID"
+    )
+    type: str = Field(
+        default="delivery",
+        pattern="^(pickup|delivery)$",
+        description="Timeline event type at the stop (pickup/delivery)"
+    )
+
+
+# Route calculation modes: exact routing or an offline indicative estimate
+ROUTE_MODE_EXACT = "exact"
+ROUTE_MODE_ESTIMATE = "estimate"
+ROUTE_MODES = (ROUTE_MODE_EXACT, ROUTE_MODE_ESTIMATE)
+
+
 class Route(BaseModel):
     """Complete transport route with timeline."""
     
@@ -237,8 +299,8 @@ class Route(BaseModel):
         default_factory=list,
         description="Country segments"
     )
-    route_polyline: List[List[float]] = Field(
-        default_factory=list,
+    route_polyline: RouteGeometry = Field(
+        default_factory=RouteGeometry,
         description="List of [lat, lng] coordinates representing the actual route path"
     )
     total_distance_km: float = Field(
@@ -259,6 +321,15 @@ class Route(BaseModel):
         default=RouteStatus.DRAFT,
         description="Route status"
     )
+    mode: str = Field(
+        default=ROUTE_MODE_EXACT,
+        description="Calculation mode: exact routing or an offline estimate"
+    )
+    waypoint_count: int = Field(
+        default=0,
+        ge=0,
+        description="Number of intermediate stops between origin and destination"
+    )
     certifications_validated: bool = Field(
         default=False,
         description="Flag indicating if certifications are validated"
@@ -274,4 +345,81 @@ class Route(BaseModel):
     validation_details: dict = Field(
         default_factory=dict,
         description="Additional validation details"
-    ) 
\ No newline at end of file
+    ) 
+
+
+class Lane(BaseModel):
+    """Computed route between snapped origin/destination cells, reused across routes."""
+
+    id: UUID = Field(
+        ...,
+        description="Lane identifier"
+    )
+    lane_key: str = Field(
+        ...,
+        min_length=1,
+        description="Snapped origin/destination cells"
+    )
+    total_distance_km: float = Field(
+        ...,
+        ge=0,
+        description="Lane distance in kilometers"
+    )
+    total_duration_hours: float = Field(
+        ...,
+        ge=0,
+        description="Lane duration in hours"
+    )
+    route_polyline: RouteGeometry = Field(
+        default_factory=RouteGeometry,
+        description="List of [lat, lng] coordinates representing the lane path"
+    )
+    country_segments: List[CountrySegment] = Field(
+        default_factory=list,
+        description="Country segments with geometry, distances and durations"
+    )
+    created_at: datetime = Field(
+        ...,
+        description="When the lane was calculated"
+    )
+
+    def country_totals(self) -> Dict[str, Tuple[float, float]]:
+        """Get (distance_km, duration_hours) per country code."""
+        totals: Dict[str, Tuple[float, float]] = {}
+        for segment in self.country_segments:
+            distance, duration = totals.get(segment.country_code, (0.0, 0.0))
+            totals[segment.country_code] = (distance + segment.distance_km, duration + segment.duration_hours)
+        return totals
+
+
+class TruckCandidate(BaseModel):
+    """Transport ranked by empty driving to a cargo origin."""
+
+    transport_id: UUID = Field(
+        ...,
+        description="Candidate transport identifier"
+    )
+    truck_location_id: UUID = Field(
+        ...,
+        description="Current truck location identifier"
+    )
+    straight_line_km: float = Field(
+        ...,
+        ge=0,
+        description="Great-circle distance from truck to cargo origin"
+    )
+    empty_distance_km: float = Field(
+        ...,
+        ge=0,
+        description="Empty driving distance in kilometers"
+    )
+    empty_duration_hours: float = Field(
+        ...,
+        ge=0,
+        description="Empty driving duration in hours"
+    )
+    empty_driving_cost: Decimal = Field(
+        ...,
+        ge=0,
+        description="Estimated empty driving cost (fuel, maintenance, driver time)"
+    )
@@ -0,0 +1,122 @@
+"""Per-component fingerprints of cost calculation inputs.
+
+Each cost component reads only part of the settings, route, transport and
+business entity. Hashing exactly those inputs per component lets a
+recalculation reuse every component of the previous breakdown whose
+inputs did not change.
+"""
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from ..entities.business import BusinessEntity
+from ..entities.cargo import CostSettings
+from ..entities.route import EmptyDriving, Route
+from ..entities.transport import Transport
+
+DRIVER_RATE_KEYS = ("driver_base_rate", "driver_time_rate")
+# Version of the cost calculation rules, hashed into every fingerprint.
+# Bump it whenever pricing or rounding changes so that stored components
+# and memoized breakdowns from the old rules are no longer reused.
+# 2: scaled-integer arithmetic with per line item rounding
+CALCULATION_ENGINE_VERSION = 2
+
+
+def fingerprint(content: Any) -> str:
+    """Get a stable content hash of JSON-serializable data.
+
+    Values JSON cannot encode (Decimal, UUID, datetime) are hashed by
+    their string form. The calculation engine version is hashed along.
+    """
+    encoded = json.dumps([CALCULATION_ENGINE_VERSION, content], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _rates(settings: CostSettings, prefix: str) -> Dict[str, str]:
+    """Get the settings rates whose key starts with a prefix."""
+    return {key: str(value) for key, value in settings.rates.items() if key.startswith(prefix)}
+
+
+def component_fingerprints(
+    route: Route,
+    transport: Transport,
+    business: BusinessEntity,
+    settings: CostSettings,
+    empty_driving: Optional[EmptyDriving],
+    toll_rate_version: Optional[str] = None,
+    toll_override_version: Optional[str] = None
+) -> Dict[str, str]:
+    """Fingerprint the inputs of each cost component.
+
+    Args:
+        route: Route being priced
+        transport: Transport with truck and driver specifications
+        business: Business entity with overheads and toll overrides
+        settings: Cost settings with enabled components and rates
+        empty_driving: Empty driving leg to the origin
+        toll_rate_version: Version stamp of the toll rate table
+        toll_override_version: Version digest of the business's toll overrides
+
+    Returns:
+        Fingerprint per component: fuel, toll, driver, overhead and events
+    """
+    enabled = set(settings.enabled_components)
+    segments = [
+        (segment.country_code, segment.distance_km) for segment in route.country_segments
+    ]
+    truck = transport.truck_specs
+    driver = transport.driver_specs
+    event_types = [event.type for event in route.timeline_events]
+    return {
+        "fuel": fingerprint([
+            "fuel" in enabled,
+            _rates(settings, "fuel_rate"),
+            segments,
+            empty_driving.distance_km if empty_driving else None,
+            truck.fuel_consumption_loaded,
+            truck.fuel_consumption_empty
+        ]),
+        "toll": fingerprint([
+            "toll" in enabled,
+            _rates(settings, "toll_rate_"),
+            [
+                (segment.country_code, segment.distance_km,
+                 [step.model_dump() for step in segment.steps or []])
+                for segment in route.country_segments
+            ],
+            truck.toll_class,
+            truck.euro_class,
+            truck.co2_class,
+            str(business.id),
+            getattr(route, "route_type", None),
+            toll_rate_version,
+            toll_override_version
+        ]),
+        "driver": fingerprint([
+            "driver" in enabled,
+            {key: str(settings.rates.get(key)) for key in DRIVER_RATE_KEYS},
+            route.total_duration_hours,
+            driver.daily_rate,
+            driver.driving_time_rate,
+            driver.max_driving_hours,
+            driver.overtime_rate_multiplier
+        ]),
+        "overhead": fingerprint([
+            "overhead" in enabled,
+            {key: str(value) for key, value in business.cost_overheads.items()}
+        ]),
+        "events": fingerprint([
+            "events" in enabled,
+            event_types,
+            {f"{event_type}_rate": str(settings.rates.get(f"{event_type}_rate")) for event_type in event_types}
+        ])
+    }
+
+
+def inputs_hash(fingerprints: Dict[str, str], operating_countries: List[str]) -> str:
+    """Get the content hash of a whole cost calculation.
+
+    Combines the component fingerprints with the business's operating
+    countries, which decide whether the route can be priced at all.
+    """
+    return fingerprint([sorted(fingerprints.items()), sorted(operating_countries)])
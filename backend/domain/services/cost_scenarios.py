@@ -0,0 +1,227 @@
+"""Vectorized what-if pricing over grids of cost scenarios.
+
+Once a route's distances, durations and events are fixed, its fuel cost is
+linear in the fuel price, its driver cost is linear in the driver rates and
+its toll cost depends only on the toll class. A ``CostScenarioModel``
+therefore extracts a route's per-country figures once, and whole grids of
+scenarios are evaluated with NumPy broadcasting instead of re-running the
+Decimal pipeline per scenario. Grid results are floats and indicative; the
+scenario a user picks is priced exactly with
+``CostService.calculate_scenario_costs``.
+"""
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+# Cost components reported per scenario, in breakdown order
+COMPONENTS = ("fuel", "toll", "driver", "overhead", "events")
+# Largest grid (scenario count) evaluated in one call
+MAX_SCENARIOS = 100_000
+
+
+class CostScenario(NamedTuple):
+    """One point of a what-if grid."""
+    fuel_price_factor: float = 1.0
+    toll_class: Optional[str] = None
+    driver_rate_factor: float = 1.0
+    margin_percent: float = 0.0
+
+
+def _axis(values: Sequence[float], name: str, minimum: Optional[float] = 0.0) -> np.ndarray:
+    """Convert axis values to a validated 1-D float array."""
+    try:
+        array = np.asarray(values, dtype=float)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"{name} must be numbers") from e
+    if array.ndim != 1 or array.size == 0:
+        raise ValueError(f"{name} must be a non-empty list")
+    if not np.all(np.isfinite(array)):
+        raise ValueError(f"{name} must be finite")
+    if minimum is not None and np.any(array < minimum):
+        raise ValueError(f"{name} must be at least {minimum}")
+    return array
+
+
+class CostScenarioGrid:
+    """Costs and prices of every scenario of a grid.
+
+    Cost arrays have shape (fuel factors, toll classes, driver factors);
+    ``prices`` adds the margins as a last axis.
+    """
+
+    def __init__(
+        self,
+        route_id: UUID,
+        countries: Tuple[str, ...],
+        fuel_price_factors: np.ndarray,
+        toll_classes: Tuple[str, ...],
+        driver_rate_factors: np.ndarray,
+        margins: np.ndarray,
+        components: Dict[str, np.ndarray],
+        fuel_by_country: np.ndarray,
+        toll_by_country: np.ndarray
+    ):
+        """Initialize grid.
+
+        Args:
+            route_id: Route the scenarios were evaluated for
+            countries: Country codes in route order
+            fuel_price_factors: Multipliers applied to all fuel prices
+            toll_classes: Toll classes evaluated
+            driver_rate_factors: Multipliers applied to the driver rates
+            margins: Margins in percent applied on top of the cost
+            components: Cost per component, keyed by ``COMPONENTS``
+            fuel_by_country: Fuel cost per fuel factor and country
+            toll_by_country: Toll cost per toll class and country
+        """
+        self.route_id = route_id
+        self.countries = countries
+        self.fuel_price_factors = fuel_price_factors
+        self.toll_classes = toll_classes
+        self.driver_rate_factors = driver_rate_factors
+        self.margins = margins
+        self.components = components
+        self.fuel_by_country = fuel_by_country
+        self.toll_by_country = toll_by_country
+        self.totals = sum(components[name] for name in COMPONENTS)
+        self.prices = self.totals[..., np.newaxis] * (1.0 + margins / 100.0)
+
+    @property
+    def shape(self) -> Tuple[int, int, int, int]:
+        """Get the (fuel, toll, driver, margin) dimensions of the grid."""
+        return self.prices.shape
+
+    def scenario_at(self, fuel: int, toll: int, driver: int, margin: int = 0) -> CostScenario:
+        """Get the scenario at a grid index."""
+        return CostScenario(
+            fuel_price_factor=float(self.fuel_price_factors[fuel]),
+            toll_class=self.toll_classes[toll],
+            driver_rate_factor=float(self.driver_rate_factors[driver]),
+            margin_percent=float(self.margins[margin])
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the grid as nested lists for JSON responses."""
+        return {
+            "route_id": str(self.route_id),
+            "axes": {
+                "fuel_price_factors": self.fuel_price_factors.tolist(),
+                "toll_classes": list(self.toll_classes),
+                "driver_rate_factors": self.driver_rate_factors.tolist(),
+                "margins": self.margins.tolist()
+            },
+            "countries": list(self.countries),
+            "totals": np.round(self.totals, 2).tolist(),
+            "prices": np.round(self.prices, 2).tolist(),
+            "components": {name: np.round(value, 2).tolist() for name, value in self.components.items()},
+            "fuel_by_country": np.round(self.fuel_by_country, 2).tolist(),
+            "toll_by_country": np.round(self.toll_by_country, 2).tolist()
+        }
+
+
+class CostScenarioModel:
+    """Scenario-independent cost figures of one route, held as arrays."""
+
+    def __init__(
+        self,
+        route_id: UUID,
+        countries: Sequence[str],
+        fuel_by_country: Sequence[float],
+        toll_classes: Sequence[str],
+        toll_by_class: Sequence[Sequence[float]],
+        driver_cost: float,
+        overhead_cost: float,
+        event_cost: float
+    ):
+        """Initialize model.
+
+        Args:
+            route_id: Route the figures belong to
+            countries: Country codes in route order
+            fuel_by_country: Fuel cost per country at the configured fuel prices
+            toll_classes: Toll classes the tolls were calculated for
+            toll_by_class: Toll cost per toll class and country
+            driver_cost: Driver cost at the configured rates
+            overhead_cost: Business overhead cost
+            event_cost: Cost of all timeline events
+        """
+        self._route_id = route_id
+        self._countries = tuple(countries)
+        self._fuel_by_country = np.asarray(fuel_by_country, dtype=float)
+        self._toll_classes = tuple(toll_classes)
+        self._toll_by_class = np.asarray(toll_by_class, dtype=float).reshape(
+            len(self._toll_classes), len(self._countries)
+        )
+        if self._fuel_by_country.shape != (len(self._countries),):
+            raise ValueError("Fuel costs must have one value per country")
+        if not self._toll_classes:
+            raise ValueError("At least one toll class is required")
+        self._driver_cost = float(driver_cost)
+        self._overhead_cost = float(overhead_cost)
+        self._event_cost = float(event_cost)
+
+    @property
+    def route_id(self) -> UUID:
+        """Get the route the model was built for."""
+        return self._route_id
+
+    @property
+    def toll_classes(self) -> Tuple[str, ...]:
+        """Get the toll classes the model can evaluate."""
+        return self._toll_classes
+
+    def evaluate(
+        self,
+        fuel_price_factors: Sequence[float] = (1.0,),
+        driver_rate_factors: Sequence[float] = (1.0,),
+        margins: Sequence[float] = (0.0,),
+        toll_classes: Optional[Sequence[str]] = None
+    ) -> CostScenarioGrid:
+        """Evaluate every combination of the given scenario axes.
+
+        Args:
+            fuel_price_factors: Multipliers applied to all fuel prices
+            driver_rate_factors: Multipliers applied to the driver base and time rates
+            margins: Margins in percent
+            toll_classes: Toll classes to evaluate, all modelled classes if omitted
+
+        Returns:
+            Grid of component costs, totals and prices
+
+        Raises:
+            ValueError: If an axis is empty or invalid, a toll class was not
+                modelled, or the grid exceeds ``MAX_SCENARIOS``
+        """
+        fuel = _axis(fuel_price_factors, "fuel_price_factors")
+        driver = _axis(driver_rate_factors, "driver_rate_factors")
+        margin = _axis(margins, "margins", minimum=None)
+        classes = self._toll_classes if toll_classes is None else tuple(toll_classes)
+        unknown = [toll_class for toll_class in classes if toll_class not in self._toll_classes]
+        if not classes or unknown:
+            raise ValueError(f"Toll classes not modelled for this route: {unknown}")
+        size = fuel.size * len(classes) * driver.size * margin.size
+        if size > MAX_SCENARIOS:
+            raise ValueError(f"At most {MAX_SCENARIOS} scenarios per grid, got {size}")
+
+        fuel_by_country = fuel[:, np.newaxis] * self._fuel_by_country
+        toll_by_country = self._toll_by_class[[self._toll_classes.index(c) for c in classes]]
+        shape = (fuel.size, len(classes), driver.size)
+        components = {
+            "fuel": fuel_by_country.sum(axis=1)[:, np.newaxis, np.newaxis],
+            "toll": toll_by_country.sum(axis=1)[np.newaxis, :, np.newaxis],
+            "driver": (driver * self._driver_cost)[np.newaxis, np.newaxis, :],
+            "overhead": np.float64(self._overhead_cost),
+            "events": np.float64(self._event_cost)
+        }
+        return CostScenarioGrid(
+            route_id=self._route_id,
+            countries=self._countries,
+            fuel_price_factors=fuel,
+            toll_classes=classes,
+            driver_rate_factors=driver,
+            margins=margin,
+            components={name: np.broadcast_to(value, shape) for name, value in components.items()},
+            fuel_by_country=fuel_by_country,
+            toll_by_country=toll_by_country
+        )
@@ -1,6 +1,6 @@
 """Cost service for managing cost-related business logic."""
 from decimal import Decimal
-from typing import Dict, Optional, Protocol, List, Tuple, Any
+from typing import Dict, Hashable, Iterable, Optional, Protocol, List, Tuple, Any
 from uuid import UUID, uuid4
 import decimal
 import logging
@@ -10,9 +10,18 @@ from ..entities.route import Route, CountrySegment, EmptyDriving
 from ..entities.transport import Transport
 from ..entities.business import BusinessEntity
 from ..entities.rate_types import RateType, validate_rate
+from .cost_fingerprints import component_fingerprints, inputs_hash
+from .cost_scenarios import CostScenario, CostScenarioModel
+from .fixed_point import (
+    MILLIS, cents_map, cents_to_decimal, decimal_map, fuel_millilitres, micros_map, price_count,
+    price_metres, price_millilitres, price_milli_hours, to_cents, to_micros, to_millis
+)
 from ...infrastructure.repositories.rate_validation_repository import RateValidationRepository
 from ...infrastructure.data.fuel_rates import get_fuel_rate
 
+# Fuel price (EUR/L) used when the settings have no fuel rate
+DEFAULT_FUEL_RATE = Decimal("1.5")
+
 
 class CostSettingsRepository(Protocol):
     """Repository interface for CostSettings entity."""
@@ -24,6 +33,10 @@ class CostSettingsRepository(Protocol):
         """Find cost settings by route ID."""
         ...
 
+    def find_by_route_ids(self, route_ids: Iterable[UUID]) -> Dict[UUID, CostSettings]:
+        """Find cost settings for several routes, keyed by route ID."""
+        ...
+
     def create_settings(
         self,
         route_id: UUID,
@@ -52,6 +65,33 @@ class CostBreakdownRepository(Protocol):
         """Find cost breakdown by route ID."""
         ...
 
+    def find_latest_by_route_id(self, route_id: UUID) -> Optional[CostBreakdown]:
+        """Find the most recently saved cost breakdown of a route."""
+        ...
+
+    def mark_latest(self, breakdown_id: UUID) -> None:
+        """Make a stored breakdown the latest one of its route."""
+        ...
+
+    def find_by_input_hash(self, input_hash: str) -> Optional[CostBreakdown]:
+        """Find the most recent cost breakdown calculated from identical inputs."""
+        ...
+
+    def save_all(self, breakdowns: List[CostBreakdown]) -> List[CostBreakdown]:
+        """Save several cost breakdowns in a single transaction."""
+        ...
+
+
+class CostBreakdownMemo(Protocol):
+    """In-memory cache of cost breakdowns keyed by input hash."""
+    def get(self, key: Hashable) -> Optional[CostBreakdown]:
+        """Get a cached breakdown."""
+        ...
+
+    def set(self, key: Hashable, value: CostBreakdown) -> None:
+        """Cache a breakdown."""
+        ...
+
 
 class EmptyDrivingRepository(Protocol):
     """Repository interface for EmptyDriving entity."""
@@ -87,6 +127,34 @@ class TollCalculationPort(Protocol):
         """
         ...
 
+    def calculate_tolls(
+        self,
+        segments: List[CountrySegment],
+        truck_specs: dict,
+        business_entity_id: Optional[UUID] = None,
+        overrides: Optional[Dict[str, Any]] = None
+    ) -> List[Decimal]:
+        """Calculate toll costs for several segments of a route at once.
+
+        Args:
+            segments: Route segments in route order
+            truck_specs: Dictionary containing truck specifications
+            business_entity_id: Optional business entity ID for rate overrides
+            overrides: Optional dictionary with rate override settings
+
+        Returns:
+            Toll cost per segment, in segment order
+        """
+        ...
+
+    def get_rate_version(self) -> Optional[str]:
+        """Get the version stamp of the toll rates used for calculations."""
+        ...
+
+    def get_override_version(self, business_entity_id: UUID) -> Optional[str]:
+        """Get the version of a business entity's toll rate overrides."""
+        ...
+
 
 class RouteRepository(Protocol):
     """Repository interface for Route entity."""
@@ -94,6 +162,10 @@ class RouteRepository(Protocol):
         """Find route by ID."""
         ...
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Route]:
+        """Find routes with their empty driving records, keyed by ID."""
+        ...
+
 
 class TransportRepository(Protocol):
     """Repository interface for Transport entity."""
@@ -101,6 +173,10 @@ class TransportRepository(Protocol):
         """Find transport by ID."""
         ...
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Transport]:
+        """Find transports keyed by ID."""
+        ...
+
 
 class BusinessRepository(Protocol):
     """Repository interface for Business entity."""
@@ -108,6 +184,10 @@ class BusinessRepository(Protocol):
         """Find business entity by ID."""
         ...
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, BusinessEntity]:
+        """Find business entities keyed by ID."""
+        ...
+
 
 class CostService:
     """Service for managing cost-related business logic."""
@@ -121,7 +201,8 @@ class CostService:
         rate_validation_repo: RateValidationRepository,
         route_repo: RouteRepository,
         transport_repo: TransportRepository,
-        business_repo: BusinessRepository
+        business_repo: BusinessRepository,
+        breakdown_memo: Optional[CostBreakdownMemo] = None
     ):
         self._settings_repo = settings_repo
         self._breakdown_repo = breakdown_repo
@@ -131,6 +212,7 @@ class CostService:
         self._route_repo = route_repo
         self._transport_repo = transport_repo
         self._business_repo = business_repo
+        self._breakdown_memo = breakdown_memo
         self._logger = logging.getLogger(__name__)
 
     def validate_rates(self, rates: Dict[str, Decimal]) -> Tuple[bool, List[str]]:
@@ -399,9 +481,18 @@ class CostService:
         self,
         route: Route,
         transport: Transport,
-        business: BusinessEntity
+        business: BusinessEntity,
+        settings: Optional[CostSettings] = None,
+        empty_driving: Optional[EmptyDriving] = None,
+        previous: Optional[CostBreakdown] = None
     ) -> CostBreakdown:
-        """Calculate complete cost breakdown for a route."""
+        """Calculate complete cost breakdown for a route.
+
+        Settings and the empty driving record are looked up unless the
+        caller has already loaded them. Components of a ``previous``
+        breakdown whose input fingerprints still match are reused instead
+        of recalculated, so a rate edit only reprices what it affects.
+        """
         try:
             # Validate business entity operates in all route countries
             route_countries = {segment.country_code for segment in route.country_segments}
@@ -414,86 +505,111 @@ class CostService:
                 raise ValueError(f"Business entity does not operate in required countries: {missing_countries}")
 
             # Load cost settings
-            settings = self._settings_repo.find_by_route_id(route.id)
+            if settings is None:
+                settings = self._settings_repo.find_by_route_id(route.id)
             if not settings:
                 self._logger.error(f"Cost settings not found for route {route.id}")
                 raise ValueError("Cost settings not found for route")
 
             # Load empty driving record
-            empty_driving = self._empty_driving_repo.find_by_id(route.empty_driving_id)
+            if empty_driving is None:
+                empty_driving = self._empty_driving_repo.find_by_id(route.empty_driving_id)
             if not empty_driving:
                 self._logger.error(
                     f"Empty driving record not found for route {route.id}, empty_driving_id: {route.empty_driving_id}"
                 )
                 raise ValueError("Empty driving record not found for route")
 
+            # Reuse components whose inputs match the previous breakdown
+            fingerprints = self._component_fingerprints(route, transport, business, settings, empty_driving)
+            reused = {
+                component for component, value in fingerprints.items()
+                if previous is not None and previous.input_fingerprints.get(component) == value
+            }
+            if reused:
+                self._logger.info(f"Reusing unchanged cost components for route {route.id}: {sorted(reused)}")
+
+            # Rates are converted to micro-euros once; components are summed in cents
+            rates = micros_map(settings.rates)
+
             # Calculate fuel costs per country
             try:
-                fuel_costs = self._calculate_fuel_costs(route, transport, settings, empty_driving)
-                self._logger.info(f"Calculated fuel costs for route {route.id}: {fuel_costs}")
+                if "fuel" in reused:
+                    fuel_cents = cents_map(previous.fuel_costs)
+                else:
+                    fuel_cents = self._fuel_cents(route, transport, settings, rates, empty_driving)
+                self._logger.info(f"Calculated fuel costs for route {route.id}: {fuel_cents} cents")
             except Exception as e:
                 self._logger.error(f"Error calculating fuel costs for route {route.id}: {str(e)}")
                 raise
 
             # Calculate toll costs per country
             try:
-                toll_costs = self._calculate_toll_costs(route, transport, settings, business)
-                self._logger.info(f"Calculated toll costs for route {route.id}: {toll_costs}")
+                if "toll" in reused:
+                    toll_cents = cents_map(previous.toll_costs)
+                else:
+                    toll_cents = self._toll_cents(route, transport, settings, rates, business)
+                self._logger.info(f"Calculated toll costs for route {route.id}: {toll_cents} cents")
             except Exception as e:
                 self._logger.error(f"Error calculating toll costs for route {route.id}: {str(e)}")
                 raise
 
             # Calculate driver costs
             try:
-                driver_costs = self._calculate_driver_costs(route, transport, settings)
-                self._logger.info(f"Calculated driver costs for route {route.id}: {driver_costs}")
+                if "driver" in reused:
+                    driver_cents = cents_map(previous.driver_costs)
+                else:
+                    driver_cents = self._driver_cents(route, transport, settings, rates)
+                self._logger.info(f"Calculated driver costs for route {route.id}: {driver_cents} cents")
             except Exception as e:
                 self._logger.error(f"Error calculating driver costs for route {route.id}: {str(e)}")
                 raise
 
             # Calculate overhead costs
             try:
-                overhead_costs = self._calculate_overhead_costs(business, settings)
-                self._logger.info(f"Calculated overhead costs for route {route.id}: {overhead_costs}")
+                if "overhead" in reused:
+                    overhead_cents = to_cents(previous.overhead_costs)
+                else:
+                    overhead_cents = self._overhead_cents(business, settings)
+                self._logger.info(f"Calculated overhead costs for route {route.id}: {overhead_cents} cents")
             except Exception as e:
                 self._logger.error(f"Error calculating overhead costs for route {route.id}: {str(e)}")
                 raise
 
             # Calculate timeline event costs
             try:
-                timeline_event_costs = self._calculate_event_costs(route, settings)
-                self._logger.info(f"Calculated timeline event costs for route {route.id}: {timeline_event_costs}")
+                if "events" in reused:
+                    event_cents = cents_map(previous.timeline_event_costs)
+                else:
+                    event_cents = self._event_cents(route, settings, rates)
+                self._logger.info(f"Calculated timeline event costs for route {route.id}: {event_cents} cents")
             except Exception as e:
                 self._logger.error(f"Error calculating timeline event costs for route {route.id}: {str(e)}")
                 raise
 
-            # Calculate total cost
-            try:
-                total_cost = (
-                    sum(Decimal(str(value)) for value in fuel_costs.values()) +
-                    sum(Decimal(str(value[0])) if isinstance(value, tuple) else Decimal(str(value)) for value in toll_costs.values()) +
-                    driver_costs["total_cost"] +
-                    overhead_costs +
-                    sum(Decimal(str(value)) for value in timeline_event_costs.values())
-                )
-                self._logger.info(f"Calculated total cost for route {route.id}: {total_cost}")
-            except Exception as e:
-                self._logger.error(f"Error calculating total cost for route {route.id}: {str(e)}")
-                raise
+            # Calculate total cost; sums of cents are exact
+            total_cents = (
+                sum(fuel_cents.values()) +
+                sum(toll_cents.values()) +
+                driver_cents["total_cost"] +
+                overhead_cents +
+                sum(event_cents.values())
+            )
+            self._logger.info(f"Calculated total cost for route {route.id}: {cents_to_decimal(total_cents)}")
 
-            # Create and return cost breakdown
+            # Create and return cost breakdown, converting back to Decimal
             return CostBreakdown(
                 id=uuid4(),
                 route_id=route.id,
-                fuel_costs=fuel_costs,
-                toll_costs={
-                    country: value[0] if isinstance(value, tuple) else value
-                    for country, value in toll_costs.items()
-                },
-                driver_costs=driver_costs,
-                overhead_costs=overhead_costs,
-                timeline_event_costs=timeline_event_costs,
-                total_cost=total_cost
+                fuel_costs=decimal_map(fuel_cents),
+                toll_costs=decimal_map(toll_cents),
+                driver_costs=decimal_map(driver_cents),
+                overhead_costs=cents_to_decimal(overhead_cents),
+                timeline_event_costs=decimal_map(event_cents),
+                total_cost=cents_to_decimal(total_cents),
+                toll_rate_version=self._toll_calculator.get_rate_version(),
+                input_fingerprints=fingerprints,
+                input_hash=inputs_hash(fingerprints, business.operating_countries)
             )
 
         except Exception as e:
@@ -510,216 +626,215 @@ class CostService:
         empty_driving: EmptyDriving
     ) -> Dict[str, Decimal]:
         """Calculate fuel costs per country segment."""
+        return decimal_map(self._fuel_cents(route, transport, settings, micros_map(settings.rates), empty_driving))
+
+    def _calculate_toll_costs(
+        self,
+        route: Route,
+        transport: Transport,
+        settings: CostSettings,
+        business: Optional[BusinessEntity] = None
+    ) -> Dict[str, Decimal]:
+        """Calculate toll costs per country segment."""
+        return decimal_map(self._toll_cents(route, transport, settings, micros_map(settings.rates), business))
+
+    def _calculate_driver_costs(
+        self,
+        route: Route,
+        transport: Transport,
+        settings: CostSettings
+    ) -> Dict[str, Decimal]:
+        """
+        Calculate detailed driver costs for the route.
+        
+        Args:
+            route: Route to calculate costs for
+            transport: Transport with driver specifications
+            settings: Cost settings with enabled components
+            
+        Returns:
+            Dictionary containing breakdown of driver costs
+        """
+        return decimal_map(self._driver_cents(route, transport, settings, micros_map(settings.rates)))
+
+    def _calculate_overhead_costs(
+        self,
+        business: BusinessEntity,
+        settings: CostSettings
+    ) -> Decimal:
+        """Calculate business overhead costs."""
+        return cents_to_decimal(self._overhead_cents(business, settings))
+
+    def _calculate_event_costs(
+        self,
+        route: Route,
+        settings: CostSettings
+    ) -> Dict[str, Decimal]:
+        """Calculate costs for timeline events."""
+        return decimal_map(self._event_cents(route, settings, micros_map(settings.rates)))
+
+    def _fuel_cents(
+        self,
+        route: Route,
+        transport: Transport,
+        settings: CostSettings,
+        rates: Dict[str, int],
+        empty_driving: Optional[EmptyDriving]
+    ) -> Dict[str, int]:
+        """Calculate fuel costs per country in cents.
+
+        Args:
+            rates: Settings rates in micro-euros
+        """
         if "fuel" not in settings.enabled_components:
-            return {segment.country_code: Decimal("0")
-                   for segment in route.country_segments}
+            return {segment.country_code: 0 for segment in route.country_segments}
 
-        costs = {}
+        default_rate = rates.get("fuel_rate", to_micros(DEFAULT_FUEL_RATE))
+        loaded = to_micros(transport.truck_specs.fuel_consumption_loaded)
+        costs: Dict[str, int] = {}
 
-        # First, calculate costs for main route segments
+        # Loaded consumption on the main route segments; a country can be
+        # crossed more than once on multi-stop routes
         for segment in route.country_segments:
             country_code = segment.country_code
-            # Get country-specific fuel rate, fall back to default if not found
-            rate_key = f"fuel_rate_{country_code}"
-            fuel_rate = settings.rates.get(rate_key)
-            
-            if fuel_rate is None:
-                # Fall back to default rate if country-specific rate not found
-                fuel_rate = settings.rates.get("fuel_rate", Decimal("1.5"))
-            
-            # Convert to Decimal if needed
-            if not isinstance(fuel_rate, Decimal):
-                fuel_rate = Decimal(str(fuel_rate))
-            
-            # Calculate based on loaded consumption
-            consumption = Decimal(str(transport.truck_specs.fuel_consumption_loaded)) * Decimal(str(segment.distance_km))
-            costs[country_code] = consumption * fuel_rate
-            self._logger.info(f"Calculated fuel cost for {country_code}: {costs[country_code]} ({consumption} L * {fuel_rate} EUR/L)")
+            fuel_rate = rates.get(f"fuel_rate_{country_code}", default_rate)
+            millilitres = fuel_millilitres(loaded, to_millis(segment.distance_km))
+            costs[country_code] = costs.get(country_code, 0) + price_millilitres(millilitres, fuel_rate)
 
-        # Then add empty driving cost to first country
+        # Empty driving is charged to the first country
         if route.country_segments and empty_driving:
             first_country = route.country_segments[0].country_code
-            rate_key = f"fuel_rate_{first_country}"
-            fuel_rate = settings.rates.get(rate_key)
-            
-            if fuel_rate is None:
-                fuel_rate = settings.rates.get("fuel_rate", Decimal("1.5"))
-            
-            if not isinstance(fuel_rate, Decimal):
-                fuel_rate = Decimal(str(fuel_rate))
-                
-            empty_consumption = Decimal(str(transport.truck_specs.fuel_consumption_empty)) * Decimal(str(empty_driving.distance_km))
-            empty_cost = empty_consumption * fuel_rate
-            costs[first_country] = costs.get(first_country, Decimal("0")) + empty_cost
-            self._logger.info(f"Added empty driving fuel cost to {first_country}: {empty_cost} ({empty_consumption} L * {fuel_rate} EUR/L)")
+            fuel_rate = rates.get(f"fuel_rate_{first_country}", default_rate)
+            millilitres = fuel_millilitres(
+                to_micros(transport.truck_specs.fuel_consumption_empty),
+                to_millis(empty_driving.distance_km)
+            )
+            costs[first_country] = costs.get(first_country, 0) + price_millilitres(millilitres, fuel_rate)
 
-        self._logger.info(f"Final fuel costs per country: {costs}")
+        self._logger.debug(f"Fuel costs per country (cents): {costs}")
         return costs
 
-    def _calculate_toll_costs(
+    def _toll_cents(
         self,
         route: Route,
         transport: Transport,
         settings: CostSettings,
+        rates: Dict[str, int],
         business: Optional[BusinessEntity] = None
-    ) -> Dict[str, Decimal]:
-        """Calculate toll costs per country segment."""
+    ) -> Dict[str, int]:
+        """Calculate toll costs per country in cents.
+
+        Segments with a ``toll_rate_<country>`` setting are priced per km;
+        the rest are resolved by the toll calculator in one call.
+        """
         if "toll" not in settings.enabled_components:
-            return {segment.country_code: Decimal("0")
-                   for segment in route.country_segments}
-
-        costs = {}
-        truck_specs = {
-            "toll_class": transport.truck_specs.toll_class,
-            "euro_class": transport.truck_specs.euro_class,
-            "co2_class": transport.truck_specs.co2_class
-        }
+            return {segment.country_code: 0 for segment in route.country_segments}
 
+        costs: Dict[str, int] = {}
+        calculated = []
         for segment in route.country_segments:
             country_code = segment.country_code
-            # First try to get rate from settings
-            rate_key = f"toll_rate_{country_code}"
-            if rate_key in settings.rates:
-                # Use the rate from settings
-                rate = Decimal(str(settings.rates[rate_key]))
-                toll_cost = rate * Decimal(str(segment.distance_km))
-                costs[country_code] = toll_cost
+            costs.setdefault(country_code, 0)
+            rate = rates.get(f"toll_rate_{country_code}")
+            if rate is not None:
+                costs[country_code] += price_metres(to_millis(segment.distance_km), rate)
             else:
-                # Fallback to calculator if no rate in settings
-                toll_cost = self._toll_calculator.calculate_toll(
-                    segment,
-                    truck_specs,
-                    business.id if business else None,
-                    {
-                        "vehicle_class": transport.truck_specs.toll_class,
-                        "route_type": getattr(route, "route_type", None)
-                    } if business else None
-                )
-                costs[country_code] = toll_cost
+                calculated.append(segment)
+
+        if calculated:
+            # Resolve all remaining segments against the business overrides at once
+            tolls = self._toll_calculator.calculate_tolls(
+                calculated,
+                {
+                    "toll_class": transport.truck_specs.toll_class,
+                    "euro_class": transport.truck_specs.euro_class,
+                    "co2_class": transport.truck_specs.co2_class
+                },
+                business.id if business else None,
+                {
+                    "vehicle_class": transport.truck_specs.toll_class,
+                    "route_type": getattr(route, "route_type", None)
+                } if business else None
+            )
+            for segment, toll_cost in zip(calculated, tolls):
+                costs[segment.country_code] += to_cents(toll_cost)
 
         return costs
 
-    def _calculate_driver_costs(
+    def _driver_cents(
         self,
         route: Route,
         transport: Transport,
-        settings: CostSettings
-    ) -> Dict[str, Decimal]:
-        """
-        Calculate detailed driver costs for the route.
-        
-        Args:
-            route: Route to calculate costs for
-            transport: Transport with driver specifications
-            settings: Cost settings with enabled components
-            
-        Returns:
-            Dictionary containing breakdown of driver costs
+        settings: CostSettings,
+        rates: Dict[str, int]
+    ) -> Dict[str, int]:
+        """Calculate driver cost components in cents.
+
+        Days are whole driving hours divided by 24, rounded up. Hours beyond
+        ``max_driving_hours`` per day are paid at the overtime multiplier.
         """
         if "driver" not in settings.enabled_components:
-            return {
-                "base_cost": Decimal("0"),
-                "regular_hours_cost": Decimal("0"),
-                "overtime_cost": Decimal("0"),
-                "total_cost": Decimal("0")
-            }
+            return {"base_cost": 0, "regular_hours_cost": 0, "overtime_cost": 0, "total_cost": 0}
 
-        # Get rates from settings, fall back to transport specs if not set
-        base_rate = settings.rates.get("driver_base_rate")
-        time_rate = settings.rates.get("driver_time_rate")
-        
-        self._logger.info(f"Using driver rates from settings - base_rate: {base_rate}, time_rate: {time_rate}")
-        
-        # Only fall back to transport specs if rates are None (not found in settings)
+        # Fall back to transport specs only if the rates are not in the settings
+        base_rate = rates.get("driver_base_rate")
         if base_rate is None:
-            base_rate = Decimal(str(transport.driver_specs.daily_rate))
-            self._logger.info(f"Falling back to transport spec base_rate: {base_rate}")
-        elif isinstance(base_rate, (int, float, str)):
-            base_rate = Decimal(str(base_rate))
-            
+            base_rate = to_micros(transport.driver_specs.daily_rate)
+        time_rate = rates.get("driver_time_rate")
         if time_rate is None:
-            time_rate = Decimal(str(transport.driver_specs.driving_time_rate))
-            self._logger.info(f"Falling back to transport spec time_rate: {time_rate}")
-        elif isinstance(time_rate, (int, float, str)):
-            time_rate = Decimal(str(time_rate))
-
-        # Calculate days (round up partial days)
-        total_hours = Decimal(str(route.total_duration_hours))
-        days = (int(total_hours) + 23) // 24
-        self._logger.info(f"Calculated {days} days from {total_hours} total hours")
-
-        # Calculate base cost using the configured rate
-        base_cost = base_rate * Decimal(str(days))
-        self._logger.info(f"Calculated base cost: {base_cost} ({base_rate} * {days})")
-
-        # Calculate regular and overtime hours
-        max_regular_hours = transport.driver_specs.max_driving_hours * days
-        regular_hours = min(float(total_hours), float(max_regular_hours))
-        overtime_hours = max(0, float(total_hours) - regular_hours)
-        self._logger.info(f"Hours breakdown - regular: {regular_hours}, overtime: {overtime_hours}")
-
-        # Calculate time-based costs using the configured rate
-        regular_hours_cost = Decimal(str(regular_hours)) * time_rate
-        self._logger.info(f"Regular hours cost: {regular_hours_cost} ({regular_hours} * {time_rate})")
-        
-        overtime_cost = (
-            Decimal(str(overtime_hours)) * 
-            time_rate * 
-            transport.driver_specs.overtime_rate_multiplier
-        )
-        self._logger.info(f"Overtime cost: {overtime_cost}")
+            time_rate = to_micros(transport.driver_specs.driving_time_rate)
 
-        # Calculate total cost
-        total_cost = base_cost + regular_hours_cost + overtime_cost
-        self._logger.info(f"Total driver cost: {total_cost}")
+        milli_hours = to_millis(route.total_duration_hours)
+        days = (milli_hours // MILLIS + 23) // 24
+        regular_milli_hours = min(milli_hours, transport.driver_specs.max_driving_hours * days * MILLIS)
+        overtime_milli_hours = max(0, milli_hours - regular_milli_hours)
 
+        base_cost = price_count(days, base_rate)
+        regular_hours_cost = price_milli_hours(regular_milli_hours, time_rate)
+        overtime_cost = price_milli_hours(
+            overtime_milli_hours, time_rate, to_millis(transport.driver_specs.overtime_rate_multiplier)
+        )
+        self._logger.debug(
+            f"Driver costs (cents) for {days} days, {regular_milli_hours} regular and "
+            f"{overtime_milli_hours} overtime milli-hours: {base_cost}, {regular_hours_cost}, {overtime_cost}"
+        )
         return {
             "base_cost": base_cost,
             "regular_hours_cost": regular_hours_cost,
             "overtime_cost": overtime_cost,
-            "total_cost": total_cost
+            "total_cost": base_cost + regular_hours_cost + overtime_cost
         }
 
-    def _calculate_overhead_costs(
-        self,
-        business: BusinessEntity,
-        settings: CostSettings
-    ) -> Decimal:
-        """Calculate business overhead costs."""
+    def _overhead_cents(self, business: BusinessEntity, settings: CostSettings) -> int:
+        """Calculate business overhead costs in cents."""
         if "overhead" not in settings.enabled_components:
-            return Decimal("0")
+            return 0
+        return sum(to_cents(value) for value in business.cost_overheads.values())
 
-        # Sum all overhead costs
-        return sum(business.cost_overheads.values())
-
-    def _calculate_event_costs(
+    def _event_cents(
         self,
         route: Route,
-        settings: CostSettings
-    ) -> Dict[str, Decimal]:
-        """Calculate costs for timeline events."""
+        settings: CostSettings,
+        rates: Dict[str, int]
+    ) -> Dict[str, int]:
+        """Calculate timeline event costs per event type in cents.
+
+        Event types without a ``<type>_rate`` setting use the configured
+        default event rates.
+        """
         if "events" not in settings.enabled_components:
-            return {event.type: Decimal("0") for event in route.timeline_events}
+            return {event.type: 0 for event in route.timeline_events}
 
-        event_costs = {}
-        for event in route.timeline_events:
-            # Try to get specific rate for event type, fall back to default if not found
-            rate_key = f"{event.type}_rate"
-            event_rate = settings.rates.get(rate_key)
-            
-            if event_rate is None:
-                # Fall back to default rates from configuration
-                from ...infrastructure.data.event_rates import EVENT_RATES
-                event_rate = EVENT_RATES.get(event.type, Decimal("50"))
-            
-            # Convert to Decimal if needed
-            if not isinstance(event_rate, Decimal):
-                event_rate = Decimal(str(event_rate))
-                
-            event_costs[event.type] = event_rate
+        from ...infrastructure.data.event_rates import EVENT_RATES
 
-        self._logger.info(f"Calculated event costs for route {route.id}: {event_costs}")
-        return event_costs
+        costs: Dict[str, int] = {}
+        for event in route.timeline_events:
+            rate = rates.get(f"{event.type}_rate")
+            if rate is None:
+                rate = to_micros(EVENT_RATES.get(event.type, Decimal("50")))
+            # Multi-stop routes have several events of one type
+            costs[event.type] = costs.get(event.type, 0) + price_count(1, rate)
+        return costs
 
     def calculate_cost_breakdown(self, route: Route, transport: Transport) -> CostBreakdown:
         """Calculate the cost breakdown for a route with a given transport."""
@@ -730,7 +845,7 @@ class CostService:
         # Calculate costs for each timeline event
         for event in route.timeline_events:
             event_cost = self._calculate_event_cost(event, transport)
-            timeline_event_costs[event.type] = event_cost
+            timeline_event_costs[event.type] = timeline_event_costs.get(event.type, Decimal("0")) + event_cost
             total_cost += event_cost
 
         # Add empty driving costs if applicable
@@ -862,9 +977,9 @@ class CostService:
             route_id: ID of the route to get breakdown for
             
         Returns:
-            Cost breakdown if found, None otherwise
+            Latest cost breakdown if found, None otherwise
         """
-        return self._breakdown_repo.find_by_route_id(route_id)
+        return self._breakdown_repo.find_latest_by_route_id(route_id)
 
     def calculate_and_save_costs(
         self,
@@ -883,6 +998,32 @@ class CostService:
         Returns:
             Calculated cost breakdown
             
+        Raises:
+            ValueError: If required entities not found or validation fails
+        """
+        return self.calculate_or_reuse_costs(route_id, transport_id, business_entity_id)[0]
+
+    def calculate_or_reuse_costs(
+        self,
+        route_id: UUID,
+        transport_id: UUID,
+        business_entity_id: UUID
+    ) -> Tuple[CostBreakdown, bool]:
+        """
+        Calculate and save costs for a route unless identical inputs were priced before.
+
+        Breakdowns are looked up by the content hash of their inputs, first
+        in the in-memory memo and then in the repository. A breakdown priced
+        for another route with identical inputs is copied to this route.
+
+        Args:
+            route_id: ID of the route to calculate costs for
+            transport_id: ID of the transport used
+            business_entity_id: ID of the business entity
+
+        Returns:
+            Tuple of (cost breakdown, whether it was reused)
+
         Raises:
             ValueError: If required entities not found or validation fails
         """
@@ -898,9 +1039,248 @@ class CostService:
         
         if not route or not transport or not business:
             raise ValueError("Required entities not found")
-            
-        # Calculate costs
-        breakdown = self.calculate_costs(route, transport, business)
+
+        settings = self._settings_repo.find_by_route_id(route_id)
+        empty_driving = route.empty_driving or self._empty_driving_repo.find_by_id(route.empty_driving_id)
+        if not settings or not empty_driving:
+            # Let calculate_costs report the missing input
+            input_hash = None
+        else:
+            fingerprints = self._component_fingerprints(route, transport, business, settings, empty_driving)
+            input_hash = inputs_hash(fingerprints, business.operating_countries)
+            cached = self._find_memoized_breakdown(input_hash)
+            if cached is not None:
+                if cached.route_id != route.id:
+                    cached = self._breakdown_repo.save(
+                        cached.model_copy(update={"id": uuid4(), "route_id": route.id})
+                    )
+                    self._remember_breakdown(cached)
+                else:
+                    # Reported breakdown must stay the route's latest one
+                    self._breakdown_repo.mark_latest(cached.id)
+                self._logger.info(f"Reusing cost breakdown {cached.id} for route {route.id}")
+                return cached, True
+
+        # Calculate costs, reusing components unchanged since the last breakdown
+        breakdown = self.calculate_costs(
+            route, transport, business,
+            settings=settings,
+            empty_driving=empty_driving,
+            previous=self._breakdown_repo.find_latest_by_route_id(route_id)
+        )
         
         # Save and return breakdown
-        return self._breakdown_repo.save(breakdown) 
\ No newline at end of file
+        saved = self._breakdown_repo.save(breakdown)
+        self._remember_breakdown(saved)
+        return saved, False
+
+    def calculate_and_save_costs_batch(
+        self,
+        route_ids: List[UUID]
+    ) -> Tuple[List[CostBreakdown], Dict[UUID, str]]:
+        """
+        Calculate and save costs for many routes at once.
+
+        Routes (with their empty driving), cost settings, transports and
+        business entities are each loaded with bulk IN queries, breakdowns
+        are computed in one pass and saved in a single transaction. A route
+        that cannot be priced is reported in the errors and does not stop
+        the others.
+
+        Args:
+            route_ids: IDs of the routes to calculate costs for
+
+        Returns:
+            Tuple of (saved breakdowns in input order, error message per failed route ID)
+
+        Raises:
+            ValueError: If saving the breakdowns fails; nothing is saved then
+        """
+        route_ids = list(dict.fromkeys(route_ids))
+        routes = self._route_repo.find_by_ids(route_ids)
+        settings_by_route = self._settings_repo.find_by_route_ids(route_ids)
+        transports = self._transport_repo.find_by_ids({route.transport_id for route in routes.values()})
+        businesses = self._business_repo.find_by_ids({route.business_entity_id for route in routes.values()})
+
+        breakdowns = []
+        errors = {}
+        for route_id in route_ids:
+            route = routes.get(route_id)
+            settings = settings_by_route.get(route_id)
+            if not route:
+                errors[route_id] = "Route not found"
+                continue
+            if not settings:
+                errors[route_id] = f"No cost settings found for route {route_id}"
+                continue
+            is_valid, setting_errors = self.validate_cost_settings(settings)
+            if not is_valid:
+                errors[route_id] = f"Cost calculation validation failed: {'; '.join(setting_errors)}"
+                continue
+            transport = transports.get(route.transport_id)
+            business = businesses.get(route.business_entity_id)
+            if not transport or not business:
+                errors[route_id] = "Required entities not found"
+                continue
+            try:
+                breakdowns.append(self.calculate_costs(
+                    route, transport, business,
+                    settings=settings,
+                    empty_driving=route.empty_driving
+                ))
+            except Exception as e:
+                errors[route_id] = str(e)
+
+        saved = self._breakdown_repo.save_all(breakdowns) if breakdowns else []
+        self._logger.info(
+            f"Batch cost calculation: {len(saved)} saved, {len(errors)} failed of {len(route_ids)} routes"
+        )
+        return saved, errors
+
+    def build_scenario_model(
+        self,
+        route_id: UUID,
+        toll_classes: Optional[List[str]] = None
+    ) -> CostScenarioModel:
+        """
+        Extract the scenario-independent cost figures of a route.
+
+        The route is priced once with its saved settings; tolls are
+        calculated once per requested toll class.
+
+        Args:
+            route_id: ID of the route to model
+            toll_classes: Toll classes to model, the transport's own class if omitted
+
+        Returns:
+            Model that evaluates scenario grids without further lookups
+
+        Raises:
+            ValueError: If required entities are not found or the route cannot be priced
+        """
+        route, transport, business, settings = self._load_scenario_inputs(route_id)
+        empty_driving = route.empty_driving
+        breakdown = self.calculate_costs(route, transport, business, settings=settings, empty_driving=empty_driving)
+
+        countries = list(dict.fromkeys(segment.country_code for segment in route.country_segments))
+        classes = list(dict.fromkeys(toll_classes or [transport.truck_specs.toll_class]))
+        toll_by_class = []
+        for toll_class in classes:
+            tolls = self._calculate_toll_costs(
+                route, self._with_toll_class(transport, toll_class), settings, business
+            )
+            toll_by_class.append([tolls.get(country, Decimal("0")) for country in countries])
+
+        return CostScenarioModel(
+            route_id=route.id,
+            countries=countries,
+            fuel_by_country=[breakdown.fuel_costs.get(country, Decimal("0")) for country in countries],
+            toll_classes=classes,
+            toll_by_class=toll_by_class,
+            driver_cost=breakdown.driver_costs["total_cost"],
+            overhead_cost=breakdown.overhead_costs,
+            event_cost=sum(breakdown.timeline_event_costs.values(), Decimal("0"))
+        )
+
+    def calculate_scenario_costs(
+        self,
+        route_id: UUID,
+        scenario: CostScenario
+    ) -> Tuple[CostBreakdown, Decimal]:
+        """
+        Price one scenario exactly with Decimal arithmetic.
+
+        The breakdown is not saved; the route's settings stay unchanged.
+
+        Args:
+            route_id: ID of the route to price
+            scenario: Fuel, toll class, driver rate and margin adjustments
+
+        Returns:
+            Tuple of (cost breakdown, final price including the margin)
+
+        Raises:
+            ValueError: If required entities are not found or the route cannot be priced
+        """
+        route, transport, business, settings = self._load_scenario_inputs(route_id)
+
+        rates = dict(settings.rates)
+        fuel_factor = Decimal(str(scenario.fuel_price_factor))
+        rates["fuel_rate"] = Decimal(str(rates.get("fuel_rate", DEFAULT_FUEL_RATE)))
+        for key in rates:
+            if key == "fuel_rate" or key.startswith("fuel_rate_"):
+                rates[key] = Decimal(str(rates[key])) * fuel_factor
+        driver_factor = Decimal(str(scenario.driver_rate_factor))
+        base_rate = rates.get("driver_base_rate")
+        time_rate = rates.get("driver_time_rate")
+        if base_rate is None:
+            base_rate = transport.driver_specs.daily_rate
+        if time_rate is None:
+            time_rate = transport.driver_specs.driving_time_rate
+        rates["driver_base_rate"] = Decimal(str(base_rate)) * driver_factor
+        rates["driver_time_rate"] = Decimal(str(time_rate)) * driver_factor
+
+        if scenario.toll_class is not None:
+            transport = self._with_toll_class(transport, scenario.toll_class)
+        breakdown = self.calculate_costs(
+            route, transport, business,
+            settings=settings.model_copy(update={"rates": rates}),
+            empty_driving=route.empty_driving
+        )
+        margin_multiplier = Decimal("1.0") + Decimal(str(scenario.margin_percent)) / Decimal("100.0")
+        return breakdown, breakdown.total_cost * margin_multiplier
+
+    def _load_scenario_inputs(
+        self,
+        route_id: UUID
+    ) -> Tuple[Route, Transport, BusinessEntity, CostSettings]:
+        """Load the route, transport, business entity and settings a scenario is priced from."""
+        route = self._route_repo.find_by_id(route_id)
+        if not route:
+            raise ValueError("Route not found")
+        settings = self._settings_repo.find_by_route_id(route_id)
+        if not settings:
+            raise ValueError(f"No cost settings found for route {route_id}")
+        transport = self._transport_repo.find_by_id(route.transport_id)
+        business = self._business_repo.find_by_id(route.business_entity_id)
+        if not transport or not business:
+            raise ValueError("Required entities not found")
+        return route, transport, business, settings
+
+    @staticmethod
+    def _with_toll_class(transport: Transport, toll_class: str) -> Transport:
+        """Get a copy of a transport classified in another toll class."""
+        return transport.model_copy(update={
+            "truck_specs": transport.truck_specs.model_copy(update={"toll_class": toll_class})
+        })
+
+    def _component_fingerprints(
+        self,
+        route: Route,
+        transport: Transport,
+        business: BusinessEntity,
+        settings: CostSettings,
+        empty_driving: Optional[EmptyDriving]
+    ) -> Dict[str, str]:
+        """Fingerprint the inputs of each cost component, including toll rate versions."""
+        return component_fingerprints(
+            route, transport, business, settings, empty_driving,
+            toll_rate_version=self._toll_calculator.get_rate_version(),
+            toll_override_version=self._toll_calculator.get_override_version(business.id)
+        )
+
+    def _find_memoized_breakdown(self, input_hash: str) -> Optional[CostBreakdown]:
+        """Find a breakdown by input hash in the memo, falling back to the repository."""
+        if self._breakdown_memo is not None:
+            cached = self._breakdown_memo.get(input_hash)
+            if cached is not None:
+                return cached
+        stored = self._breakdown_repo.find_by_input_hash(input_hash)
+        if stored is not None:
+            self._remember_breakdown(stored)
+        return stored
+
+    def _remember_breakdown(self, breakdown: CostBreakdown) -> None:
+        """Add a breakdown to the memo."""
+        if self._breakdown_memo is not None and breakdown.input_hash:
+            self._breakdown_memo.set(breakdown.input_hash, breakdown)
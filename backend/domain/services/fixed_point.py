@@ -0,0 +1,117 @@
+"""Scaled-integer arithmetic for cost calculations.
+
+Cost breakdowns are computed on integers in fixed units instead of
+Decimal or float values:
+
+- money: euro cents
+- rates: micro-euros per unit (EUR/L, EUR/km, EUR/h, EUR/day)
+- distances: metres (milli-km)
+- fuel: millilitres
+- fuel consumption: microlitres per km
+- durations: milli-hours
+- multipliers: thousandths
+
+Rounding rules, all half up (away from zero):
+
+1. Every input is rounded to its unit once, when it enters the engine.
+2. Fuel quantities are rounded to millilitres before they are priced.
+3. Every line item (segment fuel, segment toll, driver component,
+   overhead item, event) is rounded to cents once, from the exact
+   product of its integer inputs.
+4. Sums of line items are exact.
+
+Converting cents back to Decimal is exact.
+"""
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, Mapping, Union
+
+Number = Union[int, float, str, Decimal]
+
+CENTS_PER_EURO = 100
+MICROS = 1_000_000
+MILLIS = 1_000
+
+
+def scale(value: Number, units_per_one: int) -> int:
+    """Convert a number to integer units of ``1 / units_per_one``."""
+    if isinstance(value, int):
+        return value * units_per_one
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return int((value * units_per_one).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def div_half_up(numerator: int, denominator: int) -> int:
+    """Divide integers, rounding half away from zero.
+
+    ``denominator`` must be a positive even number, which holds for the
+    powers of ten used as unit conversions.
+    """
+    if numerator < 0:
+        return -((-numerator + denominator // 2) // denominator)
+    return (numerator + denominator // 2) // denominator
+
+
+def to_cents(value: Number) -> int:
+    """Convert a euro amount to cents."""
+    return scale(value, CENTS_PER_EURO)
+
+
+def to_micros(value: Number) -> int:
+    """Convert a rate to micro-euros per unit."""
+    return scale(value, MICROS)
+
+
+def to_millis(value: Number) -> int:
+    """Convert km to metres, hours to milli-hours or a multiplier to thousandths."""
+    return scale(value, MILLIS)
+
+
+def cents_to_decimal(cents: int) -> Decimal:
+    """Convert cents to a euro Decimal with two places."""
+    return Decimal(cents).scaleb(-2)
+
+
+def fuel_millilitres(consumption_ul_per_km: int, distance_m: int) -> int:
+    """Get the fuel used over a distance, in millilitres."""
+    # uL/km * m = 1e-9 L
+    return div_half_up(consumption_ul_per_km * distance_m, MICROS)
+
+
+def price_millilitres(millilitres: int, rate_micros: int) -> int:
+    """Price a fuel quantity at a rate per litre, in cents."""
+    # mL * uEUR/L = 1e-9 EUR
+    return div_half_up(millilitres * rate_micros, 10_000_000)
+
+
+def price_metres(distance_m: int, rate_micros: int) -> int:
+    """Price a distance at a rate per km, in cents."""
+    # m * uEUR/km = 1e-9 EUR
+    return div_half_up(distance_m * rate_micros, 10_000_000)
+
+
+def price_milli_hours(milli_hours: int, rate_micros: int, multiplier_millis: int = MILLIS) -> int:
+    """Price a duration at a rate per hour and an optional multiplier, in cents."""
+    # mh * uEUR/h * 1e-3 = 1e-12 EUR
+    return div_half_up(milli_hours * rate_micros * multiplier_millis, 10_000_000_000)
+
+
+def price_count(count: int, rate_micros: int) -> int:
+    """Price a whole number of units (days, events) at a rate per unit, in cents."""
+    # uEUR = 1e-6 EUR
+    return div_half_up(count * rate_micros, 10_000)
+
+
+def micros_map(rates: Mapping[str, Number]) -> Dict[str, int]:
+    """Convert a mapping of rates to micro-euros."""
+    return {key: to_micros(value) for key, value in rates.items()}
+
+
+def cents_map(amounts: Mapping[str, Number]) -> Dict[str, int]:
+    """Convert a mapping of euro amounts to cents."""
+    return {key: to_cents(value) for key, value in amounts.items()}
+
+
+def decimal_map(cents: Mapping[str, int]) -> Dict[str, Decimal]:
+    """Convert a mapping of cents to euro Decimals."""
+    return {key: cents_to_decimal(value) for key, value in cents.items()}
@@ -1,16 +1,56 @@
 """Route service for managing route-related business logic."""
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Protocol, Tuple, Dict, Any
+from decimal import Decimal
+from itertools import accumulate
+from typing import List, Optional, Protocol, Tuple, Dict, Any, Iterable
 from uuid import UUID, uuid4
 import structlog
 
+from ..entities.geometry import RouteGeometry
 from ..entities.route import (
     Route, Location, TimelineEvent,
-    CountrySegment, EmptyDriving, RouteStatus, EventStatus, SegmentType
+    CountrySegment, EmptyDriving, RouteStatus, EventStatus, SegmentType,
+    TruckCandidate, Lane, RouteStop, ROUTE_MODE_EXACT, ROUTE_MODE_ESTIMATE, ROUTE_MODES
 )
+from ..entities.transport import Transport
+from ...infrastructure.data.fuel_rates import DEFAULT_RATES_BY_REGION
+from ...infrastructure.geo import geohash
+from ...infrastructure.geo.distance import haversine_km
 
 logger = structlog.get_logger(__name__)
 
+# Number of nearest trucks (by straight line) sent to the distance matrix
+DEFAULT_MAX_TRUCK_CANDIDATES = 25
+# Geohash precision used to snap lane endpoints (~150 m cells)
+DEFAULT_LANE_PRECISION = 7
+# Intermediate stops per route; the Directions API limit for one request
+MAX_ROUTE_WAYPOINTS = 25
+
+
+def lane_key(
+    origin: Location,
+    destination: Location,
+    precision: int = DEFAULT_LANE_PRECISION
+) -> str:
+    """Build the lane store key for an origin/destination pair.
+
+    Endpoints are snapped to geohash cells, so repeat bookings between the
+    same depots share a lane even when geocoding differs by a few meters.
+
+    Args:
+        origin: Route origin
+        destination: Route destination
+        precision: Geohash precision of the snapped endpoints
+
+    Returns:
+        Key of the form "<origin cell>:<destination cell>"
+    """
+    return ":".join((
+        geohash.encode(origin.latitude, origin.longitude, precision),
+        geohash.encode(destination.latitude, destination.longitude, precision)
+    ))
+
+
 def _log_route_creation(transport_id: UUID, origin_id: UUID, destination_id: UUID, pickup_time: datetime, delivery_time: datetime) -> None:
     """Log route creation details."""
     logger.info("Creating new route",
@@ -45,23 +85,40 @@ class LocationRepository(Protocol):
         """Find a location by ID."""
         ...
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Location]:
+        """Find locations by ID in bulk."""
+        ...
+
 
 class RouteCalculationPort(Protocol):
     """External service port for route calculations."""
     def calculate_route(
         self,
         origin: Location,
-        destination: Location
-    ) -> tuple[float, float, List[CountrySegment], List[List[float]]]:
-        """Calculate route details, country segments, and route polyline."""
+        destination: Location,
+        waypoints: Optional[List[Location]] = None
+    ) -> tuple[float, float, List[CountrySegment], RouteGeometry]:
+        """Calculate route details, country segments, and route polyline.
+
+        Segments run in stop order and the last segment before each
+        waypoint ends at that waypoint's location.
+        """
         ...
 
     def calculate_empty_driving(
         self,
         truck_location: Location,
         origin: Location
-    ) -> tuple[float, float]:
-        """Calculate empty driving distance and duration."""
+    ) -> tuple[float, float, RouteGeometry]:
+        """Calculate empty driving distance, duration and route points."""
+        ...
+
+    def calculate_distance_matrix(
+        self,
+        origins: List[Location],
+        destinations: List[Location]
+    ) -> tuple[List[List[float]], List[List[float]]]:
+        """Calculate driving distances (km) and durations (hours) between location sets."""
         ...
 
 
@@ -80,6 +137,17 @@ class RouteRepository(Protocol):
         ...
 
 
+class LaneRepository(Protocol):
+    """Repository interface for Lane entity."""
+    def find_by_key(self, lane_key: str) -> Optional[Lane]:
+        """Find a lane by its key."""
+        ...
+
+    def save(self, lane: Lane) -> Lane:
+        """Save a lane, replacing any lane stored under the same key."""
+        ...
+
+
 class RouteService:
     """Service for managing route-related business logic."""
 
@@ -87,11 +155,30 @@ class RouteService:
         self,
         route_repo: RouteRepository,
         route_calculator: RouteCalculationPort,
-        location_repo: LocationRepository
+        location_repo: LocationRepository,
+        lane_repo: Optional[LaneRepository] = None,
+        lane_max_age: Optional[timedelta] = None,
+        lane_precision: int = DEFAULT_LANE_PRECISION,
+        route_estimator: Optional[RouteCalculationPort] = None
     ):
+        """Initialize the service.
+
+        Args:
+            route_repo: Route repository
+            route_calculator: Port for route calculations
+            location_repo: Location repository
+            lane_repo: Optional lane store; without it every route is calculated
+            lane_max_age: Age after which a stored lane is recalculated, None for no limit
+            lane_precision: Geohash precision used to snap lane endpoints
+            route_estimator: Optional offline calculator used for ``mode="estimate"``
+        """
         self._route_repo = route_repo
         self._route_calculator = route_calculator
         self._location_repo = location_repo
+        self._lane_repo = lane_repo
+        self._lane_max_age = lane_max_age
+        self._lane_precision = lane_precision
+        self._route_estimator = route_estimator
 
     def create_route(
         self,
@@ -102,9 +189,33 @@ class RouteService:
         destination_id: UUID,
         pickup_time: datetime,
         delivery_time: datetime,
-        truck_location_id: UUID
+        truck_location_id: UUID,
+        mode: str = ROUTE_MODE_EXACT,
+        waypoints: Optional[List[RouteStop]] = None
     ) -> Route:
-        """Create a new route."""
+        """Create a new route.
+
+        With ``mode="estimate"`` the main route and empty driving come from
+        the offline route estimator instead of the route calculator, for an
+        indicative quote without external calls. Estimates bypass the lane
+        store.
+
+        ``waypoints`` are intermediate pickups and drops visited in order
+        between origin and destination. The whole route is calculated in one
+        call and each stop gets its own timeline event. Multi-stop routes
+        bypass the lane store.
+
+        Raises:
+            ValueError: If a location is missing, there are too many
+                waypoints or the mode is unavailable
+        """
+        if mode not in ROUTE_MODES:
+            raise ValueError(f"Unsupported route mode: {mode}")
+        if mode == ROUTE_MODE_ESTIMATE and self._route_estimator is None:
+            raise ValueError("Route estimates are not available")
+        waypoints = list(waypoints or [])
+        if len(waypoints) > MAX_ROUTE_WAYPOINTS:
+            raise ValueError(f"At most {MAX_ROUTE_WAYPOINTS} waypoints are supported")
         _log_route_creation(transport_id, origin_id, destination_id, pickup_time, delivery_time)
 
         # Fetch locations
@@ -118,31 +229,48 @@ class RouteService:
                 truck_location_id=str(truck_location_id)
             )
             raise ValueError("Origin, destination, or truck location not found")
-
-        # Calculate main route
-        total_distance_km, total_duration_hours, segments, route_polyline = self._route_calculator.calculate_route(
-            origin, destination
-        )
+        waypoint_locations = [self._location_repo.find_by_id(stop.location_id) for stop in waypoints]
+        missing = [str(stop.location_id) for stop, location in zip(waypoints, waypoint_locations) if not location]
+        if missing:
+            logger.error("Waypoint location not found", waypoint_ids=missing)
+            raise ValueError(f"Waypoint location not found: {', '.join(missing)}")
+
+        # Calculate main route, reusing a stored lane when one is fresh
+        if mode == ROUTE_MODE_ESTIMATE:
+            calculator = self._route_estimator
+            total_distance_km, total_duration_hours, segments, route_polyline = calculator.calculate_route(
+                origin, destination, waypoints=waypoint_locations or None
+            )
+        elif waypoint_locations:
+            calculator = self._route_calculator
+            total_distance_km, total_duration_hours, segments, route_polyline = calculator.calculate_route(
+                origin, destination, waypoints=waypoint_locations
+            )
+        else:
+            calculator = self._route_calculator
+            total_distance_km, total_duration_hours, segments, route_polyline = self._calculate_main_route(
+                origin, destination
+            )
 
         # Calculate empty driving if truck location is provided
         empty_driving = None
         empty_distance_km = 0.0
         empty_duration_hours = 0.0
         if truck_location_id:
-            empty_distance_km, empty_duration_hours = self._route_calculator.calculate_empty_driving(
-                truck_location, origin
-            )
+            empty_distance_km, empty_duration_hours, empty_route_points = \
+                calculator.calculate_empty_driving(truck_location, origin)
             empty_driving = EmptyDriving(
                 id=uuid4(),
                 distance_km=empty_distance_km,
-                duration_hours=empty_duration_hours
+                duration_hours=empty_duration_hours,
+                route_points=empty_route_points
             )
             saved_empty_driving = self._route_repo.save_empty_driving(empty_driving)
 
         # Generate timeline
         timeline_events = self._generate_timeline_events(
             origin, destination, pickup_time, delivery_time,
-            uuid4(), segments
+            uuid4(), segments, waypoints
         )
         _log_timeline_generation(origin, destination, segments, timeline_events)
 
@@ -163,6 +291,8 @@ class RouteService:
             total_duration_hours=total_duration_hours + empty_duration_hours,
             is_feasible=True,
             status=RouteStatus.DRAFT,
+            mode=mode,
+            waypoint_count=len(waypoints),
             timeline_events=timeline_events,
             country_segments=segments,
             route_polyline=route_polyline,
@@ -173,6 +303,183 @@ class RouteService:
         _log_route_update(saved_route, "created")
         return saved_route
 
+    def _calculate_main_route(
+        self,
+        origin: Location,
+        destination: Location
+    ) -> tuple[float, float, List[CountrySegment], RouteGeometry]:
+        """Calculate the origin to destination route through the lane store.
+
+        A fresh lane is cloned without calling the route calculator. On a
+        miss or a stale lane the route is calculated and the lane replaced.
+        """
+        if self._lane_repo is None:
+            return self._route_calculator.calculate_route(origin, destination)
+
+        key = lane_key(origin, destination, precision=self._lane_precision)
+        now = datetime.now(timezone.utc)
+        lane = self._lane_repo.find_by_key(key)
+        if lane and (self._lane_max_age is None or now - lane.created_at <= self._lane_max_age):
+            logger.info("Lane store hit", lane_key=key, segment_count=len(lane.country_segments))
+            return (
+                lane.total_distance_km,
+                lane.total_duration_hours,
+                self._clone_lane_segments(lane, origin, destination),
+                lane.route_polyline
+            )
+
+        logger.info("Lane store miss", lane_key=key, stale=lane is not None)
+        total_distance_km, total_duration_hours, segments, route_polyline = \
+            self._route_calculator.calculate_route(origin, destination)
+        try:
+            self._lane_repo.save(Lane(
+                id=uuid4(),
+                lane_key=key,
+                total_distance_km=total_distance_km,
+                total_duration_hours=total_duration_hours,
+                route_polyline=route_polyline,
+                country_segments=segments,
+                created_at=now
+            ))
+        except Exception as e:
+            # The lane store is an optimization; never fail route creation on it
+            logger.warning("Failed to store lane", lane_key=key, error=str(e))
+        return total_distance_km, total_duration_hours, segments, route_polyline
+
+    def _clone_lane_segments(
+        self,
+        lane: Lane,
+        origin: Location,
+        destination: Location
+    ) -> List[CountrySegment]:
+        """Copy lane segments for a new route.
+
+        Segments get new IDs and the route's own origin and destination as
+        endpoints; border locations and geometry are shared with the lane.
+        """
+        last = len(lane.country_segments) - 1
+        return [
+            segment.model_copy(update={
+                "id": uuid4(),
+                "route_id": None,
+                "segment_order": order,
+                "start_location_id": origin.id if order == 0 else segment.start_location_id,
+                "end_location_id": destination.id if order == last else segment.end_location_id
+            })
+            for order, segment in enumerate(lane.country_segments)
+        ]
+
+    def rank_trucks(
+        self,
+        origin_id: UUID,
+        candidates: List[Tuple[Transport, UUID]],
+        max_candidates: int = DEFAULT_MAX_TRUCK_CANDIDATES,
+        max_radius_km: Optional[float] = None,
+        fuel_rate: Optional[Decimal] = None,
+        rank_by: str = "distance"
+    ) -> List[TruckCandidate]:
+        """Rank trucks by empty driving to a cargo origin.
+
+        Candidates are prefiltered by great-circle distance so only the
+        nearest ``max_candidates`` trucks are sent to the distance matrix,
+        which prices all of them in one batched call instead of one
+        Directions request per truck.
+
+        Args:
+            origin_id: Cargo origin location ID
+            candidates: Pairs of (transport, current truck location ID)
+            max_candidates: Number of nearest trucks to query by road
+            max_radius_km: Optional straight-line cutoff in kilometers
+            fuel_rate: Fuel price in EUR/L, defaults to the EU average
+            rank_by: "distance" or "cost" as the primary sort key
+
+        Returns:
+            Reachable candidates ordered best first
+
+        Raises:
+            ValueError: If the origin is missing or rank_by is unknown
+        """
+        if rank_by not in ("distance", "cost"):
+            raise ValueError(f"Unsupported rank_by: {rank_by}")
+        origin = self._location_repo.find_by_id(origin_id)
+        if not origin:
+            raise ValueError("Origin location not found")
+
+        candidates = [(transport, location_id) for transport, location_id in candidates if transport.is_active]
+        locations = self._location_repo.find_by_ids(location_id for _, location_id in candidates)
+
+        located = []
+        for transport, location_id in candidates:
+            location = locations.get(location_id)
+            if not location:
+                logger.warning("Truck location not found",
+                    transport_id=str(transport.id),
+                    truck_location_id=str(location_id)
+                )
+                continue
+            straight_line = haversine_km(
+                location.latitude, location.longitude,
+                origin.latitude, origin.longitude
+            )
+            if max_radius_km is not None and straight_line > max_radius_km:
+                continue
+            located.append((straight_line, transport, location))
+
+        located.sort(key=lambda item: item[0])
+        located = located[:max_candidates]
+        if not located:
+            return []
+
+        distances, durations = self._route_calculator.calculate_distance_matrix(
+            [location for _, _, location in located], [origin]
+        )
+
+        fuel_rate = fuel_rate if fuel_rate is not None else DEFAULT_RATES_BY_REGION["EU"]
+        ranked = []
+        for (straight_line, transport, location), distance_row, duration_row in zip(
+            located, distances, durations
+        ):
+            distance_km, duration_hours = distance_row[0], duration_row[0]
+            if distance_km == float("inf"):
+                continue
+            ranked.append(TruckCandidate(
+                transport_id=transport.id,
+                truck_location_id=location.id,
+                straight_line_km=straight_line,
+                empty_distance_km=distance_km,
+                empty_duration_hours=duration_hours,
+                empty_driving_cost=self._empty_driving_cost(
+                    transport, distance_km, duration_hours, fuel_rate
+                )
+            ))
+
+        if rank_by == "cost":
+            ranked.sort(key=lambda c: (c.empty_driving_cost, c.empty_distance_km))
+        else:
+            ranked.sort(key=lambda c: (c.empty_distance_km, c.empty_driving_cost))
+
+        logger.info("Ranked trucks for cargo origin",
+            origin_id=str(origin_id),
+            candidates=len(candidates),
+            queried=len(located),
+            reachable=len(ranked)
+        )
+        return ranked
+
+    def _empty_driving_cost(
+        self,
+        transport: Transport,
+        distance_km: float,
+        duration_hours: float,
+        fuel_rate: Decimal
+    ) -> Decimal:
+        """Estimate the cost of driving a truck empty."""
+        distance = Decimal(str(distance_km))
+        fuel = Decimal(str(transport.truck_specs.fuel_consumption_empty)) * distance * fuel_rate
+        maintenance = transport.truck_specs.maintenance_rate_per_km * distance
+        driver = transport.driver_specs.driving_time_rate * Decimal(str(duration_hours))
+        return (fuel + maintenance + driver).quantize(Decimal("0.01"))
+
     def _generate_timeline_events(
         self,
         origin: Location,
@@ -180,69 +487,87 @@ class RouteService:
         pickup_time: datetime,
         delivery_time: datetime,
         route_id: UUID,
-        segments: Optional[List[CountrySegment]]
+        segments: Optional[List[CountrySegment]],
+        waypoints: Optional[List[RouteStop]] = None
     ) -> List[TimelineEvent]:
-        """Generate timeline events for a route."""
+        """Generate timeline events for a route.
+
+        Waypoint events are planned between pickup and delivery in
+        proportion to the driving time to their stop, and events are
+        ordered by planned time.
+        """
         logger.debug("Generating timeline events",
             route_id=str(route_id),
             pickup_time=pickup_time.isoformat(),
             delivery_time=delivery_time.isoformat(),
-            segment_count=len(segments) if segments else 0
+            segment_count=len(segments) if segments else 0,
+            waypoint_count=len(waypoints) if waypoints else 0
         )
 
         total_duration = delivery_time - pickup_time
         mid_point = pickup_time + (total_duration / 2)
 
-        events = [
-            # Pickup event
-            TimelineEvent(
-                id=uuid4(),
-                route_id=route_id,
-                type="pickup",
-                location_id=origin.id,
-                planned_time=pickup_time,
-                duration_hours=1.0,
-                event_order=1,
-                status=EventStatus.PENDING
-            )
-        ]
-
         # Rest event - use first segment's end location or origin if no segments
         rest_location_id = origin.id  # Default to origin
         if segments and len(segments) > 0:
             # Get the end location of the first segment
             rest_location_id = segments[0].end_location_id
 
-        events.append(
-            TimelineEvent(
-                id=uuid4(),
-                route_id=route_id,
-                type="rest",
-                location_id=rest_location_id,
-                planned_time=mid_point,
-                duration_hours=1.0,
-                event_order=2,
-                status=EventStatus.PENDING
-            )
-        )
+        planned = [
+            ("pickup", origin.id, pickup_time),
+            ("rest", rest_location_id, mid_point),
+            ("delivery", destination.id, delivery_time)
+        ]
+        stop_fractions = self._waypoint_fractions(waypoints or [], segments or [])
+        for stop, fraction in zip(waypoints or [], stop_fractions):
+            planned.append((stop.type, stop.location_id, pickup_time + total_duration * fraction))
 
-        # Delivery event
-        events.append(
+        # Stable sort keeps pickup before events planned at the same time
+        planned.sort(key=lambda item: item[2])
+        events = [
             TimelineEvent(
                 id=uuid4(),
                 route_id=route_id,
-                type="delivery",
-                location_id=destination.id,
-                planned_time=delivery_time,
+                type=event_type,
+                location_id=location_id,
+                planned_time=planned_time,
                 duration_hours=1.0,
-                event_order=3,
+                event_order=order,
                 status=EventStatus.PENDING
             )
-        )
+            for order, (event_type, location_id, planned_time) in enumerate(planned, start=1)
+        ]
 
         _log_timeline_generation(origin, destination, segments or [], events)
         return events
 
+    def _waypoint_fractions(
+        self,
+        waypoints: List[RouteStop],
+        segments: List[CountrySegment]
+    ) -> List[float]:
+        """Get each waypoint's share of the driving time from origin to destination.
+
+        A stop is reached at the end of the first segment, after the
+        previous stop, that ends at its location. Stops not found among the
+        segment endpoints are spaced evenly.
+        """
+        cumulative_hours = list(accumulate(segment.duration_hours for segment in segments))
+        total_hours = cumulative_hours[-1] if cumulative_hours else 0.0
+        fractions = []
+        position = 0
+        for index, stop in enumerate(waypoints):
+            match = next(
+                (i for i in range(position, len(segments)) if segments[i].end_location_id == stop.location_id),
+                None
+            )
+            if match is not None and total_hours > 0:
+                position = match + 1
+                fractions.append(cumulative_hours[match] / total_hours)
+            else:
+                fractions.append((index + 1) / (len(waypoints) + 1))
+        return fractions
+
     def get_route(self, route_id: UUID) -> Optional[Route]:
         """Retrieve a route by ID."""
         try:
@@ -534,19 +859,19 @@ class RouteService:
 
         return new_status in valid_transitions.get(current_status, []) 
 
-    def get_segment_route_points(self, segment_id: UUID) -> List[List[float]]:
+    def get_segment_route_points(self, segment_id: UUID) -> RouteGeometry:
         """Get route points for a segment."""
         try:
             # Get segment from repository
             segment = self._route_repo.find_segment_by_id(segment_id)
             if not segment:
-                return []
+                return RouteGeometry()
 
             # Get start and end locations
             start_location = self._location_repo.find_by_id(segment.start_location_id)
             end_location = self._location_repo.find_by_id(segment.end_location_id)
             if not start_location or not end_location:
-                return []
+                return RouteGeometry()
 
             # Calculate route points using Google Maps
             _, _, _, route_points = self._route_calculator.calculate_route(
@@ -556,4 +881,4 @@ class RouteService:
 
         except Exception as e:
             logger.error(f"Failed to get route points for segment {segment_id}: {str(e)}")
-            return [] 
\ No newline at end of file
+            return RouteGeometry() 
\ No newline at end of file
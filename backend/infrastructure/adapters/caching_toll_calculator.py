@@ -0,0 +1,134 @@
+"""Memoizing decorator for TollCalculationPort."""
+import hashlib
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ...domain.entities.route import CountrySegment
+from ...domain.services.cost_service import TollCalculationPort
+from ..cache.lru import LRUCache
+from ..repositories.route_repository import encode_route_steps
+
+DEFAULT_TOLL_RESULT_CACHE_SIZE = 4096
+
+
+def segment_fingerprint(segment: CountrySegment) -> str:
+    """Get a content hash of everything a segment's toll depends on.
+
+    Unlike the segment ID, the fingerprint changes when the segment's
+    country, distance or step records change.
+    """
+    content = "|".join((
+        segment.country_code,
+        "{:.4f}".format(segment.distance_km),
+        encode_route_steps(segment.steps) or ""
+    ))
+    return hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CachingTollCalculator(TollCalculationPort):
+    """TollCalculationPort that memoizes per-segment toll results.
+
+    Results are keyed by segment fingerprint, vehicle classes, override
+    lookup settings, the toll rate table version and the business entity's
+    override version, so a rate reload or override edit never serves a
+    stale toll. Only segments without a cached result reach the wrapped
+    calculator.
+    """
+
+    def __init__(self, calculator: TollCalculationPort, cache: LRUCache):
+        """Initialize the decorator.
+
+        Args:
+            calculator: Toll calculator to delegate cache misses to
+            cache: LRU cache of toll results, usually shared per process
+        """
+        self._calculator = calculator
+        self._cache = cache
+
+    def get_rate_version(self) -> Optional[str]:
+        """Get the version stamp of the toll rate table in use."""
+        return self._calculator.get_rate_version()
+
+    def get_override_version(self, business_entity_id: UUID) -> Optional[str]:
+        """Get the version digest of a business entity's toll overrides."""
+        return self._calculator.get_override_version(business_entity_id)
+
+    def calculate_toll(
+        self,
+        segment: CountrySegment,
+        truck_specs: dict,
+        business_entity_id: Optional[UUID] = None,
+        overrides: Optional[Dict[str, Any]] = None
+    ) -> Decimal:
+        """Calculate toll costs for a country segment, using cached results."""
+        return self.calculate_tolls([segment], truck_specs, business_entity_id, overrides)[0]
+
+    def calculate_tolls(
+        self,
+        segments: List[CountrySegment],
+        truck_specs: dict,
+        business_entity_id: Optional[UUID] = None,
+        overrides: Optional[Dict[str, Any]] = None
+    ) -> List[Decimal]:
+        """Calculate toll costs for several segments, using cached results.
+
+        Args:
+            segments: Route segments in route order
+            truck_specs: Dictionary containing truck specifications
+            business_entity_id: Optional business entity ID for rate overrides
+            overrides: Optional dictionary with rate override settings
+
+        Returns:
+            Toll cost per segment, in segment order
+        """
+        context = self._context(truck_specs, business_entity_id, overrides)
+        keys = [(segment_fingerprint(segment),) + context for segment in segments]
+
+        tolls: List[Optional[Decimal]] = [self._cache.get(key) for key in keys]
+        missing = [i for i, toll in enumerate(tolls) if toll is None]
+        if missing:
+            calculated = self._calculator.calculate_tolls(
+                [segments[i] for i in missing], truck_specs, business_entity_id, overrides
+            )
+            for i, toll in zip(missing, calculated):
+                self._cache.set(keys[i], toll)
+                tolls[i] = toll
+        return tolls
+
+    def metrics(self) -> Dict[str, int]:
+        """Get cache hit and miss counts."""
+        return {"hits": self._cache.hits, "misses": self._cache.misses, "size": len(self._cache)}
+
+    def _context(
+        self,
+        truck_specs: dict,
+        business_entity_id: Optional[UUID],
+        overrides: Optional[Dict[str, Any]]
+    ) -> Tuple:
+        """Get the non-segment part of the cache key."""
+        override_key = None
+        if business_entity_id and overrides:
+            override_key = (
+                overrides.get("vehicle_class", truck_specs["toll_class"]),
+                overrides.get("route_type"),
+                self._calculator.get_override_version(business_entity_id)
+            )
+        return (
+            truck_specs["toll_class"],
+            truck_specs["euro_class"],
+            truck_specs["co2_class"],
+            self._calculator.get_rate_version(),
+            override_key
+        )
+
+
+@lru_cache(maxsize=None)
+def get_toll_result_cache(max_size: int = DEFAULT_TOLL_RESULT_CACHE_SIZE) -> LRUCache:
+    """Get the process-wide toll result cache.
+
+    Calculators are created per request; caching here lets them share
+    results.
+    """
+    return LRUCache(max_size=max_size)
@@ -3,6 +3,7 @@ from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from ..external_services.google_maps_service import GoogleMapsService
+from ...domain.entities.geometry import RouteGeometry
 from ...domain.entities.route import Location, CountrySegment, SegmentType
 
 class GoogleMapsAdapter:
@@ -15,27 +16,22 @@ class GoogleMapsAdapter:
     def calculate_route(
         self,
         origin: Location,
-        destination: Location
-    ) -> tuple[float, float, List[CountrySegment], List[List[float]]]:
-        """Calculate route details using Google Maps."""
+        destination: Location,
+        waypoints: Optional[List[Location]] = None
+    ) -> tuple[float, float, List[CountrySegment], RouteGeometry]:
+        """Calculate route details using Google Maps.
+
+        Segment route points are sliced from the step polylines of the main
+        Directions response, so a route costs a single Directions call,
+        including routes with intermediate waypoints.
+        """
         try:
-            # Get route details from Google Maps
-            total_distance_km, total_duration_hours, segments, route_points = self._maps_service.calculate_route(
+            return self._maps_service.calculate_route(
                 origin=origin,
-                destination=destination
+                destination=destination,
+                waypoints=waypoints
             )
 
-            # Process segments to include route points
-            for segment in segments:
-                # Get route points for this segment
-                segment_points = self._maps_service.get_segment_route_points(
-                    origin=self._maps_service._location_repo.find_by_id(segment.start_location_id),
-                    destination=self._maps_service._location_repo.find_by_id(segment.end_location_id)
-                )
-                segment.route_points = segment_points
-
-            return total_distance_km, total_duration_hours, segments, route_points
-
         except Exception as e:
             raise ValueError(f"Failed to calculate route: {str(e)}")
 
@@ -43,14 +39,26 @@ class GoogleMapsAdapter:
         self,
         truck_location: Location,
         origin: Location
-    ) -> tuple[float, float]:
+    ) -> tuple[float, float, RouteGeometry]:
         """Calculate empty driving details."""
         try:
             return self._maps_service.calculate_empty_driving(truck_location, origin)
         except Exception as e:
             raise ValueError(f"Failed to calculate empty driving: {str(e)}")
 
-    def get_segment_route_points(self, segment_id: UUID) -> List[List[float]]:
+    def calculate_distance_matrix(
+        self,
+        origins: List[Location],
+        destinations: List[Location]
+    ) -> Tuple[List[List[float]], List[List[float]]]:
+        """Calculate driving distances and durations between location sets."""
+        try:
+            matrix = self._maps_service.get_distance_matrix(origins, destinations)
+            return matrix["distances"], matrix["durations"]
+        except Exception as e:
+            raise ValueError(f"Failed to calculate distance matrix: {str(e)}")
+
+    def get_segment_route_points(self, segment_id: UUID) -> RouteGeometry:
         """Get route points for a segment."""
         try:
             return self._maps_service.get_segment_route_points(segment_id)
@@ -0,0 +1,262 @@
+"""Offline route estimation adapter."""
+import math
+from typing import Callable, List, Optional, Tuple
+from uuid import uuid4
+
+from ...domain.entities.geometry import RouteGeometry
+from ...domain.entities.route import CountrySegment, Location, SegmentType
+from ..data.truck_speeds import get_truck_speed
+from ..geo.country_index import CountryBoundaryIndex
+from ..geo.detour import DetourFactors
+from ..geo.distance import haversine_km
+from ..geo.segmentation import country_runs
+from ..logging import get_logger
+
+logger = get_logger()
+
+# Spacing of the coarse country samples along the great circle (km)
+DEFAULT_SAMPLE_KM = 20.0
+# Bisection steps used to place a border crossing between two samples
+_BORDER_BISECTIONS = 6
+# Longest stretch of unresolved samples between covered countries (km), e.g.
+# slivers between simplified polygons or a short coastal detour over sea
+MAX_UNRESOLVED_GAP_KM = 50.0
+
+
+def great_circle_point(
+    lat1: float, lng1: float, lat2: float, lng2: float, fraction: float
+) -> Tuple[float, float]:
+    """Get the point at a fraction of the great circle between two coordinates."""
+    phi1, lambda1 = math.radians(lat1), math.radians(lng1)
+    phi2, lambda2 = math.radians(lat2), math.radians(lng2)
+    x1, y1, z1 = math.cos(phi1) * math.cos(lambda1), math.cos(phi1) * math.sin(lambda1), math.sin(phi1)
+    x2, y2, z2 = math.cos(phi2) * math.cos(lambda2), math.cos(phi2) * math.sin(lambda2), math.sin(phi2)
+    angle = math.acos(max(-1.0, min(1.0, x1 * x2 + y1 * y2 + z1 * z2)))
+    if angle < 1e-12:
+        return lat1, lng1
+    a = math.sin((1 - fraction) * angle) / math.sin(angle)
+    b = math.sin(fraction * angle) / math.sin(angle)
+    x, y, z = a * x1 + b * x2, a * y1 + b * y2, a * z1 + b * z2
+    return math.degrees(math.atan2(z, math.hypot(x, y))), math.degrees(math.atan2(y, x))
+
+
+class HaversineEstimateAdapter:
+    """Route calculator that estimates routes without external calls.
+
+    The great circle between two locations is split into per-country
+    sections with the offline boundary polygons. Each section's length is
+    scaled by the calibrated detour factor of the origin/destination
+    corridor, and durations come from average truck speeds per country.
+    The results are indicative; exact routing stays with GoogleMapsAdapter.
+    """
+
+    def __init__(
+        self,
+        location_repo,
+        country_index: CountryBoundaryIndex,
+        detour_factors: Callable[[], DetourFactors],
+        speed_for: Callable[[Optional[str]], float] = get_truck_speed,
+        sample_km: float = DEFAULT_SAMPLE_KM
+    ):
+        """Initialize adapter.
+
+        Args:
+            location_repo: Repository used to save estimated border crossings
+            country_index: Offline boundary index used to attribute distance to countries
+            detour_factors: Provider of road/great-circle ratios per corridor,
+                called per estimate so calibration can refresh in place
+            speed_for: Average truck speed in km/h for a country code
+            sample_km: Spacing of the country samples along the path
+        """
+        if sample_km <= 0:
+            raise ValueError("Sample spacing must be positive")
+        self._location_repo = location_repo
+        self._country_index = country_index
+        self._detour_factors = detour_factors
+        self._speed_for = speed_for
+        self._sample_km = sample_km
+
+    def calculate_route(
+        self,
+        origin: Location,
+        destination: Location,
+        waypoints: Optional[List[Location]] = None
+    ) -> tuple[float, float, List[CountrySegment], RouteGeometry]:
+        """Estimate route distance, duration, country segments and path.
+
+        Routes with waypoints are estimated leg by leg and chained, so the
+        last segment of each leg ends at its stop.
+
+        Raises:
+            ValueError: If a leg starts, ends or runs for more than
+                MAX_UNRESOLVED_GAP_KM outside the indexed countries
+        """
+        stops = [origin] + list(waypoints or []) + [destination]
+        segments: List[CountrySegment] = []
+        path: List[List[float]] = []
+        total_distance_km = 0.0
+        total_duration_hours = 0.0
+        for start, end in zip(stops, stops[1:]):
+            distance_km, duration_hours, leg_segments, leg_path = self._estimate_route(start, end)
+            for segment in leg_segments:
+                segments.append(segment.model_copy(update={"segment_order": len(segments)}))
+            path.extend(leg_path.to_list()[1:] if path else leg_path.to_list())
+            total_distance_km += distance_km
+            total_duration_hours += duration_hours
+        return total_distance_km, total_duration_hours, segments, RouteGeometry(path)
+
+    def _estimate_route(
+        self,
+        origin: Location,
+        destination: Location
+    ) -> tuple[float, float, List[CountrySegment], RouteGeometry]:
+        """Estimate a single origin to destination leg."""
+        straight_km = haversine_km(origin.latitude, origin.longitude,
+                                   destination.latitude, destination.longitude)
+        count = max(2, int(math.ceil(straight_km / self._sample_km)) + 1)
+        fractions = [i / (count - 1) for i in range(count)]
+        countries = [self._country_at(origin, destination, fraction) for fraction in fractions]
+        self._check_coverage(countries, straight_km / (count - 1))
+        runs = country_runs(countries)
+
+        # Place each border between the last resolved sample of one run and
+        # the first of the next, so short unresolved gaps are split between them
+        resolved = [index for index, code in enumerate(countries) if code]
+        borders = [
+            self._find_border(origin, destination,
+                              fractions[max(index for index in resolved if index <= run.last_step)],
+                              fractions[following.first_step],
+                              run.country_code, following.country_code)
+            for run, following in zip(runs, runs[1:])
+        ]
+        factor = self._detour_factors().factor(runs[0].country_code, runs[-1].country_code)
+
+        segments = []
+        path: List[Tuple[float, float]] = []
+        start_location = origin
+        total_distance_km = 0.0
+        total_duration_hours = 0.0
+        for order, run in enumerate(runs):
+            start = borders[order - 1] if order > 0 else 0.0
+            end = borders[order] if order < len(borders) else 1.0
+            if order < len(borders):
+                lat, lng = great_circle_point(origin.latitude, origin.longitude,
+                                              destination.latitude, destination.longitude, end)
+                end_location = self._location_repo.save(Location(
+                    id=uuid4(),
+                    latitude=lat,
+                    longitude=lng,
+                    address=f"{run.country_code}/{runs[order + 1].country_code} border (estimated)"
+                ))
+            else:
+                end_location = destination
+
+            points = [(start_location.latitude, start_location.longitude)] + [
+                great_circle_point(origin.latitude, origin.longitude,
+                                   destination.latitude, destination.longitude, fraction)
+                for fraction in fractions if start < fraction < end
+            ] + [(end_location.latitude, end_location.longitude)]
+            path.extend(points if not path else points[1:])
+
+            distance_km = max((end - start) * straight_km * factor, 0.001)
+            duration_hours = distance_km / self._speed_for(run.country_code)
+            segments.append(CountrySegment(
+                id=uuid4(),
+                country_code=run.country_code,
+                segment_type=SegmentType.ROUTE,
+                distance_km=distance_km,
+                duration_hours=duration_hours,
+                start_location_id=start_location.id,
+                end_location_id=end_location.id,
+                segment_order=order,
+                route_points=points
+            ))
+            total_distance_km += distance_km
+            total_duration_hours += duration_hours
+            start_location = end_location
+
+        logger.debug("Route estimated",
+                     straight_km=round(straight_km, 1),
+                     detour_factor=round(factor, 3),
+                     countries=[run.country_code for run in runs])
+        return total_distance_km, total_duration_hours, segments, RouteGeometry(path)
+
+    def calculate_empty_driving(
+        self,
+        truck_location: Location,
+        origin: Location
+    ) -> tuple[float, float, RouteGeometry]:
+        """Estimate empty driving distance, duration and path."""
+        distance_km, duration_hours = self._estimate_leg(truck_location, origin)
+        # Empty driving must be positive even when the truck is already at the origin
+        if distance_km <= 0:
+            distance_km = 0.001
+            duration_hours = distance_km / self._speed_for(None)
+        return distance_km, duration_hours, RouteGeometry([
+            (truck_location.latitude, truck_location.longitude),
+            (origin.latitude, origin.longitude)
+        ])
+
+    def calculate_distance_matrix(
+        self,
+        origins: List[Location],
+        destinations: List[Location]
+    ) -> Tuple[List[List[float]], List[List[float]]]:
+        """Estimate driving distances (km) and durations (hours) between location sets."""
+        distances, durations = [], []
+        for origin in origins:
+            legs = [self._estimate_leg(origin, destination) for destination in destinations]
+            distances.append([distance for distance, _ in legs])
+            durations.append([duration for _, duration in legs])
+        return distances, durations
+
+    def _estimate_leg(self, start: Location, end: Location) -> Tuple[float, float]:
+        """Estimate a single leg from its end countries only."""
+        start_country = self._country_index.lookup(start.latitude, start.longitude)
+        end_country = self._country_index.lookup(end.latitude, end.longitude)
+        distance_km = haversine_km(start.latitude, start.longitude, end.latitude, end.longitude) * \
+            self._detour_factors().factor(start_country, end_country)
+        return distance_km, distance_km / self._speed_for(start_country or end_country)
+
+    @staticmethod
+    def _check_coverage(countries: List[Optional[str]], spacing_km: float) -> None:
+        """Reject paths whose distance would be credited to the wrong country.
+
+        Raises:
+            ValueError: If an end of the path or a stretch longer than
+                MAX_UNRESOLVED_GAP_KM lies outside the indexed countries
+        """
+        if not countries[0] or not countries[-1]:
+            raise ValueError("Cannot estimate a route outside the countries covered by the boundary index")
+        gap = 0
+        for code in countries:
+            gap = 0 if code else gap + 1
+            if gap * spacing_km > MAX_UNRESOLVED_GAP_KM:
+                raise ValueError("Cannot estimate a route outside the countries covered by the boundary index")
+
+    def _country_at(self, origin: Location, destination: Location, fraction: float) -> Optional[str]:
+        """Resolve the country at a fraction of the great circle."""
+        lat, lng = great_circle_point(origin.latitude, origin.longitude,
+                                      destination.latitude, destination.longitude, fraction)
+        return self._country_index.lookup(lat, lng)
+
+    def _find_border(
+        self,
+        origin: Location,
+        destination: Location,
+        low: float,
+        high: float,
+        low_country: str,
+        high_country: str
+    ) -> float:
+        """Bisect the fraction where the path leaves one country for the next."""
+        for _ in range(_BORDER_BISECTIONS):
+            middle = (low + high) / 2
+            country = self._country_at(origin, destination, middle)
+            if country == low_country:
+                low = middle
+            elif country == high_country:
+                high = middle
+            else:
+                return middle
+        return (low + high) / 2
@@ -1,6 +1,6 @@
 """Adapter for toll rate service implementing TollCalculationPort."""
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 
 from ...domain.entities.route import CountrySegment
@@ -17,6 +17,14 @@ class TollRateAdapter(TollCalculationPort):
         self._service = toll_service
         self._override_repo = override_repository
 
+    def get_rate_version(self) -> Optional[str]:
+        """Get the version stamp of the toll rate table in use."""
+        return self._service.rate_version
+
+    def get_override_version(self, business_entity_id: UUID) -> Optional[str]:
+        """Get the version digest of a business entity's toll overrides."""
+        return self._override_repo.find_all_for_business(business_entity_id).version
+
     def calculate_toll(
         self,
         segment: CountrySegment,
@@ -26,6 +34,9 @@ class TollRateAdapter(TollCalculationPort):
     ) -> Decimal:
         """
         Calculate toll costs for a country segment with optional overrides.
+
+        Toll km are classified from the segment's stored step records, so no
+        Directions request is made for routes calculated with step data.
         
         Args:
             segment: Route segment in a specific country
@@ -40,14 +51,7 @@ class TollRateAdapter(TollCalculationPort):
             ExternalServiceError: If toll rate service fails
         """
         try:
-            # Get base toll cost
-            base_toll = self._service.get_toll_rate(
-                country_code=segment.country_code,
-                distance_km=segment.distance_km,
-                toll_class=truck_specs["toll_class"],
-                euro_class=truck_specs["euro_class"],
-                co2_class=truck_specs["co2_class"]
-            )
+            base_toll = self._base_toll(segment, truck_specs)
 
             # If no overrides needed, return base toll
             if not business_entity_id or not overrides:
@@ -69,4 +73,64 @@ class TollRateAdapter(TollCalculationPort):
         except Exception as e:
             raise ExternalServiceError(
                 f"Failed to calculate toll costs: {str(e)}"
-            ) from e 
\ No newline at end of file
+            ) from e
+
+    def calculate_tolls(
+        self,
+        segments: List[CountrySegment],
+        truck_specs: dict,
+        business_entity_id: Optional[UUID] = None,
+        overrides: Optional[Dict[str, Any]] = None
+    ) -> List[Decimal]:
+        """
+        Calculate toll costs for all segments of a route.
+
+        The business entity's overrides are loaded once as an index and
+        every segment is resolved against it.
+
+        Args:
+            segments: Route segments in route order
+            truck_specs: Dictionary containing truck specifications
+            business_entity_id: Optional business entity ID for rate overrides
+            overrides: Optional dictionary with rate override settings
+
+        Returns:
+            Toll cost per segment, in segment order
+
+        Raises:
+            ExternalServiceError: If toll rate service fails
+        """
+        try:
+            index = None
+            if business_entity_id and overrides:
+                index = self._override_repo.find_all_for_business(business_entity_id)
+                vehicle_class = overrides.get("vehicle_class", truck_specs["toll_class"])
+                route_type = overrides.get("route_type")
+
+            tolls = []
+            for segment in segments:
+                toll = self._base_toll(segment, truck_specs)
+                if index is not None:
+                    override = index.resolve(segment.country_code, vehicle_class, route_type)
+                    if override:
+                        toll = toll * override.rate_multiplier
+                tolls.append(toll)
+            return tolls
+
+        except Exception as e:
+            raise ExternalServiceError(
+                f"Failed to calculate toll costs: {str(e)}"
+            ) from e
+
+    def _base_toll(self, segment: CountrySegment, truck_specs: dict) -> Decimal:
+        """Get the toll for a segment before business overrides."""
+        base_toll = self._service.get_toll_rate(
+            country_code=segment.country_code,
+            distance_km=segment.distance_km,
+            toll_class=truck_specs["toll_class"],
+            euro_class=truck_specs["euro_class"],
+            co2_class=truck_specs["co2_class"],
+            steps=segment.steps or None
+        )
+        # The service reports whether default rates were used alongside the toll
+        return base_toll[0] if isinstance(base_toll, tuple) else base_toll
@@ -0,0 +1,209 @@
+"""Disk-backed cache for external API responses."""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from ..logging import get_logger
+
+logger = get_logger()
+
+# Default number of decimal places kept for coordinates (~1 m)
+DEFAULT_COORD_PRECISION = 5
+# Default maximum number of cached responses
+DEFAULT_MAX_ENTRIES = 10000
+# Number of writes between expiry/size sweeps
+PRUNE_INTERVAL = 100
+
+# Parameters whose list values are order-independent
+UNORDERED_PARAMS = {"avoid"}
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL expiry and a size cap.
+
+    Entries are keyed on the endpoint name plus a normalized form of the
+    request parameters. Floats are rounded to ``coord_precision`` decimal
+    places so repeated quotes for the same lane share cache entries even
+    when coordinates differ by floating point noise. When the cache grows
+    past ``max_entries`` the least recently used entries are evicted; expiry
+    and the size cap are swept every ``PRUNE_INTERVAL`` writes and on prune().
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: int,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        coord_precision: int = DEFAULT_COORD_PRECISION
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path, or ":memory:"
+            ttl_seconds: Time-to-live for cached entries
+            max_entries: Maximum number of entries kept
+            coord_precision: Decimal places kept when normalizing floats
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("Cache TTL must be positive")
+        if max_entries <= 0:
+            raise ValueError("Cache size must be positive")
+
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._precision = coord_precision
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS response_cache (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_response_cache_accessed "
+            "ON response_cache (accessed_at)"
+        )
+        self._conn.commit()
+        self._logger = logger.bind(component="response_cache")
+
+    @property
+    def ttl_seconds(self) -> int:
+        """Get the entry time-to-live."""
+        return self._ttl
+
+    def make_key(self, endpoint: str, args: Sequence[Any], params: Dict[str, Any]) -> str:
+        """Build a cache key from an endpoint and its request parameters.
+
+        Args:
+            endpoint: Logical endpoint name (e.g. "directions")
+            args: Positional request arguments
+            params: Keyword request arguments
+
+        Returns:
+            Hex digest identifying the normalized request
+        """
+        normalized = {
+            "endpoint": endpoint,
+            "args": [self._normalize(value) for value in args],
+            "params": {
+                name: self._normalize(value, unordered=name in UNORDERED_PARAMS)
+                for name, value in params.items()
+                if value is not None
+            },
+        }
+        encoded = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _normalize(self, value: Any, unordered: bool = False) -> Any:
+        """Normalize a parameter value for key generation."""
+        if isinstance(value, bool) or value is None:
+            return value
+        if isinstance(value, float):
+            return round(value, self._precision)
+        if isinstance(value, dict):
+            return {str(k): self._normalize(v) for k, v in value.items() if v is not None}
+        if isinstance(value, (list, tuple)):
+            items = [self._normalize(v) for v in value]
+            if unordered:
+                items = sorted(items, key=lambda item: json.dumps(item, sort_keys=True))
+            return items
+        if isinstance(value, (int, str)):
+            return value
+        return str(value)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM response_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, created_at = row
+            if now - created_at > self._ttl:
+                self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE response_cache SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            self._conn.commit()
+        return json.loads(payload)
+
+    def set(self, key: str, endpoint: str, value: Any) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from make_key
+            endpoint: Endpoint name, kept for diagnostics
+            value: JSON-serializable response
+        """
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            self._logger.warning("Response not cacheable", endpoint=endpoint, error=str(e))
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache "
+                "(key, endpoint, payload, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, endpoint, payload, now, now)
+            )
+            self._writes += 1
+            if self._writes % PRUNE_INTERVAL == 0:
+                self._prune(now)
+            self._conn.commit()
+
+    def prune(self) -> None:
+        """Remove expired entries and enforce the size cap."""
+        with self._lock:
+            self._prune(time.time())
+            self._conn.commit()
+
+    def _prune(self, now: float) -> None:
+        """Prune while holding the lock."""
+        self._conn.execute(
+            "DELETE FROM response_cache WHERE created_at < ?",
+            (now - self._ttl,)
+        )
+        count = self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+        excess = count - self._max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                "SELECT key FROM response_cache ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,)
+            )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        """Get the number of stored entries (including expired ones not yet pruned)."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
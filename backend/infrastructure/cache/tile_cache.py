@@ -0,0 +1,143 @@
+"""Geohash tile cache for reverse geocoding results."""
+import sqlite3
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from ..geo import geohash
+from .lru import LRUCache
+
+# Default geohash precision (~150 m cells)
+DEFAULT_TILE_PRECISION = 7
+# Default number of tiles kept in memory
+DEFAULT_MEMORY_SIZE = 4096
+# Default lifetime of persisted tiles (30 days)
+DEFAULT_TILE_TTL = 30 * 24 * 3600
+
+
+class TileEntry(NamedTuple):
+    """Cached reverse geocoding result for a tile."""
+    country_code: str
+    address: str
+
+
+class GeocodeTileCache:
+    """Two-level cache mapping geohash tiles to country and address.
+
+    Coordinates are quantized to geohash cells so nearby points along the
+    same corridor share one lookup. An in-process LRU sits in front of an
+    optional SQLite table that survives restarts.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        precision: int = DEFAULT_TILE_PRECISION,
+        memory_size: int = DEFAULT_MEMORY_SIZE,
+        ttl_seconds: int = DEFAULT_TILE_TTL
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database path for the persistent layer, or None for memory only
+            precision: Geohash precision used to quantize coordinates
+            memory_size: Number of tiles kept in the in-process LRU
+            ttl_seconds: Lifetime of persisted tiles
+        """
+        if precision < 1:
+            raise ValueError("Tile precision must be at least 1")
+
+        self._precision = precision
+        self._ttl = ttl_seconds
+        self._memory = LRUCache(memory_size)
+        self._lock = threading.Lock()
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS geocode_tiles (
+                    tile TEXT PRIMARY KEY,
+                    country_code TEXT NOT NULL,
+                    address TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+
+    @property
+    def precision(self) -> int:
+        """Get the geohash precision."""
+        return self._precision
+
+    @property
+    def memory(self) -> LRUCache:
+        """Get the in-process layer (exposes hit/miss counters)."""
+        return self._memory
+
+    def tile_for(self, lat: float, lng: float) -> str:
+        """Get the tile key for a coordinate."""
+        return geohash.encode(lat, lng, self._precision)
+
+    def get(self, lat: float, lng: float) -> Optional[TileEntry]:
+        """Look up the cached result for a coordinate.
+
+        Args:
+            lat: Latitude
+            lng: Longitude
+
+        Returns:
+            TileEntry, or None on a miss
+        """
+        tile = self.tile_for(lat, lng)
+        entry = self._memory.get(tile)
+        if entry is not None or self._conn is None:
+            return entry
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT country_code, address, updated_at FROM geocode_tiles WHERE tile = ?",
+                (tile,)
+            ).fetchone()
+        if row is None or time.time() - row[2] > self._ttl:
+            return None
+
+        entry = TileEntry(country_code=row[0], address=row[1])
+        self._memory.set(tile, entry)
+        return entry
+
+    def set(self, lat: float, lng: float, country_code: str, address: str) -> None:
+        """Store the result for a coordinate's tile.
+
+        Args:
+            lat: Latitude
+            lng: Longitude
+            country_code: ISO country code
+            address: Formatted address
+        """
+        if not country_code:
+            return
+        tile = self.tile_for(lat, lng)
+        entry = TileEntry(country_code=country_code, address=address or "")
+        self._memory.set(tile, entry)
+        if self._conn is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocode_tiles (tile, country_code, address, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (tile, entry.country_code, entry.address, time.time())
+            )
+            self._conn.commit()
+
+    def prune(self) -> None:
+        """Remove expired tiles from the persistent layer."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM geocode_tiles WHERE updated_at < ?",
+                (time.time() - self._ttl,)
+            )
+            self._conn.commit()
@@ -1,19 +1,33 @@
 """Dependency injection container for the application."""
-from typing import Dict, Any
+from datetime import timedelta
+from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from flask import current_app, g
 
 from .external_services.google_maps_service import GoogleMapsService
 from .external_services.toll_rate_service import TollRateService
 from .external_services.openai_service import OpenAIService
+from .external_services.maps_client import MapsClientFactory, get_maps_client_factory
+
+from .data.toll_rate_table import TollRateStore, configure_toll_rate_store
+
+from .geo.country_index import get_country_index
+from .geo.detour import (
+    DEFAULT_CALIBRATION_SECONDS, CorridorSample, DetourFactorStore, get_detour_factor_store
+)
+from .data.truck_speeds import DEFAULT_TRUCK_SPEED_KMH, get_truck_speed
+from .cache.response_cache import ResponseCache
+from .cache.tile_cache import GeocodeTileCache
 
 from .adapters.google_maps_adapter import GoogleMapsAdapter
 from .adapters.toll_rate_adapter import TollRateAdapter
+from .adapters.caching_toll_calculator import CachingTollCalculator, get_toll_result_cache
 from .adapters.openai_adapter import OpenAIAdapter
+from .adapters.haversine_estimate_adapter import HaversineEstimateAdapter
 
 from ..domain.services.transport_service import TransportService
-from ..domain.services.route_service import RouteService
-from ..domain.services.cost_service import CostService
+from ..domain.services.route_service import RouteService, DEFAULT_LANE_PRECISION
+from ..domain.services.cost_service import CostService, TollCalculationPort
 from ..domain.services.offer_service import OfferService
 from ..domain.services.business_service import BusinessService
 from ..domain.services.cargo_service import CargoService
@@ -25,13 +39,19 @@ from .repositories.cargo_repository import (
     SQLCostSettingsRepository,
     SQLCostBreakdownRepository,
     SQLOfferRepository,
-    SQLCargoRepository
+    SQLCargoRepository,
+    DEFAULT_BREAKDOWN_MEMO_SIZE,
+    get_cost_breakdown_memo
 )
 from .repositories.business_repository import SQLBusinessRepository
 from .repositories.location_repository import SQLLocationRepository
-from .repositories.toll_rate_override_repository import TollRateOverrideRepository
+from .repositories.toll_rate_override_repository import (
+    TollRateOverrideRepository,
+    get_toll_override_cache
+)
 from .repositories.rate_validation_repository import RateValidationRepository
 from .repositories.empty_driving_repository import SQLEmptyDrivingRepository
+from .repositories.lane_repository import SQLLaneRepository
 
 
 class Container:
@@ -58,19 +78,88 @@ class Container:
                 location_repo=self.location_repository(),
                 timeout=self._config['GOOGLE_MAPS']['TIMEOUT'],
                 max_retries=self._config['GOOGLE_MAPS']['MAX_RETRIES'],
-                retry_delay=self._config['GOOGLE_MAPS']['RETRY_DELAY']
+                retry_delay=self._config['GOOGLE_MAPS']['RETRY_DELAY'],
+                country_index=get_country_index(
+                    self._config['GOOGLE_MAPS'].get('BORDER_MARGIN_KM', 25.0)
+                ),
+                response_cache=self.maps_response_cache(),
+                tile_cache=self.geocode_tile_cache(),
+                max_workers=self._config['GOOGLE_MAPS'].get('MAX_WORKERS', 8),
+                client=self.maps_client_factory().client()
+            )
+        )
+
+    def maps_client_factory(self) -> MapsClientFactory:
+        """Get the process-wide Google Maps client factory."""
+        maps_config = self._config['GOOGLE_MAPS']
+        return self._get_or_create(
+            'maps_client_factory',
+            lambda: get_maps_client_factory(
+                api_key=maps_config['API_KEY'],
+                timeout=maps_config['TIMEOUT'],
+                queries_per_second=maps_config.get('QUERIES_PER_SECOND', 50),
+                daily_quota=maps_config.get('DAILY_QUOTA', 0),
+                pool_size=maps_config.get('POOL_SIZE', 20),
+                failure_threshold=maps_config.get('CIRCUIT_FAILURE_THRESHOLD', 5),
+                reset_timeout=maps_config.get('CIRCUIT_RESET_SECONDS', 30.0),
+                transport_mode=maps_config.get('TRANSPORT_MODE', 'live'),
+                cassette_dir=maps_config.get('CASSETTE_DIR', 'tests/fixtures/cassettes'),
+                replay_latency_ms=maps_config.get('REPLAY_LATENCY_MS', 0.0)
+            )
+        )
+
+    def maps_response_cache(self) -> Optional[ResponseCache]:
+        """Get the persistent Google Maps response cache, if enabled."""
+        def create():
+            maps_config = self._config['GOOGLE_MAPS']
+            ttl = maps_config.get('CACHE_TTL', 0)
+            path = maps_config.get('CACHE_PATH')
+            if not ttl or ttl <= 0 or not path:
+                return None
+            return ResponseCache(
+                path=path,
+                ttl_seconds=ttl,
+                max_entries=maps_config.get('CACHE_MAX_ENTRIES', 10000),
+                coord_precision=maps_config.get('CACHE_COORD_PRECISION', 5)
+            )
+        return self._get_or_create('maps_response_cache', create)
+
+    def geocode_tile_cache(self) -> GeocodeTileCache:
+        """Get the geohash tile cache for reverse geocoding results."""
+        maps_config = self._config['GOOGLE_MAPS']
+        return self._get_or_create(
+            'geocode_tile_cache',
+            lambda: GeocodeTileCache(
+                path=maps_config.get('CACHE_PATH') or None,
+                precision=maps_config.get('TILE_PRECISION', 7),
+                memory_size=maps_config.get('TILE_CACHE_SIZE', 4096)
+            )
+        )
+
+    def toll_rate_store(self) -> TollRateStore:
+        """Get the process-wide toll rate store."""
+        return self._get_or_create(
+            'toll_rate_store',
+            lambda: configure_toll_rate_store(
+                path=self._config['TOLL_RATE'].get('RATES_FILE'),
+                reload_seconds=self._config['TOLL_RATE'].get('RATES_RELOAD_SECONDS', 5.0)
             )
         )
 
     def toll_rate_service(self) -> TollRateService:
         """Get Toll Rate service instance."""
+        self.toll_rate_store()
         return self._get_or_create(
             'toll_rate_service',
             lambda: TollRateService(
                 api_key=self._config['TOLL_RATE']['API_KEY'],
                 timeout=self._config['TOLL_RATE']['TIMEOUT'],
                 max_retries=self._config['TOLL_RATE']['MAX_RETRIES'],
-                retry_delay=self._config['TOLL_RATE']['RETRY_DELAY']
+                retry_delay=self._config['TOLL_RATE']['RETRY_DELAY'],
+                client=(
+                    self.maps_client_factory().client()
+                    if self._config['TOLL_RATE']['API_KEY'] else None
+                )
             )
         )
 
@@ -94,16 +183,64 @@ class Container:
             maps_service=self.google_maps_service()
         )
 
+    def route_estimator(self) -> HaversineEstimateAdapter:
+        """Get the offline route estimator, calibrated from stored routes."""
+        def create():
+            maps_config = self._config['GOOGLE_MAPS']
+            default_speed = maps_config.get('ESTIMATE_SPEED_KMH', DEFAULT_TRUCK_SPEED_KMH)
+            store = self.detour_factor_store()
+            return HaversineEstimateAdapter(
+                location_repo=self.location_repository(),
+                country_index=get_country_index(0.0),
+                detour_factors=lambda: store.get(self._load_corridor_samples),
+                speed_for=lambda country_code: get_truck_speed(country_code, default_speed)
+            )
+        return self._get_or_create('route_estimator', create)
+
+    def detour_factor_store(self) -> DetourFactorStore:
+        """Get the process-wide detour factor store of the route estimator."""
+        return get_detour_factor_store(
+            self._config['GOOGLE_MAPS'].get('ESTIMATE_CALIBRATION_SECONDS', DEFAULT_CALIBRATION_SECONDS)
+        )
+
+    def warm_detour_factors(self) -> None:
+        """Start calibrating detour factors in the background, e.g. at startup."""
+        self.detour_factor_store().refresh_async(self._load_corridor_samples)
+
+    def _load_corridor_samples(self) -> List[CorridorSample]:
+        """Load detour calibration samples in a session of their own.
+
+        Calibration runs on a background thread, which must not share the
+        container's session.
+        """
+        session = Session(bind=self._db.get_bind())
+        try:
+            return SQLRouteRepository(session).find_corridor_samples()
+        finally:
+            session.close()
+
     def toll_rate_adapter(self) -> TollRateAdapter:
         """Get Toll Rate adapter instance."""
         return self._get_or_create(
             'toll_rate_adapter',
             lambda: TollRateAdapter(
                 toll_service=self.toll_rate_service(),
-                override_repository=TollRateOverrideRepository(self._db)
+                override_repository=self.toll_rate_override_repo()
             )
         )
 
+    def toll_calculator(self) -> TollCalculationPort:
+        """Get the toll calculator, memoizing per-segment results if enabled."""
+        def create():
+            cache_size = self._config['TOLL_RATE'].get('RESULT_CACHE_SIZE', 4096)
+            if cache_size <= 0:
+                return self.toll_rate_adapter()
+            return CachingTollCalculator(
+                self.toll_rate_adapter(),
+                cache=get_toll_result_cache(cache_size)
+            )
+        return self._get_or_create('toll_calculator', create)
+
     def openai_adapter(self) -> OpenAIAdapter:
         """Get OpenAI adapter instance."""
         return self._get_or_create(
@@ -194,6 +331,13 @@ class Container:
             lambda: SQLLocationRepository(self._db)
         )
 
+    def toll_rate_override_repo(self) -> TollRateOverrideRepository:
+        """Get toll rate override repository backed by the shared override cache."""
+        return self._get_or_create(
+            'toll_rate_override_repo',
+            lambda: TollRateOverrideRepository(self._db, cache=get_toll_override_cache())
+        )
+
     def empty_driving_repository(self) -> SQLEmptyDrivingRepository:
         """Get empty driving repository instance."""
         return self._get_or_create(
@@ -201,6 +345,13 @@ class Container:
             lambda: SQLEmptyDrivingRepository(self._db)
         )
 
+    def lane_repository(self) -> SQLLaneRepository:
+        """Get lane repository instance."""
+        return self._get_or_create(
+            'lane_repository',
+            lambda: SQLLaneRepository(self._db)
+        )
+
     # Domain Services
     def business_service(self) -> BusinessService:
         """Get business service instance."""
@@ -221,31 +372,37 @@ class Container:
         )
 
     def route_service(self) -> RouteService:
-        """Get route service instance."""
-        return self._get_or_create(
-            'route_service',
-            lambda: RouteService(
+        """Get route service instance, backed by the lane store if enabled."""
+        def create():
+            maps_config = self._config['GOOGLE_MAPS']
+            max_age_hours = maps_config.get('LANE_MAX_AGE_HOURS', 168.0)
+            return RouteService(
                 route_repo=self.route_repository(),
                 route_calculator=self.google_maps_adapter(),
-                location_repo=self.location_repository()
+                location_repo=self.location_repository(),
+                lane_repo=self.lane_repository() if max_age_hours > 0 else None,
+                lane_max_age=timedelta(hours=max_age_hours),
+                lane_precision=maps_config.get('LANE_PRECISION', DEFAULT_LANE_PRECISION),
+                route_estimator=self.route_estimator()
             )
-        )
+        return self._get_or_create('route_service', create)
 
     def cost_service(self) -> CostService:
-        """Get cost service instance."""
-        return self._get_or_create(
-            'cost_service',
-            lambda: CostService(
+        """Get cost service instance, memoizing breakdowns if enabled."""
+        def create():
+            memo_size = self._config.get('COST', {}).get('BREAKDOWN_MEMO_SIZE', DEFAULT_BREAKDOWN_MEMO_SIZE)
+            return CostService(
                 settings_repo=self.cost_settings_repository(),
                 breakdown_repo=self.cost_breakdown_repository(),
                 empty_driving_repo=self.empty_driving_repository(),
-                toll_calculator=self.toll_rate_adapter(),
+                toll_calculator=self.toll_calculator(),
                 rate_validation_repo=RateValidationRepository(self._db),
                 route_repo=self.route_repository(),
                 transport_repo=self.transport_repository(),
-                business_repo=self.business_repository()
+                business_repo=self.business_repository(),
+                breakdown_memo=get_cost_breakdown_memo(memo_size) if memo_size > 0 else None
             )
-        )
+        return self._get_or_create('cost_service', create)
 
     def offer_service(self) -> OfferService:
         """Get offer service instance."""
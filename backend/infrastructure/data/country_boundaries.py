@@ -0,0 +1,351 @@
+"""Simplified country boundary polygons for offline country lookup."""
+from typing import Dict, List, Tuple
+
+# Points closer than this to a simplified border are treated as ambiguous (km)
+DEFAULT_BORDER_MARGIN_KM = 25.0
+
+# Size of the grid buckets used by the boundary index (degrees)
+DEFAULT_GRID_CELL_DEG = 1.0
+
+# Simplified boundary polygons as (lat, lng) vertices for Switzerland and every
+# EU member state priced by the toll rate table. Only the mainland and the
+# islands noted next to each country are covered; other territory, such as
+# Norway, the western Balkans or Great Britain, resolves to None.
+# Land borders are traced coarsely and share vertices between neighbours;
+# coastlines are drawn generously offshore since no other country sits there.
+# Accuracy is only good to a few kilometres, which is why lookups within
+# DEFAULT_BORDER_MARGIN_KM of an edge fall back to reverse geocoding.
+COUNTRY_BOUNDARIES: Dict[str, List[Tuple[float, float]]] = {
+    "DE": [  # Germany
+        (53.33, 7.20), (53.70, 7.00), (53.95, 8.10), (54.10, 8.50),
+        (54.55, 8.40), (54.91, 8.30), (54.91, 8.65), (54.85, 9.25),
+        (54.81, 9.45), (54.84, 9.90), (54.65, 10.10), (54.45, 10.45),
+        (54.55, 11.35), (54.20, 11.60), (54.25, 12.20), (54.50, 12.60),
+        (54.70, 13.40), (54.40, 13.90), (53.93, 14.22), (53.75, 14.28),
+        (53.45, 14.42), (53.28, 14.41), (53.05, 14.30), (52.85, 14.13),
+        (52.60, 14.60), (52.34, 14.55), (52.05, 14.72), (51.55, 14.73),
+        (51.15, 14.99), (50.87, 14.82), (51.04, 14.50), (50.90, 14.25),
+        (50.77, 13.90), (50.65, 13.55), (50.50, 13.20), (50.42, 12.95),
+        (50.35, 12.55), (50.32, 12.10), (50.10, 12.20), (49.95, 12.45),
+        (49.70, 12.50), (49.45, 12.70), (49.25, 12.95), (49.15, 13.20),
+        (48.95, 13.50), (48.77, 13.84), (48.57, 13.50), (48.45, 13.43),
+        (48.25, 13.00), (48.05, 12.77), (47.85, 12.95), (47.70, 13.05),
+        (47.55, 13.05), (47.48, 12.95), (47.62, 12.75), (47.68, 12.45),
+        (47.58, 12.20), (47.55, 11.80), (47.45, 11.60), (47.40, 11.25),
+        (47.40, 10.95), (47.55, 10.70), (47.50, 10.45), (47.27, 10.18),
+        (47.38, 10.05), (47.55, 9.78), (47.53, 9.60), (47.655, 9.17),
+        (47.69, 8.87), (47.80, 8.65), (47.70, 8.45), (47.58, 8.22),
+        (47.56, 7.95), (47.59, 7.59), (47.75, 7.55), (48.10, 7.58),
+        (48.58, 7.80), (48.97, 8.23), (49.05, 7.95), (49.12, 7.50),
+        (49.18, 7.05), (49.40, 6.60), (49.47, 6.37), (49.70, 6.50),
+        (49.85, 6.35), (50.00, 6.14), (50.13, 6.13), (50.33, 6.40),
+        (50.50, 6.27), (50.63, 6.05), (50.75, 6.02), (50.95, 6.02),
+        (51.05, 5.87), (51.18, 6.08), (51.50, 6.20), (51.85, 6.03),
+        (51.85, 6.40), (51.97, 6.80), (52.25, 7.00), (52.45, 7.00),
+        (52.65, 7.07), (53.00, 7.20),
+    ],
+    "NL": [  # Netherlands
+        (53.33, 7.20), (53.00, 7.20), (52.65, 7.07), (52.45, 7.00),
+        (52.25, 7.00), (51.97, 6.80), (51.85, 6.40), (51.85, 6.03),
+        (51.50, 6.20), (51.18, 6.08), (51.05, 5.87), (50.95, 6.02),
+        (50.75, 6.02), (50.75, 5.65), (50.90, 5.63), (51.10, 5.80),
+        (51.25, 5.55), (51.30, 5.20), (51.45, 5.00), (51.48, 4.45),
+        (51.40, 4.25), (51.27, 3.95), (51.20, 3.55), (51.27, 3.38),
+        (51.37, 3.37), (51.60, 3.40), (52.00, 4.00), (52.50, 4.45),
+        (53.00, 4.60), (53.45, 5.00), (53.55, 6.00), (53.55, 6.90),
+    ],
+    "BE": [  # Belgium
+        (51.37, 3.37), (51.27, 3.38), (51.20, 3.55), (51.27, 3.95),
+        (51.40, 4.25), (51.48, 4.45), (51.45, 5.00), (51.30, 5.20),
+        (51.25, 5.55), (51.10, 5.80), (50.90, 5.63), (50.75, 5.65),
+        (50.75, 6.02), (50.63, 6.05), (50.50, 6.27), (50.33, 6.40),
+        (50.13, 6.13), (50.18, 6.03), (49.95, 5.76), (49.70, 5.87),
+        (49.55, 5.82), (49.50, 5.47), (49.70, 5.20), (49.80, 4.85),
+        (50.15, 4.82), (49.95, 4.45), (50.05, 4.15), (50.33, 4.00),
+        (50.45, 3.65), (50.70, 3.15), (50.80, 2.90), (50.95, 2.60),
+        (51.08, 2.55), (51.30, 2.55), (51.45, 3.20),
+    ],
+    "LU": [  # Luxembourg
+        (50.13, 6.13), (50.00, 6.14), (49.85, 6.35), (49.70, 6.50),
+        (49.47, 6.37), (49.47, 6.10), (49.55, 5.82), (49.70, 5.87),
+        (49.95, 5.76), (50.18, 6.03),
+    ],
+    "FR": [  # France (mainland)
+        (51.08, 2.55), (50.95, 2.60), (50.80, 2.90), (50.70, 3.15),
+        (50.45, 3.65), (50.33, 4.00), (50.05, 4.15), (49.95, 4.45),
+        (50.15, 4.82), (49.80, 4.85), (49.70, 5.20), (49.50, 5.47),
+        (49.55, 5.82), (49.47, 6.10), (49.47, 6.37), (49.40, 6.60),
+        (49.18, 7.05), (49.12, 7.50), (49.05, 7.95), (48.97, 8.23),
+        (48.58, 7.80), (48.10, 7.58), (47.75, 7.55), (47.59, 7.59),
+        (47.50, 7.45), (47.50, 7.00), (47.43, 6.95), (47.30, 6.95),
+        (47.05, 6.65), (46.80, 6.45), (46.55, 6.10), (46.40, 6.05),
+        (46.25, 5.97), (46.15, 6.05), (46.13, 6.20), (46.30, 6.45),
+        (46.40, 6.80), (46.20, 6.85), (45.92, 7.04), (45.80, 6.82),
+        (45.65, 6.85), (45.40, 7.10), (45.20, 6.85), (45.10, 6.65),
+        (44.90, 6.75), (44.60, 6.95), (44.35, 6.90), (44.20, 7.00),
+        (44.10, 7.60), (43.90, 7.55), (43.78, 7.53), (43.50, 7.30),
+        (43.00, 6.50), (43.00, 5.00), (43.30, 4.00), (42.90, 3.30),
+        (42.43, 3.17), (42.45, 2.90), (42.40, 2.50), (42.50, 1.90),
+        (42.55, 1.70), (42.70, 1.45), (42.80, 0.70), (42.70, 0.00),
+        (42.85, -0.55), (43.05, -1.30), (43.25, -1.40), (43.37, -1.78),
+        (43.60, -1.80), (44.50, -1.50), (45.50, -1.50), (46.30, -2.00),
+        (47.20, -2.80), (47.60, -3.50), (47.80, -4.50), (48.40, -5.00),
+        (48.80, -4.00), (48.90, -3.00), (48.70, -2.00), (48.70, -1.60),
+        (49.70, -1.90), (49.70, -1.20), (49.40, -0.60), (49.50, 0.20),
+        (49.90, 0.70), (50.20, 1.50), (50.90, 1.60),
+    ],
+    "CH": [  # Switzerland (including Liechtenstein)
+        (47.59, 7.59), (47.56, 7.95), (47.58, 8.22), (47.70, 8.45),
+        (47.80, 8.65), (47.69, 8.87), (47.655, 9.17), (47.53, 9.60),
+        (47.27, 9.53), (47.05, 9.60), (47.05, 9.87), (46.95, 10.10),
+        (46.85, 10.47), (46.60, 10.45), (46.50, 10.15), (46.30, 10.15),
+        (46.25, 9.95), (46.40, 9.45), (46.00, 9.05), (45.82, 9.02),
+        (45.95, 8.80), (46.10, 8.70), (46.25, 8.45), (46.25, 8.10),
+        (45.93, 7.70), (45.87, 7.10), (45.92, 7.04), (46.20, 6.85),
+        (46.40, 6.80), (46.30, 6.45), (46.13, 6.20), (46.15, 6.05),
+        (46.25, 5.97), (46.40, 6.05), (46.55, 6.10), (46.80, 6.45),
+        (47.05, 6.65), (47.30, 6.95), (47.43, 6.95), (47.50, 7.00),
+        (47.50, 7.45),
+    ],
+    "AT": [  # Austria
+        (47.53, 9.60), (47.55, 9.78), (47.38, 10.05), (47.27, 10.18),
+        (47.50, 10.45), (47.55, 10.70), (47.40, 10.95), (47.40, 11.25),
+        (47.45, 11.60), (47.55, 11.80), (47.58, 12.20), (47.68, 12.45),
+        (47.62, 12.75), (47.48, 12.95), (47.55, 13.05), (47.70, 13.05),
+        (47.85, 12.95), (48.05, 12.77), (48.25, 13.00), (48.45, 13.43),
+        (48.57, 13.50), (48.77, 13.84), (48.60, 14.05), (48.58, 14.70),
+        (48.75, 14.95), (49.00, 15.00), (48.95, 15.30), (48.85, 15.90),
+        (48.75, 16.50), (48.62, 16.94), (48.40, 16.85), (48.15, 16.98),
+        (48.01, 17.16), (47.85, 17.00), (47.75, 16.85), (47.70, 16.45),
+        (47.60, 16.60), (47.40, 16.45), (47.20, 16.50), (46.87, 16.11),
+        (46.70, 15.90), (46.70, 15.60), (46.65, 15.00), (46.45, 14.60),
+        (46.48, 14.00), (46.52, 13.71), (46.60, 13.20), (46.65, 12.60),
+        (46.70, 12.25), (46.95, 12.15), (47.00, 11.50), (46.75, 11.00),
+        (46.83, 10.50), (46.85, 10.47), (46.95, 10.10), (47.05, 9.87),
+        (47.05, 9.60), (47.27, 9.53),
+    ],
+    "CZ": [  # Czech Republic
+        (50.87, 14.82), (51.04, 14.50), (50.90, 14.25), (50.77, 13.90),
+        (50.65, 13.55), (50.50, 13.20), (50.42, 12.95), (50.35, 12.55),
+        (50.32, 12.10), (50.10, 12.20), (49.95, 12.45), (49.70, 12.50),
+        (49.45, 12.70), (49.25, 12.95), (49.15, 13.20), (48.95, 13.50),
+        (48.77, 13.84), (48.60, 14.05), (48.58, 14.70), (48.75, 14.95),
+        (49.00, 15.00), (48.95, 15.30), (48.85, 15.90), (48.75, 16.50),
+        (48.62, 16.94), (48.80, 17.15), (48.90, 17.50), (49.10, 17.90),
+        (49.30, 18.15), (49.52, 18.85), (49.85, 18.55), (49.95, 18.35),
+        (50.05, 18.00), (50.25, 17.70), (50.30, 17.20), (50.40, 16.90),
+        (50.20, 16.80), (50.10, 16.70), (50.30, 16.30), (50.60, 16.20),
+        (50.75, 15.90), (50.75, 15.70), (50.85, 15.25), (51.00, 15.00),
+    ],
+    "PL": [  # Poland
+        (53.93, 14.22), (53.75, 14.28), (53.45, 14.42), (53.28, 14.41),
+        (53.05, 14.30), (52.85, 14.13), (52.60, 14.60), (52.34, 14.55),
+        (52.05, 14.72), (51.55, 14.73), (51.15, 14.99), (50.87, 14.82),
+        (51.00, 15.00), (50.85, 15.25), (50.75, 15.70), (50.75, 15.90),
+        (50.60, 16.20), (50.30, 16.30), (50.10, 16.70), (50.20, 16.80),
+        (50.40, 16.90), (50.30, 17.20), (50.25, 17.70), (50.05, 18.00),
+        (49.95, 18.35), (49.85, 18.55), (49.52, 18.85), (49.40, 19.20),
+        (49.55, 19.50), (49.25, 19.95), (49.40, 20.40), (49.40, 21.00),
+        (49.35, 21.60), (49.15, 22.10), (49.08, 22.56), (49.50, 22.70),
+        (50.05, 23.00), (50.40, 23.70), (50.50, 24.10), (51.20, 23.90),
+        (51.60, 23.60), (52.10, 23.65), (52.60, 23.90), (53.10, 23.90),
+        (53.90, 23.50), (54.35, 22.80), (54.40, 20.00), (54.45, 19.60),
+        (54.50, 19.00), (54.85, 18.40), (54.85, 17.50), (54.55, 16.50),
+        (54.25, 15.80), (54.10, 14.80),
+    ],
+    "SK": [  # Slovakia
+        (48.62, 16.94), (48.80, 17.15), (48.90, 17.50), (49.10, 17.90),
+        (49.30, 18.15), (49.52, 18.85), (49.40, 19.20), (49.55, 19.50),
+        (49.25, 19.95), (49.40, 20.40), (49.40, 21.00), (49.35, 21.60),
+        (49.15, 22.10), (49.08, 22.56), (48.80, 22.40), (48.40, 22.15),
+        (48.55, 21.70), (48.55, 21.10), (48.30, 20.50), (48.10, 20.00),
+        (48.05, 19.50), (48.10, 19.00), (47.80, 18.80), (47.75, 18.30),
+        (47.87, 17.70), (48.01, 17.16), (48.15, 16.98), (48.40, 16.85),
+    ],
+    "HU": [  # Hungary
+        (48.01, 17.16), (47.87, 17.70), (47.75, 18.30), (47.80, 18.80),
+        (48.10, 19.00), (48.05, 19.50), (48.10, 20.00), (48.30, 20.50),
+        (48.55, 21.10), (48.55, 21.70), (48.40, 22.15), (48.10, 22.90),
+        (47.75, 22.40), (47.35, 22.00), (46.80, 21.50), (46.40, 21.25),
+        (46.12, 20.30), (46.15, 19.50), (45.95, 19.00), (45.90, 18.80),
+        (45.75, 18.40), (45.90, 17.70), (46.10, 17.20), (46.40, 16.70),
+        (46.48, 16.60), (46.70, 16.30), (46.87, 16.11), (47.20, 16.50),
+        (47.40, 16.45), (47.60, 16.60), (47.70, 16.45), (47.75, 16.85),
+        (47.85, 17.00),
+    ],
+    "DK": [  # Denmark (Jutland and the main islands, without Bornholm)
+        (54.91, 8.30), (54.91, 8.65), (54.85, 9.25), (54.81, 9.45),
+        (54.84, 9.90), (54.65, 10.10), (54.45, 10.45), (54.55, 11.35),
+        (54.20, 11.60), (54.25, 12.20), (54.50, 12.60), (54.70, 13.40),
+        (55.10, 13.40), (55.30, 12.75), (55.55, 12.80), (55.80, 12.70),
+        (56.03, 12.65), (56.15, 12.50), (56.40, 12.20), (57.00, 11.70),
+        (57.60, 11.30), (58.00, 10.80), (57.95, 10.00), (57.60, 9.20),
+        (57.25, 8.20), (56.60, 7.90), (55.50, 7.90), (55.10, 7.90),
+    ],
+    "SE": [  # Sweden (including Oland and Gotland)
+        (59.10, 11.45), (59.05, 11.10), (58.90, 10.90), (58.00, 10.80),
+        (57.60, 11.30), (57.00, 11.70), (56.40, 12.20), (56.15, 12.50),
+        (56.03, 12.65), (55.80, 12.70), (55.55, 12.80), (55.30, 12.75),
+        (55.10, 13.40), (55.30, 14.30), (55.80, 14.50), (56.00, 16.30),
+        (56.70, 17.80), (57.80, 19.40), (58.80, 19.20), (59.50, 19.40),
+        (60.30, 19.15), (61.50, 19.80), (62.50, 20.30), (63.50, 21.10),
+        (64.20, 22.30), (65.00, 23.50), (65.60, 24.10), (65.85, 24.15),
+        (66.40, 23.70), (67.20, 23.60), (67.90, 23.45), (68.35, 22.30),
+        (68.70, 21.00), (69.05, 20.55), (68.43, 18.12), (67.95, 17.40),
+        (67.40, 16.30), (66.90, 15.60), (66.15, 14.55), (65.55, 14.50),
+        (64.50, 14.10), (64.00, 13.10), (63.32, 12.10), (62.60, 12.25),
+        (61.60, 12.75), (61.00, 12.65), (60.20, 12.55), (59.80, 11.85),
+    ],
+    "FI": [  # Finland (including Aland)
+        (69.05, 20.55), (68.70, 21.00), (68.35, 22.30), (67.90, 23.45),
+        (67.20, 23.60), (66.40, 23.70), (65.85, 24.15), (65.60, 24.10),
+        (65.00, 23.50), (64.20, 22.30), (63.50, 21.10), (62.50, 20.30),
+        (61.50, 19.80), (60.30, 19.15), (59.70, 20.30), (59.60, 22.00),
+        (59.75, 23.50), (59.85, 25.00), (60.00, 26.80), (60.55, 27.75),
+        (61.25, 29.20), (62.20, 30.70), (63.10, 31.30), (64.00, 29.95),
+        (64.80, 30.10), (65.65, 30.10), (66.90, 29.05), (67.60, 29.90),
+        (68.10, 28.70), (68.90, 28.80), (69.05, 28.93), (69.80, 29.10),
+        (70.08, 27.90), (69.90, 26.80), (69.40, 25.80), (68.85, 25.20),
+        (68.65, 24.00), (68.90, 22.40), (69.30, 21.30),
+    ],
+    "EE": [  # Estonia
+        (59.47, 28.05), (59.38, 28.20), (59.00, 27.80), (58.40, 27.50),
+        (58.00, 27.65), (57.52, 27.35), (57.70, 26.90), (57.85, 26.50),
+        (57.78, 26.05), (57.95, 25.30), (57.85, 24.90), (57.87, 24.35),
+        (57.65, 23.60), (57.70, 23.00), (57.84, 22.35), (57.80, 21.20),
+        (58.50, 20.60), (59.30, 21.50), (59.60, 22.00), (59.75, 23.50),
+        (59.85, 25.00), (60.00, 26.80),
+    ],
+    "LV": [  # Latvia
+        (57.52, 27.35), (57.70, 26.90), (57.85, 26.50), (57.78, 26.05),
+        (57.95, 25.30), (57.85, 24.90), (57.87, 24.35), (57.65, 23.60),
+        (57.70, 23.00), (57.84, 22.35), (57.80, 21.20), (57.00, 20.50),
+        (56.07, 20.50), (56.07, 21.06), (56.40, 22.00), (56.40, 22.90),
+        (56.33, 24.00), (56.05, 25.20), (56.15, 25.80), (55.67, 26.63),
+        (55.85, 27.60), (56.17, 28.16), (56.90, 27.80),
+    ],
+    "LT": [  # Lithuania
+        (56.07, 21.06), (56.07, 20.50), (55.28, 20.50), (55.28, 20.95),
+        (55.30, 21.30), (55.10, 22.00), (55.07, 22.60), (54.80, 22.85),
+        (54.35, 22.80), (53.90, 23.50), (54.00, 24.00), (53.95, 24.70),
+        (54.15, 25.20), (54.25, 25.60), (54.55, 25.78), (54.85, 25.80),
+        (55.15, 26.80), (55.67, 26.63), (56.15, 25.80), (56.05, 25.20),
+        (56.33, 24.00), (56.40, 22.90), (56.40, 22.00),
+    ],
+    "IT": [  # Italy (mainland)
+        (43.78, 7.53), (43.90, 7.55), (44.10, 7.60), (44.20, 7.00),
+        (44.35, 6.90), (44.60, 6.95), (44.90, 6.75), (45.10, 6.65),
+        (45.20, 6.85), (45.40, 7.10), (45.65, 6.85), (45.80, 6.82),
+        (45.92, 7.04), (45.87, 7.10), (45.93, 7.70), (46.25, 8.10),
+        (46.25, 8.45), (46.10, 8.70), (45.95, 8.80), (45.82, 9.02),
+        (46.00, 9.05), (46.40, 9.45), (46.25, 9.95), (46.30, 10.15),
+        (46.50, 10.15), (46.60, 10.45), (46.85, 10.47), (46.83, 10.50),
+        (46.75, 11.00), (47.00, 11.50), (46.95, 12.15), (46.70, 12.25),
+        (46.65, 12.60), (46.60, 13.20), (46.52, 13.71), (46.30, 13.60),
+        (46.10, 13.65), (45.90, 13.60), (45.72, 13.85), (45.60, 13.90),
+        (45.59, 13.72), (45.40, 13.10), (44.50, 12.60), (43.60, 13.80),
+        (42.50, 14.50), (41.90, 16.30), (40.60, 18.60), (39.80, 18.50),
+        (40.20, 17.00), (38.90, 17.30), (37.90, 16.00), (37.90, 15.60),
+        (38.90, 15.60), (40.00, 15.30), (40.60, 14.00), (41.20, 13.00),
+        (42.40, 11.00), (43.00, 10.20), (43.90, 9.80), (44.30, 8.60),
+        (43.80, 7.70),
+    ],
+    "SI": [  # Slovenia
+        (46.52, 13.71), (46.48, 14.00), (46.45, 14.60), (46.65, 15.00),
+        (46.70, 15.60), (46.70, 15.90), (46.87, 16.11), (46.70, 16.30),
+        (46.48, 16.60), (46.39, 16.27), (46.20, 15.65), (45.85, 15.70),
+        (45.75, 15.30), (45.48, 15.30), (45.47, 14.85), (45.58, 14.60),
+        (45.48, 14.25), (45.48, 13.60), (45.48, 13.50), (45.59, 13.72),
+        (45.60, 13.90), (45.72, 13.85), (45.90, 13.60), (46.10, 13.65),
+        (46.30, 13.60),
+    ],
+    "HR": [  # Croatia
+        (45.48, 13.50), (45.48, 13.60), (45.48, 14.25), (45.58, 14.60),
+        (45.47, 14.85), (45.48, 15.30), (45.75, 15.30), (45.85, 15.70),
+        (46.20, 15.65), (46.39, 16.27), (46.48, 16.60), (46.40, 16.70),
+        (46.10, 17.20), (45.90, 17.70), (45.75, 18.40), (45.90, 18.80),
+        (45.60, 19.00), (45.20, 19.42), (45.00, 19.10), (44.87, 19.03),
+        (45.05, 18.70), (45.10, 18.00), (45.15, 17.40), (45.25, 16.90),
+        (45.05, 16.40), (45.22, 15.90), (44.85, 15.72), (44.60, 15.95),
+        (44.20, 16.15), (44.00, 16.40), (43.50, 17.10), (43.15, 17.50),
+        (43.00, 17.80), (42.75, 18.10), (42.55, 18.45), (42.40, 18.52),
+        (42.35, 18.45), (42.40, 16.00), (43.00, 15.30), (43.60, 14.50),
+        (44.30, 13.80), (44.80, 13.40), (45.20, 13.20),
+    ],
+    "RO": [  # Romania
+        (48.10, 22.90), (47.95, 23.50), (47.95, 24.00), (47.75, 24.90),
+        (47.95, 25.30), (48.10, 26.20), (48.25, 26.63), (47.85, 27.20),
+        (47.40, 27.75), (47.00, 28.05), (46.50, 28.15), (46.00, 28.05),
+        (45.47, 28.20), (45.33, 28.80), (45.40, 29.60), (45.20, 29.80),
+        (44.80, 29.90), (44.00, 29.00), (43.74, 28.58), (43.98, 27.90),
+        (44.12, 27.27), (44.05, 26.60), (43.89, 25.97), (43.63, 25.35),
+        (43.70, 24.80), (43.72, 24.00), (43.80, 23.40), (43.85, 23.00),
+        (44.10, 22.95), (44.22, 22.67), (44.55, 22.45), (44.70, 22.00),
+        (44.60, 21.60), (44.80, 21.38), (45.20, 21.50), (45.55, 20.90),
+        (45.90, 20.60), (46.12, 20.30), (46.40, 21.25), (46.80, 21.50),
+        (47.35, 22.00), (47.75, 22.40),
+    ],
+    "BG": [  # Bulgaria
+        (44.22, 22.67), (44.10, 22.95), (43.85, 23.00), (43.80, 23.40),
+        (43.72, 24.00), (43.70, 24.80), (43.63, 25.35), (43.89, 25.97),
+        (44.05, 26.60), (44.12, 27.27), (43.98, 27.90), (43.74, 28.58),
+        (43.60, 28.80), (42.80, 28.20), (41.98, 28.10), (41.95, 27.60),
+        (42.05, 27.00), (41.72, 26.36), (41.55, 25.90), (41.35, 25.20),
+        (41.45, 24.50), (41.42, 24.10), (41.55, 23.40), (41.34, 22.93),
+        (41.70, 22.95), (42.05, 22.60), (42.32, 22.36), (42.90, 22.45),
+        (43.00, 22.83), (43.25, 22.95), (43.55, 22.50), (43.90, 22.40),
+    ],
+    "GR": [  # Greece (mainland, Peloponnese and Euboea)
+        (41.34, 22.93), (41.55, 23.40), (41.42, 24.10), (41.45, 24.50),
+        (41.35, 25.20), (41.55, 25.90), (41.72, 26.36), (41.60, 26.60),
+        (41.30, 26.65), (41.00, 26.35), (40.85, 26.05), (40.60, 25.50),
+        (40.10, 24.50), (39.50, 24.00), (38.40, 24.70), (37.90, 24.20),
+        (37.50, 23.80), (36.30, 23.30), (36.20, 22.50), (36.70, 21.50),
+        (37.80, 20.50), (38.50, 20.20), (39.30, 20.00), (39.65, 20.15),
+        (39.90, 20.35), (40.10, 20.70), (40.45, 20.95), (40.86, 20.98),
+        (40.95, 21.35), (41.12, 21.95), (41.10, 22.55),
+    ],
+    "ES": [  # Spain (mainland)
+        (43.37, -1.78), (43.25, -1.40), (43.05, -1.30), (42.85, -0.55),
+        (42.70, 0.00), (42.80, 0.70), (42.70, 1.45), (42.55, 1.70),
+        (42.50, 1.90), (42.40, 2.50), (42.45, 2.90), (42.43, 3.17),
+        (41.90, 3.30), (41.20, 2.20), (40.50, 0.80), (39.50, -0.10),
+        (38.70, 0.30), (37.60, -0.60), (36.70, -2.10), (36.60, -4.40),
+        (36.00, -5.60), (36.40, -6.30), (37.17, -7.40), (37.70, -7.50),
+        (38.20, -7.10), (38.90, -7.05), (39.40, -7.30), (39.65, -7.55),
+        (39.70, -7.00), (40.20, -6.90), (40.60, -6.80), (41.00, -6.80),
+        (41.60, -6.20), (41.95, -6.55), (41.95, -7.20), (41.85, -8.15),
+        (42.05, -8.65), (41.87, -8.87), (42.50, -9.20), (43.10, -9.40),
+        (43.80, -8.00), (43.60, -6.00), (43.60, -4.00), (43.50, -3.00),
+        (43.45, -2.00),
+    ],
+    "PT": [  # Portugal (mainland)
+        (41.87, -8.87), (42.05, -8.65), (41.85, -8.15), (41.95, -7.20),
+        (41.95, -6.55), (41.60, -6.20), (41.00, -6.80), (40.60, -6.80),
+        (40.20, -6.90), (39.70, -7.00), (39.65, -7.55), (39.40, -7.30),
+        (38.90, -7.05), (38.20, -7.10), (37.70, -7.50), (37.17, -7.40),
+        (36.90, -8.00), (37.00, -9.00), (38.00, -8.90), (38.70, -9.50),
+        (39.50, -9.40), (40.50, -8.80), (41.50, -8.90),
+    ],
+    "IE": [  # Ireland
+        (54.05, -6.15), (54.10, -6.65), (54.35, -7.00), (54.20, -7.25),
+        (54.10, -7.60), (54.25, -7.90), (54.45, -8.15), (54.60, -7.80),
+        (54.75, -7.55), (55.00, -7.40), (55.20, -7.05), (55.45, -7.05),
+        (55.55, -7.40), (55.40, -8.60), (54.50, -10.50), (53.20, -10.50),
+        (51.90, -10.80), (51.30, -9.90), (51.30, -8.50), (52.00, -6.20),
+        (52.80, -5.80), (53.40, -5.80), (53.95, -6.00),
+    ],
+    "CY": [  # Cyprus
+        (35.20, 32.20), (35.45, 32.90), (35.40, 33.50), (35.75, 34.65),
+        (35.55, 34.75), (35.00, 34.20), (34.80, 34.10), (34.50, 33.00),
+        (34.60, 32.40), (34.90, 32.20),
+    ],
+    "MT": [  # Malta (Malta and Gozo)
+        (35.75, 14.30), (36.10, 14.15), (36.10, 14.40), (35.80, 14.65),
+    ],
+}
+
+
+def get_supported_countries() -> List[str]:
+    """Get country codes covered by the offline boundary data."""
+    return sorted(COUNTRY_BOUNDARIES.keys())
@@ -0,0 +1,266 @@
+"""Compiled toll rate table loaded from a versioned data file.
+
+The JSON rate file is compiled into a flat ``(country, toll_class,
+euro_class) -> TollRate`` dict so a lookup is a single dict hit. A
+TollRateStore watches the file and swaps in a freshly compiled table when
+it changes, so rate updates do not require a deploy.
+"""
+import json
+import os
+import threading
+import time
+from decimal import Decimal
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from ..logging import get_logger
+
+DEFAULT_RATES_FILE = os.path.join(os.path.dirname(__file__), "toll_rates.json")
+DEFAULT_RELOAD_SECONDS = 5.0
+
+# Key used for countries without their own rates in the file
+FALLBACK_COUNTRY = "*"
+
+
+class TollRate(NamedTuple):
+    """Toll rate for one country and vehicle class combination (EUR/km)."""
+    base_rate: Decimal
+    euro_adjustment: Decimal
+    total_rate: Decimal
+
+
+class TollRateTable:
+    """Immutable, compiled toll rate table."""
+
+    def __init__(
+        self,
+        version: str,
+        rates: Dict[Tuple[str, str, str], TollRate],
+        countries: frozenset,
+        toll_classes: frozenset,
+        euro_classes: frozenset,
+        default_toll_class: str,
+        default_euro_class: str
+    ):
+        self.version = version
+        self._rates = rates
+        self._countries = countries
+        self._toll_classes = toll_classes
+        self._euro_classes = euro_classes
+        self._default_toll_class = default_toll_class
+        self._default_euro_class = default_euro_class
+
+    @property
+    def countries(self) -> frozenset:
+        """Get the countries with their own rates."""
+        return self._countries
+
+    def lookup(self, country_code: str, toll_class: str, euro_class: str) -> TollRate:
+        """Get the toll rate for a country and vehicle classes.
+
+        Unknown countries use the fallback rates; unknown toll and euro
+        classes use the file's default classes.
+        """
+        rate = self._rates.get((country_code, toll_class, euro_class))
+        if rate is not None:
+            return rate
+        return self._rates[(
+            country_code if country_code in self._countries else FALLBACK_COUNTRY,
+            toll_class if toll_class in self._toll_classes else self._default_toll_class,
+            euro_class if euro_class in self._euro_classes else self._default_euro_class
+        )]
+
+    def __len__(self) -> int:
+        return len(self._rates)
+
+
+def compile_toll_rate_table(document: Dict) -> TollRateTable:
+    """Compile a parsed rate file into a flat lookup table.
+
+    Args:
+        document: Parsed rate file with version, countries and default rates
+
+    Returns:
+        Compiled table
+
+    Raises:
+        ValueError: If the document is incomplete or has invalid rates
+    """
+    try:
+        version = str(document["version"])
+        default_toll_class = document.get("default_toll_class", "1")
+        default_euro_class = document.get("default_euro_class", "III")
+        tables = dict(document["countries"])
+        tables[FALLBACK_COUNTRY] = document["default"]
+
+        rates = {}
+        toll_classes = set()
+        euro_classes = set()
+        for country, table in tables.items():
+            base_rates = {k: Decimal(v) for k, v in table["toll_class"].items()}
+            adjustments = {k: Decimal(v) for k, v in table["euro_class"].items()}
+            if default_toll_class not in base_rates or default_euro_class not in adjustments:
+                raise ValueError(f"Rates for {country} lack the default vehicle classes")
+            toll_classes.update(base_rates)
+            euro_classes.update(adjustments)
+            for toll_class, base_rate in base_rates.items():
+                for euro_class, adjustment in adjustments.items():
+                    rates[(country, toll_class, euro_class)] = TollRate(
+                        base_rate, adjustment, base_rate + adjustment
+                    )
+    except (KeyError, TypeError, ArithmeticError) as e:
+        raise ValueError(f"Invalid toll rate file: {e}") from e
+
+    # Fill class gaps with the country's default classes so lookups stay a dict hit
+    for country, table in tables.items():
+        for toll_class in toll_classes:
+            for euro_class in euro_classes:
+                if (country, toll_class, euro_class) not in rates:
+                    rates[(country, toll_class, euro_class)] = rates[(
+                        country,
+                        toll_class if toll_class in table["toll_class"] else default_toll_class,
+                        euro_class if euro_class in table["euro_class"] else default_euro_class
+                    )]
+
+    return TollRateTable(
+        version=version,
+        rates=rates,
+        countries=frozenset(document["countries"]),
+        toll_classes=frozenset(toll_classes),
+        euro_classes=frozenset(euro_classes),
+        default_toll_class=default_toll_class,
+        default_euro_class=default_euro_class
+    )
+
+
+def load_toll_rate_table(path: str) -> TollRateTable:
+    """Load and compile a JSON rate file."""
+    with open(path, "r", encoding="utf-8") as rate_file:
+        return compile_toll_rate_table(json.load(rate_file))
+
+
+class TollRateStore:
+    """Holds the current rate table and hot-reloads it when the file changes.
+
+    The file's modification time is checked at most every reload_seconds.
+    A changed file is compiled off to the side and swapped in with a single
+    reference assignment, so readers always see a complete table. A file
+    that fails to load is logged and the previous table stays in use.
+    """
+
+    def __init__(self, path: str = DEFAULT_RATES_FILE, reload_seconds: float = DEFAULT_RELOAD_SECONDS):
+        self._path = path
+        self._reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._logger = get_logger()
+        self._file_stamp = self._stat()
+        self._table = load_toll_rate_table(path)
+        self._checked_at = time.monotonic()
+
+    @property
+    def path(self) -> str:
+        """Get the rate file path."""
+        return self._path
+
+    @property
+    def reload_seconds(self) -> float:
+        """Get the minimum seconds between file change checks."""
+        return self._reload_seconds
+
+    @property
+    def table(self) -> TollRateTable:
+        """Get the current table, reloading it first if the file changed."""
+        if self._reload_seconds >= 0 and time.monotonic() - self._checked_at >= self._reload_seconds:
+            self.reload()
+        return self._table
+
+    @property
+    def version(self) -> str:
+        """Get the version stamp of the current table."""
+        return self.table.version
+
+    def lookup(self, country_code: str, toll_class: str, euro_class: str) -> TollRate:
+        """Get the toll rate from the current table."""
+        return self.table.lookup(country_code, toll_class, euro_class)
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload the table if the rate file changed.
+
+        Args:
+            force: Reload even if the file appears unchanged
+
+        Returns:
+            True if a new table was swapped in
+        """
+        with self._lock:
+            self._checked_at = time.monotonic()
+            stamp = self._stat()
+            if stamp is None or (stamp == self._file_stamp and not force):
+                return False
+            self._file_stamp = stamp
+            try:
+                table = load_toll_rate_table(self._path)
+            except (OSError, ValueError) as e:
+                self._logger.warning(
+                    "Failed to reload toll rates, keeping current table",
+                    path=self._path,
+                    version=self._table.version,
+                    error=str(e)
+                )
+                return False
+
+            previous = self._table.version
+            self._table = table
+            self._logger.info(
+                "Reloaded toll rates",
+                path=self._path,
+                previous_version=previous,
+                version=table.version,
+                entries=len(table)
+            )
+            return True
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+
+_store: Optional[TollRateStore] = None
+_store_lock = threading.Lock()
+
+
+def configure_toll_rate_store(
+    path: Optional[str] = None,
+    reload_seconds: float = DEFAULT_RELOAD_SECONDS
+) -> TollRateStore:
+    """Configure the process-wide rate store.
+
+    The current store is kept when it already uses the same file and reload
+    interval, so this is cheap to call per request.
+
+    Args:
+        path: Rate file path; the bundled file when empty
+        reload_seconds: Minimum seconds between file change checks;
+            negative disables hot reload
+
+    Returns:
+        The process-wide store
+    """
+    global _store
+    path = path or DEFAULT_RATES_FILE
+    with _store_lock:
+        if _store is None or _store.path != path or _store.reload_seconds != reload_seconds:
+            _store = TollRateStore(path, reload_seconds)
+        return _store
+
+
+def get_toll_rate_store() -> TollRateStore:
+    """Get the process-wide rate store, loading the bundled file on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = TollRateStore()
+    return _store
@@ -0,0 +1,37 @@
+"""Average truck speeds used for estimated route durations."""
+from typing import Dict, Optional
+
+# Average door-to-door speed of a heavy truck per country (km/h), including
+# urban sections and motorway limits of 80-90 km/h
+AVERAGE_TRUCK_SPEEDS_KMH: Dict[str, float] = {
+    "AT": 68.0,
+    "BE": 62.0,
+    "CH": 60.0,
+    "CZ": 66.0,
+    "DE": 70.0,
+    "ES": 72.0,
+    "FR": 70.0,
+    "HU": 67.0,
+    "IT": 66.0,
+    "LU": 65.0,
+    "NL": 65.0,
+    "PL": 64.0,
+    "PT": 68.0,
+    "SK": 64.0,
+}
+
+# Speed for countries without a configured average (km/h)
+DEFAULT_TRUCK_SPEED_KMH = 65.0
+
+
+def get_truck_speed(country_code: Optional[str], default: float = DEFAULT_TRUCK_SPEED_KMH) -> float:
+    """Get the average truck speed for a country.
+
+    Args:
+        country_code: ISO country code
+        default: Speed used when the country has no configured average
+
+    Returns:
+        Average speed in km/h
+    """
+    return AVERAGE_TRUCK_SPEEDS_KMH.get((country_code or "").upper(), default)
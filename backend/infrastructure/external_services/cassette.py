@@ -0,0 +1,180 @@
+"""Record/replay HTTP session for the Google Maps client."""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from .exceptions import ExternalServiceError
+
+# Transport modes selectable through configuration
+MODE_LIVE = "live"
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+CASSETTE_MODES = (MODE_LIVE, MODE_RECORD, MODE_REPLAY)
+
+# Query parameters that identify the caller rather than the request
+CREDENTIAL_PARAMS = frozenset({"key", "client", "signature", "channel"})
+
+# Placeholder key accepted by googlemaps.Client when replaying offline
+REPLAY_API_KEY = "AIzaReplayOnlyPlaceholderKey"
+
+
+class CassetteMissError(ExternalServiceError):
+    """Raised when a replayed request has no recorded cassette."""
+    pass
+
+
+class CassetteSession(requests.Session):
+    """``requests.Session`` that records responses to disk or replays them.
+
+    Passed to ``googlemaps.Client`` as ``requests_session``. In record mode
+    every request goes to the network and the response is written to a
+    cassette file named by a hash of the method, path, sorted query (minus
+    credentials) and JSON body. In replay mode the cassette is served back
+    after an optional injected latency and no network access happens.
+    Every request is counted per API path so callers can assert how many
+    external calls an operation costs.
+    """
+
+    def __init__(self, cassette_dir: str, mode: str = MODE_REPLAY, latency_ms: float = 0.0):
+        """Initialize the session.
+
+        Args:
+            cassette_dir: Directory holding cassette files
+            mode: "record" or "replay"
+            latency_ms: Delay added to each replayed response in milliseconds
+        """
+        super().__init__()
+        if mode not in (MODE_RECORD, MODE_REPLAY):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        self._cassette_dir = cassette_dir
+        self._mode = mode
+        self._latency = max(0.0, latency_ms) / 1000.0
+        self._calls: Counter = Counter()
+        self._lock = threading.Lock()
+        if mode == MODE_RECORD:
+            os.makedirs(cassette_dir, exist_ok=True)
+
+    @property
+    def mode(self) -> str:
+        """Get the session mode."""
+        return self._mode
+
+    @property
+    def calls(self) -> Dict[str, int]:
+        """Get request counts keyed by API path."""
+        with self._lock:
+            return dict(self._calls)
+
+    @property
+    def total_calls(self) -> int:
+        """Get the total number of requests issued."""
+        with self._lock:
+            return sum(self._calls.values())
+
+    def reset_calls(self) -> None:
+        """Reset the request counters."""
+        with self._lock:
+            self._calls.clear()
+
+    @staticmethod
+    def cassette_key(method: str, url: str, json_body: Optional[Any] = None) -> str:
+        """Build the credential-independent cassette key for a request.
+
+        Args:
+            method: HTTP method
+            url: Full request URL including query string
+            json_body: Optional JSON request body
+
+        Returns:
+            Hex digest identifying the request
+        """
+        parts = urlsplit(url)
+        query = sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if name not in CREDENTIAL_PARAMS
+        )
+        payload = json.dumps(
+            [method.upper(), parts.path, urlencode(query), json_body],
+            sort_keys=True,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> requests.Response:
+        """Serve a request from the cassette or record it."""
+        key = self.cassette_key(method, url, kwargs.get("json"))
+        path = os.path.join(self._cassette_dir, f"{key}.json")
+        with self._lock:
+            self._calls[urlsplit(url).path] += 1
+
+        if self._mode == MODE_REPLAY:
+            return self._replay(path, method, url)
+
+        response = super().request(method, url, *args, **kwargs)
+        self._record(path, method, url, response)
+        return response
+
+    def _replay(self, path: str, method: str, url: str) -> requests.Response:
+        """Build a response from a cassette file."""
+        try:
+            with open(path, "r", encoding="utf-8") as cassette:
+                entry = json.load(cassette)
+        except FileNotFoundError:
+            raise CassetteMissError(f"No cassette recorded for {method} {urlsplit(url).path}")
+
+        if self._latency:
+            time.sleep(self._latency)
+
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.headers.update(entry.get("headers", {}))
+        response._content = entry["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = url
+        return response
+
+    def _record(self, path: str, method: str, url: str, response: requests.Response) -> None:
+        """Write a response to a cassette file."""
+        parts = urlsplit(url)
+        entry = {
+            "method": method.upper(),
+            "path": parts.path,
+            "status_code": response.status_code,
+            "headers": {"Content-Type": response.headers.get("Content-Type", "application/json")},
+            "body": response.text,
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as cassette:
+            json.dump(entry, cassette, indent=2)
+        os.replace(tmp_path, path)
+
+
+def create_cassette_session(
+    mode: str,
+    cassette_dir: str,
+    latency_ms: float = 0.0
+) -> Optional[CassetteSession]:
+    """Create a cassette session for the configured transport mode.
+
+    Args:
+        mode: "live", "record" or "replay"
+        cassette_dir: Directory holding cassette files
+        latency_ms: Delay added to each replayed response in milliseconds
+
+    Returns:
+        CassetteSession, or None in live mode
+    """
+    mode = (mode or MODE_LIVE).lower()
+    if mode not in CASSETTE_MODES:
+        raise ValueError(f"Unsupported Google Maps transport mode: {mode}")
+    if mode == MODE_LIVE:
+        return None
+    return CassetteSession(cassette_dir, mode=mode, latency_ms=latency_ms)
@@ -5,16 +5,25 @@ from typing import Dict, List, Optional, Tuple, Any
 from uuid import UUID, uuid4
 import polyline
 
+from ...domain.entities.geometry import RouteGeometry
 from ...domain.entities.location import Location
 from ...domain.entities.route import CountrySegment, SegmentType
 from .exceptions import ExternalServiceError
 from ...domain.services.route_service import LocationRepository
 from ...infrastructure.logging import get_logger
+from ..geo.country_index import CountryBoundaryIndex
+from ..cache.response_cache import ResponseCache
+from ..cache.tile_cache import GeocodeTileCache
+from ..geo.segmentation import country_runs
+from ..geo.road_steps import compact_steps
+from ..geo.toll_classifier import route_has_tolls
+from .rate_limiter import TokenBucket
 
 import time
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 import googlemaps
+import requests
 from googlemaps.exceptions import ApiError, TransportError, Timeout
 from retry import retry
 
@@ -22,6 +31,14 @@ from retry import retry
 DEFAULT_MODE = "driving"
 DEFAULT_UNITS = "metric"
 DEFAULT_LANGUAGE = "en"
+DEFAULT_QUERIES_PER_SECOND = 50
+DEFAULT_MAX_WORKERS = 8
+# Distance Matrix API per-request limits
+MAX_MATRIX_ORIGINS = 25
+MAX_MATRIX_DESTINATIONS = 25
+MAX_MATRIX_ELEMENTS = 100
+# Directions API limit on intermediate waypoints per request
+MAX_WAYPOINTS = 25
 
 
 class GoogleMapsServiceError(ExternalServiceError):
@@ -43,26 +60,57 @@ class GoogleMapsService:
         language: str = DEFAULT_LANGUAGE,
         timeout: float = 30.0,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        country_index: Optional[CountryBoundaryIndex] = None,
+        response_cache: Optional[ResponseCache] = None,
+        tile_cache: Optional[GeocodeTileCache] = None,
+        queries_per_second: int = DEFAULT_QUERIES_PER_SECOND,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        requests_session: Optional[requests.Session] = None,
+        client: Optional[googlemaps.Client] = None
     ):
-        """Initialize Google Maps service."""
-        if not api_key:
+        """Initialize Google Maps service.
+
+        Args:
+            country_index: Optional offline boundary index used to resolve
+                step countries without reverse geocoding
+            response_cache: Optional persistent cache for API responses
+            tile_cache: Optional geohash tile cache for reverse geocoding results
+            queries_per_second: Request rate shared by the client and the
+                concurrent geocoding workers
+            max_workers: Maximum concurrent reverse geocoding requests
+            requests_session: Optional HTTP session used by the client, e.g.
+                a record/replay cassette session
+            client: Optional shared client; when given, rate limiting is left
+                to the client and no per-service client is constructed
+        """
+        if not api_key and client is None:
             raise ValueError("API key is required")
 
         self._logger = logger.bind(service="google_maps")
         self._logger.info("Google Maps client initialized successfully")
-        self._client = googlemaps.Client(
-            key=api_key,
-            timeout=timeout,
-            retry_over_query_limit=True,
-            queries_per_second=50
-        )
+        if client is not None:
+            self._client = client
+            self._rate_limiter = None
+        else:
+            self._client = googlemaps.Client(
+                key=api_key,
+                timeout=timeout,
+                retry_over_query_limit=True,
+                queries_per_second=queries_per_second,
+                requests_session=requests_session
+            )
+            self._rate_limiter = TokenBucket(queries_per_second)
+        self._max_workers = max(1, max_workers)
         self._location_repo = location_repo
         self._mode = mode
         self._units = units
         self._language = language
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._country_index = country_index
+        self._response_cache = response_cache
+        self._tile_cache = tile_cache
 
     def _log_route_details(self, route_data: Dict) -> None:
         """Log detailed route information for debugging."""
@@ -89,6 +137,8 @@ class GoogleMapsService:
         last_error = None
         for attempt in range(self._max_retries):
             try:
+                if self._rate_limiter is not None:
+                    self._rate_limiter.acquire()
                 return request_func(*args, **kwargs)
             except (ApiError, TransportError, Timeout) as e:
                 last_error = e
@@ -114,6 +164,32 @@ class GoogleMapsService:
         if last_error:
             raise GoogleMapsServiceError(f"Failed to calculate route: {str(last_error)}")
 
+    def _cached_request(
+        self,
+        endpoint: str,
+        request_func: callable,
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        """Make a request through the response cache when one is configured.
+
+        Traffic-dependent requests (with a departure_time) always go to the
+        API since their results change minute to minute.
+        """
+        if self._response_cache is None or kwargs.get("departure_time"):
+            return self._make_request(request_func, *args, **kwargs)
+
+        key = self._response_cache.make_key(endpoint, args, kwargs)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._logger.debug("Maps response cache hit", endpoint=endpoint)
+            return cached
+
+        result = self._make_request(request_func, *args, **kwargs)
+        if result:
+            self._response_cache.set(key, endpoint, result)
+        return result
+
     def _extract_country_code(self, geocoded_result: Dict) -> str:
         """Extract country code from geocoded result."""
         for component in geocoded_result.get("address_components", []):
@@ -121,6 +197,109 @@ class GoogleMapsService:
                 return component.get("short_name", "")
         return ""
 
+    def _resolve_country(self, lat: float, lng: float) -> Tuple[str, Optional[str]]:
+        """Resolve the country for a point.
+
+        Tries the offline boundary index first, then the geocode tile cache,
+        and only reverse geocodes points neither can answer (near a border or
+        outside the covered countries). Reverse geocoding results are stored
+        in the tile cache.
+
+        Returns:
+            Tuple of (country_code, address); address is None when the country
+            was resolved by the boundary index
+        """
+        local = self._lookup_country_locally(lat, lng)
+        if local is not None:
+            return local
+        return self._geocode_country(lat, lng)
+
+    def _lookup_country_locally(self, lat: float, lng: float) -> Optional[Tuple[str, Optional[str]]]:
+        """Resolve a point from the boundary index or tile cache without API calls."""
+        if self._country_index is not None:
+            country_code = self._country_index.lookup(lat, lng)
+            if country_code:
+                return country_code, None
+
+        if self._tile_cache is not None:
+            entry = self._tile_cache.get(lat, lng)
+            if entry is not None:
+                return entry.country_code, entry.address
+        return None
+
+    def _geocode_country(self, lat: float, lng: float) -> Tuple[str, Optional[str]]:
+        """Resolve a point by reverse geocoding and record it in the tile cache."""
+        geocoded = self._cached_request("reverse_geocode", self._client.reverse_geocode, (lat, lng))
+        if not geocoded:
+            return "", None
+        country_code = self._extract_country_code(geocoded[0])
+        address = geocoded[0].get("formatted_address", "")
+        if self._tile_cache is not None:
+            self._tile_cache.set(lat, lng, country_code, address)
+        return country_code, address
+
+    def _resolve_countries(
+        self,
+        points: List[Tuple[float, float]]
+    ) -> List[Tuple[str, Optional[str]]]:
+        """Resolve countries for a batch of points, preserving order.
+
+        Identical coordinates are resolved once. Points the boundary index or
+        tile cache cannot answer are reverse geocoded concurrently on up to
+        max_workers threads; every request goes through _make_request, so
+        they share the service rate limiter and per-request retries. This is
+        the only stage of segmentation that may perform I/O.
+
+        Args:
+            points: List of (lat, lng) tuples
+
+        Returns:
+            List of (country_code, address) tuples aligned with points
+        """
+        resolved: Dict[Tuple[float, float], Tuple[str, Optional[str]]] = {}
+        pending: List[Tuple[float, float]] = []
+        for point in dict.fromkeys(points):
+            local = self._lookup_country_locally(*point)
+            if local is not None:
+                resolved[point] = local
+            else:
+                pending.append(point)
+
+        if len(pending) == 1 or self._max_workers == 1:
+            for point in pending:
+                resolved[point] = self._geocode_country(*point)
+        elif pending:
+            workers = min(self._max_workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(lambda point: self._geocode_country(*point), pending)
+                resolved.update(zip(pending, results))
+
+        self._logger.debug("Resolved step countries",
+                           point_count=len(points),
+                           geocoded_count=len(pending))
+        return [resolved[point] for point in points]
+
+    def _leg_geometry(self, steps: List[Dict]) -> Tuple[RouteGeometry, List[Tuple[int, int]]]:
+        """Decode and concatenate step polylines, dropping shared joining vertices.
+
+        Returns:
+            Tuple of (leg geometry, (start, stop) point range of each step).
+            A step's range includes the joining vertex it shares with the
+            previous step, so slicing from one step's start to another's stop
+            yields the same points as joining just those steps.
+        """
+        points: List[Tuple[float, float]] = []
+        bounds: List[Tuple[int, int]] = []
+        for step in steps:
+            step_points = polyline.decode(step["polyline"]["points"])
+            start = len(points)
+            if points and step_points and points[-1] == step_points[0]:
+                step_points = step_points[1:]
+                start -= 1
+            points.extend(step_points)
+            bounds.append((start, len(points)))
+        return RouteGeometry(points), bounds
+
     def _create_and_save_location(self, lat: float, lng: float, address: str) -> Location:
         """Create and save a location."""
         location = Location(
@@ -139,11 +318,22 @@ class GoogleMapsService:
         departure_time: Optional[int] = None,
         avoid: Optional[List[str]] = None,
         waypoints: Optional[List[Location]] = None
-    ) -> tuple[float, float, List[CountrySegment], List[List[float]]]:
+    ) -> tuple[float, float, List[CountrySegment], RouteGeometry]:
         """
         Calculate route details using Google Maps API.
         Returns tuple of (total_distance_km, total_duration_hours, country_segments, route_polylines).
+
+        Intermediate stops go into a single Directions request as waypoints.
+        Segments are built per leg, so a segment never spans a stop and the
+        last segment of each leg ends at that leg's stop location.
+
+        Raises:
+            ValueError: If more than MAX_WAYPOINTS waypoints are given
         """
+        waypoints = list(waypoints or [])
+        if len(waypoints) > MAX_WAYPOINTS:
+            raise ValueError(f"At most {MAX_WAYPOINTS} waypoints are supported, got {len(waypoints)}")
+
         try:
             # Prepare waypoints if provided
             waypoints_param = None
@@ -151,7 +341,8 @@ class GoogleMapsService:
                 waypoints_param = [{"lat": wp.latitude, "lng": wp.longitude} for wp in waypoints]
 
             # Get route from Google Maps
-            route_data = self._make_request(
+            route_data = self._cached_request(
+                "directions",
                 self._client.directions,
                 origin={"lat": origin.latitude, "lng": origin.longitude},
                 destination={"lat": destination.latitude, "lng": destination.longitude},
@@ -169,87 +360,72 @@ class GoogleMapsService:
 
             self._log_route_details(route_data[0])
 
-            # Extract total distance and duration
-            leg = route_data[0]["legs"][0]
-            total_distance_km = leg["distance"]["value"] / 1000.0  # Convert to km
-            total_duration_hours = leg["duration"]["value"] / 3600.0  # Convert to hours
+            # Extract total distance and duration over all legs
+            legs = route_data[0]["legs"]
+            stops = [origin] + waypoints + [destination]
+            if len(legs) != len(stops) - 1:
+                raise GoogleMapsServiceError(f"Expected {len(stops) - 1} route legs, got {len(legs)}")
+            total_distance_km = sum(leg["distance"]["value"] for leg in legs) / 1000.0  # Convert to km
+            total_duration_hours = sum(leg["duration"]["value"] for leg in legs) / 3600.0  # Convert to hours
 
             self._logger.info("Route totals",
                             total_distance_km=total_distance_km,
-                            total_duration_hours=total_duration_hours)
+                            total_duration_hours=total_duration_hours,
+                            leg_count=len(legs))
 
             # Extract polyline points for the entire route
             route_polyline = route_data[0]["overview_polyline"]["points"]
             route_points = self._decode_polyline(route_polyline)
 
-            # Process steps to create country segments
-            steps = leg["steps"]
-            segments = []
-            current_country = None
-            current_distance = 0.0
-            current_duration = 0.0
-            current_start_location = None
-            current_route_points = []
-
+            # Resolve the origin and every step end of every leg in one batch,
+            # then group each leg's steps by the country they start in
+            all_steps = [step for leg in legs for step in leg["steps"]]
             self._logger.debug("Processing route steps",
-                             step_count=len(steps))
+                             step_count=len(all_steps))
 
-            # Get initial country from origin
-            origin_geocoded = self._make_request(
-                self._client.reverse_geocode,
-                (origin.latitude, origin.longitude)
+            resolved = self._resolve_countries(
+                [(origin.latitude, origin.longitude)] +
+                [(step["end_location"]["lat"], step["end_location"]["lng"]) for step in all_steps]
             )
-            current_country = self._extract_country_code(origin_geocoded[0])
-            current_start_location = origin
-
-            for i, step in enumerate(steps):
-                step_lat = step["end_location"]["lat"]
-                step_lng = step["end_location"]["lng"]
-                step_geocoded = self._make_request(
-                    self._client.reverse_geocode,
-                    (step_lat, step_lng)
-                )
-                step_country = self._extract_country_code(step_geocoded[0])
-                
-                # Add distance and duration for current step
-                current_distance += step["distance"]["value"] / 1000.0  # Convert to km
-                current_duration += step["duration"]["value"] / 3600.0  # Convert to hours
-
-                # Add route points for this step
-                step_points = self._decode_polyline(step["polyline"]["points"])
-                current_route_points.extend(step_points)
-
-                # If country changes or this is the last step, create a segment
-                if step_country != current_country or i == len(steps) - 1:
-                    # Create location for segment end
-                    end_location = self._create_and_save_location(
-                        step_lat,
-                        step_lng,
-                        step_geocoded[0].get("formatted_address", "")
-                    )
 
-                    # Create segment
+            has_tolls = route_has_tolls(route_data[0])
+            segments = []
+            offset = 0
+            for leg, leg_start, leg_end in zip(legs, stops, stops[1:]):
+                steps = leg["steps"]
+                step_countries = [country_code for country_code, _ in resolved[offset:offset + len(steps)]]
+                leg_geometry, step_bounds = self._leg_geometry(steps)
+                runs = country_runs(step_countries)
+                current_start_location = leg_start
+                for index, run in enumerate(runs):
+                    run_steps = steps[run.first_step:run.last_step + 1]
+                    if index == len(runs) - 1:
+                        end_location = leg_end
+                    else:
+                        # Create location for the border crossing
+                        end_step = run_steps[-1]
+                        end_location = self._create_and_save_location(
+                            end_step["end_location"]["lat"],
+                            end_step["end_location"]["lng"],
+                            resolved[offset + run.last_step + 1][1] or ""
+                        )
+
                     segment = CountrySegment(
                         id=uuid4(),
                         route_id=None,
-                        country_code=current_country,
+                        country_code=run.country_code,
                         segment_type=SegmentType.ROUTE,
-                        distance_km=current_distance,
-                        duration_hours=current_duration,
+                        distance_km=sum(step["distance"]["value"] for step in run_steps) / 1000.0,
+                        duration_hours=sum(step["duration"]["value"] for step in run_steps) / 3600.0,
                         start_location_id=current_start_location.id,
                         end_location_id=end_location.id,
-                        segment_order=len(segments)
+                        segment_order=len(segments),
+                        route_points=leg_geometry[step_bounds[run.first_step][0]:step_bounds[run.last_step][1]],
+                        steps=compact_steps(run_steps, run.country_code, has_tolls)
                     )
-                    # Add route points to segment
-                    segment.route_points = current_route_points
                     segments.append(segment)
-
-                    # Reset counters and update current country
-                    current_country = step_country
-                    current_distance = 0.0
-                    current_duration = 0.0
                     current_start_location = end_location
-                    current_route_points = []
+                offset += len(steps)
 
             self._logger.info("Segment totals",
                             segment_count=len(segments),
@@ -262,72 +438,120 @@ class GoogleMapsService:
             self._logger.error("Failed to calculate route", error=str(e))
             raise GoogleMapsServiceError(f"Failed to calculate route: {str(e)}")
 
-    def _decode_polyline(self, polyline_str: str) -> List[List[float]]:
-        """
-        Decodes a polyline string into a list of lat/lng points.
-        Returns points in the format [lat, lng] for backend compatibility.
-        """
+    def _decode_polyline(self, polyline_str: str) -> RouteGeometry:
+        """Decode a Google encoded polyline into [lat, lng] route geometry."""
         try:
-            # Decode the polyline into a list of [lat, lng] coordinates
-            coords = polyline.decode(polyline_str)
-            # Return the coordinates directly as [lat, lng] lists
-            return coords
+            return RouteGeometry.from_polyline(polyline_str)
         except Exception as e:
             self._logger.error("Failed to decode polyline", error=str(e))
-            return []
+            return RouteGeometry()
 
     def get_distance_matrix(
         self,
         origins: List[Location],
         destinations: List[Location]
     ) -> Dict[str, List[List[float]]]:
-        """Get distance matrix between multiple origins and destinations."""
+        """Get distance matrix between multiple origins and destinations.
+
+        The matrix is split into blocks that respect the per-request limits
+        of the Distance Matrix API; blocks are requested concurrently and
+        stitched back together in input order. Unreachable pairs are
+        reported as infinity.
+
+        Args:
+            origins: Origin locations (matrix rows)
+            destinations: Destination locations (matrix columns)
+
+        Returns:
+            Dict with "distances" (km) and "durations" (hours) matrices
+        """
         try:
             origin_coords = [(loc.latitude, loc.longitude) for loc in origins]
             destination_coords = [(loc.latitude, loc.longitude) for loc in destinations]
-            
-            matrix = self._make_request(
-                self._client.distance_matrix,
-                origins=origin_coords,
-                destinations=destination_coords,
-                mode=self._mode,
-                units=self._units,
-                language=self._language
-            )
-            
-            if matrix["status"] != "OK":
-                raise GoogleMapsServiceError(f"Distance matrix error: {matrix['status']}")
-            
-            # Extract distances and durations
-            distances = []
-            durations = []
-            
-            for row in matrix["rows"]:
-                distance_row = []
-                duration_row = []
-                
-                for element in row["elements"]:
-                    if element["status"] != "OK":
-                        distance_row.append(float("inf"))
-                        duration_row.append(float("inf"))
-                    else:
-                        distance_row.append(element["distance"]["value"] / 1000.0)  # Convert to km
-                        duration_row.append(element["duration"]["value"] / 3600.0)  # Convert to hours
-                
-                distances.append(distance_row)
-                durations.append(duration_row)
-            
+            if not origin_coords or not destination_coords:
+                return {"distances": [[] for _ in origin_coords], "durations": [[] for _ in origin_coords]}
+
+            row_size = min(MAX_MATRIX_ORIGINS, len(origin_coords))
+            col_size = max(1, min(MAX_MATRIX_DESTINATIONS, MAX_MATRIX_ELEMENTS // row_size))
+            blocks = [
+                (row, col)
+                for row in range(0, len(origin_coords), row_size)
+                for col in range(0, len(destination_coords), col_size)
+            ]
+
+            def fetch(block: Tuple[int, int]) -> Tuple[List[List[float]], List[List[float]]]:
+                row, col = block
+                return self._request_matrix_block(
+                    origin_coords[row:row + row_size],
+                    destination_coords[col:col + col_size]
+                )
+
+            if len(blocks) == 1:
+                results = [fetch(blocks[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(self._max_workers, len(blocks))) as executor:
+                    results = list(executor.map(fetch, blocks))
+
+            distances = [[float("inf")] * len(destination_coords) for _ in origin_coords]
+            durations = [[float("inf")] * len(destination_coords) for _ in origin_coords]
+            for (row, col), (block_distances, block_durations) in zip(blocks, results):
+                for offset, (distance_row, duration_row) in enumerate(zip(block_distances, block_durations)):
+                    distances[row + offset][col:col + len(distance_row)] = distance_row
+                    durations[row + offset][col:col + len(duration_row)] = duration_row
+
+            self._logger.debug("Distance matrix calculated",
+                             origins=len(origin_coords),
+                             destinations=len(destination_coords),
+                             requests=len(blocks))
             return {
                 "distances": distances,
                 "durations": durations
             }
-            
+
+        except GoogleMapsServiceError:
+            raise
         except Exception as e:
             self._logger.error("Error getting distance matrix",
                              error=str(e),
                              error_type=type(e).__name__)
             raise GoogleMapsServiceError(f"Failed to get distance matrix: {str(e)}")
 
+    def _request_matrix_block(
+        self,
+        origin_coords: List[Tuple[float, float]],
+        destination_coords: List[Tuple[float, float]]
+    ) -> Tuple[List[List[float]], List[List[float]]]:
+        """Request one API-sized block of the distance matrix."""
+        matrix = self._cached_request(
+            "distance_matrix",
+            self._client.distance_matrix,
+            origins=origin_coords,
+            destinations=destination_coords,
+            mode=self._mode,
+            units=self._units,
+            language=self._language
+        )
+
+        if not matrix or matrix["status"] != "OK":
+            status = matrix["status"] if matrix else "NO_RESPONSE"
+            raise GoogleMapsServiceError(f"Distance matrix error: {status}")
+
+        distances = []
+        durations = []
+        for row in matrix["rows"]:
+            distance_row = []
+            duration_row = []
+            for element in row["elements"]:
+                if element["status"] != "OK":
+                    distance_row.append(float("inf"))
+                    duration_row.append(float("inf"))
+                else:
+                    distance_row.append(element["distance"]["value"] / 1000.0)  # Convert to km
+                    duration_row.append(element["duration"]["value"] / 3600.0)  # Convert to hours
+            distances.append(distance_row)
+            durations.append(duration_row)
+        return distances, durations
+
     def geocode(self, address: str) -> Location:
         """Geocode an address to get its coordinates.
         
@@ -341,7 +565,8 @@ class GoogleMapsService:
             GoogleMapsServiceError: If geocoding fails
         """
         try:
-            results = self._make_request(
+            results = self._cached_request(
+                "geocode",
                 self._client.geocode,
                 address=address,
                 language=self._language
@@ -376,7 +601,18 @@ class GoogleMapsService:
             GoogleMapsServiceError: If reverse geocoding fails
         """
         try:
-            results = self._make_request(
+            if self._tile_cache is not None:
+                entry = self._tile_cache.get(latitude, longitude)
+                if entry is not None and entry.address:
+                    return Location(
+                        id=uuid4(),
+                        latitude=latitude,
+                        longitude=longitude,
+                        address=entry.address
+                    )
+
+            results = self._cached_request(
+                "reverse_geocode",
                 self._client.reverse_geocode,
                 latlng=(latitude, longitude),
                 language=self._language
@@ -384,6 +620,14 @@ class GoogleMapsService:
             
             if not results:
                 raise GoogleMapsServiceError(f"No results found for coordinates: {latitude}, {longitude}")
+
+            if self._tile_cache is not None:
+                self._tile_cache.set(
+                    latitude,
+                    longitude,
+                    self._extract_country_code(results[0]),
+                    results[0]["formatted_address"]
+                )
             
             return Location(
                 id=uuid4(),
@@ -416,7 +660,8 @@ class GoogleMapsService:
                 raise ValueError("Origin and destination must be Location objects")
 
             # Get directions from Google Maps
-            directions_result = self._make_request(
+            directions_result = self._cached_request(
+                "directions",
                 self._client.directions,
                 origin=(origin.latitude, origin.longitude),
                 destination=(destination.latitude, destination.longitude),
@@ -428,80 +673,44 @@ class GoogleMapsService:
             if not directions_result:
                 raise GoogleMapsServiceError("No route found between the specified locations")
 
-            # Process the route and extract country segments
+            # Resolve every step end once, then group steps in memory by the
+            # country they end in
             segments = []
             route = directions_result[0]
-            
+
             for leg in route['legs']:
-                current_country = None
-                current_distance = 0.0
-                current_duration = 0.0
-                current_start_location = None
-                current_end_location = None
+                steps = leg['steps']
+                resolved = self._resolve_countries(
+                    [(step['end_location']['lat'], step['end_location']['lng']) for step in steps]
+                )
 
-                for i, step in enumerate(leg['steps']):
-                    # Create location for current step
-                    step_location = Location(
-                        id=uuid4(),
-                        latitude=step['end_location']['lat'],
-                        longitude=step['end_location']['lng'],
-                        address=""  # We'll get this from reverse geocoding
-                    )
-                    
-                    # Extract country from geocoded location
-                    geocoded_result = self._make_request(
-                        self._client.reverse_geocode,
-                        (step_location.latitude, step_location.longitude)
-                    )
-                    
-                    if not geocoded_result:
-                        continue
-                        
-                    country_code = self._extract_country_code(geocoded_result[0])
-                    
-                    if current_country is None:
-                        current_country = country_code
+                current_start_location = None
+                for run in country_runs([country_code for country_code, _ in resolved]):
+                    run_steps = steps[run.first_step:run.last_step + 1]
+                    if current_start_location is None:
                         current_start_location = Location(
                             id=uuid4(),
-                            latitude=step['start_location']['lat'],
-                            longitude=step['start_location']['lng'],
-                            address=""  # We'll get this from reverse geocoding
+                            latitude=run_steps[0]['start_location']['lat'],
+                            longitude=run_steps[0]['start_location']['lng'],
+                            address=""
                         )
-                    
-                    current_distance += step['distance']['value']
-                    current_duration += step['duration']['value']
-                    current_end_location = step_location
-
-                    # Check if country changes in next step or if this is the last step
-                    is_last_step = i == len(leg['steps']) - 1
-                    next_step_country = None
-                    
-                    if not is_last_step:
-                        next_step = leg['steps'][i + 1]
-                        next_geocoded = self._make_request(
-                            self._client.reverse_geocode,
-                            (next_step['end_location']['lat'], next_step['end_location']['lng'])
-                        )
-                        if next_geocoded:
-                            next_step_country = self._extract_country_code(next_geocoded[0])
-                    
-                    if is_last_step or (next_step_country and next_step_country != current_country):
-                        # Create segment for current country
-                        segments.append(CountrySegment(
-                            id=uuid4(),
-                            country_code=current_country,
-                            distance_km=current_distance / 1000,  # Convert to km
-                            duration_hours=current_duration / 3600,  # Convert to hours
-                            start_location_id=current_start_location.id,
-                            end_location_id=current_end_location.id
-                        ))
-                        
-                        if not is_last_step:
-                            # Start new segment
-                            current_country = next_step_country
-                            current_distance = 0
-                            current_duration = 0
-                            current_start_location = current_end_location
+                    end_location = Location(
+                        id=uuid4(),
+                        latitude=run_steps[-1]['end_location']['lat'],
+                        longitude=run_steps[-1]['end_location']['lng'],
+                        address=resolved[run.last_step][1] or ""
+                    )
+
+                    segments.append(CountrySegment(
+                        id=uuid4(),
+                        country_code=run.country_code,
+                        distance_km=sum(step['distance']['value'] for step in run_steps) / 1000,  # Convert to km
+                        duration_hours=sum(step['duration']['value'] for step in run_steps) / 3600,  # Convert to hours
+                        start_location_id=current_start_location.id,
+                        end_location_id=end_location.id,
+                        segment_order=len(segments)
+                    ))
+                    current_start_location = end_location
 
             return segments
 
@@ -516,11 +725,12 @@ class GoogleMapsService:
         self,
         truck_location: Location,
         origin: Location
-    ) -> tuple[float, float]:
-        """Calculate empty driving distance and duration from truck to origin."""
+    ) -> tuple[float, float, RouteGeometry]:
+        """Calculate empty driving distance, duration and route points from truck to origin."""
         try:
             # Get route from Google Maps
-            route_data = self._make_request(
+            route_data = self._cached_request(
+                "directions",
                 self._client.directions,
                 origin={"lat": truck_location.latitude, "lng": truck_location.longitude},
                 destination={"lat": origin.latitude, "lng": origin.longitude},
@@ -538,11 +748,13 @@ class GoogleMapsService:
             distance_km = leg["distance"]["value"] / 1000.0  # Convert to km
             duration_hours = leg["duration"]["value"] / 3600.0  # Convert to hours
 
+            route_points = self._decode_polyline(route_data[0]["overview_polyline"]["points"])
+
             self._logger.info("Empty driving calculated",
                             distance_km=distance_km,
                             duration_hours=duration_hours)
 
-            return distance_km, duration_hours
+            return distance_km, duration_hours, route_points
 
         except Exception as e:
             self._logger.error("Failed to calculate empty driving", error=str(e))
@@ -552,11 +764,12 @@ class GoogleMapsService:
         self,
         origin: Location,
         destination: Location
-    ) -> List[List[float]]:
+    ) -> RouteGeometry:
         """Get route points for a segment between two locations."""
         try:
             # Get route from Google Maps
-            route_data = self._make_request(
+            route_data = self._cached_request(
+                "directions",
                 self._client.directions,
                 origin={"lat": origin.latitude, "lng": origin.longitude},
                 destination={"lat": destination.latitude, "lng": destination.longitude},
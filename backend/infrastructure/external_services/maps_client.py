@@ -0,0 +1,313 @@
+"""Shared Google Maps client with pooled transport and quota governance."""
+import threading
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import googlemaps
+import requests
+from googlemaps.exceptions import HTTPError, Timeout, TransportError
+from requests.adapters import HTTPAdapter
+
+from .cassette import MODE_REPLAY, REPLAY_API_KEY, create_cassette_session
+from .exceptions import ExternalServiceError
+from .rate_limiter import TokenBucket
+from ..logging import get_logger
+
+# Default connection pool size for the shared session
+DEFAULT_POOL_SIZE = 20
+# Consecutive failures that open the circuit
+DEFAULT_FAILURE_THRESHOLD = 5
+# Seconds the circuit stays open before a trial request is allowed
+DEFAULT_RESET_TIMEOUT = 30.0
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+logger = get_logger()
+
+
+class QuotaExceededError(ExternalServiceError):
+    """Raised when the daily Google Maps request quota is used up."""
+    pass
+
+
+class CircuitOpenError(ExternalServiceError):
+    """Raised when requests are rejected because the circuit is open."""
+    pass
+
+
+class QuotaGovernor:
+    """Process-wide admission control for Google Maps requests.
+
+    Combines a token bucket for queries per second, a daily request quota
+    that resets at midnight UTC and a circuit breaker that rejects requests
+    after repeated transport failures until a trial request succeeds.
+    """
+
+    def __init__(
+        self,
+        queries_per_second: float,
+        daily_quota: int = 0,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT
+    ):
+        """Initialize the governor.
+
+        Args:
+            queries_per_second: Sustained request rate across all consumers
+            daily_quota: Maximum requests per UTC day, or 0 for no limit
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before an open circuit allows a trial request
+        """
+        if failure_threshold < 1:
+            raise ValueError("Failure threshold must be at least 1")
+        self._bucket = TokenBucket(queries_per_second)
+        self._daily_quota = max(0, daily_quota)
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._day = self._today()
+        self._daily_used = 0
+        self._state = CIRCUIT_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._counters = {
+            "requests": 0,
+            "retries": 0,
+            "successes": 0,
+            "failures": 0,
+            "rejected_quota": 0,
+            "rejected_circuit": 0,
+            "circuit_opened": 0,
+        }
+        self._throttled_seconds = 0.0
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).date().isoformat()
+
+    @property
+    def state(self) -> str:
+        """Get the circuit state."""
+        with self._lock:
+            return self._state
+
+    def acquire(self, retry: bool = False) -> None:
+        """Admit one request, waiting for rate capacity if needed.
+
+        Args:
+            retry: Whether this is a client-side retry of an earlier attempt
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            QuotaExceededError: If the daily quota is used up
+        """
+        with self._lock:
+            if self._state == CIRCUIT_OPEN:
+                if time.monotonic() - self._opened_at < self._reset_timeout:
+                    self._counters["rejected_circuit"] += 1
+                    raise CircuitOpenError("Google Maps circuit is open")
+                self._state = CIRCUIT_HALF_OPEN
+                self._trial_in_flight = False
+            if self._state == CIRCUIT_HALF_OPEN:
+                if self._trial_in_flight and not retry:
+                    self._counters["rejected_circuit"] += 1
+                    raise CircuitOpenError("Google Maps circuit is half-open")
+                self._trial_in_flight = True
+
+            today = self._today()
+            if today != self._day:
+                self._day = today
+                self._daily_used = 0
+            if self._daily_quota and self._daily_used >= self._daily_quota:
+                self._counters["rejected_quota"] += 1
+                if self._state == CIRCUIT_HALF_OPEN:
+                    self._trial_in_flight = False
+                raise QuotaExceededError(
+                    f"Daily Google Maps quota of {self._daily_quota} requests exhausted"
+                )
+            self._daily_used += 1
+            self._counters["requests"] += 1
+            if retry:
+                self._counters["retries"] += 1
+
+        waited = self._bucket.acquire()
+        if waited:
+            with self._lock:
+                self._throttled_seconds += waited
+
+    def record_success(self) -> None:
+        """Record a completed request and close the circuit."""
+        with self._lock:
+            self._counters["successes"] += 1
+            self._consecutive_failures = 0
+            self._state = CIRCUIT_CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        with self._lock:
+            self._counters["failures"] += 1
+            self._consecutive_failures += 1
+            self._trial_in_flight = False
+            if self._state == CIRCUIT_HALF_OPEN or self._consecutive_failures >= self._failure_threshold:
+                if self._state != CIRCUIT_OPEN:
+                    self._counters["circuit_opened"] += 1
+                    logger.warning("Google Maps circuit opened",
+                                   consecutive_failures=self._consecutive_failures)
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get a snapshot of governor counters."""
+        with self._lock:
+            return {
+                **self._counters,
+                "throttled_seconds": round(self._throttled_seconds, 3),
+                "daily_used": self._daily_used,
+                "daily_quota": self._daily_quota,
+                "queries_per_second": self._bucket.rate,
+                "circuit_state": self._state,
+            }
+
+
+class GovernedClient(googlemaps.Client):
+    """``googlemaps.Client`` whose every HTTP attempt passes the governor.
+
+    The client's own retries (5xx responses, OVER_QUERY_LIMIT) re-enter
+    ``_request`` and are therefore admitted and counted individually, while
+    success or failure is recorded once per logical call.
+    """
+
+    def __init__(self, governor: QuotaGovernor, **kwargs: Any):
+        """Initialize the client.
+
+        Args:
+            governor: Shared quota governor
+            **kwargs: Arguments for googlemaps.Client
+        """
+        super().__init__(**kwargs)
+        self._governor = governor
+
+    def _request(self, url, params, first_request_time=None, retry_counter=0, *args, **kwargs):
+        self._governor.acquire(retry=retry_counter > 0)
+        if retry_counter > 0:
+            return super()._request(url, params, first_request_time, retry_counter, *args, **kwargs)
+
+        try:
+            result = super()._request(url, params, first_request_time, retry_counter, *args, **kwargs)
+        except (HTTPError, Timeout, TransportError):
+            self._governor.record_failure()
+            raise
+        except googlemaps.exceptions.ApiError:
+            # The API answered; the request itself was rejected
+            self._governor.record_success()
+            raise
+        self._governor.record_success()
+        return result
+
+
+class MapsClientFactory:
+    """Owns the single Google Maps client shared by all consumers."""
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 30.0,
+        queries_per_second: float = 50,
+        daily_quota: int = 0,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        requests_session: Optional[requests.Session] = None
+    ):
+        """Initialize the factory.
+
+        Args:
+            api_key: Google Maps API key; no client is built without one
+            timeout: Combined connect and read timeout in seconds
+            queries_per_second: Global request rate
+            daily_quota: Maximum requests per UTC day, or 0 for no limit
+            pool_size: Keep-alive connections kept per host
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before an open circuit allows a trial request
+            requests_session: Optional base session, e.g. a cassette session
+        """
+        self._session = requests_session or requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount("https://", adapter)
+        self._governor = QuotaGovernor(
+            queries_per_second=queries_per_second,
+            daily_quota=daily_quota,
+            failure_threshold=failure_threshold,
+            reset_timeout=reset_timeout
+        )
+        self._client = None
+        if api_key:
+            self._client = GovernedClient(
+                governor=self._governor,
+                key=api_key,
+                timeout=timeout,
+                queries_per_second=queries_per_second,
+                retry_over_query_limit=True,
+                requests_session=self._session
+            )
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the shared HTTP session."""
+        return self._session
+
+    @property
+    def governor(self) -> QuotaGovernor:
+        """Get the shared quota governor."""
+        return self._governor
+
+    def client(self) -> Optional[GovernedClient]:
+        """Get the shared client, or None if no API key is configured."""
+        return self._client
+
+    def metrics(self) -> Dict[str, Any]:
+        """Get governor metrics plus transport details."""
+        return {
+            **self._governor.metrics(),
+            "client_configured": self._client is not None,
+            "session": type(self._session).__name__,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_maps_client_factory(
+    api_key: str,
+    timeout: float = 30.0,
+    queries_per_second: float = 50,
+    daily_quota: int = 0,
+    pool_size: int = DEFAULT_POOL_SIZE,
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    transport_mode: str = "live",
+    cassette_dir: str = "tests/fixtures/cassettes",
+    replay_latency_ms: float = 0.0
+) -> MapsClientFactory:
+    """Get the process-wide client factory for a configuration.
+
+    Containers are created per app and per request; caching here keeps a
+    single pool and governor per process for identical settings.
+    """
+    session = create_cassette_session(transport_mode, cassette_dir, replay_latency_ms)
+    if not api_key and session is not None and session.mode == MODE_REPLAY:
+        api_key = REPLAY_API_KEY
+    return MapsClientFactory(
+        api_key=api_key,
+        timeout=timeout,
+        queries_per_second=queries_per_second,
+        daily_quota=daily_quota,
+        pool_size=pool_size,
+        failure_threshold=failure_threshold,
+        reset_timeout=reset_timeout,
+        requests_session=session
+    )
@@ -8,16 +8,16 @@ from uuid import UUID
 import googlemaps
 from googlemaps.exceptions import ApiError, TransportError
 import requests
-import re
 
-from ...domain.entities.route import CountrySegment
+from ...domain.entities.route import CountrySegment, RouteStep
 from ...infrastructure.logging import get_logger
 from ...infrastructure.external_services.exceptions import ExternalServiceError
+from ..geo.toll_classifier import classify_steps, clean_html, extract_road_ref, route_has_tolls
 from ..data.toll_rates import (
-    TOLL_KEYWORDS,
     get_toll_rate,
     get_toll_class_description,
     get_euro_class_description,
+    get_toll_rate_version,
     DEFAULT_UNKNOWN_RATE
 )
 
@@ -38,7 +38,9 @@ class TollRateService:
         api_key: Optional[str] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        requests_session: Optional[requests.Session] = None,
+        client: Optional[googlemaps.Client] = None
     ):
         """Initialize toll rate service.
         
@@ -47,17 +49,24 @@ class TollRateService:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries
             retry_delay: Delay between retries in seconds
+            requests_session: Optional HTTP session used by the client
+            client: Optional shared Google Maps client, used instead of
+                constructing one from api_key
         """
         self._logger = logger.bind(service="toll_rate")
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         
-        # Initialize Google Maps client if API key is provided
-        self.client = None
-        if api_key:
+        # Use the shared client, or initialize one if API key is provided
+        self.client = client
+        if self.client is None and api_key:
             try:
-                self.client = googlemaps.Client(key=api_key)
+                self.client = googlemaps.Client(
+                    key=api_key,
+                    timeout=timeout,
+                    requests_session=requests_session
+                )
                 self._logger.info("Google Maps client initialized successfully")
             except Exception as e:
                 self._logger.warning(
@@ -65,31 +74,49 @@ class TollRateService:
                     error=str(e)
                 )
 
+    @property
+    def rate_version(self) -> str:
+        """Get the version stamp of the toll rate table in use."""
+        return get_toll_rate_version()
+
     def _extract_road_name(self, text: str) -> Optional[str]:
         """Extract road name from text using common patterns."""
-        patterns = [
-            r'\b[aA][0-9]{1,3}\b',  # A1, A12, A123
-            r'\b[eE][0-9]{1,3}\b',  # E40, E55
-            r'\b[dD][0-9]{1,3}\b',  # D1, D11
-            r'\b[sS][0-9]{1,3}\b'   # S1, S8
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0).upper()
-                
-        autobahn_match = re.search(r'autobahn[- ]?([0-9]{1,3})', text.lower())
-        if autobahn_match:
-            return f"A{autobahn_match.group(1)}"
-            
-        return None
+        return extract_road_ref(text)
 
     def _clean_html(self, text: str) -> str:
         """Remove HTML tags from text."""
-        text = re.sub(r'<[^>]+>', '', text)
-        text = text.replace('&nbsp;', ' ').replace('/<wbr/>', ' ')
-        return ' '.join(text.split()).lower()
+        return clean_html(text)
+
+    def _calculate_step_toll(
+        self,
+        country_code: str,
+        steps: List[RouteStep],
+        toll_class: str,
+        euro_class: str
+    ) -> Decimal:
+        """Calculate toll from stored step records without network calls.
+
+        Returns:
+            Toll amount for the toll-flagged steps in the country
+        """
+        toll_km = sum(
+            step.distance_km for step in steps
+            if step.is_toll and step.country_code == country_code
+        )
+        if not toll_km:
+            return Decimal('0')
+
+        rates = get_toll_rate(country_code, toll_class, euro_class)
+        total_rate = rates["base_rate"] + rates["euro_adjustment"]
+        toll_amount = Decimal("{:.4f}".format(toll_km)) * total_rate
+        self._logger.info(
+            "Toll calculated from stored route steps",
+            country_code=country_code,
+            toll_km=toll_km,
+            rate=str(total_rate),
+            toll=str(toll_amount)
+        )
+        return toll_amount
 
     def _get_toll_data(
         self,
@@ -168,7 +195,8 @@ class TollRateService:
         euro_class: str,
         co2_class: str,
         origin: Optional[tuple[float, float]] = None,
-        destination: Optional[tuple[float, float]] = None
+        destination: Optional[tuple[float, float]] = None,
+        steps: Optional[List[RouteStep]] = None
     ) -> Tuple[Decimal, bool]:
         """Calculate toll rate for a route segment.
         
@@ -180,6 +208,8 @@ class TollRateService:
             co2_class: Vehicle CO2 emission class
             origin: Optional start coordinates (lat, lon)
             destination: Optional end coordinates (lat, lon)
+            steps: Optional stored step records of the segment; when given,
+                toll km are classified from them and no API call is made
             
         Returns:
             Tuple of (toll_amount, used_default_rates)
@@ -188,57 +218,42 @@ class TollRateService:
             TollRateServiceError: If calculation fails completely
         """
         try:
+            # Prefer the step records stored with the route
+            if steps:
+                toll_amount = self._calculate_step_toll(country_code, steps, toll_class, euro_class)
+                if toll_amount > Decimal('0'):
+                    return toll_amount, False
+                return self._calculate_default_toll(country_code, distance_km, toll_class, euro_class)
+
             # Try to use Google Maps API if coordinates are provided
             if origin and destination:
                 route_data = self._get_toll_data(origin, destination, toll_class)
                 
                 if route_data:
-                    # Extract toll information
-                    toll_amount = Decimal('0')
-                    has_tolls = any('toll' in warning.lower() for warning in route_data.get('warnings', []))
-                    
-                    # Process each leg of the route
-                    if route_data.get('legs'):
-                        for leg in route_data['legs']:
-                            for step in leg.get('steps', []):
-                                html_instructions = self._clean_html(step.get('html_instructions', ''))
-                                
-                                # Check for toll roads
-                                is_toll = False
-                                
-                                # Check toll keywords
-                                if any(keyword in html_instructions for keyword in TOLL_KEYWORDS):
-                                    is_toll = True
-                                
-                                # Check road names
-                                road_name = self._extract_road_name(html_instructions)
-                                if road_name and has_tolls:
-                                    is_toll = True
-                                
-                                # Calculate toll if toll road found
-                                if is_toll:
-                                    step_distance_km = step['distance']['value'] / 1000
-                                    rates = get_toll_rate(country_code, toll_class, euro_class)
-                                    total_rate = rates["base_rate"] + rates["euro_adjustment"]
-                                    # Format distance to 4 decimal places to avoid scientific notation
-                                    formatted_distance = "{:.4f}".format(step_distance_km)
-                                    segment_toll = Decimal(formatted_distance) * total_rate
-                                    
-                                    self._logger.info(
-                                        "Toll segment found via Google Maps",
-                                        road=road_name,
-                                        distance_km=step_distance_km,
-                                        rate=str(total_rate),
-                                        toll=str(segment_toll)
-                                    )
-                                    
-                                    toll_amount += segment_toll
-                    
-                    if toll_amount > Decimal('0'):
+                    # Classify all steps of each leg in one pass
+                    has_tolls = route_has_tolls(route_data)
+                    toll_km_by_road: Dict[Optional[str], float] = {}
+                    for leg in route_data.get('legs', []):
+                        classification = classify_steps(leg.get('steps', []), has_tolls)
+                        for road_ref, toll_km in classification.toll_km_by_road.items():
+                            toll_km_by_road[road_ref] = toll_km_by_road.get(road_ref, 0.0) + toll_km
+
+                    toll_km = sum(toll_km_by_road.values())
+                    if toll_km > 0:
+                        rates = get_toll_rate(country_code, toll_class, euro_class)
+                        total_rate = rates["base_rate"] + rates["euro_adjustment"]
+                        # Format distance to 4 decimal places to avoid scientific notation
+                        toll_amount = Decimal("{:.4f}".format(toll_km)) * total_rate
+                        self._logger.info(
+                            "Toll roads found via Google Maps",
+                            toll_km_by_road={str(road): km for road, km in toll_km_by_road.items()},
+                            rate=str(total_rate),
+                            toll=str(toll_amount)
+                        )
                         return toll_amount, False
 
             # Fall back to default rates if:
-            # 1. No coordinates provided
+            # 1. No step records or coordinates provided
             # 2. Google Maps API call failed
             # 3. No toll roads found in Google Maps data
             return self._calculate_default_toll(country_code, distance_km, toll_class, euro_class)
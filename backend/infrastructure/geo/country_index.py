@@ -0,0 +1,208 @@
+"""Offline point-in-polygon country lookup."""
+import math
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..data.country_boundaries import (
+    COUNTRY_BOUNDARIES,
+    DEFAULT_BORDER_MARGIN_KM,
+    DEFAULT_GRID_CELL_DEG
+)
+
+# Kilometres per degree of latitude (mean)
+KM_PER_DEG_LAT = 110.574
+# Kilometres per degree of longitude at the equator
+KM_PER_DEG_LNG = 111.320
+
+Point = Tuple[float, float]
+BBox = Tuple[float, float, float, float]
+
+
+class CountryBoundaryIndex:
+    """Grid-bucketed index over simplified country polygons.
+
+    Polygons are bucketed into a regular lat/lng grid by bounding box so a
+    lookup only runs point-in-polygon tests against the few countries whose
+    bounds touch the query cell. Points that fall outside every polygon or
+    within ``border_margin_km`` of a polygon edge are reported as unresolved
+    so callers can fall back to an authoritative source.
+    """
+
+    def __init__(
+        self,
+        boundaries: Dict[str, Sequence[Point]],
+        border_margin_km: float = DEFAULT_BORDER_MARGIN_KM,
+        cell_size_deg: float = DEFAULT_GRID_CELL_DEG
+    ):
+        """Build the index.
+
+        Args:
+            boundaries: Mapping of country code to polygon (lat, lng) vertices
+            border_margin_km: Distance from an edge below which a point is ambiguous
+            cell_size_deg: Grid bucket size in degrees
+        """
+        if cell_size_deg <= 0:
+            raise ValueError("Grid cell size must be positive")
+        if border_margin_km < 0:
+            raise ValueError("Border margin cannot be negative")
+
+        self._border_margin_km = border_margin_km
+        self._cell_size = cell_size_deg
+        self._polygons: Dict[str, List[Point]] = {}
+        self._bboxes: Dict[str, BBox] = {}
+        self._grid: Dict[Tuple[int, int], List[str]] = {}
+
+        for country_code, vertices in boundaries.items():
+            if len(vertices) < 3:
+                raise ValueError(f"Polygon for {country_code} needs at least 3 vertices")
+            polygon = [(float(lat), float(lng)) for lat, lng in vertices]
+            lats = [lat for lat, _ in polygon]
+            lngs = [lng for _, lng in polygon]
+            bbox = (min(lats), min(lngs), max(lats), max(lngs))
+            self._polygons[country_code] = polygon
+            self._bboxes[country_code] = bbox
+            self._add_to_grid(country_code, bbox)
+
+    @property
+    def border_margin_km(self) -> float:
+        """Get the border ambiguity margin in kilometres."""
+        return self._border_margin_km
+
+    @property
+    def countries(self) -> List[str]:
+        """Get the indexed country codes."""
+        return sorted(self._polygons.keys())
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        """Get the grid cell for a coordinate."""
+        return (
+            int(math.floor(lat / self._cell_size)),
+            int(math.floor(lng / self._cell_size))
+        )
+
+    def _add_to_grid(self, country_code: str, bbox: BBox) -> None:
+        """Register a country in every grid cell its bounding box overlaps."""
+        min_row, min_col = self._cell(bbox[0], bbox[1])
+        max_row, max_col = self._cell(bbox[2], bbox[3])
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                self._grid.setdefault((row, col), []).append(country_code)
+
+    def candidates(self, lat: float, lng: float) -> List[str]:
+        """Get countries whose bounding box contains the point."""
+        result = []
+        for country_code in self._grid.get(self._cell(lat, lng), ()):
+            min_lat, min_lng, max_lat, max_lng = self._bboxes[country_code]
+            if min_lat <= lat <= max_lat and min_lng <= lng <= max_lng:
+                result.append(country_code)
+        return result
+
+    def contains(self, country_code: str, lat: float, lng: float) -> bool:
+        """Check whether a point lies inside a country's polygon."""
+        polygon = self._polygons.get(country_code)
+        if polygon is None:
+            return False
+        return _point_in_polygon(lat, lng, polygon)
+
+    def distance_to_border_km(self, country_code: str, lat: float, lng: float) -> float:
+        """Get the approximate distance from a point to a country's polygon edge."""
+        polygon = self._polygons[country_code]
+        return _distance_to_edges_km(lat, lng, polygon, stop_below=0.0)
+
+    def lookup(self, lat: float, lng: float) -> Optional[str]:
+        """Resolve the country code for a coordinate.
+
+        Args:
+            lat: Latitude
+            lng: Longitude
+
+        Returns:
+            ISO country code, or None if the point is outside all polygons,
+            inside more than one, or too close to a border to trust
+        """
+        matches = [
+            country_code
+            for country_code in self.candidates(lat, lng)
+            if _point_in_polygon(lat, lng, self._polygons[country_code])
+        ]
+        if len(matches) != 1:
+            return None
+
+        country_code = matches[0]
+        if self._border_margin_km > 0:
+            distance = _distance_to_edges_km(
+                lat, lng, self._polygons[country_code],
+                stop_below=self._border_margin_km
+            )
+            if distance < self._border_margin_km:
+                return None
+        return country_code
+
+
+def _point_in_polygon(lat: float, lng: float, polygon: Sequence[Point]) -> bool:
+    """Ray casting test along the longitude axis."""
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        lat_i, lng_i = polygon[i]
+        lat_j, lng_j = polygon[j]
+        if (lat_i > lat) != (lat_j > lat):
+            cross_lng = lng_i + (lat - lat_i) * (lng_j - lng_i) / (lat_j - lat_i)
+            if lng < cross_lng:
+                inside = not inside
+        j = i
+    return inside
+
+
+def _distance_to_edges_km(
+    lat: float,
+    lng: float,
+    polygon: Sequence[Point],
+    stop_below: float
+) -> float:
+    """Approximate distance to the nearest polygon edge.
+
+    Uses an equirectangular projection centred on the query point, which is
+    accurate to well under a percent at the distances the margin cares about.
+    Returns early once an edge closer than ``stop_below`` is found.
+    """
+    kx = KM_PER_DEG_LNG * math.cos(math.radians(lat))
+    ky = KM_PER_DEG_LAT
+    best = float("inf")
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        ax = (polygon[j][1] - lng) * kx
+        ay = (polygon[j][0] - lat) * ky
+        bx = (polygon[i][1] - lng) * kx
+        by = (polygon[i][0] - lat) * ky
+        dx = bx - ax
+        dy = by - ay
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0:
+            t = 0.0
+        else:
+            t = max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+        px = ax + t * dx
+        py = ay + t * dy
+        distance = math.hypot(px, py)
+        if distance < best:
+            best = distance
+            if best < stop_below:
+                return best
+        j = i
+    return best
+
+
+@lru_cache(maxsize=None)
+def get_country_index(
+    border_margin_km: float = DEFAULT_BORDER_MARGIN_KM
+) -> CountryBoundaryIndex:
+    """Get the shared boundary index, building it on first use.
+
+    Args:
+        border_margin_km: Distance from an edge below which a point is ambiguous
+
+    Returns:
+        CountryBoundaryIndex over the bundled boundary data
+    """
+    return CountryBoundaryIndex(COUNTRY_BOUNDARIES, border_margin_km=border_margin_km)
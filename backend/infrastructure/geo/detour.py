@@ -0,0 +1,183 @@
+"""Road detour factors calibrated from historical routes."""
+import statistics
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from ..logging import get_logger
+
+logger = get_logger()
+
+# Road distance over great-circle distance when no history is available;
+# typical for European motorway corridors
+DEFAULT_DETOUR_FACTOR = 1.25
+# Ratios outside this range are treated as bad data and ignored
+MIN_DETOUR_FACTOR = 1.0
+MAX_DETOUR_FACTOR = 3.0
+# Routes needed before a corridor gets its own factor
+DEFAULT_MIN_SAMPLES = 3
+# Default interval between recalibrations (seconds)
+DEFAULT_CALIBRATION_SECONDS = 3600.0
+
+Corridor = Tuple[str, str]
+
+
+class CorridorSample(NamedTuple):
+    """Road and great-circle distance of one historical route."""
+    origin_country: str
+    destination_country: str
+    straight_km: float
+    road_km: float
+
+
+def corridor(origin_country: str, destination_country: str) -> Corridor:
+    """Get the direction-independent corridor key for a country pair."""
+    return tuple(sorted((origin_country.upper(), destination_country.upper())))
+
+
+class DetourFactors:
+    """Immutable per-corridor detour factors with a global fallback."""
+
+    def __init__(
+        self,
+        factors: Optional[Dict[Corridor, float]] = None,
+        default: float = DEFAULT_DETOUR_FACTOR,
+        sample_count: int = 0
+    ):
+        """Initialize factors.
+
+        Args:
+            factors: Detour factor per corridor
+            default: Factor for corridors without history
+            sample_count: Number of routes the factors were calibrated from
+        """
+        self._factors = dict(factors or {})
+        self._default = default
+        self._sample_count = sample_count
+
+    @property
+    def default(self) -> float:
+        """Get the factor used for corridors without history."""
+        return self._default
+
+    @property
+    def sample_count(self) -> int:
+        """Get the number of routes the factors were calibrated from."""
+        return self._sample_count
+
+    def factor(self, origin_country: Optional[str], destination_country: Optional[str]) -> float:
+        """Get the detour factor for a corridor."""
+        if not origin_country or not destination_country:
+            return self._default
+        return self._factors.get(corridor(origin_country, destination_country), self._default)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Get factors keyed by "XX-YY" corridor names."""
+        return {"-".join(key): value for key, value in sorted(self._factors.items())}
+
+    @classmethod
+    def calibrate(
+        cls,
+        samples: Iterable[CorridorSample],
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        default: float = DEFAULT_DETOUR_FACTOR
+    ) -> "DetourFactors":
+        """Calibrate factors as the median road/great-circle ratio per corridor.
+
+        Medians keep a few unusual routes (ferries, closures) from skewing a
+        corridor. Corridors with fewer than ``min_samples`` routes use the
+        median over all routes, or ``default`` without enough history.
+        """
+        ratios: Dict[Corridor, list] = {}
+        for sample in samples:
+            if sample.straight_km <= 0:
+                continue
+            ratio = sample.road_km / sample.straight_km
+            if not MIN_DETOUR_FACTOR <= ratio <= MAX_DETOUR_FACTOR:
+                continue
+            ratios.setdefault(corridor(sample.origin_country, sample.destination_country), []).append(ratio)
+
+        all_ratios = [ratio for values in ratios.values() for ratio in values]
+        if len(all_ratios) >= min_samples:
+            default = statistics.median(all_ratios)
+        factors = {
+            key: statistics.median(values)
+            for key, values in ratios.items()
+            if len(values) >= min_samples
+        }
+        return cls(factors, default=default, sample_count=len(all_ratios))
+
+
+class DetourFactorStore:
+    """Process-wide detour factors, recalibrated every ``refresh_seconds``.
+
+    Calibration reads the route history, so it never runs on a request:
+    ``refresh_async`` warms the store at startup, and ``get`` starts a
+    background recalibration once the interval has passed while returning
+    the current factors. A failed calibration keeps the previous factors.
+    """
+
+    def __init__(self, refresh_seconds: float = DEFAULT_CALIBRATION_SECONDS):
+        """Initialize an uncalibrated store."""
+        self._refresh_seconds = refresh_seconds
+        self._factors = DetourFactors()
+        self._calibrated_at: Optional[float] = None
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def get(self, load_samples: Callable[[], Iterable[CorridorSample]]) -> DetourFactors:
+        """Get current factors, recalibrating from ``load_samples`` in the background when due."""
+        calibrated_at = self._calibrated_at
+        if calibrated_at is None or time.monotonic() - calibrated_at >= self._refresh_seconds:
+            self.refresh_async(load_samples)
+        return self._factors
+
+    def refresh_async(
+        self,
+        load_samples: Callable[[], Iterable[CorridorSample]]
+    ) -> Optional[threading.Thread]:
+        """Recalibrate on a daemon thread.
+
+        Returns:
+            The calibration thread, or None if one is already running
+        """
+        with self._lock:
+            if self._refreshing:
+                return None
+            self._refreshing = True
+        thread = threading.Thread(
+            target=self._refresh_in_background,
+            args=(load_samples,),
+            name="detour-calibration",
+            daemon=True
+        )
+        thread.start()
+        return thread
+
+    def refresh(self, load_samples: Callable[[], Iterable[CorridorSample]]) -> DetourFactors:
+        """Recalibrate from ``load_samples`` on the calling thread."""
+        try:
+            self._factors = DetourFactors.calibrate(load_samples())
+            logger.info("Detour factors calibrated",
+                        sample_count=self._factors.sample_count,
+                        default=round(self._factors.default, 3),
+                        corridors=len(self._factors.to_dict()))
+        except Exception as e:
+            logger.warning("Detour factor calibration failed", error=str(e))
+        self._calibrated_at = time.monotonic()
+        return self._factors
+
+    def _refresh_in_background(self, load_samples: Callable[[], Iterable[CorridorSample]]) -> None:
+        """Recalibrate and allow the next background refresh."""
+        try:
+            self.refresh(load_samples)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+@lru_cache(maxsize=None)
+def get_detour_factor_store(refresh_seconds: float = DEFAULT_CALIBRATION_SECONDS) -> DetourFactorStore:
+    """Get the shared detour factor store."""
+    return DetourFactorStore(refresh_seconds)
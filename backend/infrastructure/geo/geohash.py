@@ -0,0 +1,70 @@
+"""Geohash encoding for coordinate bucketing."""
+from typing import Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def encode(lat: float, lng: float, precision: int = 7) -> str:
+    """Encode a coordinate as a geohash.
+
+    Precision 6 cells are roughly 1.2 x 0.6 km, precision 7 roughly
+    150 x 150 m and precision 8 roughly 38 x 19 m.
+
+    Args:
+        lat: Latitude
+        lng: Longitude
+        precision: Number of geohash characters
+
+    Returns:
+        Geohash string
+    """
+    if precision < 1:
+        raise ValueError("Geohash precision must be at least 1")
+
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        rng, value = (lng_range, lng) if even else (lat_range, lat)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits = bits << 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def decode(geohash: str) -> Tuple[float, float]:
+    """Decode a geohash to the centre of its cell.
+
+    Args:
+        geohash: Geohash string
+
+    Returns:
+        Tuple of (lat, lng)
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+    for char in geohash:
+        value = _BASE32.index(char)
+        for shift in range(4, -1, -1):
+            rng = lng_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if (value >> shift) & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return (lat_range[0] + lat_range[1]) / 2, (lng_range[0] + lng_range[1]) / 2
@@ -0,0 +1,28 @@
+"""Compact per-step road records derived from Directions steps."""
+from typing import Dict, List, Sequence
+
+from ...domain.entities.route import RouteStep
+from .toll_classifier import classify_steps
+
+
+def compact_steps(steps: Sequence[Dict], country_code: str, has_tolls: bool) -> List[RouteStep]:
+    """Build compact records for the Directions steps of one country segment.
+
+    Args:
+        steps: Raw Directions steps in route order
+        country_code: Country the steps are attributed to
+        has_tolls: Whether the route carries a toll warning
+
+    Returns:
+        One RouteStep per input step
+    """
+    classification = classify_steps(steps, has_tolls)
+    return [
+        RouteStep(
+            distance_km=step['distance']['value'] / 1000.0,
+            road_ref=step_class.road_ref,
+            is_toll=step_class.is_toll,
+            country_code=country_code
+        )
+        for step, step_class in zip(steps, classification.steps)
+    ]
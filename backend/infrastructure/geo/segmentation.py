@@ -0,0 +1,39 @@
+"""Pure grouping of route steps into per-country runs."""
+from typing import List, NamedTuple, Optional, Sequence
+
+
+class CountryRun(NamedTuple):
+    """Consecutive route steps attributed to one country."""
+    country_code: str
+    first_step: int
+    last_step: int
+
+
+def country_runs(step_countries: Sequence[Optional[str]]) -> List[CountryRun]:
+    """Run-length group per-step country codes.
+
+    Steps whose country could not be resolved (empty or None) are attributed
+    to the preceding country, or to the first resolved country if they lead
+    the route, so their distance is never dropped.
+
+    Args:
+        step_countries: Country code attributed to each step, in route order
+
+    Returns:
+        List of CountryRun in route order; empty if no step has a country
+    """
+    first_known = next((code for code in step_countries if code), None)
+    if first_known is None:
+        return []
+
+    runs: List[CountryRun] = []
+    current = first_known
+    start = 0
+    for index, code in enumerate(step_countries):
+        code = code or current
+        if code != current:
+            runs.append(CountryRun(current, start, index - 1))
+            current = code
+            start = index
+    runs.append(CountryRun(current, start, len(step_countries) - 1))
+    return runs
@@ -0,0 +1,102 @@
+"""Douglas-Peucker polyline simplification with named levels of detail."""
+import math
+from array import array
+from itertools import chain
+from typing import Dict, Sequence
+
+from ...domain.entities.geometry import RouteGeometry
+from .distance import EARTH_RADIUS_KM
+
+# Named levels of detail and their tolerances in meters. "full" serves the
+# stored points unchanged.
+LOD_FULL = "full"
+LOD_TOLERANCES_M = {
+    "overview": 500.0,
+    "detail": 50.0,
+}
+LODS = (LOD_FULL,) + tuple(LOD_TOLERANCES_M)
+
+_EARTH_RADIUS_M = EARTH_RADIUS_KM * 1000.0
+
+# Points per independently simplified window. Splits that peel off one point
+# at a time make Douglas-Peucker O(n * kept); windows bound that cost.
+_WINDOW = 512
+
+
+def simplify_points(points: Sequence[Sequence[float]], tolerance_m: float) -> RouteGeometry:
+    """Simplify a [lat, lng] polyline with the Douglas-Peucker algorithm.
+
+    Points are projected onto a local equirectangular plane in meters, which
+    is accurate enough for map display. The scan uses an
+    explicit stack, so long routes do not hit the recursion limit, and runs
+    over fixed windows whose boundary points are always kept.
+
+    Args:
+        points: Polyline as [lat, lng] pairs
+        tolerance_m: Maximum distance in meters between the simplified line
+            and any dropped point
+
+    Returns:
+        Simplified geometry; the first and last points are always kept
+    """
+    geometry = RouteGeometry.validate(points)
+    count = len(geometry)
+    if count < 3 or tolerance_m <= 0:
+        return geometry
+
+    values = geometry.buffer
+    lats, lngs = values[0::2], values[1::2]
+    lat0 = math.radians(sum(lats) / count)
+    scale_x = _EARTH_RADIUS_M * math.cos(lat0) * math.pi / 180.0
+    scale_y = _EARTH_RADIUS_M * math.pi / 180.0
+    xs = [lng * scale_x for lng in lngs]
+    ys = [lat * scale_y for lat in lats]
+
+    keep = [False] * count
+    keep[-1] = True
+    stack = []
+    for first in range(0, count - 1, _WINDOW):
+        keep[first] = True
+        stack.append((first, min(first + _WINDOW, count - 1)))
+    tolerance_sq = tolerance_m * tolerance_m
+    while stack:
+        first, last = stack.pop()
+        ax, ay = xs[first], ys[first]
+        dx, dy = xs[last] - ax, ys[last] - ay
+        length_sq = dx * dx + dy * dy
+
+        max_sq = -1.0
+        index = first
+        for i in range(first + 1, last):
+            px, py = xs[i] - ax, ys[i] - ay
+            if length_sq == 0.0:
+                dist_sq = px * px + py * py
+            else:
+                t = max(0.0, min(1.0, (px * dx + py * dy) / length_sq))
+                ex, ey = px - t * dx, py - t * dy
+                dist_sq = ex * ex + ey * ey
+            if dist_sq > max_sq:
+                max_sq = dist_sq
+                index = i
+
+        if max_sq > tolerance_sq:
+            keep[index] = True
+            if index - first > 1:
+                stack.append((first, index))
+            if last - index > 1:
+                stack.append((index, last))
+
+    return RouteGeometry.from_buffer(array("d", chain.from_iterable(
+        (lats[i], lngs[i]) for i in range(count) if keep[i]
+    )))
+
+
+def build_lods(points: Sequence[Sequence[float]]) -> Dict[str, RouteGeometry]:
+    """Simplify a polyline for every named level of detail.
+
+    Returns:
+        Simplified points per level name, excluding "full"
+    """
+    if not points:
+        return {}
+    return {lod: simplify_points(points, tolerance) for lod, tolerance in LOD_TOLERANCES_M.items()}
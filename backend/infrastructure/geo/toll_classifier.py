@@ -0,0 +1,128 @@
+"""Compiled toll-road classifier for Directions steps."""
+import re
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from ..data.toll_rates import TOLL_KEYWORDS
+
+# Separator placed between step instructions when a leg is scanned at once
+_STEP_SEPARATOR = "\x00"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Road references in priority order: A roads, E roads, D roads, S roads,
+# then spelled-out "autobahn 7". Keywords share the same alternation so a
+# single scan finds both.
+_ROAD_PRIORITY = {"a": 0, "e": 1, "d": 2, "s": 3}
+_AUTOBAHN_PRIORITY = 4
+_SCAN_RE = re.compile(
+    "(?P<keyword>" + "|".join(
+        re.escape(keyword) for keyword in sorted(TOLL_KEYWORDS, key=len, reverse=True)
+    ) + ")"
+    r"|\b(?P<prefix>[aeds])(?P<number>[0-9]{1,3})\b"
+    r"|autobahn[- ]?(?P<autobahn>[0-9]{1,3})"
+)
+
+
+class StepClass(NamedTuple):
+    """Classification of one Directions step."""
+    road_ref: Optional[str]
+    is_toll: bool
+
+
+class LegClassification(NamedTuple):
+    """Classification of all steps of a leg."""
+    steps: List[StepClass]
+    toll_km_by_road: Dict[Optional[str], float]
+
+    @property
+    def toll_km(self) -> float:
+        """Get the total toll distance in kilometers."""
+        return sum(self.toll_km_by_road.values())
+
+
+def _normalize(text: str) -> str:
+    """Strip tags and entities, collapse whitespace and lowercase."""
+    text = _TAG_RE.sub("", text)
+    text = text.replace("&nbsp;", " ").replace("/<wbr/>", " ")
+    return _WHITESPACE_RE.sub(" ", text).lower()
+
+
+def clean_html(text: str) -> str:
+    """Remove HTML tags from step instructions and normalize whitespace."""
+    return _normalize(text).strip()
+
+
+def _road_ref(match: "re.Match") -> tuple:
+    """Get (priority, road ref) for a road match."""
+    if match.group("autobahn") is not None:
+        return _AUTOBAHN_PRIORITY, f"A{match.group('autobahn')}"
+    prefix = match.group("prefix")
+    return _ROAD_PRIORITY[prefix], f"{prefix.upper()}{match.group('number')}"
+
+
+def extract_road_ref(text: str) -> Optional[str]:
+    """Extract a road reference such as A2 or E30 from instruction text."""
+    best = None
+    for match in _SCAN_RE.finditer(text.lower()):
+        if match.group("keyword") is None:
+            candidate = _road_ref(match)
+            if best is None or candidate[0] < best[0]:
+                best = candidate
+    return best[1] if best else None
+
+
+def route_has_tolls(route: Dict) -> bool:
+    """Check the Directions route warnings for tolls."""
+    return any("toll" in warning.lower() for warning in route.get("warnings", []))
+
+
+def classify_steps(steps: Sequence[Dict], has_tolls: bool) -> LegClassification:
+    """Classify every step of a leg in a single regex pass.
+
+    Step instructions are normalized and joined with a separator, scanned
+    once, and matches are mapped back to their step by offset. A step is a
+    toll step when it mentions a toll keyword, or names a road on a route
+    that Directions flagged as having tolls.
+
+    Args:
+        steps: Raw Directions steps in route order
+        has_tolls: Whether the route carries a toll warning
+
+    Returns:
+        Per-step classification and toll kilometers per road ref
+    """
+    if not steps:
+        return LegClassification([], {})
+
+    text = _normalize(_STEP_SEPARATOR.join(step.get("html_instructions", "") for step in steps))
+    separators = []
+    position = -1
+    for part in text.split(_STEP_SEPARATOR)[:-1]:
+        position += len(part) + 1
+        separators.append(position)
+
+    keyword_hit = [False] * len(steps)
+    best_road: List[Optional[tuple]] = [None] * len(steps)
+    for match in _SCAN_RE.finditer(text):
+        index = bisect_right(separators, match.start())
+        if match.group("keyword") is not None:
+            keyword_hit[index] = True
+            continue
+        candidate = _road_ref(match)
+        current = best_road[index]
+        if current is None or candidate[0] < current[0]:
+            best_road[index] = candidate
+
+    classified = []
+    toll_km_by_road: Dict[Optional[str], float] = {}
+    for step, keyword, road in zip(steps, keyword_hit, best_road):
+        road_ref = road[1] if road else None
+        is_toll = keyword or (road_ref is not None and has_tolls)
+        classified.append(StepClass(road_ref, is_toll))
+        if is_toll:
+            toll_km_by_road[road_ref] = (
+                toll_km_by_road.get(road_ref, 0.0) + step["distance"]["value"] / 1000.0
+            )
+    return LegClassification(classified, toll_km_by_road)
@@ -7,7 +7,7 @@ from .cargo_models import (
 )
 from .route_models import (
     LocationModel, EmptyDrivingModel, TimelineEventModel,
-    CountrySegmentModel, RouteModel, RouteStatusHistoryModel
+    CountrySegmentModel, RouteModel, RouteStatusHistoryModel, LaneModel
 )
 from .transport_models import (
     TransportTypeModel, TransportModel,
@@ -132,10 +132,16 @@ class CostBreakdownModel(Base):
     overhead_costs = Column(String(50), nullable=False)  # Stored as string for Decimal
     timeline_event_costs = Column(JSON, nullable=False)
     total_cost = Column(String(50), nullable=False)  # Stored as string for Decimal
+    toll_rate_version = Column(String(50), nullable=True)  # Toll rate table version used
+    input_fingerprints = Column(JSON, nullable=True)  # Input hash per cost component
+    input_hash = Column(String(32), nullable=True, index=True)  # Content hash of all inputs
+    created_at = Column(DateTime(timezone=True), nullable=False, index=True,
+                        default=lambda: datetime.now(timezone.utc))
 
     def __init__(self, id, route_id, fuel_costs=None, toll_costs=None,
                  driver_costs=None, overhead_costs=None, timeline_event_costs=None,
-                 total_cost=None):
+                 total_cost=None, toll_rate_version=None, input_fingerprints=None,
+                 input_hash=None):
         self.id = id
         self.route_id = route_id
         self.set_fuel_costs(fuel_costs or {})
@@ -149,6 +155,9 @@ class CostBreakdownModel(Base):
         self.overhead_costs = str(overhead_costs) if overhead_costs is not None else "0"
         self.set_timeline_event_costs(timeline_event_costs or {})
         self.total_cost = str(total_cost) if total_cost is not None else "0"
+        self.toll_rate_version = toll_rate_version
+        self.input_fingerprints = input_fingerprints or {}
+        self.input_hash = input_hash
 
     def get_fuel_costs(self) -> dict[str, str]:
         """Get fuel costs as dictionary with decimal strings."""
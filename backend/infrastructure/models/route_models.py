@@ -1,7 +1,7 @@
 """SQLAlchemy models for route-related entities."""
 from sqlalchemy import (
     Column, String, Float, Boolean, ForeignKey,
-    DateTime, Integer, JSON
+    DateTime, Integer, JSON, Text
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.mutable import MutableDict
@@ -35,11 +35,15 @@ class EmptyDrivingModel(Base):
     id = Column(String(36), primary_key=True)
     distance_km = Column(String(50), nullable=False)  # Store as string for Decimal
     duration_hours = Column(String(50), nullable=False)  # Store as string for Decimal
+    route_polyline = Column(Text, nullable=True)  # Google encoded polyline
+    route_polyline_lods = Column(Text, nullable=True)  # Simplified polylines per level of detail
 
-    def __init__(self, id, distance_km, duration_hours):
+    def __init__(self, id, distance_km, duration_hours, route_polyline=None, route_polyline_lods=None):
         self.id = id
         self.distance_km = str(distance_km)  # Convert to string
         self.duration_hours = str(duration_hours)  # Convert to string
+        self.route_polyline = route_polyline
+        self.route_polyline_lods = route_polyline_lods
 
 
 class TimelineEventModel(Base):
@@ -109,13 +113,17 @@ class CountrySegmentModel(Base):
     start_location_id = Column(String(36), ForeignKey("locations.id"), nullable=False)
     end_location_id = Column(String(36), ForeignKey("locations.id"), nullable=False)
     segment_order = Column(Integer, nullable=False)
+    route_polyline = Column(Text, nullable=True)  # Google encoded polyline
+    route_steps = Column(Text, nullable=True)  # Compact JSON step records
+    route_polyline_lods = Column(Text, nullable=True)  # Simplified polylines per level of detail
 
     # Relationships
     start_location = relationship("LocationModel", foreign_keys=[start_location_id])
     end_location = relationship("LocationModel", foreign_keys=[end_location_id])
 
     def __init__(self, id, route_id, country_code, distance_km, duration_hours,
-                 start_location_id, end_location_id, segment_order, segment_type="route"):
+                 start_location_id, end_location_id, segment_order, segment_type="route",
+                 route_polyline=None, route_steps=None, route_polyline_lods=None):
         self.id = id
         self.route_id = route_id
         self.country_code = country_code
@@ -125,6 +133,9 @@ class CountrySegmentModel(Base):
         self.start_location_id = start_location_id
         self.end_location_id = end_location_id
         self.segment_order = segment_order
+        self.route_polyline = route_polyline
+        self.route_steps = route_steps
+        self.route_polyline_lods = route_polyline_lods
 
     def to_dict(self):
         """Convert country segment to dictionary."""
@@ -159,11 +170,15 @@ class RouteModel(Base):
     total_duration_hours = Column(String(50), nullable=False)  # Store as string for Decimal
     is_feasible = Column(Boolean, nullable=False, default=True)
     status = Column(String(50), nullable=False, default="draft")
+    mode = Column(String(20), nullable=False, default="exact")  # exact or estimate
+    waypoint_count = Column(Integer, nullable=False, default=0)
     country_segments_json = Column(JSON, nullable=True)
     certifications_validated = Column(Boolean, nullable=False, default=False)
     operating_countries_validated = Column(Boolean, nullable=False, default=False)
     validation_timestamp = Column(DateTime(timezone=True), nullable=True)
     validation_details = Column(JSON, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, index=True,
+                        default=lambda: datetime.now(timezone.utc))
 
     # Relationships
     business_entity = relationship("BusinessEntityModel")
@@ -180,7 +195,7 @@ class RouteModel(Base):
                  origin_id, destination_id, truck_location_id, pickup_time, delivery_time,
                  total_distance_km, total_duration_hours,
                  cargo_id=None, empty_driving_id=None,
-                 is_feasible=True, status="draft",
+                 is_feasible=True, status="draft", mode="exact", waypoint_count=0,
                  timeline_events=None, country_segments_json=None,
                  certifications_validated=False,
                  operating_countries_validated=False,
@@ -208,6 +223,8 @@ class RouteModel(Base):
         self.total_duration_hours = str(total_duration_hours)  # Convert to string
         self.is_feasible = is_feasible
         self.status = status
+        self.mode = mode
+        self.waypoint_count = waypoint_count
         self.timeline_events = timeline_events or []
         self.country_segments_json = country_segments_json or []
         self.certifications_validated = certifications_validated
@@ -273,4 +290,27 @@ class RouteStatusHistoryModel(Base):
             'status': self.status,
             'timestamp': self.timestamp.isoformat() if self.timestamp else None,
             'comment': self.comment
-        } 
\ No newline at end of file
+        } 
+
+class LaneModel(Base):
+    """Model for computed origin/destination lanes reused across routes."""
+
+    __tablename__ = 'lanes'
+
+    id = Column(String(36), primary_key=True)
+    lane_key = Column(String(100), nullable=False, unique=True, index=True)
+    total_distance_km = Column(String(50), nullable=False)  # Store as string for Decimal
+    total_duration_hours = Column(String(50), nullable=False)  # Store as string for Decimal
+    route_polyline = Column(Text, nullable=True)  # Google encoded polyline
+    segments_json = Column(JSON, nullable=False)  # Country segments with encoded geometry and steps
+    created_at = Column(DateTime(timezone=True), nullable=False)
+
+    def __init__(self, id: str, lane_key: str, total_distance_km, total_duration_hours,
+                 segments_json, created_at: datetime, route_polyline=None):
+        self.id = id
+        self.lane_key = lane_key
+        self.total_distance_km = str(total_distance_km)  # Convert to string
+        self.total_duration_hours = str(total_duration_hours)  # Convert to string
+        self.route_polyline = route_polyline
+        self.segments_json = segments_json
+        self.created_at = created_at
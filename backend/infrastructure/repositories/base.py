@@ -1,5 +1,5 @@
 """Base repository implementation with common CRUD operations."""
-from typing import Generic, Optional, Type, TypeVar, Any, Dict, ContextManager, Generator
+from typing import Generic, Optional, Type, TypeVar, Any, Dict, ContextManager, Generator, Iterable, List
 from uuid import UUID
 from datetime import datetime
 from contextlib import contextmanager
@@ -14,6 +14,9 @@ from ..database import Base
 
 ModelType = TypeVar("ModelType", bound=Any)
 
+# Values bound per IN (...) clause; keeps bulk lookups under SQLite's parameter limit
+IN_QUERY_CHUNK_SIZE = 500
+
 # Configure logger
 logger = structlog.get_logger()
 
@@ -84,6 +87,42 @@ class BaseRepository(Generic[ModelType]):
             logger.error("repository.find_all.unexpected_error", filters=filters, error=str(e))
             raise
 
+    def find_many(
+        self,
+        values: Iterable[Any],
+        column: str = "id",
+        options: Iterable[Any] = ()
+    ) -> List[ModelType]:
+        """Find entities whose column matches any of the values.
+
+        Values are queried with ``IN (...)`` in chunks of
+        IN_QUERY_CHUNK_SIZE, so loading hundreds of entities costs a few
+        queries instead of one per entity.
+
+        Args:
+            values: Column values to match; UUIDs are compared as strings
+            column: Model column to filter on
+            options: Loader options, e.g. selectinload of relationships
+
+        Returns:
+            Matching entities in no particular order
+        """
+        keys = list(dict.fromkeys(str(value) for value in values))
+        options = list(options)
+        models = []
+        try:
+            for start in range(0, len(keys), IN_QUERY_CHUNK_SIZE):
+                query = self._db.query(self._model).options(*options)
+                query = query.filter(getattr(self._model, column).in_(keys[start:start + IN_QUERY_CHUNK_SIZE]))
+                models.extend(query.all())
+            return models
+        except SQLAlchemyError as e:
+            logger.error("repository.find_many.error", column=column, count=len(keys), error=str(e))
+            raise
+        except Exception as e:
+            logger.error("repository.find_many.unexpected_error", column=column, count=len(keys), error=str(e))
+            raise
+
     def create(self, entity: ModelType) -> ModelType:
         """Create a new entity."""
         try:
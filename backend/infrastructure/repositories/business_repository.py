@@ -1,6 +1,6 @@
 """Repository implementation for business entities."""
 from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
 from uuid import UUID
 import structlog
 from sqlalchemy.exc import SQLAlchemyError
@@ -116,6 +116,12 @@ class SQLBusinessEntityRepository(BaseRepository[BusinessEntityModel]):
             logger.error("business_repository.find_by_id.unexpected_error", entity_id=str(id), error=str(e))
             raise
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, BusinessEntity]:
+        """Find business entities by ID with bulk IN queries."""
+        models = self.find_many(ids)
+        logger.info("business_repository.find_by_ids.success", count=len(models))
+        return {UUID(model.id): self._to_domain(model) for model in models}
+
     def find_all(self, filters: Optional[Dict[str, Any]] = None) -> List[BusinessEntity]:
         """Find all business entities matching the filters."""
         logger.debug("business_repository.find_all.start", filters=filters)
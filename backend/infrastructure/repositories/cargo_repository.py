@@ -1,6 +1,7 @@
 """Repository implementations for cargo and cost-related entities."""
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List
 from uuid import UUID, uuid4
 from datetime import datetime, timezone
 
@@ -14,8 +15,11 @@ from ..models.cargo_models import (
     CargoModel, CostSettingsModel,
     CostBreakdownModel, OfferModel
 )
+from ..cache.lru import LRUCache
 from .base import BaseRepository
 
+DEFAULT_BREAKDOWN_MEMO_SIZE = 2048
+
 
 class SQLCargoRepository(BaseRepository[CargoModel]):
     """SQLAlchemy implementation of CargoRepository."""
@@ -108,6 +112,13 @@ class SQLCostSettingsRepository(BaseRepository[CostSettingsModel]):
         model = models[0] if models else None
         return self._to_domain(model) if model else None
 
+    def find_by_route_ids(self, route_ids: Iterable[UUID]) -> Dict[UUID, CostSettings]:
+        """Find cost settings for several routes with bulk IN queries."""
+        settings = {}
+        for model in self.find_many(route_ids, column="route_id"):
+            settings.setdefault(UUID(model.route_id), self._to_domain(model))
+        return settings
+
     def _to_domain(self, model: CostSettingsModel) -> CostSettings:
         """Convert model to domain entity."""
         return CostSettings(
@@ -191,11 +202,45 @@ class SQLCostBreakdownRepository(BaseRepository[CostBreakdownModel]):
         model.overhead_costs = str(breakdown.overhead_costs)
         model.set_timeline_event_costs({k: str(v) for k, v in breakdown.timeline_event_costs.items()})
         model.total_cost = str(breakdown.total_cost)
+        model.toll_rate_version = breakdown.toll_rate_version
+        model.input_fingerprints = dict(breakdown.input_fingerprints)
+        model.input_hash = breakdown.input_hash
         
         created = self.create(model)
         print(f"Created model driver_costs: {created.driver_costs}")
         return self._to_domain(created)
 
+    def save_all(self, breakdowns: List[CostBreakdown]) -> List[CostBreakdown]:
+        """Save several cost breakdowns in a single transaction.
+
+        Raises:
+            ValueError: If any breakdown fails to save; none are saved then
+        """
+        models = []
+        for breakdown in breakdowns:
+            model = CostBreakdownModel(
+                id=str(breakdown.id),
+                route_id=str(breakdown.route_id)
+            )
+            model.set_fuel_costs({k: str(v) for k, v in breakdown.fuel_costs.items()})
+            model.set_toll_costs({k: str(v) for k, v in breakdown.toll_costs.items()})
+            model.set_driver_costs({k: str(v) for k, v in breakdown.driver_costs.items()})
+            model.overhead_costs = str(breakdown.overhead_costs)
+            model.set_timeline_event_costs({k: str(v) for k, v in breakdown.timeline_event_costs.items()})
+            model.total_cost = str(breakdown.total_cost)
+            model.toll_rate_version = breakdown.toll_rate_version
+            model.input_fingerprints = dict(breakdown.input_fingerprints)
+            model.input_hash = breakdown.input_hash
+            models.append(model)
+
+        try:
+            self._db.add_all(models)
+            self._db.commit()
+        except Exception as e:
+            self._db.rollback()
+            raise ValueError(f"Failed to save cost breakdowns: {str(e)}")
+        return breakdowns
+
     def find_by_route_id(self, route_id: UUID) -> Optional[CostBreakdown]:
         """Find cost breakdown by route ID."""
         print(f"\nLooking up cost breakdown for route: {route_id}")
@@ -207,6 +252,37 @@ class SQLCostBreakdownRepository(BaseRepository[CostBreakdownModel]):
             print("No cost breakdown found")
         return self._to_domain(model) if model else None
 
+    def find_latest_by_route_id(self, route_id: UUID) -> Optional[CostBreakdown]:
+        """Find the most recently saved cost breakdown of a route."""
+        model = (
+            self._db.query(CostBreakdownModel)
+            .filter(CostBreakdownModel.route_id == str(route_id))
+            .order_by(CostBreakdownModel.created_at.desc())
+            .first()
+        )
+        return self._to_domain(model) if model else None
+
+    def mark_latest(self, breakdown_id: UUID) -> None:
+        """Make a stored breakdown the latest one of its route by bumping its creation time."""
+        try:
+            self._db.query(CostBreakdownModel).filter(
+                CostBreakdownModel.id == str(breakdown_id)
+            ).update({"created_at": datetime.now(timezone.utc)})
+            self._db.commit()
+        except Exception as e:
+            self._db.rollback()
+            raise ValueError(f"Failed to mark cost breakdown as latest: {str(e)}")
+
+    def find_by_input_hash(self, input_hash: str) -> Optional[CostBreakdown]:
+        """Find the most recent cost breakdown calculated from identical inputs."""
+        model = (
+            self._db.query(CostBreakdownModel)
+            .filter(CostBreakdownModel.input_hash == input_hash)
+            .order_by(CostBreakdownModel.created_at.desc())
+            .first()
+        )
+        return self._to_domain(model) if model else None
+
     def _to_domain(self, model: CostBreakdownModel) -> CostBreakdown:
         """Convert model to domain entity."""
         if not model:
@@ -227,7 +303,10 @@ class SQLCostBreakdownRepository(BaseRepository[CostBreakdownModel]):
                 driver_costs={k: Decimal(v) for k, v in driver_costs.items()},
                 overhead_costs=Decimal(model.overhead_costs),
                 timeline_event_costs={k: Decimal(v) for k, v in model.get_timeline_event_costs().items()},
-                total_cost=Decimal(model.total_cost)
+                total_cost=Decimal(model.total_cost),
+                toll_rate_version=model.toll_rate_version,
+                input_fingerprints=model.input_fingerprints or {},
+                input_hash=model.input_hash
             )
             print(f"Created domain entity with driver_costs: {result.driver_costs}")
             return result
@@ -301,4 +380,14 @@ class SQLOfferRepository(BaseRepository[OfferModel]):
             created_at=model.created_at,
             finalized_at=model.finalized_at,
             status=model.status
-        ) 
\ No newline at end of file
+        ) 
+
+
+@lru_cache(maxsize=None)
+def get_cost_breakdown_memo(max_size: int = DEFAULT_BREAKDOWN_MEMO_SIZE) -> LRUCache:
+    """Get the process-wide memo of cost breakdowns keyed by input hash.
+
+    Cost services are created per request; caching here lets them share
+    breakdowns.
+    """
+    return LRUCache(max_size=max_size)
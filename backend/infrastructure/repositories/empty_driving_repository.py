@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from ...domain.entities.route import EmptyDriving
 from ..models.route_models import EmptyDrivingModel
 from .base import BaseRepository
+from .route_repository import decode_route_lods, decode_route_points
 
 
 class SQLEmptyDrivingRepository(BaseRepository[EmptyDrivingModel]):
@@ -26,5 +27,7 @@ class SQLEmptyDrivingRepository(BaseRepository[EmptyDrivingModel]):
         return EmptyDriving(
             id=UUID(model.id),
             distance_km=model.distance_km,
-            duration_hours=model.duration_hours
+            duration_hours=model.duration_hours,
+            route_points=decode_route_points(model.route_polyline),
+            simplified_points=decode_route_lods(model.route_polyline_lods)
         ) 
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""Repository for computed origin/destination lanes."""
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from ...domain.entities.route import CountrySegment, Lane, SegmentType
+from ..logging import get_logger
+from ..models.route_models import LaneModel
+from .base import BaseRepository
+from .route_repository import (
+    decode_route_points, decode_route_steps, encode_route_points, encode_route_steps
+)
+
+logger = get_logger()
+
+
+class SQLLaneRepository(BaseRepository[LaneModel]):
+    """SQLAlchemy implementation of LaneRepository.
+
+    Each lane is one row; its country segments are stored as JSON with
+    encoded polylines and compact step records, so a hit is a single
+    indexed lookup.
+    """
+
+    def __init__(self, db: Session):
+        """Initialize repository with database session."""
+        super().__init__(LaneModel, db)
+
+    def find_by_key(self, lane_key: str) -> Optional[Lane]:
+        """Find a lane by its key."""
+        model = self._db.query(LaneModel).filter_by(lane_key=lane_key).first()
+        return self._to_domain(model) if model else None
+
+    def save(self, lane: Lane) -> Lane:
+        """Save a lane, replacing any lane stored under the same key."""
+        segments_json = [
+            {
+                "country_code": segment.country_code,
+                "segment_type": segment.segment_type.value,
+                "distance_km": segment.distance_km,
+                "duration_hours": segment.duration_hours,
+                "start_location_id": str(segment.start_location_id),
+                "end_location_id": str(segment.end_location_id),
+                "route_polyline": encode_route_points(segment.route_points),
+                "route_steps": encode_route_steps(segment.steps)
+            }
+            for segment in lane.country_segments
+        ]
+        try:
+            model = self._db.query(LaneModel).filter_by(lane_key=lane.lane_key).first()
+            if model:
+                model.total_distance_km = str(lane.total_distance_km)
+                model.total_duration_hours = str(lane.total_duration_hours)
+                model.route_polyline = encode_route_points(lane.route_polyline)
+                model.segments_json = segments_json
+                model.created_at = lane.created_at
+            else:
+                model = LaneModel(
+                    id=str(lane.id),
+                    lane_key=lane.lane_key,
+                    total_distance_km=lane.total_distance_km,
+                    total_duration_hours=lane.total_duration_hours,
+                    route_polyline=encode_route_points(lane.route_polyline),
+                    segments_json=segments_json,
+                    created_at=lane.created_at
+                )
+                self._db.add(model)
+            self._db.commit()
+        except Exception as e:
+            self._db.rollback()
+            raise ValueError(f"Failed to save lane: {str(e)}")
+
+        logger.debug("Lane saved", lane_key=lane.lane_key, segment_count=len(segments_json))
+        return self._to_domain(model)
+
+    def delete_older_than(self, cutoff: datetime) -> int:
+        """Delete lanes calculated before the cutoff.
+
+        Returns:
+            Number of deleted lanes
+        """
+        try:
+            deleted = self._db.query(LaneModel).filter(LaneModel.created_at < cutoff).delete()
+            self._db.commit()
+            return deleted
+        except Exception as e:
+            self._db.rollback()
+            raise ValueError(f"Failed to delete lanes: {str(e)}")
+
+    def _to_domain(self, model: LaneModel) -> Lane:
+        """Convert model to domain entity."""
+        created_at = model.created_at
+        if created_at.tzinfo is None:
+            # SQLite drops the timezone; lanes are always written in UTC
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return Lane(
+            id=UUID(model.id),
+            lane_key=model.lane_key,
+            total_distance_km=float(model.total_distance_km),
+            total_duration_hours=float(model.total_duration_hours),
+            route_polyline=decode_route_points(model.route_polyline),
+            country_segments=[
+                CountrySegment(
+                    id=uuid4(),  # Placeholder; routes cloned from the lane assign their own
+                    country_code=segment["country_code"],
+                    segment_type=SegmentType(segment["segment_type"]),
+                    distance_km=segment["distance_km"],
+                    duration_hours=segment["duration_hours"],
+                    start_location_id=UUID(segment["start_location_id"]),
+                    end_location_id=UUID(segment["end_location_id"]),
+                    segment_order=order,
+                    route_points=decode_route_points(segment["route_polyline"]),
+                    steps=decode_route_steps(segment["route_steps"])
+                )
+                for order, segment in enumerate(model.segments_json)
+            ],
+            created_at=created_at
+        )
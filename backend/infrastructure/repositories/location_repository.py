@@ -1,5 +1,5 @@
 """Repository implementation for location-related entities."""
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from uuid import UUID
 
 from sqlalchemy.orm import Session
@@ -31,6 +31,10 @@ class SQLLocationRepository(BaseRepository[LocationModel]):
         model = self.get(str(id))
         return self._to_domain(model) if model else None
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Location]:
+        """Find locations by ID in bulk."""
+        return {UUID(model.id): self._to_domain(model) for model in self.find_many(ids)}
+
     def _to_domain(self, model: LocationModel) -> Location:
         """Convert model to domain entity."""
         return Location(
@@ -1,23 +1,81 @@
 """Repository implementation for route-related entities."""
+import json
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 from uuid import UUID, uuid4
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 from ...infrastructure.logging import get_logger
 
+from ...domain.entities.geometry import RouteGeometry
 from ...domain.entities.route import (
-    Route, RouteStatus, TimelineEvent, CountrySegment, Location, EmptyDriving, EventStatus, SegmentType
+    Route, RouteStatus, TimelineEvent, CountrySegment, Location, EmptyDriving, EventStatus, SegmentType,
+    RouteStep, ROUTE_MODE_EXACT
 )
 from ..models.route_models import (
     RouteModel, TimelineEventModel, CountrySegmentModel, LocationModel, EmptyDrivingModel,
     RouteStatusHistoryModel
 )
+from ..geo.detour import CorridorSample
+from ..geo.distance import haversine_km
+from ..geo.simplify import build_lods
 from .base import BaseRepository
 
 logger = get_logger()
 
 
+def encode_route_points(route_points: Optional[Sequence[Sequence[float]]]) -> Optional[str]:
+    """Encode [lat, lng] points as a Google encoded polyline."""
+    if not route_points:
+        return None
+    return RouteGeometry.validate(route_points).to_polyline()
+
+
+def decode_route_points(encoded: Optional[str]) -> RouteGeometry:
+    """Decode a Google encoded polyline into route geometry."""
+    return RouteGeometry.from_polyline(encoded)
+
+
+def encode_route_lods(route_points: Optional[Sequence[Sequence[float]]]) -> Optional[str]:
+    """Simplify route points for every level of detail and encode them as JSON polylines."""
+    if not route_points:
+        return None
+    return json.dumps(
+        {lod: points.to_polyline() for lod, points in build_lods(route_points).items()},
+        separators=(",", ":")
+    )
+
+
+def decode_route_lods(encoded: Optional[str]) -> Dict[str, RouteGeometry]:
+    """Decode simplified route points per level of detail."""
+    if not encoded:
+        return {}
+    return {
+        lod: RouteGeometry.from_polyline(points)
+        for lod, points in json.loads(encoded).items()
+    }
+
+
+def encode_route_steps(steps: Optional[List[RouteStep]]) -> Optional[str]:
+    """Encode step records as compact JSON rows of [meters, road_ref, toll, country]."""
+    if not steps:
+        return None
+    return json.dumps(
+        [[round(step.distance_km * 1000), step.road_ref, int(step.is_toll), step.country_code] for step in steps],
+        separators=(",", ":")
+    )
+
+
+def decode_route_steps(encoded: Optional[str]) -> List[RouteStep]:
+    """Decode compact JSON step rows into RouteStep records."""
+    if not encoded:
+        return []
+    return [
+        RouteStep(distance_km=meters / 1000.0, road_ref=road_ref, is_toll=bool(toll), country_code=country_code)
+        for meters, road_ref, toll, country_code in json.loads(encoded)
+    ]
+
+
 class SQLEmptyDrivingRepository(BaseRepository[EmptyDrivingModel]):
     """SQLAlchemy implementation of EmptyDrivingRepository."""
 
@@ -33,7 +91,9 @@ class SQLEmptyDrivingRepository(BaseRepository[EmptyDrivingModel]):
         return EmptyDriving(
             id=UUID(model.id),
             distance_km=float(model.distance_km),
-            duration_hours=float(model.duration_hours)
+            duration_hours=float(model.duration_hours),
+            route_points=decode_route_points(model.route_polyline),
+            simplified_points=decode_route_lods(model.route_polyline_lods)
         )
 
 
@@ -73,7 +133,10 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
                     duration_hours=str(segment.duration_hours),
                     start_location_id=str(segment.start_location_id),
                     end_location_id=str(segment.end_location_id),
-                    segment_order=segment.segment_order
+                    segment_order=segment.segment_order,
+                    route_polyline=encode_route_points(segment.route_points),
+                    route_steps=encode_route_steps(segment.steps),
+                    route_polyline_lods=encode_route_lods(segment.route_points)
                 )
                 country_segments.append(segment_model)
 
@@ -94,6 +157,8 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
                 model.total_duration_hours = str(route.total_duration_hours)
                 model.is_feasible = route.is_feasible
                 model.status = route.status.value
+                model.mode = route.mode
+                model.waypoint_count = route.waypoint_count
                 model.certifications_validated = route.certifications_validated
                 model.operating_countries_validated = route.operating_countries_validated
                 model.validation_timestamp = route.validation_timestamp
@@ -123,6 +188,8 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
                     total_duration_hours=str(route.total_duration_hours),
                     is_feasible=route.is_feasible,
                     status=route.status.value,
+                    mode=route.mode,
+                    waypoint_count=route.waypoint_count,
                     certifications_validated=route.certifications_validated,
                     operating_countries_validated=route.operating_countries_validated,
                     validation_timestamp=route.validation_timestamp,
@@ -155,6 +222,28 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
             self._db.rollback()
             raise ValueError(f"Failed to find route: {str(e)}")
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Route]:
+        """Find routes by ID.
+
+        Timeline events, country segments and empty driving records are
+        loaded with one ``IN (...)`` query per relationship instead of
+        one query per route.
+        """
+        try:
+            models = self.find_many(ids, options=(
+                selectinload(RouteModel.timeline_events),
+                selectinload(RouteModel.country_segments),
+                selectinload(RouteModel.empty_driving)
+            ))
+            routes = {}
+            for model in models:
+                model.country_segments.sort(key=lambda x: x.segment_order)
+                routes[UUID(model.id)] = self._to_entity(model)
+            return routes
+        except Exception as e:
+            self._db.rollback()
+            raise ValueError(f"Failed to find routes: {str(e)}")
+
     def find_by_business_entity_id(self, business_entity_id: UUID) -> List[Route]:
         """Find routes by business entity ID."""
         try:
@@ -199,24 +288,30 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
         """Find empty driving by ID."""
         try:
             model = self._db.query(EmptyDrivingModel).filter(EmptyDrivingModel.id == str(id)).first()
-            if not model:
-                return None
-            return EmptyDriving(
-                id=UUID(model.id),
-                distance_km=float(model.distance_km),
-                duration_hours=float(model.duration_hours)
-            )
+            return self._empty_driving_to_entity(model) if model else None
         except Exception as e:
             self._db.rollback()
             raise ValueError(f"Failed to find empty driving: {str(e)}")
 
+    def _empty_driving_to_entity(self, model: EmptyDrivingModel) -> EmptyDriving:
+        """Convert empty driving model to domain entity."""
+        return EmptyDriving(
+            id=UUID(model.id),
+            distance_km=float(model.distance_km),
+            duration_hours=float(model.duration_hours),
+            route_points=decode_route_points(model.route_polyline),
+            simplified_points=decode_route_lods(model.route_polyline_lods)
+        )
+
     def save_empty_driving(self, empty_driving: EmptyDriving) -> EmptyDriving:
         """Save an empty driving instance."""
         try:
             model = EmptyDrivingModel(
                 id=str(empty_driving.id),
                 distance_km=str(empty_driving.distance_km),
-                duration_hours=str(empty_driving.duration_hours)
+                duration_hours=str(empty_driving.duration_hours),
+                route_polyline=encode_route_points(empty_driving.route_points),
+                route_polyline_lods=encode_route_lods(empty_driving.route_points)
             )
             self._db.add(model)
             self._db.commit()
@@ -225,6 +320,32 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
             self._db.rollback()
             raise ValueError(f"Failed to save empty driving: {str(e)}")
 
+    def update_empty_driving_route_points(self, id: UUID, route_points: Sequence[Sequence[float]]) -> None:
+        """Store route points for an empty driving segment."""
+        try:
+            model = self._db.query(EmptyDrivingModel).filter(EmptyDrivingModel.id == str(id)).first()
+            if not model:
+                raise ValueError(f"Empty driving {id} not found")
+            model.route_polyline = encode_route_points(route_points)
+            model.route_polyline_lods = encode_route_lods(route_points)
+            self._db.commit()
+        except Exception as e:
+            self._db.rollback()
+            raise ValueError(f"Failed to update empty driving route points: {str(e)}")
+
+    def update_segment_route_points(self, segment_id: UUID, route_points: Sequence[Sequence[float]]) -> None:
+        """Store route points for a country segment."""
+        try:
+            model = self._db.query(CountrySegmentModel).filter_by(id=str(segment_id)).first()
+            if not model:
+                raise ValueError(f"Segment {segment_id} not found")
+            model.route_polyline = encode_route_points(route_points)
+            model.route_polyline_lods = encode_route_lods(route_points)
+            self._db.commit()
+        except Exception as e:
+            self._db.rollback()
+            raise ValueError(f"Failed to update segment route points: {str(e)}")
+
     def _to_entity(self, model: RouteModel) -> Route:
         """Convert SQLAlchemy model to domain entity."""
         try:
@@ -255,7 +376,10 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
                     duration_hours=float(segment_model.duration_hours),
                     start_location_id=UUID(segment_model.start_location_id),
                     end_location_id=UUID(segment_model.end_location_id),
-                    segment_order=segment_model.segment_order
+                    segment_order=segment_model.segment_order,
+                    route_points=decode_route_points(segment_model.route_polyline),
+                    simplified_points=decode_route_lods(segment_model.route_polyline_lods),
+                    steps=decode_route_steps(segment_model.route_steps)
                 )
                 country_segments.append(segment)
 
@@ -271,11 +395,13 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
                 pickup_time=model.pickup_time,
                 delivery_time=model.delivery_time,
                 empty_driving_id=UUID(model.empty_driving_id) if model.empty_driving_id else None,
-                empty_driving=self.find_empty_driving_by_id(UUID(model.empty_driving_id)) if model.empty_driving_id else None,
+                empty_driving=self._empty_driving_to_entity(model.empty_driving) if model.empty_driving else None,
                 total_distance_km=float(model.total_distance_km),
                 total_duration_hours=float(model.total_duration_hours),
                 is_feasible=model.is_feasible,
                 status=RouteStatus(model.status),
+                mode=model.mode,
+                waypoint_count=model.waypoint_count,
                 timeline_events=timeline_events,
                 country_segments=country_segments,
                 certifications_validated=model.certifications_validated,
@@ -301,6 +427,52 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
             self._db.rollback()
             raise ValueError(f"Failed to get route status history: {str(e)}")
 
+    def find_corridor_samples(self, limit: int = 5000) -> List[CorridorSample]:
+        """Get road and great-circle distances of stored routes for detour calibration.
+
+        Only exact routes without waypoints are sampled: estimates would feed
+        the estimator's own factors back into calibration, and multi-stop
+        road distances are not comparable to the origin/destination great
+        circle.
+
+        Args:
+            limit: Maximum number of routes to read, most recent first
+
+        Returns:
+            One sample per route with at least one main route segment
+        """
+        models = (
+            self._db.query(RouteModel)
+            .options(
+                joinedload(RouteModel.origin),
+                joinedload(RouteModel.destination),
+                selectinload(RouteModel.country_segments)
+            )
+            .filter(RouteModel.mode == ROUTE_MODE_EXACT, RouteModel.waypoint_count == 0)
+            .order_by(RouteModel.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+        samples = []
+        for model in models:
+            segments = sorted(
+                (segment for segment in model.country_segments
+                 if segment.segment_type != SegmentType.EMPTY_DRIVING.value),
+                key=lambda segment: segment.segment_order
+            )
+            if not segments or model.origin is None or model.destination is None:
+                continue
+            samples.append(CorridorSample(
+                origin_country=segments[0].country_code,
+                destination_country=segments[-1].country_code,
+                straight_km=haversine_km(
+                    float(model.origin.latitude), float(model.origin.longitude),
+                    float(model.destination.latitude), float(model.destination.longitude)
+                ),
+                road_km=sum(float(segment.distance_km) for segment in segments)
+            ))
+        return samples
+
     def find_segment_by_id(self, segment_id: UUID) -> Optional[CountrySegment]:
         """Find a country segment by ID."""
         try:
@@ -316,7 +488,10 @@ class SQLRouteRepository(BaseRepository[RouteModel]):
                 duration_hours=segment.duration_hours,
                 start_location_id=UUID(segment.start_location_id),
                 end_location_id=UUID(segment.end_location_id),
-                segment_order=segment.segment_order
+                segment_order=segment.segment_order,
+                route_points=decode_route_points(segment.route_polyline),
+                simplified_points=decode_route_lods(segment.route_polyline_lods),
+                steps=decode_route_steps(segment.route_steps)
             )
         except Exception as e:
             logger.error(f"Failed to find segment by ID {segment_id}: {str(e)}")
@@ -1,39 +1,139 @@
 """Repository for toll rate overrides."""
-from typing import Optional
+import hashlib
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID
 
+from sqlalchemy import event
+
 from ...domain.entities.transport import TollRateOverride
+from ..cache.lru import LRUCache
 from ..models.transport_models import TollRateOverrideModel
 
+DEFAULT_OVERRIDE_CACHE_SIZE = 1024
+DEFAULT_OVERRIDE_CACHE_TTL = 300.0
+
+# Session.info key of the business IDs with uncommitted override writes
+PENDING_WRITES_KEY = "toll_override_pending_businesses"
+
+
+class TollOverrideIndex:
+    """In-memory index of one business entity's toll rate overrides.
+
+    Overrides are keyed by (country, vehicle_class, route_type). A lookup
+    prefers an exact route type match, then an override without a route
+    type; without a requested route type, any override for the country and
+    vehicle class matches. The version digest changes whenever any of the
+    overrides does, so it can key cached toll results.
+    """
+
+    def __init__(self, overrides: Iterable[TollRateOverride]):
+        self._by_key: Dict[Tuple[str, str, Optional[str]], TollRateOverride] = {}
+        self._by_class: Dict[Tuple[str, str], TollRateOverride] = {}
+        digest = hashlib.sha1()
+        for override in overrides:
+            key = (override.country_code, override.vehicle_class, override.route_type)
+            self._by_key.setdefault(key, override)
+            self._by_class.setdefault(key[:2], override)
+            digest.update(
+                f"{override.id}|{key}|{override.rate_multiplier}|{override.updated_at}\n".encode("utf-8")
+            )
+        self.version = digest.hexdigest()[:16]
+
+    def resolve(
+        self,
+        country_code: str,
+        vehicle_class: str,
+        route_type: Optional[str] = None
+    ) -> Optional[TollRateOverride]:
+        """Get the override that applies to a country and vehicle class."""
+        override = self._by_key.get((country_code, vehicle_class, route_type))
+        if override is None and route_type is not None:
+            override = self._by_key.get((country_code, vehicle_class, None))
+        if override is None and route_type is None:
+            override = self._by_class.get((country_code, vehicle_class))
+        return override
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
 
 class TollRateOverrideRepository:
     """Repository for toll rate overrides."""
 
-    def __init__(self, session):
+    def __init__(
+        self,
+        session,
+        cache: Optional[LRUCache] = None,
+        cache_ttl_seconds: float = DEFAULT_OVERRIDE_CACHE_TTL
+    ):
+        """Initialize repository.
+
+        Args:
+            session: Database session
+            cache: Optional per-business cache of override indexes, shared
+                across repositories; invalidated when a save is committed
+            cache_ttl_seconds: Maximum age of a cached index, bounding
+                staleness from writes made by other processes
+        """
         self._session = session
+        self._cache = cache
+        self._cache_ttl = cache_ttl_seconds
 
     def find_by_id(self, id: UUID) -> Optional[TollRateOverride]:
         """Find toll rate override by ID."""
         model = self._session.query(TollRateOverrideModel).filter_by(id=str(id)).first()
         return self._to_entity(model) if model else None
 
+    def find_all_for_business(self, business_entity_id: UUID) -> TollOverrideIndex:
+        """Get the override index for a business entity.
+
+        All overrides of the business are loaded with one query and the
+        index is cached per business when a cache is configured. While the
+        session holds uncommitted writes for the business, the cache is
+        bypassed so other sessions never see the pending overrides.
+        """
+        key = str(business_entity_id)
+        use_cache = self._cache is not None and key not in self._pending_writes()
+        if use_cache:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+                return cached[1]
+
+        models = (
+            self._session.query(TollRateOverrideModel)
+            .filter_by(business_entity_id=key)
+            .all()
+        )
+        index = TollOverrideIndex(self._to_entity(model) for model in models)
+        if use_cache:
+            self._cache.set(key, (time.monotonic(), index))
+        return index
+
     def find_for_business(
         self,
         business_entity_id: UUID,
         country_code: str,
-        vehicle_class: str
+        vehicle_class: str,
+        route_type: Optional[str] = None
     ) -> Optional[TollRateOverride]:
         """Find toll rate override for a business entity, country and vehicle class."""
-        model = (
-            self._session.query(TollRateOverrideModel)
-            .filter_by(
-                business_entity_id=str(business_entity_id),
-                country_code=country_code,
-                vehicle_class=vehicle_class
-            )
-            .first()
+        return self.find_all_for_business(business_entity_id).resolve(
+            country_code, vehicle_class, route_type
         )
-        return self._to_entity(model) if model else None
+
+    def find_for_business_multiple(
+        self,
+        business_entity_id: UUID,
+        countries: List[str],
+        vehicle_class: str,
+        route_type: Optional[str] = None
+    ) -> List[TollRateOverride]:
+        """Find the toll rate overrides of a business entity for several countries."""
+        index = self.find_all_for_business(business_entity_id)
+        overrides = (index.resolve(country, vehicle_class, route_type) for country in countries)
+        return [override for override in overrides if override is not None]
 
     def save(self, override: TollRateOverride) -> TollRateOverride:
         """Save a toll rate override."""
@@ -47,8 +147,40 @@ class TollRateOverrideRepository:
         )
         self._session.add(model)
         self._session.flush()
+        self._track_pending_write(override.business_entity_id)
         return self._to_entity(model)
 
+    def invalidate(self, business_entity_id: UUID) -> None:
+        """Drop the cached override index of a business entity."""
+        if self._cache is not None:
+            self._cache.pop(str(business_entity_id))
+
+    def _pending_writes(self) -> Set[str]:
+        """Get the business IDs with uncommitted override writes in this session."""
+        return self._session.info.get(PENDING_WRITES_KEY, set())
+
+    def _track_pending_write(self, business_entity_id: UUID) -> None:
+        """Invalidate a business's cached index once the session commits.
+
+        Invalidating on flush would let a concurrent request repopulate the
+        cache from committed data before this write lands, and a rolled back
+        write must not evict anything.
+        """
+        if self._cache is None:
+            return
+        pending = self._session.info.get(PENDING_WRITES_KEY)
+        if pending is None:
+            pending = self._session.info[PENDING_WRITES_KEY] = set()
+            cache = self._cache
+
+            def after_commit(session) -> None:
+                while pending:
+                    cache.pop(pending.pop())
+
+            event.listen(self._session, "after_commit", after_commit)
+            event.listen(self._session, "after_rollback", lambda session: pending.clear())
+        pending.add(str(business_entity_id))
+
     def _to_entity(self, model: TollRateOverrideModel) -> TollRateOverride:
         """Convert model to domain entity."""
         return TollRateOverride(
@@ -60,4 +192,14 @@ class TollRateOverrideRepository:
             business_entity_id=UUID(model.business_entity_id),
             created_at=model.created_at,
             updated_at=model.updated_at
-        ) 
\ No newline at end of file
+        )
+
+
+@lru_cache(maxsize=None)
+def get_toll_override_cache(max_businesses: int = DEFAULT_OVERRIDE_CACHE_SIZE) -> LRUCache:
+    """Get the process-wide cache of per-business override indexes.
+
+    Repositories are created per request; caching here lets them share
+    loaded indexes.
+    """
+    return LRUCache(max_size=max_businesses)
@@ -1,9 +1,9 @@
 """Repository implementation for transport-related entities."""
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from ...domain.entities.transport import (
     Transport, TransportType,
@@ -67,6 +67,14 @@ class SQLTransportRepository(BaseRepository[TransportModel]):
         model = self.get(str(id))
         return self._to_domain(model) if model else None
 
+    def find_by_ids(self, ids: Iterable[UUID]) -> Dict[UUID, Transport]:
+        """Find transports by ID, loading their specifications in bulk."""
+        models = self.find_many(ids, options=(
+            selectinload(TransportModel.truck_specifications),
+            selectinload(TransportModel.driver_specifications)
+        ))
+        return {UUID(model.id): self._to_domain(model) for model in models}
+
     def find_by_business_entity_id(self, business_entity_id: UUID) -> List[Transport]:
         """Find transports by business entity ID."""
         import structlog
@@ -0,0 +1,31 @@
+"""add encoded route polylines to segments
+
+Revision ID: 20250108_1000
+Revises: bcb9286cf0e4
+Create Date: 2025-01-08 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250108_1000'
+down_revision = 'bcb9286cf0e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Store segment geometry as Google encoded polylines
+    op.add_column('country_segments',
+        sa.Column('route_polyline', sa.Text(), nullable=True)
+    )
+    op.add_column('empty_drivings',
+        sa.Column('route_polyline', sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('empty_drivings', 'route_polyline')
+    op.drop_column('country_segments', 'route_polyline')
@@ -0,0 +1,27 @@
+"""add compact route step records to segments
+
+Revision ID: 20250109_1000
+Revises: 20250108_1000
+Create Date: 2025-01-09 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250109_1000'
+down_revision = '20250108_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Per-step distance, road ref, toll flag and country as compact JSON
+    op.add_column('country_segments',
+        sa.Column('route_steps', sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('country_segments', 'route_steps')
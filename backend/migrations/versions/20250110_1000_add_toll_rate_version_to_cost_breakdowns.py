@@ -0,0 +1,27 @@
+"""add toll rate version to cost breakdowns
+
+Revision ID: 20250110_1000
+Revises: 20250109_1000
+Create Date: 2025-01-10 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250110_1000'
+down_revision = '20250109_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Version stamp of the toll rate table used for the breakdown
+    op.add_column('cost_breakdowns',
+        sa.Column('toll_rate_version', sa.String(50), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('cost_breakdowns', 'toll_rate_version')
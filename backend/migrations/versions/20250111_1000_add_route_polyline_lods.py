@@ -0,0 +1,31 @@
+"""add simplified route polylines per level of detail
+
+Revision ID: 20250111_1000
+Revises: 20250110_1000
+Create Date: 2025-01-11 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250111_1000'
+down_revision = '20250110_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Douglas-Peucker simplified polylines as JSON {level: encoded polyline}
+    op.add_column('country_segments',
+        sa.Column('route_polyline_lods', sa.Text(), nullable=True)
+    )
+    op.add_column('empty_drivings',
+        sa.Column('route_polyline_lods', sa.Text(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('empty_drivings', 'route_polyline_lods')
+    op.drop_column('country_segments', 'route_polyline_lods')
@@ -0,0 +1,35 @@
+"""add lane store for reusable origin/destination routes
+
+Revision ID: 20250112_1000
+Revises: 20250111_1000
+Create Date: 2025-01-12 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250112_1000'
+down_revision = '20250111_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Computed routes keyed by snapped origin/destination
+    op.create_table('lanes',
+        sa.Column('id', sa.String(36), primary_key=True),
+        sa.Column('lane_key', sa.String(100), nullable=False),
+        sa.Column('total_distance_km', sa.String(50), nullable=False),
+        sa.Column('total_duration_hours', sa.String(50), nullable=False),
+        sa.Column('route_polyline', sa.Text(), nullable=True),
+        sa.Column('segments_json', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False)
+    )
+    op.create_index('ix_lanes_lane_key', 'lanes', ['lane_key'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_lanes_lane_key', table_name='lanes')
+    op.drop_table('lanes')
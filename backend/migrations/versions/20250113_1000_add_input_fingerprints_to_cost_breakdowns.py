@@ -0,0 +1,27 @@
+"""add input fingerprints to cost breakdowns
+
+Revision ID: 20250113_1000
+Revises: 20250112_1000
+Create Date: 2025-01-13 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250113_1000'
+down_revision = '20250112_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Input hash per cost component, used to recalculate only changed components
+    op.add_column('cost_breakdowns',
+        sa.Column('input_fingerprints', sa.JSON(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('cost_breakdowns', 'input_fingerprints')
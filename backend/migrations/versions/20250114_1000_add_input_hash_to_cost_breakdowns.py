@@ -0,0 +1,29 @@
+"""add input hash to cost breakdowns
+
+Revision ID: 20250114_1000
+Revises: 20250113_1000
+Create Date: 2025-01-14 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250114_1000'
+down_revision = '20250113_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Content hash of all calculation inputs, used to reuse identical breakdowns
+    op.add_column('cost_breakdowns',
+        sa.Column('input_hash', sa.String(32), nullable=True)
+    )
+    op.create_index('ix_cost_breakdowns_input_hash', 'cost_breakdowns', ['input_hash'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cost_breakdowns_input_hash', table_name='cost_breakdowns')
+    op.drop_column('cost_breakdowns', 'input_hash')
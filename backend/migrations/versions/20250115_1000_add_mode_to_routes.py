@@ -0,0 +1,38 @@
+"""add calculation mode, waypoint count and creation time to routes
+
+Revision ID: 20250115_1000
+Revises: 20250114_1000
+Create Date: 2025-01-15 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250115_1000'
+down_revision = '20250114_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Detour calibration samples only exact routes without waypoints, newest first
+    op.add_column('routes',
+        sa.Column('mode', sa.String(20), nullable=False, server_default='exact')
+    )
+    op.add_column('routes',
+        sa.Column('waypoint_count', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column('routes',
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.func.current_timestamp())
+    )
+    op.create_index('ix_routes_created_at', 'routes', ['created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_routes_created_at', table_name='routes')
+    op.drop_column('routes', 'created_at')
+    op.drop_column('routes', 'waypoint_count')
+    op.drop_column('routes', 'mode')
@@ -0,0 +1,30 @@
+"""add creation time to cost breakdowns
+
+Revision ID: 20250116_1000
+Revises: 20250115_1000
+Create Date: 2025-01-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '20250116_1000'
+down_revision = '20250115_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Routes are recalculated into new rows; the latest one is the current breakdown
+    op.add_column('cost_breakdowns',
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False,
+                  server_default=sa.func.current_timestamp())
+    )
+    op.create_index('ix_cost_breakdowns_created_at', 'cost_breakdowns', ['created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_cost_breakdowns_created_at', table_name='cost_breakdowns')
+    op.drop_column('cost_breakdowns', 'created_at')
@@ -0,0 +1,126 @@
+"""Benchmark the route pipeline against recorded Google Maps responses.
+
+The committed cassettes under tests/fixtures/cassettes/benchmark hold
+synthetic straight-line routes, so replaying them exercises the pipeline
+and its call counts but not real Google Maps timings. Record cassettes
+once with a real key, then replay them offline:
+
+    GOOGLE_MAPS_API_KEY=... python backend/scripts/benchmark_routes.py --mode record
+    python backend/scripts/benchmark_routes.py --mode replay --latency-ms 80 --iterations 5
+"""
+import argparse
+import os
+import sys
+import time
+from uuid import uuid4
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.domain.entities.location import Location
+from backend.infrastructure.database import Base
+from backend.infrastructure.models import route_models  # noqa: F401 - registers tables
+from backend.infrastructure.repositories.location_repository import SQLLocationRepository
+from backend.infrastructure.external_services.cassette import (
+    MODE_RECORD, MODE_REPLAY, REPLAY_API_KEY, CassetteSession
+)
+from backend.infrastructure.external_services.google_maps_service import GoogleMapsService
+from backend.infrastructure.external_services.maps_client import MapsClientFactory
+from backend.infrastructure.external_services.toll_rate_service import TollRateService
+from backend.infrastructure.adapters.google_maps_adapter import GoogleMapsAdapter
+from backend.infrastructure.geo.country_index import get_country_index
+from backend.infrastructure.cache.tile_cache import GeocodeTileCache
+
+# (truck location, cargo origin, cargo destination) as (lat, lng) tuples
+SCENARIOS = [
+    ((52.3676, 4.9041), (52.5200, 13.4050), (52.2297, 21.0122)),   # Amsterdam -> Berlin -> Warsaw
+    ((50.9375, 6.9603), (48.1351, 11.5820), (48.2082, 16.3738)),   # Cologne -> Munich -> Vienna
+    ((51.2194, 4.4025), (48.8566, 2.3522), (45.7640, 4.8357)),     # Antwerp -> Paris -> Lyon
+    ((50.0755, 14.4378), (49.1951, 16.6068), (47.4979, 19.0402)),  # Prague -> Brno -> Budapest
+]
+
+DEFAULT_CASSETTE_DIR = os.path.join("tests", "fixtures", "cassettes", "benchmark")
+
+
+def _location(repo: SQLLocationRepository, point) -> Location:
+    return repo.save(Location(id=uuid4(), latitude=point[0], longitude=point[1]))
+
+
+def run(mode: str, cassette_dir: str, latency_ms: float, iterations: int, use_caches: bool) -> None:
+    """Run every scenario and print throughput and external call counts."""
+    api_key = os.getenv("GOOGLE_MAPS_API_KEY", "")
+    if not api_key:
+        if mode == MODE_RECORD:
+            raise SystemExit("GOOGLE_MAPS_API_KEY is required to record cassettes")
+        api_key = REPLAY_API_KEY
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    location_repo = SQLLocationRepository(db)
+
+    session = CassetteSession(cassette_dir, mode=mode, latency_ms=latency_ms)
+    factory = MapsClientFactory(api_key=api_key, requests_session=session)
+    maps_service = GoogleMapsService(
+        api_key=api_key,
+        location_repo=location_repo,
+        retry_delay=0.0,
+        country_index=get_country_index() if use_caches else None,
+        tile_cache=GeocodeTileCache() if use_caches else None,
+        client=factory.client()
+    )
+    toll_service = TollRateService(client=factory.client())
+    adapter = GoogleMapsAdapter(maps_service)
+
+    durations = []
+    for iteration in range(iterations):
+        for truck, origin, destination in SCENARIOS:
+            session.reset_calls()
+            started = time.perf_counter()
+            truck_loc = _location(location_repo, truck)
+            origin_loc = _location(location_repo, origin)
+            destination_loc = _location(location_repo, destination)
+
+            adapter.calculate_empty_driving(truck_loc, origin_loc)
+            _, _, segments, _ = adapter.calculate_route(origin_loc, destination_loc)
+            for segment in segments:
+                start = location_repo.find_by_id(segment.start_location_id)
+                end = location_repo.find_by_id(segment.end_location_id)
+                toll_service.get_toll_rate(
+                    segment.country_code, segment.distance_km, "4", "EURO6", "1",
+                    origin=(start.latitude, start.longitude),
+                    destination=(end.latitude, end.longitude)
+                )
+
+            elapsed = time.perf_counter() - started
+            durations.append(elapsed)
+            if iteration == 0:
+                print(f"{origin} -> {destination}: {elapsed * 1000:.1f} ms, "
+                      f"{session.total_calls} calls {session.calls}")
+
+    total = sum(durations)
+    print(f"\n{len(durations)} routes in {total:.2f} s "
+          f"({len(durations) / total:.2f} routes/s, mean {total / len(durations) * 1000:.1f} ms)")
+    print(f"Client metrics: {factory.metrics()}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=[MODE_RECORD, MODE_REPLAY], default=MODE_REPLAY)
+    parser.add_argument("--cassette-dir", default=DEFAULT_CASSETTE_DIR)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Delay injected into each replayed response")
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--no-caches", action="store_true",
+                        help="Disable the boundary index and tile cache")
+    args = parser.parse_args()
+    run(args.mode, args.cassette_dir, args.latency_ms, args.iterations, not args.no_caches)
+
+
+if __name__ == "__main__":
+    main()
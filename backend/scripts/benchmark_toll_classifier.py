@@ -0,0 +1,116 @@
+"""Micro-benchmark the toll step classifier on long-haul Directions legs.
+
+Legs are read from recorded Directions cassettes when available (see
+benchmark_routes.py); otherwise a deterministic 600-step long-haul leg is
+synthesized. The one-pass classifier is compared against the previous
+per-step implementation and both must agree.
+
+    python backend/scripts/benchmark_toll_classifier.py --cassette-dir tests/fixtures/cassettes/benchmark
+"""
+import argparse
+import glob
+import json
+import os
+import random
+import re
+import sys
+import timeit
+
+# Add the project root directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+from backend.infrastructure.data.toll_rates import TOLL_KEYWORDS
+from backend.infrastructure.geo.toll_classifier import classify_steps
+
+MIN_STEPS = 500
+
+_INSTRUCTIONS = [
+    "Head <b>north</b> on <b>Industriestraße</b>",
+    "Turn <b>right</b> onto <b>B{n}</b>",
+    "Merge onto <b>A{n}</b>",
+    "Keep <b>left</b> to stay on <b>A{n}</b>/<wbr/><b>E{m}</b>",
+    "Take exit <b>{n}</b> toward <b>Autobahn {n}</b>",
+    "Continue onto <b>D{n}</b><div style=\"font-size:0.9em\">Toll road</div>",
+    "At the roundabout, take the <b>2nd</b> exit onto <b>S{n}</b>",
+    "Slight right onto the péage ramp",
+    "Continue&nbsp;straight onto <b>Rue de la Gare</b>",
+]
+
+
+def _legacy_classify(steps, has_tolls):
+    """Per-step classification as implemented before the compiled classifier."""
+    results = []
+    for step in steps:
+        text = re.sub(r'<[^>]+>', '', step.get('html_instructions', ''))
+        text = text.replace('&nbsp;', ' ').replace('/<wbr/>', ' ')
+        text = ' '.join(text.split()).lower()
+        road = None
+        for pattern in (r'\b[aA][0-9]{1,3}\b', r'\b[eE][0-9]{1,3}\b',
+                        r'\b[dD][0-9]{1,3}\b', r'\b[sS][0-9]{1,3}\b'):
+            match = re.search(pattern, text)
+            if match:
+                road = match.group(0).upper()
+                break
+        if road is None:
+            autobahn = re.search(r'autobahn[- ]?([0-9]{1,3})', text.lower())
+            if autobahn:
+                road = f"A{autobahn.group(1)}"
+        is_toll = any(keyword in text for keyword in TOLL_KEYWORDS) or bool(road and has_tolls)
+        results.append((road, is_toll))
+    return results
+
+
+def _synthetic_leg(step_count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        {
+            "html_instructions": rng.choice(_INSTRUCTIONS).format(n=rng.randint(1, 999), m=rng.randint(1, 99)),
+            "distance": {"value": rng.randint(50, 40000)},
+        }
+        for _ in range(step_count)
+    ]
+
+
+def _recorded_legs(cassette_dir: str, min_steps: int) -> list:
+    legs = []
+    for path in glob.glob(os.path.join(cassette_dir, "*.json")):
+        with open(path, "r", encoding="utf-8") as cassette:
+            entry = json.load(cassette)
+        if not entry.get("path", "").endswith("/directions/json"):
+            continue
+        for route in json.loads(entry["body"]).get("routes", []):
+            for leg in route.get("legs", []):
+                if len(leg.get("steps", [])) >= min_steps:
+                    legs.append(leg["steps"])
+    return legs
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cassette-dir", default=os.path.join("tests", "fixtures", "cassettes", "benchmark"))
+    parser.add_argument("--min-steps", type=int, default=MIN_STEPS)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    legs = _recorded_legs(args.cassette_dir, args.min_steps)
+    source = "recorded"
+    if not legs:
+        legs = [_synthetic_leg(600)]
+        source = "synthetic"
+
+    for steps in legs:
+        expected = _legacy_classify(steps, True)
+        actual = [tuple(step) for step in classify_steps(steps, True).steps]
+        if actual != expected:
+            raise SystemExit("Classifier disagrees with the legacy implementation")
+
+        legacy = min(timeit.repeat(lambda: _legacy_classify(steps, True), number=args.repeat, repeat=3))
+        compiled = min(timeit.repeat(lambda: classify_steps(steps, True), number=args.repeat, repeat=3))
+        per_leg = lambda total: total / args.repeat * 1000
+        print(f"{source} leg, {len(steps)} steps: legacy {per_leg(legacy):.3f} ms, "
+              f"compiled {per_leg(compiled):.3f} ms ({legacy / compiled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,9 +29,9 @@ def update_route_timeline(route_id: str, events: List[Dict]) -> Optional[Dict]:
         data={"timeline_events": events}
     )
 
-def get_route_segments(route_id: str) -> Optional[Dict]:
-    """Get route segments information."""
-    return api_request(f"/api/route/{route_id}/segments")
+def get_route_segments(route_id: str, lod: str = "detail") -> Optional[Dict]:
+    """Get route segments information with route points at a level of detail."""
+    return api_request(f"/api/route/{route_id}/segments?lod={lod}")
 
 def get_route_status_history(route_id: str) -> Optional[Dict]:
     """Get route status history."""
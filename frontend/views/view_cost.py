@@ -65,7 +65,7 @@ def display_cost_settings(route_id: str) -> dict:
             
             # Get route segments from the API
             from utils.route_utils import get_route_segments
-            segments_data = get_route_segments(route_id)
+            segments_data = get_route_segments(route_id, lod="overview")
             print(f"[DEBUG] Segments data from API: {segments_data}")
             
             if segments_data and 'segments' in segments_data:
@@ -163,7 +163,7 @@ def display_cost_settings(route_id: str) -> dict:
                 
                 # Get route segments from the API
                 from utils.route_utils import get_route_segments
-                segments_data = get_route_segments(route_id)
+                segments_data = get_route_segments(route_id, lod="overview")
                 print(f"[DEBUG] Segments data from API: {segments_data}")
                 
                 if segments_data and 'segments' in segments_data:
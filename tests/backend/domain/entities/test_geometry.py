@@ -0,0 +1,92 @@
+"""Tests for the array-backed route geometry."""
+import sys
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from backend.domain.entities.geometry import RouteGeometry
+from backend.domain.entities.route import CountrySegment
+
+POINTS = [[52.52, 13.405], [52.4, 14.0], [52.35, 14.55], [52.23, 21.01]]
+
+
+def _segment(route_points):
+    return CountrySegment(
+        id=uuid4(),
+        country_code="DE",
+        distance_km=100.0,
+        duration_hours=1.5,
+        start_location_id=uuid4(),
+        end_location_id=uuid4(),
+        segment_order=0,
+        route_points=route_points
+    )
+
+
+def test_behaves_like_list_of_points():
+    """Test indexing, iteration and equality against plain lists."""
+    geometry = RouteGeometry(POINTS)
+
+    assert len(geometry) == 4
+    assert geometry[0] == [52.52, 13.405]
+    assert geometry[-1] == [52.23, 21.01]
+    assert list(geometry) == POINTS
+    assert geometry == POINTS
+    assert geometry != POINTS[:3]
+    assert RouteGeometry() == [] and not RouteGeometry()
+    with pytest.raises(IndexError):
+        geometry[4]
+
+
+def test_slices_share_the_buffer():
+    """Test that contiguous slices are views rather than copies."""
+    geometry = RouteGeometry(POINTS)
+
+    middle = geometry[1:3]
+
+    assert middle == POINTS[1:3]
+    assert middle.buffer.obj is geometry.buffer.obj
+    assert middle[1:] == POINTS[2:3]
+    assert geometry[::2] == POINTS[::2]
+    assert geometry[3:1] == []
+
+
+def test_polyline_round_trip():
+    """Test Google encoded polyline serialization."""
+    geometry = RouteGeometry(POINTS)
+
+    decoded = RouteGeometry.from_polyline(geometry.to_polyline())
+
+    assert decoded == geometry
+    assert RouteGeometry().to_polyline() is None
+    assert RouteGeometry.from_polyline(None) == []
+
+
+def test_pydantic_field_keeps_geometry_without_copying():
+    """Test validation and serialization as an entity field."""
+    geometry = RouteGeometry(POINTS)
+
+    segment = _segment(geometry)
+
+    assert segment.route_points is geometry
+    assert segment.model_dump()["route_points"] is geometry
+    assert segment.model_copy().route_points is geometry
+    assert '"route_points":[[52.52,13.405],' in segment.model_dump_json()
+    assert _segment(POINTS).route_points == POINTS
+    assert _segment(geometry.to_polyline()).route_points == geometry
+    with pytest.raises(ValidationError):
+        _segment([[52.52]])
+
+
+def test_compact_storage():
+    """Test that geometry stores 16 bytes per point."""
+    points = [[50.0 + i * 1e-4, 10.0 + i * 1e-4] for i in range(10000)]
+    list_bytes = sys.getsizeof(points) + sum(
+        sys.getsizeof(point) + 2 * sys.getsizeof(point[0]) for point in points
+    )
+
+    geometry = RouteGeometry(points)
+
+    assert geometry.nbytes == 16 * len(points)
+    assert list_bytes / geometry.nbytes > 7
@@ -0,0 +1,128 @@
+"""Shared fixtures for domain service tests."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from backend.domain.entities.business import BusinessEntity
+from backend.domain.entities.route import CountrySegment, EmptyDriving, Route, TimelineEvent
+from backend.domain.entities.transport import DriverSpecification, Transport, TruckSpecification
+from backend.domain.services.cost_service import CostService
+
+
+@pytest.fixture
+def business():
+    """Create a business operating in Germany."""
+    return BusinessEntity(
+        id=uuid4(),
+        name="Test Logistics",
+        address="Berlin",
+        contact_info={},
+        business_type="carrier",
+        certifications=["ADR"],
+        operating_countries=["DE"],
+        cost_overheads={"admin": Decimal("40.00")}
+    )
+
+
+@pytest.fixture
+def make_transport():
+    """Get a factory for flatbed transports."""
+    def make(business_entity_id=None, fuel_consumption_empty=0.22, toll_class="4", is_active=True):
+        return Transport(
+            id=uuid4(),
+            transport_type_id="flatbed",
+            business_entity_id=business_entity_id or uuid4(),
+            truck_specs=TruckSpecification(
+                fuel_consumption_empty=fuel_consumption_empty,
+                fuel_consumption_loaded=0.29,
+                toll_class=toll_class,
+                euro_class="EURO6",
+                co2_class="A",
+                maintenance_rate_per_km=Decimal("0.15")
+            ),
+            driver_specs=DriverSpecification(
+                daily_rate=Decimal("138"),
+                driving_time_rate=Decimal("25"),
+                required_license_type="CE",
+                required_certifications=["ADR"]
+            ),
+            is_active=is_active
+        )
+    return make
+
+
+@pytest.fixture
+def transport(business, make_transport):
+    """Create a transport in toll class 4."""
+    return make_transport(business.id)
+
+
+@pytest.fixture
+def make_route():
+    """Get a factory for routes with a 50 km empty driving leg."""
+    def make(transport, segments=(("DE", 500.0),), total_duration_hours=8.0,
+             event_types=("pickup", "delivery"), days=1):
+        route_id = uuid4()
+        empty_driving = EmptyDriving(id=uuid4(), distance_km=50.0, duration_hours=1.0)
+        pickup_time = datetime.now(timezone.utc)
+        return Route(
+            id=route_id,
+            transport_id=transport.id,
+            business_entity_id=transport.business_entity_id,
+            cargo_id=uuid4(),
+            origin_id=uuid4(),
+            destination_id=uuid4(),
+            truck_location_id=uuid4(),
+            pickup_time=pickup_time,
+            delivery_time=pickup_time + timedelta(days=days),
+            empty_driving_id=empty_driving.id,
+            empty_driving=empty_driving,
+            total_distance_km=sum(distance_km for _, distance_km in segments) + empty_driving.distance_km,
+            total_duration_hours=total_duration_hours,
+            country_segments=[
+                CountrySegment(
+                    id=uuid4(),
+                    route_id=route_id,
+                    country_code=country_code,
+                    distance_km=distance_km,
+                    duration_hours=distance_km / 70,
+                    start_location_id=uuid4(),
+                    end_location_id=uuid4(),
+                    segment_order=order
+                )
+                for order, (country_code, distance_km) in enumerate(segments)
+            ],
+            timeline_events=[
+                TimelineEvent(id=uuid4(), route_id=route_id, type=event_type, location_id=uuid4(),
+                              planned_time=pickup_time, event_order=order)
+                for order, event_type in enumerate(event_types, start=1)
+            ]
+        )
+    return make
+
+
+@pytest.fixture
+def route(transport, make_route):
+    """Create a route through Germany with a pickup and a delivery."""
+    return make_route(transport)
+
+
+@pytest.fixture
+def mock_cost_service():
+    """Create a cost service over mocked repositories and toll calculator."""
+    toll_calculator = Mock()
+    toll_calculator.get_rate_version.return_value = "v1"
+    toll_calculator.get_override_version.return_value = None
+    return CostService(
+        settings_repo=Mock(),
+        breakdown_repo=Mock(),
+        empty_driving_repo=Mock(),
+        toll_calculator=toll_calculator,
+        rate_validation_repo=Mock(),
+        route_repo=Mock(),
+        transport_repo=Mock(),
+        business_repo=Mock()
+    )
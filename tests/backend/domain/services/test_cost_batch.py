@@ -0,0 +1,68 @@
+"""Tests for batch cost calculation."""
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from backend.domain.entities.cargo import CostSettings
+from backend.domain.entities.rate_types import RateType, RateValidationSchema
+
+
+def _settings(route):
+    return CostSettings(
+        id=uuid4(),
+        route_id=route.id,
+        business_entity_id=route.business_entity_id,
+        enabled_components=["fuel", "driver"],
+        rates={"fuel_rate": Decimal("1.50"), "driver_base_rate": Decimal("200.00")}
+    )
+
+
+@pytest.fixture
+def wire_batch(mock_cost_service):
+    """Get a function wiring the bulk loaders of the mocked cost service."""
+    def wire(routes, settings, transports, businesses):
+        service = mock_cost_service
+        service._rate_validation_repo.get_all_schemas.return_value = {
+            rate_type: RateValidationSchema.from_rate_type(rate_type) for rate_type in RateType
+        }
+        service._route_repo.find_by_ids.return_value = {route.id: route for route in routes}
+        service._settings_repo.find_by_route_ids.return_value = {item.route_id: item for item in settings}
+        service._transport_repo.find_by_ids.return_value = {transport.id: transport for transport in transports}
+        service._business_repo.find_by_ids.return_value = {business.id: business for business in businesses}
+        service._breakdown_repo.save_all.side_effect = lambda breakdowns: breakdowns
+        return service
+    return wire
+
+
+def test_batch_loads_entities_in_bulk_and_saves_once(wire_batch, make_route, transport, business):
+    """Test that a batch prices every route with one bulk load per entity type."""
+    routes = [make_route(transport, segments=(("DE", distance_km),)) for distance_km in (400.0, 500.0, 600.0)]
+    service = wire_batch(routes, [_settings(route) for route in routes], [transport], [business])
+
+    breakdowns, errors = service.calculate_and_save_costs_batch([route.id for route in routes])
+
+    assert errors == {}
+    assert [breakdown.route_id for breakdown in breakdowns] == [route.id for route in routes]
+    service._route_repo.find_by_ids.assert_called_once()
+    service._settings_repo.find_by_route_ids.assert_called_once()
+    service._transport_repo.find_by_ids.assert_called_once_with({transport.id})
+    service._business_repo.find_by_ids.assert_called_once_with({business.id})
+    service._breakdown_repo.save_all.assert_called_once()
+    service._settings_repo.find_by_route_id.assert_not_called()
+    service._empty_driving_repo.find_by_id.assert_not_called()
+    # 400 km * 0.29 L/km + 50 km * 0.22 L/km at 1.50 EUR/L
+    assert breakdowns[0].fuel_costs == {"DE": Decimal("190.5000")}
+
+
+def test_batch_reports_failed_routes_without_stopping(wire_batch, make_route, transport, business):
+    """Test that unknown routes and routes without settings are reported per route."""
+    priced, unsettled = make_route(transport), make_route(transport)
+    missing_id = uuid4()
+    service = wire_batch([priced, unsettled], [_settings(priced)], [transport], [business])
+
+    breakdowns, errors = service.calculate_and_save_costs_batch([missing_id, priced.id, unsettled.id])
+
+    assert [breakdown.route_id for breakdown in breakdowns] == [priced.id]
+    assert errors[missing_id] == "Route not found"
+    assert "No cost settings" in errors[unsettled.id]
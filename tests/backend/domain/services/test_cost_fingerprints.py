@@ -0,0 +1,171 @@
+"""Tests for incremental and memoized cost calculation."""
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from backend.domain.entities.cargo import CostSettings
+from backend.domain.entities.rate_types import RateType, RateValidationSchema
+from backend.domain.services import cost_fingerprints
+from backend.domain.services.cost_fingerprints import component_fingerprints, inputs_hash
+from backend.infrastructure.cache.lru import LRUCache
+
+
+def _settings(route, **rates):
+    return CostSettings(
+        id=uuid4(),
+        route_id=route.id,
+        business_entity_id=route.business_entity_id,
+        enabled_components=["fuel", "toll", "driver", "overhead", "events"],
+        rates={
+            "fuel_rate": Decimal("1.50"),
+            "driver_base_rate": Decimal("200.00"),
+            "toll_rate_multiplier": Decimal("1.00"),
+            **rates
+        }
+    )
+
+
+@pytest.fixture
+def service(mock_cost_service):
+    """Create a cost service with a per-km toll calculator."""
+    toll_calculator = mock_cost_service._toll_calculator
+    toll_calculator.get_override_version.return_value = "overrides-1"
+    toll_calculator.calculate_tolls.side_effect = lambda segments, *args: [
+        Decimal("0.20") * Decimal(str(segment.distance_km)) for segment in segments
+    ]
+    return mock_cost_service
+
+
+def test_fingerprints_change_only_for_affected_component(route, transport, business):
+    """Test that a driver rate edit changes only the driver fingerprint."""
+    before = component_fingerprints(route, transport, business, _settings(route), route.empty_driving, "v1")
+    after = component_fingerprints(route, transport, business,
+                                   _settings(route, driver_time_rate=Decimal("30.00")), route.empty_driving, "v1")
+    reloaded = component_fingerprints(route, transport, business, _settings(route), route.empty_driving, "v2")
+
+    assert set(before) == {"fuel", "toll", "driver", "overhead", "events"}
+    assert [name for name in before if before[name] != after[name]] == ["driver"]
+    assert [name for name in before if before[name] != reloaded[name]] == ["toll"]
+
+
+def test_engine_version_invalidates_every_fingerprint(route, transport, business, monkeypatch):
+    """Test that a pricing rule change stops reuse of every component and the memo."""
+    before = component_fingerprints(route, transport, business, _settings(route), route.empty_driving, "v1")
+    before_hash = inputs_hash(before, ["DE"])
+    monkeypatch.setattr(cost_fingerprints, "CALCULATION_ENGINE_VERSION",
+                        cost_fingerprints.CALCULATION_ENGINE_VERSION + 1)
+    after = component_fingerprints(route, transport, business, _settings(route), route.empty_driving, "v1")
+
+    assert all(before[name] != after[name] for name in before)
+    assert inputs_hash(before, ["DE"]) != before_hash
+
+
+def test_recalculation_reuses_unchanged_components(service, route, transport, business):
+    """Test that only the edited component is recalculated and totals stay exact."""
+    previous = service.calculate_costs(route, transport, business,
+                                       settings=_settings(route), empty_driving=route.empty_driving)
+    service._toll_calculator.calculate_tolls.reset_mock()
+    edited = _settings(route, driver_time_rate=Decimal("30.00"))
+
+    breakdown = service.calculate_costs(route, transport, business, settings=edited,
+                                        empty_driving=route.empty_driving, previous=previous)
+    full = service.calculate_costs(route, transport, business, settings=edited,
+                                   empty_driving=route.empty_driving)
+
+    assert service._toll_calculator.calculate_tolls.call_count == 1
+    assert breakdown.toll_costs == previous.toll_costs
+    assert breakdown.driver_costs != previous.driver_costs
+    assert breakdown.driver_costs == full.driver_costs
+    assert breakdown.total_cost == full.total_cost
+    assert breakdown.input_fingerprints == full.input_fingerprints
+    service._empty_driving_repo.find_by_id.assert_not_called()
+
+
+def _memoized_service(service, route, transport, business, memo):
+    """Wire repositories for calculate_or_reuse_costs onto a service."""
+    service._rate_validation_repo.get_all_schemas.return_value = {
+        rate_type: RateValidationSchema.from_rate_type(rate_type) for rate_type in RateType
+    }
+    service._settings_repo.find_by_route_id.return_value = _settings(route)
+    service._route_repo.find_by_id.side_effect = lambda route_id: route if route_id == route.id else None
+    service._transport_repo.find_by_id.return_value = transport
+    service._business_repo.find_by_id.return_value = business
+    service._breakdown_repo.find_latest_by_route_id.return_value = None
+    service._breakdown_repo.find_by_input_hash.return_value = None
+    service._breakdown_repo.save.side_effect = lambda breakdown: breakdown
+    service._breakdown_memo = memo
+    return service
+
+
+def test_identical_inputs_reuse_memoized_breakdown(service, route, transport, business):
+    """Test that a repeated request is served from the memo without recalculating."""
+    memo = LRUCache(max_size=16)
+    _memoized_service(service, route, transport, business, memo)
+
+    first, first_reused = service.calculate_or_reuse_costs(route.id, transport.id, business.id)
+    second, second_reused = service.calculate_or_reuse_costs(route.id, transport.id, business.id)
+
+    assert (first_reused, second_reused) == (False, True)
+    assert second is first
+    assert first.input_hash in memo
+    assert service._breakdown_repo.save.call_count == 1
+    service._breakdown_repo.find_latest_by_route_id.assert_called_once_with(route.id)
+    assert service._toll_calculator.calculate_tolls.call_count == 1
+
+
+def test_memo_falls_back_to_stored_breakdown(service, route, transport, business):
+    """Test that a breakdown stored by another process is found by input hash."""
+    _memoized_service(service, route, transport, business, LRUCache(max_size=16))
+    stored, _ = service.calculate_or_reuse_costs(route.id, transport.id, business.id)
+    other_route = route.model_copy(update={"id": uuid4()})
+    _memoized_service(service, other_route, transport, business, LRUCache(max_size=16))
+    service._breakdown_repo.find_by_input_hash.return_value = stored
+    service._toll_calculator.calculate_tolls.reset_mock()
+
+    breakdown, reused = service.calculate_or_reuse_costs(other_route.id, transport.id, business.id)
+
+    assert reused
+    service._breakdown_repo.find_by_input_hash.assert_called_with(stored.input_hash)
+    assert breakdown.route_id == other_route.id and breakdown.id != stored.id
+    assert breakdown.total_cost == stored.total_cost
+    service._toll_calculator.calculate_tolls.assert_not_called()
+
+
+class InMemoryBreakdownRepository:
+    """Breakdown repository keeping rows in save order, latest last."""
+
+    def __init__(self):
+        self.rows = []
+
+    def save(self, breakdown):
+        self.rows.append(breakdown)
+        return breakdown
+
+    def mark_latest(self, breakdown_id):
+        row = next(row for row in self.rows if row.id == breakdown_id)
+        self.rows.remove(row)
+        self.rows.append(row)
+
+    def find_latest_by_route_id(self, route_id):
+        return next((row for row in reversed(self.rows) if row.route_id == route_id), None)
+
+    def find_by_input_hash(self, input_hash):
+        return next((row for row in reversed(self.rows) if row.input_hash == input_hash), None)
+
+
+def test_reused_breakdown_becomes_latest(service, route, transport, business):
+    """Test that returning to earlier settings reports and stores that breakdown as latest."""
+    _memoized_service(service, route, transport, business, LRUCache(max_size=16))
+    service._breakdown_repo = InMemoryBreakdownRepository()
+    settings = {rate: _settings(route, driver_time_rate=Decimal(rate)) for rate in ("20.00", "30.00", "40.00")}
+
+    reported = {}
+    for rate in ("20.00", "30.00", "40.00", "30.00"):
+        service._settings_repo.find_by_route_id.return_value = settings[rate]
+        reported[rate], reused = service.calculate_or_reuse_costs(route.id, transport.id, business.id)
+
+    assert reused
+    assert len(service._breakdown_repo.rows) == 3
+    assert service._breakdown_repo.find_latest_by_route_id(route.id) is reported["30.00"]
+    assert service.get_cost_breakdown(route.id) is reported["30.00"]
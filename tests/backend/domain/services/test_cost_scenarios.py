@@ -0,0 +1,114 @@
+"""Tests for vectorized cost scenarios."""
+from decimal import Decimal
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from backend.domain.entities.cargo import CostSettings
+from backend.domain.services.cost_scenarios import CostScenario, CostScenarioModel
+
+# Toll per km by toll class
+TOLL_RATES = {"2": Decimal("0.10"), "4": Decimal("0.20")}
+
+
+@pytest.fixture
+def business(business):
+    """Create a business operating in Germany and Poland."""
+    return business.model_copy(update={"operating_countries": ["DE", "PL"]})
+
+
+@pytest.fixture
+def route(transport, make_route):
+    """Create a DE-PL-DE route with one pickup and one delivery."""
+    return make_route(
+        transport,
+        segments=(("DE", 300.0), ("PL", 400.0), ("DE", 100.0)),
+        total_duration_hours=26.0,
+        days=2
+    )
+
+
+@pytest.fixture
+def service(mock_cost_service, route, transport, business):
+    """Create a cost service over mocked repositories."""
+    settings = CostSettings(
+        id=uuid4(),
+        route_id=route.id,
+        business_entity_id=business.id,
+        enabled_components=["fuel", "toll", "driver", "overhead", "events"],
+        rates={
+            "fuel_rate": Decimal("1.50"),
+            "fuel_rate_PL": Decimal("1.40"),
+            "driver_base_rate": Decimal("200.00"),
+            "pickup_rate": Decimal("60.00"),
+            "delivery_rate": Decimal("55.00")
+        }
+    )
+    mock_cost_service._route_repo.find_by_id.return_value = route
+    mock_cost_service._settings_repo.find_by_route_id.return_value = settings
+    mock_cost_service._transport_repo.find_by_id.return_value = transport
+    mock_cost_service._business_repo.find_by_id.return_value = business
+    mock_cost_service._toll_calculator.calculate_tolls.side_effect = lambda segments, truck_specs, *args: [
+        TOLL_RATES[truck_specs["toll_class"]] * Decimal(str(segment.distance_km)) for segment in segments
+    ]
+    return mock_cost_service
+
+
+def test_grid_matches_exact_pricing(service, route):
+    """Test that every grid point agrees with the Decimal pipeline."""
+    model = service.build_scenario_model(route.id, ["4", "2"])
+    grid = model.evaluate(
+        fuel_price_factors=[0.8, 1.0, 1.2],
+        driver_rate_factors=[0.9, 1.1],
+        margins=[10, 15]
+    )
+
+    assert grid.shape == (3, 2, 2, 2)
+    assert grid.countries == ("DE", "PL")
+    for index in np.ndindex(grid.shape):
+        breakdown, price = service.calculate_scenario_costs(route.id, grid.scenario_at(*index))
+        assert grid.prices[index] == pytest.approx(float(price))
+        assert grid.totals[index[:3]] == pytest.approx(float(breakdown.total_cost))
+    # Repeated countries add up: (300 + 100) km * 0.29 L/km + 50 km * 0.22 L/km at 1.50 EUR/L
+    assert grid.fuel_by_country[1, 0] == pytest.approx(190.5)
+    assert service._settings_repo.find_by_route_id.return_value.rates["fuel_rate"] == Decimal("1.50")
+
+
+def test_exact_scenario_scales_rates(service, route):
+    """Test the Decimal breakdown of one adjusted scenario."""
+    baseline, _ = service.calculate_scenario_costs(route.id, CostScenario())
+
+    breakdown, price = service.calculate_scenario_costs(route.id, CostScenario(
+        fuel_price_factor=1.2, toll_class="2", driver_rate_factor=1.1, margin_percent=15
+    ))
+
+    assert breakdown.fuel_costs["PL"] == baseline.fuel_costs["PL"] * Decimal("1.2")
+    assert breakdown.toll_costs == {"DE": Decimal("40.000"), "PL": Decimal("40.000")}
+    assert breakdown.driver_costs["total_cost"] == baseline.driver_costs["total_cost"] * Decimal("1.1")
+    assert breakdown.timeline_event_costs == baseline.timeline_event_costs
+    assert price == breakdown.total_cost * Decimal("1.15")
+
+
+def test_model_rejects_invalid_axes():
+    """Test validation of scenario axes."""
+    model = CostScenarioModel(
+        route_id=uuid4(),
+        countries=["DE"],
+        fuel_by_country=[100.0],
+        toll_classes=["4"],
+        toll_by_class=[[50.0]],
+        driver_cost=300.0,
+        overhead_cost=40.0,
+        event_cost=115.0
+    )
+
+    assert model.evaluate(margins=[10]).prices[0, 0, 0, 0] == pytest.approx(665.5)
+    with pytest.raises(ValueError):
+        model.evaluate(toll_classes=["2"])
+    with pytest.raises(ValueError):
+        model.evaluate(fuel_price_factors=[])
+    with pytest.raises(ValueError):
+        model.evaluate(driver_rate_factors=[-1.0])
+    with pytest.raises(ValueError):
+        model.evaluate(fuel_price_factors=np.linspace(0.5, 1.5, 1000), margins=np.arange(101))
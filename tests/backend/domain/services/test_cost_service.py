@@ -806,12 +806,12 @@ def test_get_cost_breakdown_success(
         timeline_event_costs={"pickup": Decimal("50.0")},
         total_cost=Decimal("500.0")
     )
-    mock_breakdown_repo.find_by_route_id.return_value = expected_breakdown
+    mock_breakdown_repo.find_latest_by_route_id.return_value = expected_breakdown
     
     breakdown = cost_service.get_cost_breakdown(sample_route.id)
     
     assert breakdown == expected_breakdown
-    mock_breakdown_repo.find_by_route_id.assert_called_once_with(sample_route.id)
+    mock_breakdown_repo.find_latest_by_route_id.assert_called_once_with(sample_route.id)
 
 
 def test_get_cost_breakdown_not_found(
@@ -820,12 +820,12 @@ def test_get_cost_breakdown_not_found(
     sample_route
 ):
     """Test cost breakdown retrieval when not found."""
-    mock_breakdown_repo.find_by_route_id.return_value = None
+    mock_breakdown_repo.find_latest_by_route_id.return_value = None
     
     breakdown = cost_service.get_cost_breakdown(sample_route.id)
     
     assert breakdown is None
-    mock_breakdown_repo.find_by_route_id.assert_called_once_with(sample_route.id)
+    mock_breakdown_repo.find_latest_by_route_id.assert_called_once_with(sample_route.id)
 
 
 def test_calculate_and_save_costs_success(
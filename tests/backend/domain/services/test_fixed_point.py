@@ -0,0 +1,194 @@
+"""Property tests for the scaled-integer cost engine."""
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from uuid import uuid4
+
+import pytest
+
+from backend.domain.entities.business import BusinessEntity
+from backend.domain.entities.cargo import CostSettings
+from backend.domain.entities.route import CountrySegment, EmptyDriving, Route, TimelineEvent
+from backend.domain.entities.transport import DriverSpecification, Transport, TruckSpecification
+from backend.domain.services.cost_service import DEFAULT_FUEL_RATE
+from backend.domain.services.fixed_point import cents_to_decimal, div_half_up, to_cents, to_micros
+from backend.infrastructure.data.event_rates import EVENT_RATES
+
+COUNTRIES = ["DE", "PL", "CZ"]
+MICRO, MILLI, CENT = Decimal("0.000001"), Decimal("0.001"), Decimal("0.01")
+
+
+def q(value, exponent):
+    """Round half up to an exponent, the reference for every engine rounding step."""
+    return Decimal(str(value)).quantize(exponent, rounding=ROUND_HALF_UP)
+
+
+def reference_breakdown(route, transport, business, settings, tolls):
+    """Price a route with Decimal arithmetic and the documented rounding rules."""
+    rates = {key: q(value, MICRO) for key, value in settings.rates.items()}
+    truck, driver = transport.truck_specs, transport.driver_specs
+
+    fuel = {}
+    default_rate = rates.get("fuel_rate", q(DEFAULT_FUEL_RATE, MICRO))
+    loaded = q(truck.fuel_consumption_loaded, MICRO)
+    for segment in route.country_segments:
+        litres = q(loaded * q(segment.distance_km, MILLI), MILLI)
+        rate = rates.get(f"fuel_rate_{segment.country_code}", default_rate)
+        fuel[segment.country_code] = fuel.get(segment.country_code, 0) + q(litres * rate, CENT)
+    first = route.country_segments[0].country_code
+    litres = q(q(truck.fuel_consumption_empty, MICRO) * q(route.empty_driving.distance_km, MILLI), MILLI)
+    fuel[first] += q(litres * rates.get(f"fuel_rate_{first}", default_rate), CENT)
+
+    toll = {}
+    for segment in route.country_segments:
+        rate = rates.get(f"toll_rate_{segment.country_code}")
+        cost = q(q(segment.distance_km, MILLI) * rate, CENT) if rate is not None else q(tolls[segment.id], CENT)
+        toll[segment.country_code] = toll.get(segment.country_code, 0) + cost
+
+    hours = q(route.total_duration_hours, MILLI)
+    days = (int(hours) + 23) // 24
+    regular = min(hours, driver.max_driving_hours * days)
+    time_rate = rates["driver_time_rate"]
+    base_cost = q(rates["driver_base_rate"] * days, CENT)
+    regular_cost = q(regular * time_rate, CENT)
+    overtime_cost = q((hours - regular) * time_rate * q(driver.overtime_rate_multiplier, MILLI), CENT)
+
+    overhead = sum((q(value, CENT) for value in business.cost_overheads.values()), Decimal("0"))
+    events = {}
+    for event in route.timeline_events:
+        rate = rates.get(f"{event.type}_rate", q(EVENT_RATES.get(event.type, Decimal("50")), MICRO))
+        events[event.type] = events.get(event.type, 0) + q(rate, CENT)
+
+    driver_total = base_cost + regular_cost + overtime_cost
+    total = sum(fuel.values()) + sum(toll.values()) + driver_total + overhead + sum(events.values())
+    return fuel, toll, [base_cost, regular_cost, overtime_cost, driver_total], overhead, events, total
+
+
+def _decimal(rng, low, high, places):
+    """Draw a Decimal, sometimes with more places than the engine keeps."""
+    value = Decimal(str(rng.uniform(low, high)))
+    return value if rng.random() < 0.3 else value.quantize(Decimal(1).scaleb(-places))
+
+
+def _random_case(rng):
+    business = BusinessEntity(
+        id=uuid4(),
+        name="Test Logistics",
+        address="Berlin",
+        contact_info={},
+        business_type="carrier",
+        certifications=["ADR"],
+        operating_countries=COUNTRIES,
+        cost_overheads={f"item_{i}": _decimal(rng, 0, 500, 2) for i in range(rng.randint(0, 3))}
+    )
+    transport = Transport(
+        id=uuid4(),
+        transport_type_id="flatbed",
+        business_entity_id=business.id,
+        truck_specs=TruckSpecification(
+            fuel_consumption_empty=rng.uniform(0.1, 0.3),
+            fuel_consumption_loaded=rng.uniform(0.2, 0.6),
+            toll_class="4",
+            euro_class="EURO6",
+            co2_class="A",
+            maintenance_rate_per_km=Decimal("0.15")
+        ),
+        driver_specs=DriverSpecification(
+            daily_rate=Decimal("138"),
+            driving_time_rate=Decimal("25"),
+            required_license_type="CE",
+            required_certifications=["ADR"],
+            overtime_rate_multiplier=_decimal(rng, 1.01, 2.5, 3),
+            max_driving_hours=rng.randint(6, 11)
+        )
+    )
+    route_id = uuid4()
+    pickup_time = datetime.now(timezone.utc)
+    segments = [
+        CountrySegment(
+            id=uuid4(),
+            route_id=route_id,
+            country_code=rng.choice(COUNTRIES),
+            distance_km=rng.uniform(0.001, 900.0),
+            duration_hours=1.0,
+            start_location_id=uuid4(),
+            end_location_id=uuid4(),
+            segment_order=order
+        )
+        for order in range(rng.randint(1, 5))
+    ]
+    empty_driving = EmptyDriving(id=uuid4(), distance_km=rng.uniform(0.001, 200.0), duration_hours=1.0)
+    route = Route(
+        id=route_id,
+        transport_id=transport.id,
+        business_entity_id=business.id,
+        cargo_id=uuid4(),
+        origin_id=uuid4(),
+        destination_id=uuid4(),
+        truck_location_id=uuid4(),
+        pickup_time=pickup_time,
+        delivery_time=pickup_time + timedelta(days=3),
+        empty_driving_id=empty_driving.id,
+        empty_driving=empty_driving,
+        total_distance_km=sum(segment.distance_km for segment in segments),
+        total_duration_hours=rng.uniform(0.5, 120.0),
+        country_segments=segments,
+        timeline_events=[
+            TimelineEvent(id=uuid4(), route_id=route_id, type=rng.choice(["pickup", "rest", "delivery"]),
+                          location_id=uuid4(), planned_time=pickup_time, event_order=order)
+            for order in range(1, rng.randint(2, 6))
+        ]
+    )
+    rates = {
+        "fuel_rate": _decimal(rng, 1.0, 2.5, 3),
+        "driver_base_rate": _decimal(rng, 100, 400, 2),
+        "driver_time_rate": _decimal(rng, 10, 60, 2),
+        "pickup_rate": _decimal(rng, 20, 200, 2)
+    }
+    for country in COUNTRIES:
+        if rng.random() < 0.5:
+            rates[f"fuel_rate_{country}"] = _decimal(rng, 1.0, 2.5, 3)
+        if rng.random() < 0.5:
+            rates[f"toll_rate_{country}"] = _decimal(rng, 0.05, 0.5, 4)
+    settings = CostSettings(
+        id=uuid4(),
+        route_id=route.id,
+        business_entity_id=business.id,
+        enabled_components=["fuel", "toll", "driver", "overhead", "events"],
+        rates=rates
+    )
+    tolls = {segment.id: _decimal(rng, 0, 200, 4) for segment in segments}
+    return route, transport, business, settings, tolls
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_breakdown_is_identical_to_decimal_reference(seed, mock_cost_service):
+    """Test that integer pricing matches the Decimal reference digit for digit."""
+    route, transport, business, settings, tolls = _random_case(random.Random(seed))
+    mock_cost_service._toll_calculator.calculate_tolls.side_effect = \
+        lambda segments, *args: [tolls[s.id] for s in segments]
+
+    breakdown = mock_cost_service.calculate_costs(route, transport, business,
+                                                  settings=settings, empty_driving=route.empty_driving)
+    fuel, toll, driver, overhead, events, total = reference_breakdown(route, transport, business, settings, tolls)
+
+    # Compare strings so differing exponents count as differences too
+    as_text = lambda costs: {key: str(value) for key, value in costs.items()}
+    assert as_text(breakdown.fuel_costs) == as_text(fuel)
+    assert as_text(breakdown.toll_costs) == as_text(toll)
+    assert [str(breakdown.driver_costs[key]) for key in
+            ("base_cost", "regular_hours_cost", "overtime_cost", "total_cost")] == [str(value) for value in driver]
+    assert str(breakdown.overhead_costs) == str(q(overhead, CENT))
+    assert as_text(breakdown.timeline_event_costs) == as_text(events)
+    assert str(breakdown.total_cost) == str(total)
+
+
+def test_rounding_is_half_away_from_zero():
+    """Test the integer rounding primitives."""
+    assert [div_half_up(n, 10) for n in (14, 15, -14, -15)] == [1, 2, -1, -2]
+    assert to_cents(Decimal("0.005")) == 1 and to_cents(Decimal("-0.005")) == -1
+    assert to_cents(2) == 200
+    assert to_micros("1.4999995") == 1_500_000
+    assert to_micros(0.1) == 100_000
+    assert str(cents_to_decimal(19050)) == "190.50"
+    assert str(cents_to_decimal(-5)) == "-0.05"
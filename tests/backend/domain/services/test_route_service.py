@@ -4,7 +4,7 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from backend.domain.services.route_service import RouteService
+from backend.domain.services.route_service import RouteService, lane_key
 from backend.domain.entities.route import (
     Route,
     Location,
@@ -12,7 +12,8 @@ from backend.domain.entities.route import (
     CountrySegment,
     EmptyDriving,
     RouteStatus,
-    EventStatus
+    EventStatus,
+    RouteStop
 )
 
 
@@ -596,4 +597,161 @@ def test_handle_cargo_status_change_to_cancelled(route_service, sample_route):
     
     # Check other events are cancelled
     for event in updated_route.timeline_events[1:]:
-        assert event.status == EventStatus.CANCELLED 
\ No newline at end of file
+        assert event.status == EventStatus.CANCELLED 
+
+class MockLaneRepository:
+    """Mock repository for Lane entity."""
+
+    def __init__(self):
+        self.lanes = {}
+
+    def find_by_key(self, lane_key: str):
+        """Find a lane by its key."""
+        return self.lanes.get(lane_key)
+
+    def save(self, lane):
+        """Save a lane instance."""
+        self.lanes[lane.lane_key] = lane
+        return lane
+
+
+class CountingRouteCalculator(MockRouteCalculator):
+    """Route calculator that counts calls and returns a route polyline."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def calculate_route(self, origin: Location, destination: Location):
+        self.calls += 1
+        distance_km, duration_hours, segments = super().calculate_route(origin, destination)
+        return distance_km, duration_hours, segments, [[origin.latitude, origin.longitude],
+                                                       [destination.latitude, destination.longitude]]
+
+
+def _lane_service(location_repo, calculator, lanes, lane_max_age=timedelta(days=7)):
+    return RouteService(
+        route_repo=MockRouteRepository(),
+        route_calculator=calculator,
+        location_repo=location_repo,
+        lane_repo=lanes,
+        lane_max_age=lane_max_age
+    )
+
+
+def test_lane_hit_clones_route_without_calculating(location_repo, origin, destination):
+    """Test that a repeat origin/destination pair is served from the lane store."""
+    calculator = CountingRouteCalculator()
+    lanes = MockLaneRepository()
+    service = _lane_service(location_repo, calculator, lanes)
+    # Same depots geocoded a few meters apart snap to the same lane
+    nearby_origin = origin.model_copy(update={"id": uuid4(), "latitude": origin.latitude + 0.0001})
+
+    first = service._calculate_main_route(origin, destination)
+    second = service._calculate_main_route(nearby_origin, destination)
+
+    assert calculator.calls == 1
+    assert lane_key(origin, destination) == lane_key(nearby_origin, destination)
+    assert second[:2] == first[:2] and second[3] == first[3]
+    first_ids = {segment.id for segment in first[2]}
+    assert not first_ids & {segment.id for segment in second[2]}
+    assert second[2][0].start_location_id == nearby_origin.id
+    assert second[2][-1].end_location_id == destination.id
+    assert [segment.country_code for segment in second[2]] == ["PL", "DE"]
+
+
+def test_stale_lane_is_recalculated(location_repo, origin, destination):
+    """Test that lanes older than the freshness window are recalculated."""
+    calculator = CountingRouteCalculator()
+    lanes = MockLaneRepository()
+    service = _lane_service(location_repo, calculator, lanes, lane_max_age=timedelta(hours=1))
+    service._calculate_main_route(origin, destination)
+    key = lane_key(origin, destination)
+    lanes.lanes[key] = lanes.lanes[key].model_copy(
+        update={"created_at": datetime.now(timezone.utc) - timedelta(hours=2)}
+    )
+
+    service._calculate_main_route(origin, destination)
+
+    assert calculator.calls == 2
+    assert datetime.now(timezone.utc) - lanes.lanes[key].created_at < timedelta(minutes=1)
+
+
+class MultiStopRouteCalculator:
+    """Route calculator returning one segment per leg between stops."""
+
+    def __init__(self):
+        self.calls = []
+
+    def calculate_route(self, origin: Location, destination: Location, waypoints=None):
+        self.calls.append(waypoints)
+        stops = [origin] + list(waypoints or []) + [destination]
+        segments = [
+            CountrySegment(
+                id=uuid4(),
+                country_code="PL",
+                distance_km=100.0 * hours,
+                duration_hours=float(hours),
+                start_location_id=start.id,
+                end_location_id=end.id,
+                segment_order=order
+            )
+            for order, (hours, start, end) in enumerate(zip([2, 6], stops, stops[1:]))
+        ]
+        return 800.0, 8.0, segments, [[stop.latitude, stop.longitude] for stop in stops]
+
+    def calculate_empty_driving(self, truck_location: Location, origin: Location):
+        return 10.0, 0.2, [[truck_location.latitude, truck_location.longitude],
+                           [origin.latitude, origin.longitude]]
+
+
+def test_create_route_with_waypoints(location_repo, origin, destination, pickup_time, delivery_time):
+    """Test that a multi-stop route is calculated once with a timeline event per stop."""
+    stop = Location(id=uuid4(), latitude=52.40, longitude=16.93, address="Poznan, Poland")
+    for location in (origin, destination, stop):
+        location_repo.save(location)
+    calculator = MultiStopRouteCalculator()
+    lanes = MockLaneRepository()
+    service = _lane_service(location_repo, calculator, lanes)
+
+    route = service.create_route(
+        transport_id=uuid4(),
+        business_entity_id=uuid4(),
+        cargo_id=uuid4(),
+        origin_id=origin.id,
+        destination_id=destination.id,
+        pickup_time=pickup_time,
+        delivery_time=delivery_time,
+        truck_location_id=origin.id,
+        waypoints=[RouteStop(location_id=stop.id)]
+    )
+
+    assert calculator.calls == [[stop]]
+    assert not lanes.lanes  # Multi-stop routes bypass the lane store
+    assert (route.mode, route.waypoint_count) == ("exact", 1)
+    assert [segment.end_location_id for segment in route.country_segments] == [stop.id, destination.id]
+    events = route.timeline_events
+    assert [event.type for event in events] == ["pickup", "delivery", "rest", "delivery"]
+    assert [event.event_order for event in events] == [1, 2, 3, 4]
+    # The stop is reached after 2 of 8 driving hours
+    assert events[1].location_id == stop.id
+    assert events[1].planned_time == pickup_time + (delivery_time - pickup_time) / 4
+
+
+def test_create_route_rejects_unknown_waypoint(location_repo, origin, destination, pickup_time, delivery_time):
+    """Test that waypoints must reference existing locations."""
+    location_repo.save(origin)
+    location_repo.save(destination)
+    service = _lane_service(location_repo, MultiStopRouteCalculator(), MockLaneRepository())
+
+    with pytest.raises(ValueError, match="Waypoint location not found"):
+        service.create_route(
+            transport_id=uuid4(),
+            business_entity_id=uuid4(),
+            cargo_id=uuid4(),
+            origin_id=origin.id,
+            destination_id=destination.id,
+            pickup_time=pickup_time,
+            delivery_time=delivery_time,
+            truck_location_id=origin.id,
+            waypoints=[RouteStop(location_id=uuid4(), type="pickup")]
+        )
@@ -0,0 +1,114 @@
+"""Tests for fleet-wide nearest-truck ranking."""
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from backend.domain.entities.location import Location
+from backend.domain.services.route_service import RouteService
+from backend.infrastructure.external_services.google_maps_service import GoogleMapsService
+
+
+@pytest.fixture
+def fleet():
+    """Cargo origin in Berlin and trucks spread across Europe."""
+    origin = Location(id=uuid4(), latitude=52.52, longitude=13.405)
+    locations = {
+        "potsdam": Location(id=uuid4(), latitude=52.39, longitude=13.06),
+        "leipzig": Location(id=uuid4(), latitude=51.34, longitude=12.37),
+        "madrid": Location(id=uuid4(), latitude=40.42, longitude=-3.70),
+    }
+    by_id = {origin.id: origin, **{loc.id: loc for loc in locations.values()}}
+    location_repo = Mock()
+    location_repo.find_by_id.side_effect = by_id.get
+    location_repo.find_by_ids.side_effect = lambda ids: {id: by_id[id] for id in ids if id in by_id}
+    return origin, locations, location_repo
+
+
+class TestRankTrucks:
+    """Test cases for RouteService.rank_trucks."""
+
+    def test_prefilters_and_ranks_by_distance(self, fleet, make_transport):
+        """Test that only the nearest trucks are priced in one matrix call."""
+        origin, locations, location_repo = fleet
+        calculator = Mock()
+        calculator.calculate_distance_matrix.return_value = ([[40.0], [190.0]], [[0.6], [2.1]])
+        service = RouteService(route_repo=Mock(), route_calculator=calculator, location_repo=location_repo)
+        near, mid, far = make_transport(), make_transport(), make_transport()
+
+        ranked = service.rank_trucks(
+            origin.id,
+            [(far, locations["madrid"].id), (mid, locations["leipzig"].id), (near, locations["potsdam"].id)],
+            max_candidates=2
+        )
+
+        origins, destinations = calculator.calculate_distance_matrix.call_args.args
+        assert [loc.id for loc in origins] == [locations["potsdam"].id, locations["leipzig"].id]
+        assert destinations == [origin]
+        assert [c.transport_id for c in ranked] == [near.id, mid.id]
+        # 40 km * (0.22 L/km * 1.80 EUR/L + 0.15 EUR/km) + 0.6 h * 25 EUR/h
+        assert ranked[0].empty_driving_cost == Decimal("36.84")
+        location_repo.find_by_ids.assert_called_once()
+
+    def test_rank_by_cost_and_drop_unreachable(self, fleet, make_transport):
+        """Test cost ranking and that unreachable trucks are excluded."""
+        origin, locations, location_repo = fleet
+        calculator = Mock()
+        calculator.calculate_distance_matrix.return_value = (
+            [[40.0], [45.0], [float("inf")]],
+            [[0.6], [0.6], [float("inf")]]
+        )
+        service = RouteService(route_repo=Mock(), route_calculator=calculator, location_repo=location_repo)
+        thirsty, frugal, stranded = make_transport(fuel_consumption_empty=0.40), make_transport(fuel_consumption_empty=0.20), make_transport()
+
+        ranked = service.rank_trucks(
+            origin.id,
+            [
+                (thirsty, locations["potsdam"].id),
+                (frugal, locations["leipzig"].id),
+                (stranded, locations["madrid"].id),
+                (make_transport(is_active=False), locations["potsdam"].id),
+            ],
+            rank_by="cost"
+        )
+
+        assert [c.transport_id for c in ranked] == [frugal.id, thirsty.id]
+
+    def test_radius_cutoff_skips_matrix(self, fleet, make_transport):
+        """Test that no API call is made when every truck is out of range."""
+        origin, locations, location_repo = fleet
+        calculator = Mock()
+        service = RouteService(route_repo=Mock(), route_calculator=calculator, location_repo=location_repo)
+
+        ranked = service.rank_trucks(origin.id, [(make_transport(), locations["madrid"].id)], max_radius_km=500)
+
+        assert ranked == []
+        calculator.calculate_distance_matrix.assert_not_called()
+
+
+def test_distance_matrix_split_into_api_sized_blocks():
+    """Test that large matrices are requested in blocks and stitched in order."""
+    service = GoogleMapsService(api_key="AIzaTestKey", location_repo=Mock(), queries_per_second=1000)
+
+    def distance_matrix(origins, destinations, **kwargs):
+        assert len(origins) * len(destinations) <= 100
+        return {"status": "OK", "rows": [
+            {"elements": [
+                {"status": "OK",
+                 "distance": {"value": int(o[0] * 1000 + d[0])},
+                 "duration": {"value": 3600}}
+                for d in destinations
+            ]}
+            for o in origins
+        ]}
+
+    service._client.distance_matrix = Mock(side_effect=distance_matrix)
+    origins = [Location(id=uuid4(), latitude=float(i), longitude=0.0) for i in range(30)]
+    destinations = [Location(id=uuid4(), latitude=float(j), longitude=1.0) for j in range(6)]
+
+    matrix = service.get_distance_matrix(origins, destinations)
+
+    assert service._client.distance_matrix.call_count == 4
+    assert matrix["distances"][27][5] == pytest.approx(27.005)
+    assert all(len(row) == 6 for row in matrix["durations"])
@@ -0,0 +1,96 @@
+"""Tests for the record/replay Google Maps session."""
+import json
+import os
+import time
+
+import googlemaps
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+from backend.infrastructure.external_services.cassette import (
+    CassetteMissError, CassetteSession, MODE_RECORD, MODE_REPLAY, create_cassette_session
+)
+from backend.scripts import benchmark_routes
+
+GEOCODE_BODY = {
+    "status": "OK",
+    "results": [{"formatted_address": "Berlin, Germany", "geometry": {"location": {"lat": 52.52, "lng": 13.405}}}],
+}
+
+
+class _CannedAdapter(BaseAdapter):
+    """Transport adapter answering every request with a fixed JSON body."""
+
+    def __init__(self, body):
+        super().__init__()
+        self.body = body
+        self.sent = []
+
+    def send(self, request, **kwargs):
+        self.sent.append(request.url)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(self.body).encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def test_record_then_replay_offline(tmp_path):
+    """Test that recorded responses replay without network or real key."""
+    recorder = CassetteSession(str(tmp_path), mode=MODE_RECORD)
+    network = _CannedAdapter(GEOCODE_BODY)
+    recorder.mount("https://", network)
+    recorded = googlemaps.Client(key="AIzaRecordingKey", requests_session=recorder).geocode("Berlin")
+
+    assert len(network.sent) == 1
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    player = CassetteSession(str(tmp_path), mode=MODE_REPLAY)
+    offline = _CannedAdapter({})
+    player.mount("https://", offline)
+    replayed = googlemaps.Client(key="AIzaOtherKey", requests_session=player).geocode("Berlin")
+
+    assert replayed == recorded
+    assert offline.sent == []
+    assert player.calls == {"/maps/api/geocode/json": 1}
+
+
+def test_replay_miss_and_latency(tmp_path):
+    """Test that unknown requests fail and replay honours injected latency."""
+    url = "https://maps.googleapis.com/maps/api/geocode/json?address=Berlin&key=AIzaA"
+    key = CassetteSession.cassette_key("GET", url)
+    (tmp_path / f"{key}.json").write_text(json.dumps({"status_code": 200, "body": json.dumps(GEOCODE_BODY)}))
+    player = CassetteSession(str(tmp_path), mode=MODE_REPLAY, latency_ms=30)
+
+    started = time.monotonic()
+    response = player.get(url.replace("key=AIzaA", "key=AIzaB"))
+
+    assert time.monotonic() - started >= 0.03
+    assert response.json() == GEOCODE_BODY
+    with pytest.raises(CassetteMissError):
+        player.get("https://maps.googleapis.com/maps/api/geocode/json?address=Paris")
+    assert player.total_calls == 2
+
+
+def test_create_cassette_session_modes(tmp_path):
+    """Test that live mode uses the default transport."""
+    assert create_cassette_session("live", str(tmp_path)) is None
+    assert create_cassette_session("REPLAY", str(tmp_path)).mode == MODE_REPLAY
+    with pytest.raises(ValueError):
+        create_cassette_session("mock", str(tmp_path))
+
+
+@pytest.mark.parametrize("use_caches", [True, False])
+def test_benchmark_replays_committed_cassettes(capsys, use_caches):
+    """Test that the route benchmark runs offline from the committed cassettes."""
+    cassette_dir = os.path.join(os.path.dirname(__file__), "..", "..", "fixtures", "cassettes", "benchmark")
+
+    benchmark_routes.run(MODE_REPLAY, cassette_dir, latency_ms=0.0, iterations=1, use_caches=use_caches)
+
+    assert f"{len(benchmark_routes.SCENARIOS)} routes in" in capsys.readouterr().out
@@ -0,0 +1,116 @@
+"""Tests for the shared Google Maps client factory and quota governor."""
+import json
+
+import pytest
+import requests
+from googlemaps.exceptions import TransportError
+from requests.adapters import BaseAdapter
+
+from backend.infrastructure.external_services.maps_client import (
+    CIRCUIT_CLOSED, CIRCUIT_OPEN, CircuitOpenError, MapsClientFactory,
+    QuotaExceededError, QuotaGovernor, get_maps_client_factory
+)
+from backend.infrastructure.external_services.toll_rate_service import TollRateService
+
+GEOCODE_BODY = {"status": "OK", "results": [{"formatted_address": "Berlin, Germany"}]}
+
+
+class _ScriptedAdapter(BaseAdapter):
+    """Transport adapter replying with a scripted sequence of responses."""
+
+    def __init__(self, replies):
+        super().__init__()
+        self.replies = list(replies)
+        self.sent = 0
+
+    def send(self, request, **kwargs):
+        self.sent += 1
+        reply = self.replies.pop(0) if len(self.replies) > 1 else self.replies[0]
+        if isinstance(reply, Exception):
+            raise reply
+        status, body = reply
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode("utf-8")
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def _factory(replies, **kwargs):
+    factory = MapsClientFactory(api_key="AIzaTestKey", queries_per_second=1000, **kwargs)
+    adapter = _ScriptedAdapter(replies)
+    factory.session.mount("https://", adapter)
+    return factory, adapter
+
+
+class TestQuotaGovernor:
+    """Test cases for QuotaGovernor."""
+
+    def test_daily_quota(self):
+        """Test that requests beyond the daily quota are rejected."""
+        governor = QuotaGovernor(queries_per_second=1000, daily_quota=2)
+        governor.acquire()
+        governor.acquire()
+
+        with pytest.raises(QuotaExceededError):
+            governor.acquire()
+        assert governor.metrics()["rejected_quota"] == 1
+
+    def test_circuit_opens_and_recovers(self):
+        """Test that the circuit opens at the threshold and closes after a trial."""
+        governor = QuotaGovernor(queries_per_second=1000, failure_threshold=2, reset_timeout=0.0)
+        governor.record_failure()
+        assert governor.state == CIRCUIT_CLOSED
+        governor.record_failure()
+        assert governor.state == CIRCUIT_OPEN
+
+        governor.acquire()  # trial request after reset timeout
+        with pytest.raises(CircuitOpenError):
+            governor.acquire()
+        governor.record_success()
+
+        assert governor.state == CIRCUIT_CLOSED
+        assert governor.metrics()["circuit_opened"] == 1
+
+
+def test_client_retries_pass_through_governor():
+    """Test that server-side retries are admitted and counted per attempt."""
+    factory, adapter = _factory([(500, {}), (200, GEOCODE_BODY)])
+
+    result = factory.client().geocode("Berlin")
+
+    metrics = factory.metrics()
+    assert result == GEOCODE_BODY["results"]
+    assert adapter.sent == 2
+    assert (metrics["requests"], metrics["retries"], metrics["successes"]) == (2, 1, 1)
+
+
+def test_open_circuit_fails_fast_for_all_consumers():
+    """Test that transport failures trip one breaker shared by every service."""
+    factory, adapter = _factory([requests.ConnectionError("reset")], failure_threshold=2, reset_timeout=60)
+    client = factory.client()
+
+    for _ in range(2):
+        with pytest.raises(TransportError):
+            client.geocode("Berlin")
+    with pytest.raises(CircuitOpenError):
+        client.reverse_geocode((52.52, 13.405))
+
+    toll_service = TollRateService(client=client)
+    assert toll_service._get_toll_data((52.52, 13.405), (52.23, 21.01), "4") is None
+    assert adapter.sent == 2
+
+
+def test_factory_is_shared_per_configuration():
+    """Test that identical settings resolve to one pooled factory."""
+    first = get_maps_client_factory("AIzaSharedKey", 10.0, 25)
+    second = get_maps_client_factory("AIzaSharedKey", 10.0, 25)
+
+    assert first is second
+    assert first.client().session is first.session
+    assert first.session.get_adapter("https://maps.googleapis.com")._pool_maxsize == 20
+    assert get_maps_client_factory("").client() is None
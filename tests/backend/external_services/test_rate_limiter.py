@@ -0,0 +1,99 @@
+"""Tests for the token bucket limiter and concurrent country resolution."""
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from googlemaps.exceptions import TransportError
+
+from backend.infrastructure.external_services.google_maps_service import GoogleMapsService
+from backend.infrastructure.external_services.rate_limiter import TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_burst_up_to_capacity(self):
+        """Test that a full bucket serves a burst without waiting."""
+        bucket = TokenBucket(rate=10, capacity=3)
+
+        assert all(bucket.try_acquire() for _ in range(3))
+        assert not bucket.try_acquire()
+
+    def test_acquire_waits_for_refill(self):
+        """Test that acquire blocks until a token is refilled."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        bucket.acquire()
+
+        started = time.monotonic()
+        bucket.acquire()
+
+        assert time.monotonic() - started >= 0.015
+
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+def _reverse_geocode_response(lat, lng):
+    return [{
+        "address_components": [{"types": ["country"], "short_name": "PL" if lng > 15 else "DE"}],
+        "formatted_address": f"{lat},{lng}",
+    }]
+
+
+def test_resolve_countries_concurrent_and_ordered():
+    """Test that step resolution fans out but keeps input order."""
+    service = GoogleMapsService(
+        api_key="AIzaTestKey",
+        location_repo=Mock(),
+        queries_per_second=1000,
+        max_workers=4
+    )
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow_reverse_geocode(latlng):
+        with lock:
+            active.append(latlng)
+            peak.append(len(active))
+        time.sleep(0.02)
+        with lock:
+            active.remove(latlng)
+        return _reverse_geocode_response(*latlng)
+
+    service._client.reverse_geocode = Mock(side_effect=slow_reverse_geocode)
+    points = [(52.0, 13.0 + i) for i in range(8)] + [(52.0, 13.0)]
+
+    resolved = service._resolve_countries(points)
+
+    assert [code for code, _ in resolved] == ["DE", "DE", "DE", "PL", "PL", "PL", "PL", "PL", "DE"]
+    assert [address for _, address in resolved][:2] == ["52.0,13.0", "52.0,14.0"]
+    assert service._client.reverse_geocode.call_count == 8
+    assert max(peak) > 1
+
+
+def test_resolve_countries_retries_failed_points():
+    """Test that a transient failure on one point is retried individually."""
+    service = GoogleMapsService(
+        api_key="AIzaTestKey",
+        location_repo=Mock(),
+        retry_delay=0.0,
+        max_workers=4
+    )
+    failures = {(52.0, 16.0): 1}
+
+    def flaky_reverse_geocode(latlng):
+        if failures.get(latlng):
+            failures[latlng] -= 1
+            raise TransportError("connection reset")
+        return _reverse_geocode_response(*latlng)
+
+    service._client.reverse_geocode = Mock(side_effect=flaky_reverse_geocode)
+
+    resolved = service._resolve_countries([(52.0, 14.0), (52.0, 16.0)])
+
+    assert [code for code, _ in resolved] == ["DE", "PL"]
+    assert service._client.reverse_geocode.call_count == 3
@@ -0,0 +1,84 @@
+"""Tests for the memoizing toll calculator."""
+from decimal import Decimal
+from uuid import uuid4
+from unittest.mock import Mock
+
+import pytest
+
+from backend.domain.entities.route import CountrySegment, RouteStep
+from backend.infrastructure.adapters.caching_toll_calculator import (
+    CachingTollCalculator, segment_fingerprint
+)
+from backend.infrastructure.cache.lru import LRUCache
+
+TRUCK_SPECS = {"toll_class": "4", "euro_class": "VI", "co2_class": "A"}
+
+
+def _segment(country_code="DE", distance_km=100.0, steps=None):
+    return CountrySegment(
+        id=uuid4(),
+        route_id=uuid4(),
+        country_code=country_code,
+        distance_km=distance_km,
+        duration_hours=1.5,
+        start_location_id=uuid4(),
+        end_location_id=uuid4(),
+        segment_order=0,
+        steps=steps or []
+    )
+
+
+@pytest.fixture
+def inner():
+    """Create a toll calculator that prices 0.25 EUR/km."""
+    calculator = Mock()
+    calculator.get_rate_version.return_value = "v1"
+    calculator.get_override_version.return_value = "o1"
+    calculator.calculate_tolls.side_effect = lambda segments, *args: [
+        Decimal(str(segment.distance_km)) * Decimal("0.25") for segment in segments
+    ]
+    return calculator
+
+
+def test_only_changed_segments_are_recalculated(inner):
+    """Test that cached segments skip the wrapped calculator."""
+    calculator = CachingTollCalculator(inner, LRUCache(max_size=16))
+    de, pl = _segment("DE"), _segment("PL", 40.0)
+
+    assert calculator.calculate_tolls([de, pl], TRUCK_SPECS) == [Decimal("25.00"), Decimal("10.00")]
+
+    # Same geometry under a new segment ID is still a hit
+    moved = de.model_copy(update={"id": uuid4()})
+    edited = pl.model_copy(update={"distance_km": 60.0})
+    assert calculator.calculate_tolls([moved, edited], TRUCK_SPECS) == [Decimal("25.00"), Decimal("15.00")]
+
+    assert inner.calculate_tolls.call_count == 2
+    assert inner.calculate_tolls.call_args.args[0] == [edited]
+    assert calculator.metrics()["hits"] == 1
+
+
+def test_rate_and_override_versions_key_results(inner):
+    """Test that a rate reload or override edit misses the cache."""
+    calculator = CachingTollCalculator(inner, LRUCache(max_size=16))
+    segment = _segment()
+    business_id = uuid4()
+    overrides = {"vehicle_class": "4", "route_type": None}
+
+    calculator.calculate_toll(segment, TRUCK_SPECS, business_id, overrides)
+    calculator.calculate_toll(segment, TRUCK_SPECS, business_id, overrides)
+    inner.get_override_version.return_value = "o2"
+    calculator.calculate_toll(segment, TRUCK_SPECS, business_id, overrides)
+    inner.get_rate_version.return_value = "v2"
+    calculator.calculate_toll(segment, TRUCK_SPECS, business_id, overrides)
+    calculator.calculate_toll(segment, {**TRUCK_SPECS, "euro_class": "V"}, business_id, overrides)
+
+    assert inner.calculate_tolls.call_count == 4
+
+
+def test_segment_fingerprint_covers_steps():
+    """Test that step records are part of the fingerprint."""
+    plain = _segment()
+    tolled = _segment(steps=[RouteStep(distance_km=100.0, road_ref="A2", is_toll=True, country_code="DE")])
+
+    assert segment_fingerprint(plain) == segment_fingerprint(_segment())
+    assert segment_fingerprint(plain) != segment_fingerprint(tolled)
@@ -0,0 +1,53 @@
+"""Tests for Google Maps adapter."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from backend.domain.entities.location import Location
+from backend.domain.entities.route import CountrySegment
+from backend.infrastructure.adapters.google_maps_adapter import GoogleMapsAdapter
+
+
+@pytest.fixture
+def locations():
+    """Create origin and destination locations."""
+    return (
+        Location(id=uuid4(), latitude=52.52, longitude=13.40, address="Berlin"),
+        Location(id=uuid4(), latitude=52.23, longitude=21.01, address="Warsaw"),
+    )
+
+
+def test_calculate_route_reuses_segment_points(locations):
+    """Test that segment points come from the route response without extra requests."""
+    origin, destination = locations
+    segment = CountrySegment(
+        id=uuid4(),
+        country_code="DE",
+        distance_km=100.0,
+        duration_hours=1.0,
+        start_location_id=origin.id,
+        end_location_id=destination.id,
+        segment_order=0,
+        route_points=[[52.52, 13.40], [52.35, 14.55]]
+    )
+    maps_service = Mock()
+    maps_service.calculate_route.return_value = (100.0, 1.0, [segment], [[52.52, 13.40]])
+    adapter = GoogleMapsAdapter(maps_service)
+
+    distance, duration, segments, route_points = adapter.calculate_route(origin, destination)
+
+    assert distance == 100.0
+    assert segments[0].route_points == [[52.52, 13.40], [52.35, 14.55]]
+    maps_service.get_segment_route_points.assert_not_called()
+    maps_service._location_repo.find_by_id.assert_not_called()
+
+
+def test_calculate_route_wraps_errors(locations):
+    """Test that service errors surface as ValueError."""
+    maps_service = Mock()
+    maps_service.calculate_route.side_effect = RuntimeError("boom")
+    adapter = GoogleMapsAdapter(maps_service)
+
+    with pytest.raises(ValueError, match="Failed to calculate route"):
+        adapter.calculate_route(*locations)
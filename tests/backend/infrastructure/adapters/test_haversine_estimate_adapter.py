@@ -0,0 +1,194 @@
+"""Tests for the offline route estimation adapter."""
+import threading
+from uuid import uuid4
+
+import pytest
+
+from backend.domain.entities.route import Location
+from backend.infrastructure.adapters.haversine_estimate_adapter import HaversineEstimateAdapter
+from backend.infrastructure.geo.country_index import CountryBoundaryIndex, get_country_index
+from backend.infrastructure.geo.detour import (
+    DEFAULT_DETOUR_FACTOR, CorridorSample, DetourFactorStore, DetourFactors
+)
+from backend.infrastructure.geo.distance import haversine_km
+
+WARSAW = Location(id=uuid4(), latitude=52.237049, longitude=21.017532, address="Warsaw, Poland")
+BERLIN = Location(id=uuid4(), latitude=52.520008, longitude=13.404954, address="Berlin, Germany")
+LONDON = Location(id=uuid4(), latitude=51.5072, longitude=-0.1276, address="London, United Kingdom")
+
+
+class InMemoryLocationRepository:
+    """Location repository keeping saved locations in a dict."""
+
+    def __init__(self):
+        self.locations = {}
+
+    def save(self, location):
+        self.locations[location.id] = location
+        return location
+
+
+@pytest.fixture
+def locations():
+    """Create an empty location repository."""
+    return InMemoryLocationRepository()
+
+
+@pytest.fixture
+def adapter(locations):
+    """Create an estimator with a 1.2 detour factor between Poland and Germany."""
+    factors = DetourFactors({("DE", "PL"): 1.2})
+    return HaversineEstimateAdapter(
+        location_repo=locations,
+        country_index=get_country_index(0.0),
+        detour_factors=lambda: factors,
+        speed_for=lambda country_code: {"PL": 60.0, "DE": 75.0}.get(country_code, 65.0)
+    )
+
+
+def test_route_is_split_per_country(adapter, locations):
+    """Test per-country distances, durations and the estimated border crossing."""
+    straight_km = haversine_km(WARSAW.latitude, WARSAW.longitude, BERLIN.latitude, BERLIN.longitude)
+
+    distance_km, duration_hours, segments, path = adapter.calculate_route(WARSAW, BERLIN)
+
+    assert [segment.country_code for segment in segments] == ["PL", "DE"]
+    assert distance_km == pytest.approx(straight_km * 1.2)
+    assert sum(segment.distance_km for segment in segments) == pytest.approx(distance_km)
+    pl, de = segments
+    assert duration_hours == pytest.approx(pl.distance_km / 60.0 + de.distance_km / 75.0)
+    # The Oder border lies roughly 80 km east of Berlin
+    assert 60 < de.distance_km / 1.2 < 110
+    border = locations.locations[pl.end_location_id]
+    assert de.start_location_id == border.id
+    assert 14.0 < border.longitude < 15.0
+    assert pl.start_location_id == WARSAW.id and de.end_location_id == BERLIN.id
+    assert path[0] == [WARSAW.latitude, WARSAW.longitude]
+    assert path[-1] == [BERLIN.latitude, BERLIN.longitude]
+    assert pl.route_points[-1] == de.route_points[0]
+
+
+def test_route_with_waypoints_is_chained_per_leg(adapter):
+    """Test that each leg ends at its stop and legs add up."""
+    poznan = Location(id=uuid4(), latitude=52.4064, longitude=16.9252, address="Poznan, Poland")
+    first = adapter.calculate_route(WARSAW, poznan)
+    second = adapter.calculate_route(poznan, BERLIN)
+
+    distance_km, duration_hours, segments, path = adapter.calculate_route(WARSAW, BERLIN, waypoints=[poznan])
+
+    assert distance_km == pytest.approx(first[0] + second[0])
+    assert duration_hours == pytest.approx(first[1] + second[1])
+    assert [segment.country_code for segment in segments] == ["PL", "PL", "DE"]
+    assert [segment.segment_order for segment in segments] == [0, 1, 2]
+    assert segments[0].end_location_id == poznan.id == segments[1].start_location_id
+    assert len(path) == len(first[3]) + len(second[3]) - 1
+
+
+def test_route_outside_coverage_is_rejected(adapter):
+    """Test that a path without indexed countries cannot be estimated."""
+    with pytest.raises(ValueError):
+        adapter.calculate_route(LONDON, Location(id=uuid4(), latitude=53.35, longitude=-6.26))
+
+
+@pytest.mark.parametrize("destination", [
+    Location(id=uuid4(), latitude=59.9139, longitude=10.7522, address="Oslo, Norway"),
+    Location(id=uuid4(), latitude=44.7866, longitude=20.4489, address="Belgrade, Serbia"),
+])
+def test_uncovered_endpoint_is_rejected(adapter, destination):
+    """Test that distance outside the index is not credited to the last covered country."""
+    with pytest.raises(ValueError, match="outside the countries covered"):
+        adapter.calculate_route(BERLIN, destination)
+
+
+def test_unresolved_gaps_are_split_or_rejected(locations):
+    """Test short gaps between countries are split at their middle and long ones rejected."""
+    def adapter_for(gap_deg):
+        # Two countries along the equator, gap_deg of longitude apart
+        index = CountryBoundaryIndex({
+            "AA": [(-1.0, 0.0), (1.0, 0.0), (1.0, 2.0), (-1.0, 2.0)],
+            "BB": [(-1.0, 2.0 + gap_deg), (1.0, 2.0 + gap_deg), (1.0, 4.0 + gap_deg), (-1.0, 4.0 + gap_deg)],
+        }, border_margin_km=0.0)
+        return HaversineEstimateAdapter(location_repo=locations, country_index=index,
+                                        detour_factors=lambda: DetourFactors(default=1.0), sample_km=10.0)
+    start = Location(id=uuid4(), latitude=0.0, longitude=1.0)
+
+    _, _, segments, _ = adapter_for(0.3).calculate_route(start, Location(id=uuid4(), latitude=0.0, longitude=3.3))
+    with pytest.raises(ValueError, match="outside the countries covered"):
+        adapter_for(1.0).calculate_route(start, Location(id=uuid4(), latitude=0.0, longitude=4.0))
+
+    aa, bb = segments
+    # The 0.3 degree gap is shared, so the border lands near longitude 2.15
+    assert aa.distance_km == pytest.approx(bb.distance_km, rel=0.1)
+
+
+def test_empty_driving_and_matrix(adapter):
+    """Test single-leg estimates."""
+    distance_km, duration_hours, points = adapter.calculate_empty_driving(BERLIN, WARSAW)
+    distances, durations = adapter.calculate_distance_matrix([BERLIN, WARSAW], [WARSAW])
+
+    assert distances[0][0] == pytest.approx(distance_km)
+    assert durations[0][0] == pytest.approx(duration_hours)
+    assert distance_km / duration_hours == pytest.approx(75.0)
+    assert distances[1][0] == 0.0
+    assert adapter.calculate_empty_driving(WARSAW, WARSAW)[0] > 0
+    assert len(points) == 2
+
+
+def test_calibration_uses_corridor_medians():
+    """Test detour calibration from historical routes."""
+    samples = [
+        CorridorSample("PL", "DE", 500.0, 600.0),
+        CorridorSample("DE", "PL", 400.0, 500.0),
+        CorridorSample("PL", "DE", 300.0, 390.0),
+        CorridorSample("PL", "DE", 100.0, 900.0),  # Outlier, ignored
+        CorridorSample("FR", "ES", 800.0, 1000.0),
+    ]
+
+    factors = DetourFactors.calibrate(samples)
+
+    assert factors.factor("DE", "PL") == pytest.approx(1.25)
+    assert factors.factor("FR", "ES") == factors.default == pytest.approx(1.25)
+    assert factors.sample_count == 4
+    assert factors.to_dict() == {"DE-PL": pytest.approx(1.25)}
+    assert DetourFactors.calibrate([]).default == DEFAULT_DETOUR_FACTOR
+
+
+def test_store_recalibrates_after_interval():
+    """Test that calibration runs once per interval and survives failures."""
+    calls = []
+
+    def load_samples():
+        calls.append(1)
+        if len(calls) > 1:
+            raise RuntimeError("database unavailable")
+        return [CorridorSample("PL", "DE", 100.0, 130.0)] * 3
+
+    cached = DetourFactorStore(refresh_seconds=3600)
+    cached.refresh_async(load_samples).join()
+    assert cached.get(load_samples).factor("PL", "DE") == pytest.approx(1.3)
+    assert len(calls) == 1
+
+    expiring = DetourFactorStore(refresh_seconds=0)
+    calls.clear()
+    expiring.refresh(load_samples)
+    assert expiring.refresh(load_samples).factor("PL", "DE") == pytest.approx(1.3)
+    assert len(calls) == 2
+
+
+def test_store_calibrates_off_the_calling_thread():
+    """Test that a due recalibration does not block get."""
+    release = threading.Event()
+
+    def load_samples():
+        release.wait(5)
+        return [CorridorSample("PL", "DE", 100.0, 130.0)] * 3
+
+    store = DetourFactorStore(refresh_seconds=3600)
+    assert store.get(load_samples).factor("PL", "DE") == DEFAULT_DETOUR_FACTOR
+    assert store.refresh_async(load_samples) is None
+
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "detour-calibration":
+            thread.join(5)
+    assert store.get(load_samples).factor("PL", "DE") == pytest.approx(1.3)
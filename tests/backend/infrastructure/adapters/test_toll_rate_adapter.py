@@ -8,7 +8,9 @@ from backend.domain.entities.route import CountrySegment, Location
 from backend.domain.entities.transport import TollRateOverride
 from backend.infrastructure.adapters.toll_rate_adapter import TollRateAdapter
 from backend.infrastructure.external_services.toll_rate_service import TollRateService
-from backend.infrastructure.repositories.toll_rate_override_repository import TollRateOverrideRepository
+from backend.infrastructure.repositories.toll_rate_override_repository import (
+    TollOverrideIndex, TollRateOverrideRepository
+)
 
 
 @pytest.fixture
@@ -68,7 +70,8 @@ def test_calculate_toll_without_override(
         distance_km=100.0,
         toll_class="4",
         euro_class="VI",
-        co2_class="A"
+        co2_class="A",
+        steps=None
     )
     mock_override_repo.find_for_business.assert_not_called()
 
@@ -139,4 +142,36 @@ def test_calculate_toll_override_not_found(
         business_entity_id=business_id,
         country_code="DE",
         vehicle_class="4"
-    ) 
\ No newline at end of file
+    ) 
+
+def test_calculate_tolls_resolves_segments_against_one_index(
+    sample_segment,
+    sample_truck_specs,
+    mock_toll_service,
+    mock_override_repo
+):
+    """Test that all segments are priced with a single override lookup."""
+    business_id = uuid4()
+    pl_segment = sample_segment.model_copy(update={"id": uuid4(), "country_code": "PL"})
+    override = TollRateOverride(
+        id=uuid4(),
+        vehicle_class="4",
+        rate_multiplier=Decimal("1.25"),
+        country_code="DE",
+        business_entity_id=business_id
+    )
+    mock_override_repo.find_all_for_business.return_value = TollOverrideIndex([override])
+    mock_toll_service.get_toll_rate.return_value = (Decimal("24.80"), True)
+
+    adapter = TollRateAdapter(mock_toll_service, mock_override_repo)
+
+    tolls = adapter.calculate_tolls(
+        [sample_segment, pl_segment],
+        sample_truck_specs,
+        business_entity_id=business_id,
+        overrides={"vehicle_class": "4"}
+    )
+
+    assert tolls == [Decimal("31.00"), Decimal("24.80")]
+    mock_override_repo.find_all_for_business.assert_called_once_with(business_id)
+    mock_override_repo.find_for_business.assert_not_called()
@@ -0,0 +1,111 @@
+"""Tests for the persistent API response cache."""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from backend.infrastructure.cache.response_cache import PRUNE_INTERVAL, ResponseCache
+from backend.infrastructure.external_services.google_maps_service import GoogleMapsService
+
+
+@pytest.fixture
+def cache(tmp_path) -> ResponseCache:
+    """Create a cache backed by a temporary file."""
+    return ResponseCache(str(tmp_path / "cache.db"), ttl_seconds=60, max_entries=5)
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_round_trip(self, cache):
+        """Test storing and reading back a response."""
+        key = cache.make_key("directions", (), {"origin": {"lat": 52.5, "lng": 13.4}})
+        cache.set(key, "directions", [{"legs": []}])
+
+        assert cache.get(key) == [{"legs": []}]
+
+    def test_key_normalization(self, cache):
+        """Test that equivalent requests share a key."""
+        first = cache.make_key(
+            "directions", (),
+            {"origin": (52.520001, 13.400002), "avoid": ["tolls", "ferries"], "waypoints": None}
+        )
+        second = cache.make_key(
+            "directions", (),
+            {"origin": [52.519999, 13.399998], "avoid": ["ferries", "tolls"]}
+        )
+        other_mode = cache.make_key(
+            "directions", (),
+            {"origin": (52.52, 13.40), "avoid": ["tolls", "ferries"], "mode": "walking"}
+        )
+
+        assert first == second
+        assert first != other_mode
+        assert first != cache.make_key("geocode", (), {"origin": (52.52, 13.40)})
+
+    def test_expired_entries_are_misses(self, cache):
+        """Test TTL expiry."""
+        key = cache.make_key("geocode", ("Berlin",), {})
+        with patch("backend.infrastructure.cache.response_cache.time.time", return_value=1000.0):
+            cache.set(key, "geocode", [{"formatted_address": "Berlin"}])
+        with patch("backend.infrastructure.cache.response_cache.time.time", return_value=1061.0):
+            assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_size_cap_evicts_least_recently_used(self, cache):
+        """Test that pruning enforces the size cap."""
+        keys = [cache.make_key("geocode", (str(i),), {}) for i in range(7)]
+        for i, key in enumerate(keys):
+            with patch("backend.infrastructure.cache.response_cache.time.time", return_value=float(i)):
+                cache.set(key, "geocode", [i])
+        with patch("backend.infrastructure.cache.response_cache.time.time", return_value=10.0):
+            cache.get(keys[0])
+            cache.prune()
+
+        assert len(cache) == 5
+        with patch("backend.infrastructure.cache.response_cache.time.time", return_value=11.0):
+            assert cache.get(keys[0]) == [0]
+            assert cache.get(keys[1]) is None
+            assert cache.get(keys[2]) is None
+
+    def test_size_cap_applied_on_write(self, tmp_path):
+        """Test that writes periodically sweep the cache."""
+        cache = ResponseCache(str(tmp_path / "cache.db"), ttl_seconds=60, max_entries=10)
+        for i in range(PRUNE_INTERVAL):
+            cache.set(cache.make_key("geocode", (str(i),), {}), "geocode", [i])
+
+        assert len(cache) == 10
+
+
+def test_google_maps_service_uses_cache(cache):
+    """Test that repeated lookups are served from the cache."""
+    service = GoogleMapsService(
+        api_key="AIzaTestKey",
+        location_repo=Mock(),
+        response_cache=cache
+    )
+    service._client.geocode = Mock(return_value=[{
+        "geometry": {"location": {"lat": 52.52, "lng": 13.40}},
+        "formatted_address": "Berlin, Germany",
+    }])
+
+    first = service.geocode("Berlin")
+    second = service.geocode("Berlin")
+
+    service._client.geocode.assert_called_once()
+    assert first.address == second.address == "Berlin, Germany"
+
+
+def test_traffic_dependent_requests_bypass_cache(cache):
+    """Test that requests with a departure time are never cached."""
+    service = GoogleMapsService(
+        api_key="AIzaTestKey",
+        location_repo=Mock(),
+        response_cache=cache
+    )
+    request = Mock(return_value=[{"legs": []}])
+
+    service._cached_request("directions", request, origin="A", departure_time=1700000000)
+    service._cached_request("directions", request, origin="A", departure_time=1700000000)
+
+    assert request.call_count == 2
+    assert len(cache) == 0
@@ -0,0 +1,73 @@
+"""Tests for the geohash tile cache."""
+from unittest.mock import Mock
+
+import pytest
+
+from backend.infrastructure.cache.tile_cache import GeocodeTileCache, TileEntry
+from backend.infrastructure.external_services.google_maps_service import GoogleMapsService
+from backend.infrastructure.geo import geohash
+
+
+def test_geohash_reference_values():
+    """Test geohash encoding against a known reference point."""
+    assert geohash.encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    lat, lng = geohash.decode("u4pruydqqvj")
+    assert lat == pytest.approx(57.64911, abs=1e-5)
+    assert lng == pytest.approx(10.40744, abs=1e-5)
+
+
+class TestGeocodeTileCache:
+    """Test cases for GeocodeTileCache."""
+
+    def test_nearby_points_share_tile(self):
+        """Test that points inside one cell hit the same entry."""
+        cache = GeocodeTileCache(precision=6)
+        cache.set(52.2297, 21.0122, "PL", "Warsaw, Poland")
+
+        assert cache.get(52.2299, 21.0125) == TileEntry("PL", "Warsaw, Poland")
+        assert cache.get(52.5200, 13.4050) is None
+
+    def test_persistent_layer_survives_restart(self, tmp_path):
+        """Test that tiles are reloaded from SQLite into a fresh instance."""
+        path = str(tmp_path / "tiles.db")
+        GeocodeTileCache(path=path).set(50.0755, 14.4378, "CZ", "Prague, Czechia")
+
+        reopened = GeocodeTileCache(path=path)
+
+        assert reopened.get(50.0755, 14.4378) == TileEntry("CZ", "Prague, Czechia")
+        assert len(reopened.memory) == 1
+
+    def test_expired_tiles_are_ignored(self, tmp_path):
+        """Test that persisted tiles older than the TTL are misses."""
+        path = str(tmp_path / "tiles.db")
+        GeocodeTileCache(path=path, ttl_seconds=-1).set(48.2082, 16.3738, "AT", "Vienna")
+
+        assert GeocodeTileCache(path=path, ttl_seconds=-1).get(48.2082, 16.3738) is None
+
+    def test_empty_country_not_cached(self):
+        """Test that unresolved results are not stored."""
+        cache = GeocodeTileCache()
+        cache.set(0.0, 0.0, "", "Ocean")
+
+        assert cache.get(0.0, 0.0) is None
+
+
+def test_reverse_geocode_served_from_tiles():
+    """Test that repeat reverse geocoding of a corridor point skips the API."""
+    service = GoogleMapsService(
+        api_key="AIzaTestKey",
+        location_repo=Mock(),
+        tile_cache=GeocodeTileCache()
+    )
+    service._client.reverse_geocode = Mock(return_value=[{
+        "address_components": [{"types": ["country"], "short_name": "DE"}],
+        "formatted_address": "A2, Germany",
+    }])
+
+    first = service.reverse_geocode(52.30001, 10.50001)
+    second = service.reverse_geocode(52.30002, 10.50002)
+    country, address = service._resolve_country(52.30003, 10.50003)
+
+    service._client.reverse_geocode.assert_called_once()
+    assert first.address == second.address == address == "A2, Germany"
+    assert country == "DE"
@@ -0,0 +1,105 @@
+"""Tests for the compiled toll rate table and its hot-reloading store."""
+import json
+import os
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from backend.infrastructure.adapters.toll_rate_adapter import TollRateAdapter
+from backend.infrastructure.data.toll_rate_table import (
+    TollRateStore, compile_toll_rate_table, load_toll_rate_table, DEFAULT_RATES_FILE
+)
+from backend.infrastructure.data.toll_rates import get_toll_rate
+
+EU_COUNTRIES = {
+    "AT", "BE", "BG", "HR", "CY", "CZ", "DK", "EE", "FI", "FR", "DE", "GR", "HU", "IE",
+    "IT", "LV", "LT", "LU", "MT", "NL", "PL", "PT", "RO", "SK", "SI", "ES", "SE"
+}
+
+
+def _document(version="v1", de_class_4="0.248"):
+    return {
+        "version": version,
+        "countries": {
+            "DE": {
+                "toll_class": {"1": "0.187", "4": de_class_4},
+                "euro_class": {"VI": "0.000", "III": "0.063"}
+            }
+        },
+        "default": {
+            "toll_class": {"1": "0.150", "2": "0.170"},
+            "euro_class": {"VI": "0.000", "V": "0.015", "III": "0.045"}
+        }
+    }
+
+
+def _write(path, document):
+    with open(path, "w", encoding="utf-8") as rate_file:
+        json.dump(document, rate_file)
+
+
+def test_bundled_file_covers_all_eu_countries():
+    """Test that the bundled rate file has rates for every EU country."""
+    table = load_toll_rate_table(DEFAULT_RATES_FILE)
+
+    assert table.countries >= EU_COUNTRIES
+    assert table.lookup("DE", "4", "VI").total_rate == Decimal("0.248")
+    assert get_toll_rate("FR", "4", "V") == {
+        "base_rate": Decimal("0.236"), "euro_adjustment": Decimal("0.020")
+    }
+
+
+def test_lookup_fallbacks():
+    """Test fallbacks for unknown classes and countries."""
+    table = compile_toll_rate_table(_document())
+
+    assert table.lookup("DE", "4", "III").total_rate == Decimal("0.311")
+    # Class missing for DE uses DE's default class 1
+    assert table.lookup("DE", "2", "V").total_rate == Decimal("0.250")
+    # Unknown class values use the default classes
+    assert table.lookup("DE", "9", "EURO7").total_rate == Decimal("0.250")
+    # Unknown country uses the default rates
+    assert table.lookup("CH", "2", "V").total_rate == Decimal("0.185")
+
+
+def test_invalid_document_rejected():
+    """Test that incomplete rate files raise ValueError."""
+    document = _document()
+    del document["default"]
+    with pytest.raises(ValueError):
+        compile_toll_rate_table(document)
+
+    document = _document(de_class_4="abc")
+    with pytest.raises(ValueError):
+        compile_toll_rate_table(document)
+
+
+def test_store_hot_reloads_changed_file(tmp_path):
+    """Test that a changed file is swapped in and a broken one is ignored."""
+    path = str(tmp_path / "rates.json")
+    _write(path, _document())
+    store = TollRateStore(path, reload_seconds=0)
+    assert store.version == "v1"
+
+    _write(path, _document(version="v2", de_class_4="0.300"))
+    os.utime(path, ns=(1, 1))
+
+    assert store.lookup("DE", "4", "VI").total_rate == Decimal("0.300")
+    assert store.version == "v2"
+
+    with open(path, "w", encoding="utf-8") as rate_file:
+        rate_file.write("{not json")
+    os.utime(path, ns=(2, 2))
+
+    assert store.lookup("DE", "4", "VI").total_rate == Decimal("0.300")
+    assert store.version == "v2"
+
+
+def test_adapter_reports_rate_version():
+    """Test that the toll adapter exposes the rate table version."""
+    service = Mock()
+    service.rate_version = "2025-01-10.1"
+    adapter = TollRateAdapter(service, Mock())
+
+    assert adapter.get_rate_version() == "2025-01-10.1"
@@ -0,0 +1,127 @@
+"""Tests for the offline country boundary index."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from backend.domain.entities.location import Location
+from backend.infrastructure.external_services.google_maps_service import GoogleMapsService
+from backend.infrastructure.geo.country_index import CountryBoundaryIndex, get_country_index
+
+
+@pytest.fixture
+def index() -> CountryBoundaryIndex:
+    """Get the shared boundary index."""
+    return get_country_index()
+
+
+@pytest.fixture
+def square_index() -> CountryBoundaryIndex:
+    """Create an index over two adjacent square countries."""
+    return CountryBoundaryIndex(
+        {
+            "AA": [(0.0, 0.0), (0.0, 2.0), (2.0, 2.0), (2.0, 0.0)],
+            "BB": [(0.0, 2.0), (0.0, 4.0), (2.0, 4.0), (2.0, 2.0)],
+        },
+        border_margin_km=10.0
+    )
+
+
+class TestCountryBoundaryIndex:
+    """Test cases for CountryBoundaryIndex."""
+
+    @pytest.mark.parametrize("lat,lng,expected", [
+        (52.52, 13.40, "DE"),   # Berlin
+        (48.86, 2.35, "FR"),    # Paris
+        (52.23, 21.01, "PL"),   # Warsaw
+        (51.92, 4.48, "NL"),    # Rotterdam
+        (50.08, 14.44, "CZ"),   # Prague
+        (48.21, 16.37, "AT"),   # Vienna
+        (47.50, 19.04, "HU"),   # Budapest
+        (45.46, 9.19, "IT"),    # Milan
+        (40.42, -3.70, "ES"),   # Madrid
+        (56.16, 10.20, "DK"),   # Aarhus
+        (59.33, 18.07, "SE"),   # Stockholm
+        (54.69, 25.28, "LT"),   # Vilnius
+        (46.05, 14.51, "SI"),   # Ljubljana
+        (44.43, 26.10, "RO"),   # Bucharest
+        (42.70, 23.32, "BG"),   # Sofia
+        (53.35, -6.26, "IE"),   # Dublin
+    ])
+    def test_lookup_interior_points(self, index, lat, lng, expected):
+        """Test that points well inside a country resolve offline."""
+        assert index.lookup(lat, lng) == expected
+
+    def test_lookup_outside_coverage(self, index):
+        """Test that points outside the bundled countries are unresolved."""
+        assert index.lookup(51.50, -0.12) is None  # London
+        assert index.lookup(44.82, 20.46) is None  # Belgrade
+        assert index.lookup(59.91, 10.75) is None  # Oslo
+
+    def test_lookup_near_border_is_ambiguous(self, square_index):
+        """Test that points within the margin of an edge are unresolved."""
+        assert square_index.lookup(1.0, 1.0) == "AA"
+        assert square_index.lookup(1.0, 3.0) == "BB"
+        assert square_index.lookup(1.0, 1.95) is None
+        assert square_index.contains("AA", 1.0, 1.95)
+
+    def test_zero_margin_resolves_up_to_edge(self):
+        """Test that a zero margin trusts the polygons exactly."""
+        index = CountryBoundaryIndex(
+            {"AA": [(0.0, 0.0), (0.0, 2.0), (2.0, 2.0), (2.0, 0.0)]},
+            border_margin_km=0.0
+        )
+        assert index.lookup(1.0, 1.99) == "AA"
+        assert index.lookup(1.0, 2.01) is None
+
+    def test_candidates_use_grid_buckets(self, square_index):
+        """Test that only countries whose bounds cover the point are candidates."""
+        assert square_index.candidates(1.0, 1.0) == ["AA"]
+        assert square_index.candidates(5.0, 5.0) == []
+
+    def test_invalid_polygon(self):
+        """Test that degenerate polygons are rejected."""
+        with pytest.raises(ValueError):
+            CountryBoundaryIndex({"AA": [(0.0, 0.0), (1.0, 1.0)]})
+
+
+def test_calculate_route_skips_reverse_geocoding_for_interior_steps(index):
+    """Test that route segmentation only reverse geocodes unresolved points."""
+    location_repo = Mock()
+    location_repo.save.side_effect = lambda location: location
+    service = GoogleMapsService(
+        api_key="AIzaTestKey",
+        location_repo=location_repo,
+        country_index=index
+    )
+    origin = Location(id=uuid4(), latitude=52.52, longitude=13.40, address="Berlin")
+    destination = Location(id=uuid4(), latitude=52.23, longitude=21.01, address="Warsaw")
+
+    def step(lat, lng):
+        return {
+            "distance": {"value": 100000},
+            "duration": {"value": 3600},
+            "end_location": {"lat": lat, "lng": lng},
+            "polyline": {"points": "_p~iF~ps|U_ulLnnqC"},
+        }
+
+    service._client.directions = Mock(return_value=[{
+        "legs": [{
+            "distance": {"value": 300000},
+            "duration": {"value": 10800},
+            "steps": [step(52.35, 14.55), step(52.40, 16.90), step(52.23, 21.01)],
+        }],
+        "overview_polyline": {"points": "_p~iF~ps|U_ulLnnqC"},
+    }])
+    service._client.reverse_geocode = Mock(return_value=[{
+        "address_components": [{"types": ["country"], "short_name": "PL"}],
+        "formatted_address": "Slubice, Poland",
+    }])
+
+    _, _, segments, _ = service.calculate_route(origin, destination)
+
+    # Only the step on the Oder border needs an API lookup
+    service._client.reverse_geocode.assert_called_once()
+    assert [segment.country_code for segment in segments] == ["DE", "PL"]
+    assert segments[0].distance_km == pytest.approx(100.0)
+    assert segments[1].distance_km == pytest.approx(200.0)
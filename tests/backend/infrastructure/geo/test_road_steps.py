@@ -0,0 +1,69 @@
+"""Tests for compact route step records and offline toll classification."""
+from decimal import Decimal
+from unittest.mock import Mock
+
+from backend.domain.entities.route import RouteStep
+from backend.infrastructure.external_services.toll_rate_service import TollRateService
+from backend.infrastructure.geo.road_steps import compact_steps
+from backend.infrastructure.geo.toll_classifier import route_has_tolls
+from backend.infrastructure.repositories.route_repository import (
+    decode_route_steps, encode_route_steps
+)
+
+
+def _step(meters, html):
+    return {"distance": {"value": meters}, "html_instructions": html}
+
+
+def test_compact_steps_classifies_road_and_toll():
+    """Test that steps keep distance, road ref, toll flag and country."""
+    route = {"warnings": ["This route has tolls."]}
+    steps = [
+        _step(1200, "Turn <b>left</b> onto <b>Hauptstraße</b>"),
+        _step(85400, "Merge onto <b>A2</b>"),
+        _step(3000, "Continue onto the toll bridge"),
+    ]
+
+    records = compact_steps(steps, "DE", route_has_tolls(route))
+
+    assert [(r.distance_km, r.road_ref, r.is_toll, r.country_code) for r in records] == [
+        (1.2, None, False, "DE"),
+        (85.4, "A2", True, "DE"),
+        (3.0, None, True, "DE"),
+    ]
+    assert not compact_steps(steps[1:2], "DE", route_has_tolls({}))[0].is_toll
+
+
+def test_step_records_round_trip():
+    """Test the compact JSON encoding used for persistence."""
+    steps = [
+        RouteStep(distance_km=85.4, road_ref="A2", is_toll=True, country_code="DE"),
+        RouteStep(distance_km=1.2, country_code="DE"),
+    ]
+
+    encoded = encode_route_steps(steps)
+
+    assert encoded == '[[85400,"A2",1,"DE"],[1200,null,0,"DE"]]'
+    assert decode_route_steps(encoded) == steps
+    assert encode_route_steps([]) is None
+    assert decode_route_steps(None) == []
+
+
+def test_toll_from_stored_steps_is_network_free():
+    """Test that stored steps are priced without a Directions request."""
+    client = Mock()
+    service = TollRateService(client=client)
+    steps = [
+        RouteStep(distance_km=80.0, road_ref="A2", is_toll=True, country_code="DE"),
+        RouteStep(distance_km=20.0, country_code="DE"),
+    ]
+
+    toll, used_default = service.get_toll_rate(
+        "DE", 100.0, "4", "VI", "A",
+        origin=(52.52, 13.40), destination=(52.40, 9.73), steps=steps
+    )
+
+    # 80 toll km at 0.248 EUR/km (class 4, Euro VI)
+    assert toll == Decimal("19.84")
+    assert used_default is False
+    client.directions.assert_not_called()
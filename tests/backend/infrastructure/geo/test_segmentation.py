@@ -0,0 +1,128 @@
+"""Tests for country run grouping and batched segmentation."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+import polyline
+
+from backend.domain.entities.location import Location
+from backend.infrastructure.external_services.google_maps_service import GoogleMapsService
+from backend.infrastructure.geo.segmentation import CountryRun, country_runs
+
+
+class TestCountryRuns:
+    """Test cases for country_runs."""
+
+    def test_groups_consecutive_countries(self):
+        """Test run-length grouping of step countries."""
+        assert country_runs(["DE", "DE", "PL", "PL", "PL", "LT"]) == [
+            CountryRun("DE", 0, 1),
+            CountryRun("PL", 2, 4),
+            CountryRun("LT", 5, 5),
+        ]
+
+    def test_unresolved_steps_join_neighbouring_run(self):
+        """Test that unresolved steps inherit the surrounding country."""
+        assert country_runs(["", "DE", None, "PL", ""]) == [
+            CountryRun("DE", 0, 2),
+            CountryRun("PL", 3, 4),
+        ]
+
+    def test_no_resolved_countries(self):
+        """Test that fully unresolved input yields no runs."""
+        assert country_runs([]) == []
+        assert country_runs(["", None]) == []
+
+
+def test_get_country_segments_resolves_each_step_once():
+    """Test that segmentation geocodes every step end exactly once."""
+    service = GoogleMapsService(api_key="AIzaTestKey", location_repo=Mock())
+
+    def step(start, end, meters):
+        return {
+            "start_location": {"lat": start[0], "lng": start[1]},
+            "end_location": {"lat": end[0], "lng": end[1]},
+            "distance": {"value": meters},
+            "duration": {"value": meters // 25},
+        }
+
+    service._client.directions = Mock(return_value=[{"legs": [{"steps": [
+        step((1.0, 1.0), (1.0, 2.0), 100000),
+        step((1.0, 2.0), (1.0, 3.0), 50000),
+        step((1.0, 3.0), (1.0, 4.0), 70000),
+        step((1.0, 4.0), (1.0, 5.0), 30000),
+    ]}]}])
+    countries = {2.0: "DE", 3.0: "DE", 4.0: "PL", 5.0: "PL"}
+    service._client.reverse_geocode = Mock(side_effect=lambda latlng: [{
+        "address_components": [{"types": ["country"], "short_name": countries[latlng[1]]}],
+        "formatted_address": f"Point {latlng[1]}",
+    }])
+
+    origin = Location(id=uuid4(), latitude=1.0, longitude=1.0)
+    destination = Location(id=uuid4(), latitude=1.0, longitude=5.0)
+    segments = service.get_country_segments(origin, destination)
+
+    assert service._client.reverse_geocode.call_count == 4
+    assert [(s.country_code, s.distance_km, s.segment_order) for s in segments] == [
+        ("DE", 150.0, 0),
+        ("PL", 100.0, 1),
+    ]
+    assert segments[1].start_location_id == segments[0].end_location_id
+
+
+def test_calculate_route_segments_every_leg():
+    """Test that a waypoint route is segmented per leg from one Directions call."""
+    location_repo = Mock()
+    location_repo.save = Mock(side_effect=lambda location: location)
+    service = GoogleMapsService(api_key="AIzaTestKey", location_repo=location_repo)
+
+    def step(start, end, meters):
+        return {
+            "start_location": {"lat": start[0], "lng": start[1]},
+            "end_location": {"lat": end[0], "lng": end[1]},
+            "distance": {"value": meters},
+            "duration": {"value": meters // 25},
+            "polyline": {"points": polyline.encode([start, end])},
+        }
+
+    def leg(*steps):
+        return {
+            "distance": {"value": sum(s["distance"]["value"] for s in steps)},
+            "duration": {"value": sum(s["duration"]["value"] for s in steps)},
+            "steps": list(steps),
+        }
+
+    service._client.directions = Mock(return_value=[{
+        "legs": [
+            leg(step((1.0, 1.0), (1.0, 2.0), 100000)),
+            leg(step((1.0, 2.0), (1.0, 3.0), 50000), step((1.0, 3.0), (1.0, 4.0), 70000)),
+        ],
+        "overview_polyline": {"points": polyline.encode([(1.0, 1.0), (1.0, 2.0), (1.0, 4.0)])},
+    }])
+    countries = {1.0: "DE", 2.0: "DE", 3.0: "PL", 4.0: "PL"}
+    service._client.reverse_geocode = Mock(side_effect=lambda latlng: [{
+        "address_components": [{"types": ["country"], "short_name": countries[latlng[1]]}],
+        "formatted_address": f"Point {latlng[1]}",
+    }])
+
+    origin = Location(id=uuid4(), latitude=1.0, longitude=1.0)
+    stop = Location(id=uuid4(), latitude=1.0, longitude=2.0)
+    destination = Location(id=uuid4(), latitude=1.0, longitude=4.0)
+    distance_km, duration_hours, segments, points = service.calculate_route(
+        origin, destination, waypoints=[stop]
+    )
+
+    assert service._client.directions.call_count == 1
+    assert service._client.directions.call_args.kwargs["waypoints"] == [{"lat": 1.0, "lng": 2.0}]
+    assert distance_km == 220.0
+    assert duration_hours == 220000 // 25 / 3600.0
+    # The stop splits the German distance; the border is inside the second leg
+    assert [(s.country_code, s.distance_km, s.segment_order) for s in segments] == [
+        ("DE", 100.0, 0),
+        ("DE", 50.0, 1),
+        ("PL", 70.0, 2),
+    ]
+    assert segments[0].end_location_id == stop.id == segments[1].start_location_id
+    assert segments[2].start_location_id == segments[1].end_location_id
+    assert segments[2].end_location_id == destination.id
+    assert segments[1].route_points == [[1.0, 2.0], [1.0, 3.0]]
+    assert len(points) == 3
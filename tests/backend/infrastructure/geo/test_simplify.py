@@ -0,0 +1,74 @@
+"""Tests for Douglas-Peucker route simplification."""
+import math
+
+from backend.infrastructure.geo.distance import haversine_km
+from backend.infrastructure.geo.simplify import build_lods, simplify_points
+from backend.infrastructure.repositories.route_repository import (
+    decode_route_lods, encode_route_lods
+)
+
+
+def _wiggly_route(count=20000):
+    """Amsterdam towards Warsaw with a small lateral wiggle."""
+    return [
+        [52.37 - 0.15 * i / count + 0.001 * math.sin(i / 7.0), 4.90 + 16.1 * i / count]
+        for i in range(count)
+    ]
+
+
+def _deviation_m(point, start, end):
+    """Approximate distance in meters from a point to a short segment."""
+    scale = math.cos(math.radians(point[0]))
+    ax, ay = start[1] * scale, start[0]
+    bx, by = end[1] * scale, end[0]
+    px, py = point[1] * scale, point[0]
+    dx, dy = bx - ax, by - ay
+    t = 0.0 if dx == dy == 0 else max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / (dx * dx + dy * dy)))
+    return haversine_km(py, px / scale, ay + t * dy, (ax + t * dx) / scale) * 1000
+
+
+def test_straight_line_collapses_to_endpoints():
+    """Test that collinear points are dropped."""
+    points = [[50.0 + i * 0.01, 10.0 + i * 0.01] for i in range(100)]
+
+    assert simplify_points(points, 10.0) == [points[0], points[-1]]
+    assert simplify_points(points[:2], 10.0) == points[:2]
+    assert simplify_points(points, 0) == points
+
+
+def test_dropped_points_stay_within_tolerance():
+    """Test that every dropped point lies within the tolerance."""
+    points = _wiggly_route(2000)
+    simplified = simplify_points(points, 50.0)
+    kept = {tuple(point) for point in simplified}
+
+    segment = 0
+    for point in points:
+        if tuple(point) in kept:
+            continue
+        while simplified[segment + 1][1] < point[1]:
+            segment += 1
+        assert _deviation_m(point, simplified[segment], simplified[segment + 1]) <= 50.5
+
+
+def test_long_route_lods_shrink_payload():
+    """Test that levels of detail shrink a long route by an order of magnitude."""
+    points = _wiggly_route()
+
+    lods = build_lods(points)
+
+    assert len(points) / len(lods["overview"]) >= 50
+    assert len(lods["overview"]) <= len(lods["detail"]) < len(points)
+    assert lods["detail"][0] == points[0] and lods["detail"][-1] == points[-1]
+
+
+def test_lods_round_trip():
+    """Test the stored JSON encoding of simplified polylines."""
+    points = _wiggly_route(500)
+
+    decoded = decode_route_lods(encode_route_lods(points))
+
+    assert set(decoded) == {"overview", "detail"}
+    assert len(decoded["detail"]) == len(build_lods(points)["detail"])
+    assert encode_route_lods([]) is None
+    assert decode_route_lods(None) == {}
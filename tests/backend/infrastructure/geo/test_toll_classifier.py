@@ -0,0 +1,100 @@
+"""Tests for the compiled toll-road step classifier."""
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from backend.infrastructure.external_services.toll_rate_service import TollRateService
+from backend.infrastructure.geo.toll_classifier import (
+    classify_steps, clean_html, extract_road_ref
+)
+
+
+def _step(meters, html):
+    return {"distance": {"value": meters}, "html_instructions": html}
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("merge onto a2", "A2"),
+    ("keep left to stay on e40 toward a12", "A12"),
+    ("continue onto s8 then d11", "D11"),
+    ("take exit toward autobahn 7", "A7"),
+    ("take exit toward autobahn-7 and b96", "A7"),
+    ("continue on rue de la gare", None),
+    ("area51 ahead", None),
+])
+def test_extract_road_ref_priority(text, expected):
+    """Test that road refs follow the A, E, D, S, Autobahn priority."""
+    assert extract_road_ref(text) == expected
+
+
+def test_clean_html():
+    """Test that tags and entities are stripped."""
+    assert clean_html("Merge&nbsp;onto <b>A2</b>/<wbr/><b>E30</b> ") == "merge onto a2/e30"
+
+
+def test_classify_steps_single_pass():
+    """Test per-step classes and toll km per road ref."""
+    steps = [
+        _step(1200, "Turn <b>left</b> onto <b>Hauptstraße</b>"),
+        _step(85400, "Merge onto <b>A2</b>"),
+        _step(3000, "Continue onto the <b>toll bridge</b>"),
+        _step(14600, "Keep <b>left</b> to stay on <b>A2</b>"),
+        _step(40000, "Take exit toward <b>Autobahn 7</b>"),
+        _step(500, "Slight right onto the péage ramp"),
+    ]
+
+    result = classify_steps(steps, has_tolls=True)
+
+    assert [tuple(step) for step in result.steps] == [
+        (None, False),
+        ("A2", True),
+        (None, True),
+        ("A2", True),
+        ("A7", True),
+        (None, True),
+    ]
+    assert result.toll_km_by_road == pytest.approx({"A2": 100.0, "A7": 40.0, None: 3.5})
+    assert result.toll_km == pytest.approx(143.5)
+
+
+def test_classify_steps_without_toll_warning():
+    """Test that only keyword steps are tolled when the route has no toll warning."""
+    steps = [_step(85400, "Merge onto <b>A2</b>"), _step(2000, "Maut station ahead")]
+
+    result = classify_steps(steps, has_tolls=False)
+
+    assert [tuple(step) for step in result.steps] == [("A2", False), (None, True)]
+    assert result.toll_km_by_road == {None: 2.0}
+    assert classify_steps([], has_tolls=True).toll_km == 0
+
+
+def test_classify_steps_matches_do_not_cross_steps():
+    """Test that a match is attributed only to the step it occurs in."""
+    steps = [_step(1000, "Head toward <b>A</b>"), _step(2000, "<b>1</b> km ahead")]
+
+    result = classify_steps(steps, has_tolls=True)
+
+    assert [tuple(step) for step in result.steps] == [(None, False), (None, False)]
+
+
+def test_toll_service_prices_classified_leg():
+    """Test that the Directions path prices the toll km of all legs once."""
+    client = Mock()
+    client.directions.return_value = [{
+        "warnings": ["This route has tolls."],
+        "legs": [
+            {"steps": [_step(60000, "Merge onto <b>A2</b>"), _step(5000, "Turn right")]},
+            {"steps": [_step(20000, "Continue onto <b>A7</b>")]},
+        ],
+    }]
+    service = TollRateService(client=client)
+
+    toll, used_default = service.get_toll_rate(
+        "DE", 85.0, "4", "VI", "A", origin=(52.52, 13.40), destination=(52.40, 9.73)
+    )
+
+    # 80 toll km at 0.248 EUR/km (class 4, Euro VI)
+    assert toll == Decimal("19.84")
+    assert used_default is False
+    client.directions.assert_called_once()
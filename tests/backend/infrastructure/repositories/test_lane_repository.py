@@ -0,0 +1,82 @@
+"""Tests for the lane repository."""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from backend.domain.entities.route import CountrySegment, Lane, RouteStep
+from backend.infrastructure.repositories.lane_repository import SQLLaneRepository
+
+
+def _lane(lane_key="u33db2m:u3qcnhb", created_at=None, distance_km=575.0):
+    border_id = uuid4()
+    return Lane(
+        id=uuid4(),
+        lane_key=lane_key,
+        total_distance_km=distance_km,
+        total_duration_hours=6.5,
+        route_polyline=[[52.52, 13.40], [52.35, 14.55], [52.23, 21.01]],
+        country_segments=[
+            CountrySegment(
+                id=uuid4(),
+                country_code="DE",
+                distance_km=90.0,
+                duration_hours=1.0,
+                start_location_id=uuid4(),
+                end_location_id=border_id,
+                segment_order=0,
+                route_points=[[52.52, 13.40], [52.35, 14.55]],
+                steps=[RouteStep(distance_km=90.0, road_ref="A12", is_toll=True, country_code="DE")]
+            ),
+            CountrySegment(
+                id=uuid4(),
+                country_code="PL",
+                distance_km=485.0,
+                duration_hours=5.5,
+                start_location_id=border_id,
+                end_location_id=uuid4(),
+                segment_order=1,
+                route_points=[[52.35, 14.55], [52.23, 21.01]]
+            )
+        ],
+        created_at=created_at or datetime.now(timezone.utc)
+    )
+
+
+def test_save_and_find_by_key(db):
+    """Test that a lane round-trips with geometry, steps and per-country totals."""
+    repo = SQLLaneRepository(db)
+    lane = _lane()
+
+    repo.save(lane)
+    found = repo.find_by_key(lane.lane_key)
+
+    assert found.total_distance_km == 575.0
+    assert found.route_polyline == lane.route_polyline
+    assert [segment.country_code for segment in found.country_segments] == ["DE", "PL"]
+    assert found.country_segments[0].steps == lane.country_segments[0].steps
+    assert found.country_segments[1].start_location_id == lane.country_segments[0].end_location_id
+    assert found.country_totals() == {"DE": (90.0, 1.0), "PL": (485.0, 5.5)}
+    assert found.created_at.tzinfo is not None
+    assert repo.find_by_key("missing") is None
+
+
+def test_save_replaces_lane_with_same_key(db):
+    """Test that recalculating a lane overwrites the stored one."""
+    repo = SQLLaneRepository(db)
+    repo.save(_lane(distance_km=575.0))
+
+    repo.save(_lane(distance_km=580.0))
+
+    assert repo.find_by_key("u33db2m:u3qcnhb").total_distance_km == 580.0
+    assert len(repo.find_all()) == 1
+
+
+def test_delete_older_than(db):
+    """Test pruning of lanes calculated before a cutoff."""
+    repo = SQLLaneRepository(db)
+    now = datetime.now(timezone.utc)
+    repo.save(_lane("old::", created_at=now - timedelta(days=30)))
+    repo.save(_lane("new::", created_at=now))
+
+    assert repo.delete_older_than(now - timedelta(days=7)) == 1
+    assert repo.find_by_key("old::") is None
+    assert repo.find_by_key("new::") is not None
@@ -12,14 +12,18 @@ from backend.domain.entities.route import (
     Route, Location, TimelineEvent,
     CountrySegment, EmptyDriving
 )
-from backend.infrastructure.repositories.route_repository import SQLRouteRepository
+from backend.infrastructure.repositories.route_repository import (
+    SQLRouteRepository, encode_route_points, decode_route_points
+)
 from backend.infrastructure.models.business_models import BusinessEntityModel
 from backend.infrastructure.models.transport_models import (
     TransportModel, TransportTypeModel,
     TruckSpecificationModel, DriverSpecificationModel
 )
 from backend.infrastructure.models.cargo_models import CargoModel
-from backend.infrastructure.models.route_models import LocationModel, EmptyDrivingModel, RouteModel
+from backend.infrastructure.models.route_models import (
+    LocationModel, EmptyDrivingModel, RouteModel, CountrySegmentModel
+)
 
 
 @pytest.fixture
@@ -315,4 +319,87 @@ class TestSQLRouteRepository:
         assert found_route.total_distance_km == route.total_distance_km
         assert found_route.total_duration_hours == route.total_duration_hours
         assert found_route.is_feasible == route.is_feasible
-        assert found_route.status == route.status 
\ No newline at end of file
+        assert found_route.status == route.status
+
+
+class TestRoutePolylineStorage:
+    """Test cases for stored segment polylines."""
+
+    def test_encode_decode_round_trip(self):
+        """Test that route points survive polyline encoding."""
+        points = [[52.52001, 13.40495], [52.40012, 16.92001], [52.23705, 21.01753]]
+
+        decoded = decode_route_points(encode_route_points(points))
+
+        assert len(decoded) == len(points)
+        for actual, expected in zip(decoded, points):
+            assert actual == pytest.approx(expected)
+        assert encode_route_points([]) is None
+        assert decode_route_points(None) == []
+
+    def test_empty_driving_route_points_persisted(self, db: Session):
+        """Test saving and updating empty driving route points."""
+        repo = SQLRouteRepository(db)
+        empty_driving = EmptyDriving(
+            id=uuid4(),
+            distance_km=120.0,
+            duration_hours=1.5,
+            route_points=[[52.52, 13.40], [52.40, 14.00]]
+        )
+
+        repo.save_empty_driving(empty_driving)
+        found = repo.find_empty_driving_by_id(empty_driving.id)
+        assert found.route_points == [[52.52, 13.40], [52.40, 14.00]]
+
+        repo.update_empty_driving_route_points(empty_driving.id, [[51.0, 14.0], [50.5, 14.5]])
+        found = repo.find_empty_driving_by_id(empty_driving.id)
+        assert found.route_points == [[51.0, 14.0], [50.5, 14.5]]
+
+
+class TestCorridorSamples:
+    """Test cases for detour calibration samples."""
+
+    def _add_route(self, db, transport, business, locations, distance_km, created_at,
+                   mode="exact", waypoint_count=0):
+        berlin, warsaw = locations
+        route_id = str(uuid4())
+        db.add(RouteModel(
+            id=route_id,
+            transport_id=transport.id,
+            business_entity_id=business.id,
+            origin_id=berlin.id,
+            destination_id=warsaw.id,
+            truck_location_id=berlin.id,
+            pickup_time=created_at,
+            delivery_time=created_at,
+            total_distance_km=distance_km,
+            total_duration_hours=6.0,
+            mode=mode,
+            waypoint_count=waypoint_count,
+            country_segments=[CountrySegmentModel(
+                id=str(uuid4()), route_id=route_id, country_code="DE", distance_km=distance_km,
+                duration_hours=6.0, start_location_id=berlin.id, end_location_id=warsaw.id,
+                segment_order=0, segment_type="ROUTE"
+            )]
+        ))
+        db.flush()
+        db.query(RouteModel).filter_by(id=route_id).update({"created_at": created_at})
+        db.commit()
+
+    def test_samples_only_recent_exact_direct_routes(self, db: Session, test_transport,
+                                                     test_business_entity, test_locations):
+        """Test that estimates and multi-stop routes are not sampled, newest first."""
+        repo = SQLRouteRepository(db)
+        add = lambda *args, **kwargs: self._add_route(
+            db, test_transport, test_business_entity, test_locations, *args, **kwargs
+        )
+        add(600.0, datetime(2025, 1, 1, tzinfo=timezone.utc))
+        add(650.0, datetime(2025, 1, 3, tzinfo=timezone.utc))
+        add(700.0, datetime(2025, 1, 4, tzinfo=timezone.utc), mode="estimate")
+        add(900.0, datetime(2025, 1, 5, tzinfo=timezone.utc), waypoint_count=2)
+
+        samples = repo.find_corridor_samples()
+        latest = repo.find_corridor_samples(limit=1)
+
+        assert sorted(sample.road_km for sample in samples) == [600.0, 650.0]
+        assert [sample.road_km for sample in latest] == [650.0]
@@ -20,6 +20,7 @@ from backend.infrastructure.models.transport_models import (
     TruckSpecificationModel, DriverSpecificationModel
 )
 from backend.infrastructure.models.business_models import BusinessEntityModel
+from backend.infrastructure.cache.lru import LRUCache
 from backend.infrastructure.repositories.toll_rate_override_repository import TollRateOverrideRepository
 from backend.infrastructure.models.transport_models import TollRateOverrideModel
 
@@ -188,6 +189,22 @@ class TestSQLTransportRepository:
         # Assert
         assert found_transport is None
 
+    def test_find_transports_by_ids(self, db: Session, transport: Transport, transport_type_model: TransportTypeModel):
+        """Test bulk lookup of transports with their specifications."""
+        # Arrange
+        repo = SQLTransportRepository(db)
+        saved_transport = repo.save(transport)
+        missing_id = uuid4()
+
+        # Act
+        found = repo.find_by_ids([saved_transport.id, missing_id, saved_transport.id])
+
+        # Assert
+        assert list(found) == [transport.id]
+        assert found[transport.id].truck_specs == saved_transport.truck_specs
+        assert found[transport.id].driver_specs == saved_transport.driver_specs
+        assert repo.find_by_ids([]) == {}
+
 
 class TestSQLTransportTypeRepository:
     """Test cases for SQLTransportTypeRepository."""
@@ -332,4 +349,53 @@ def test_toll_rate_override_repository(db):
         country_code="AT",
         vehicle_class="4"
     )
-    assert not_found is None 
\ No newline at end of file
+    assert not_found is None 
+
+def test_toll_rate_override_cache(db):
+    """Test batch override lookup from the cached per-business index."""
+    business = BusinessEntityModel(
+        id=str(uuid4()),
+        name="Test Business",
+        address="Test Address, Berlin",
+        contact_info=json.dumps({"email": "test@example.com", "phone": "+49123456789"}),
+        business_type="TRANSPORT_COMPANY",
+        certifications=json.dumps(["ISO"]),
+        operating_countries=json.dumps(["DE", "FR", "PL"]),
+        cost_overheads=json.dumps({"admin": "100.00"}),
+        is_active=True
+    )
+    db.add(business)
+    db.add(TollRateOverrideModel(
+        id=str(uuid4()), vehicle_class="4", rate_multiplier=Decimal("1.25"),
+        country_code="DE", business_entity_id=business.id
+    ))
+    db.add(TollRateOverrideModel(
+        id=str(uuid4()), vehicle_class="4", rate_multiplier=Decimal("1.10"),
+        country_code="FR", route_type="express", business_entity_id=business.id
+    ))
+    db.commit()
+
+    cache = LRUCache(max_size=8)
+    repo = TollRateOverrideRepository(db, cache=cache)
+    business_id = UUID(business.id)
+
+    found = repo.find_for_business_multiple(business_id, ["DE", "FR", "PL"], "4")
+    assert {o.country_code for o in found} == {"DE", "FR"}
+    index = repo.find_all_for_business(business_id)
+    assert index is repo.find_all_for_business(business_id)
+    assert index.resolve("FR", "4", "express").rate_multiplier == Decimal("1.10")
+    assert index.resolve("FR", "4", "standard") is None
+
+    # An uncommitted save is visible to its session but not cached
+    repo.save(TollRateOverride(
+        id=uuid4(), vehicle_class="4", rate_multiplier=Decimal("1.05"),
+        country_code="PL", business_entity_id=business_id
+    ))
+    assert repo.find_for_business(business_id, "PL", "4").rate_multiplier == Decimal("1.05")
+    assert cache.get(str(business_id))[1] is index
+
+    # Committing invalidates the cached index of the business
+    db.commit()
+    assert str(business_id) not in cache
+    assert repo.find_for_business(business_id, "PL", "4").rate_multiplier == Decimal("1.05")
+    assert str(business_id) in cache